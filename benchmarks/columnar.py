@@ -0,0 +1,86 @@
+"""Benchmark of decoding the historical ticks messages.
+
+Compares the columnar mode of `IBDecoder`, which parses the ticks into a
+`TickArray` of NumPy arrays, with the default decoding of `ibapi` which
+creates objects for every tick. Each message carries 1000 ticks as IB does.
+
+Usage:
+    python -m benchmarks.columnar [num_of_msgs]
+"""
+import sys
+import time
+
+from ibapi import message
+from ibapi import server_versions
+from ibapi import wrapper
+
+from ibpy_native._internal import _decoder
+
+_REQ_ID = 1
+_TICKS_PER_MSG = 1000
+
+class _Wrapper(wrapper.EWrapper):
+    # pylint: disable=invalid-name, unused-argument
+    def __init__(self, columnar: bool):
+        super().__init__()
+        self._columnar = columnar
+
+    def is_columnar(self, req_id: int) -> bool:
+        return self._columnar
+
+    def historicalTicks(self, *args):
+        pass
+
+    def historicalTicksBidAsk(self, *args):
+        pass
+
+    def historicalTicksLast(self, *args):
+        pass
+
+    def historicalTicksColumnar(self, *args):
+        pass
+
+def _fields(msg_id: int) -> tuple:
+    ticks = []
+    for i in range(_TICKS_PER_MSG):
+        tick_time = str(1614556800 + i).encode()
+        if msg_id == message.IN.HISTORICAL_TICKS:
+            ticks += [tick_time, b"", b"1.2101", b"100"]
+        elif msg_id == message.IN.HISTORICAL_TICKS_BID_ASK:
+            ticks += [tick_time, b"0", b"1.2101", b"1.2102", b"100", b"200"]
+        else:
+            ticks += [tick_time, b"0", b"1.2101", b"100", b"ISLAND", b""]
+
+    return (str(msg_id).encode(), str(_REQ_ID).encode(),
+            str(_TICKS_PER_MSG).encode(), *ticks, b"1")
+
+def _run(columnar: bool, fields: tuple, num: int) -> float:
+    """Returns the number of ticks decoded per second."""
+    dec = _decoder.IBDecoder(_Wrapper(columnar=columnar),
+                             server_versions.MAX_CLIENT_VER)
+
+    start = time.perf_counter()
+    for _ in range(num):
+        dec.interpret(fields)
+    elapsed = time.perf_counter() - start
+
+    return num * _TICKS_PER_MSG / elapsed
+
+def main():
+    """Entry point"""
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print(f"Benchmark - historical ticks decoding ({num} messages of "
+          f"{_TICKS_PER_MSG} ticks)")
+    print(f"{'message':<26}{'objects (tick/s)':>18}{'columnar (tick/s)':>19}")
+    for name, msg_id in (
+            ("HISTORICAL_TICKS", message.IN.HISTORICAL_TICKS),
+            ("HISTORICAL_TICKS_BID_ASK", message.IN.HISTORICAL_TICKS_BID_ASK),
+            ("HISTORICAL_TICKS_LAST", message.IN.HISTORICAL_TICKS_LAST),):
+        fields = _fields(msg_id)
+        objects = _run(False, fields, num)
+        columnar = _run(True, fields, num)
+        print(f"{name:<26}{objects:>18,.0f}{columnar:>19,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark of dispatching the messages from IB via `ibapi.decoder.Decoder`.
+
+Compares the decode functions built per message ID with the legacy dispatch
+which resolved the arguments of every message via `interpretWithSignature`.
+
+Usage:
+    python -m benchmarks.decoder [num_of_msgs]
+"""
+import sys
+import time
+
+from ibapi import decoder
+from ibapi import message
+from ibapi import server_versions
+from ibapi import wrapper
+
+class LegacyDecoder(decoder.Decoder):
+    """`Decoder` dispatches messages as it used to be."""
+    def interpret(self, fields):
+        handle_info = self.msgId2handleInfo.get(int(fields[0]), None)
+
+        if handle_info.wrapperMeth is not None:
+            self.interpretWithSignature(fields, handle_info)
+        elif handle_info.processMeth is not None:
+            handle_info.processMeth(self, iter(fields))
+
+class _Wrapper(wrapper.EWrapper):
+    # pylint: disable=invalid-name, unused-argument
+    def tickPrice(self, *args):
+        pass
+
+    def tickSize(self, *args):
+        pass
+
+    def updateAccountValue(self, *args):
+        pass
+
+    def error(self, *args):
+        pass
+
+    def currentTime(self, *args):
+        pass
+
+_MESSAGES = (
+    ("tickSize", (str(message.IN.TICK_SIZE).encode(), b"6", b"1", b"0",
+                  b"100")),
+    ("updateAccountValue", (str(message.IN.ACCT_VALUE).encode(), b"2",
+                            b"NetLiquidation", b"123456.78", b"USD",
+                            b"DU0001")),
+    ("error", (str(message.IN.ERR_MSG).encode(), b"2", b"-1", b"2104",
+               b"Market data farm connection is OK:usfarm")),
+    ("currentTime", (str(message.IN.CURRENT_TIME).encode(), b"1",
+                     b"1614556800")),
+    ("tickPrice", (str(message.IN.TICK_PRICE).encode(), b"6", b"1", b"1",
+                   b"1.2345", b"100", b"0")),
+)
+
+def _run(decoder_cls: type, fields: tuple, num: int) -> float:
+    """Returns the number of messages decoded per second."""
+    dec = decoder_cls(_Wrapper(), server_versions.MAX_CLIENT_VER)
+
+    start = time.perf_counter()
+    for _ in range(num):
+        dec.interpret(fields)
+    elapsed = time.perf_counter() - start
+
+    return num / elapsed
+
+def main():
+    """Entry point"""
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print(f"Benchmark - Decoder ({num} messages per type)")
+    print(f"{'message':<20}{'legacy (msg/s)':>16}{'built (msg/s)':>16}")
+    for name, fields in _MESSAGES:
+        legacy = _run(LegacyDecoder, fields, num)
+        current = _run(decoder.Decoder, fields, num)
+        print(f"{name:<20}{legacy:>16,.0f}{current:>16,.0f}")
+
+if __name__ == "__main__":
+    main()
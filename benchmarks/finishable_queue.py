@@ -0,0 +1,70 @@
+"""Benchmark of the per-element overhead of `FinishableQueue`.
+
+Compares the event-driven handoff (`loop.call_soon_threadsafe`) with the
+legacy implementation which retrieved every element via
+`loop.run_in_executor(None, queue.get)`. Elements are put from a separate
+thread to mimic the reader thread of IB API.
+
+Usage:
+    python -m benchmarks.finishable_queue [num_of_elements]
+"""
+import asyncio
+import queue
+import sys
+import threading
+import time
+from typing import Any, Callable
+
+from ibpy_native.utils import finishable_queue as fq
+
+class LegacyFinishableQueue(fq.FinishableQueue):
+    """`FinishableQueue` retrieves elements via the default executor as it
+    used to be.
+    """
+    async def _next_element(self) -> Any:
+        loop = asyncio.get_event_loop()
+
+        return await loop.run_in_executor(None, self._queue.get)
+
+def _produce(f_queue: fq.FinishableQueue, num: int):
+    for i in range(num):
+        f_queue.put(i)
+    f_queue.put(fq.Status.FINISHED)
+
+async def _consume_get(f_queue: fq.FinishableQueue):
+    await f_queue.get()
+
+async def _consume_stream(f_queue: fq.FinishableQueue):
+    async for _ in f_queue.stream():
+        pass
+
+def _run(queue_cls: type, consumer: Callable, num: int) -> float:
+    """Returns the average time spent per element in microseconds."""
+    f_queue = queue_cls(queue_to_finish=queue.Queue())
+    loop = asyncio.new_event_loop()
+    producer = threading.Thread(target=_produce, args=(f_queue, num))
+
+    start = time.perf_counter()
+    producer.start()
+    loop.run_until_complete(consumer(f_queue))
+    elapsed = time.perf_counter() - start
+
+    producer.join()
+    loop.close()
+
+    return elapsed / num * 1e6
+
+def main():
+    """Entry point"""
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print(f"Benchmark - FinishableQueue ({num} elements)")
+    print(f"{'consumer':<10}{'executor (us/elm)':>20}{'event (us/elm)':>20}")
+    for name, consumer in (("get", _consume_get),
+                           ("stream", _consume_stream),):
+        legacy = _run(LegacyFinishableQueue, consumer, num)
+        current = _run(fq.FinishableQueue, consumer, num)
+        print(f"{name:<10}{legacy:>20.3f}{current:>20.3f}")
+
+if __name__ == "__main__":
+    main()
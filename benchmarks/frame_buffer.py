@@ -0,0 +1,78 @@
+"""Benchmark of framing the messages received from IB.
+
+Compares `ibapi.comm.FrameBuffer` with the legacy loop of `EReader` which
+concatenated the data received to an immutable `bytes` buffer and cut the
+messages out via `comm.read_msg`. Each scenario feeds 1MB of data in
+chunks of the socket read size.
+
+Usage:
+    python -m benchmarks.frame_buffer [num_of_mb]
+"""
+import sys
+import time
+from typing import Callable, List
+
+from ibapi import comm
+
+_MB = 1024 * 1024
+
+def _legacy(chunks: List[bytes]) -> int:
+    count = 0
+    buf = b""
+    for data in chunks:
+        buf += data
+        while len(buf) > 0:
+            _, msg, buf = comm.read_msg(buf)
+            if msg:
+                count += 1
+            else:
+                break
+
+    return count
+
+def _frame_buffer(chunks: List[bytes]) -> int:
+    count = 0
+    frames = comm.FrameBuffer()
+    for data in chunks:
+        # Mimics `socket.recv_into`
+        size = len(data)
+        frames.writable(size)[:size] = data
+        frames.commit(size)
+        for _ in frames.frames():
+            count += 1
+
+    return count
+
+def _split(data: bytes, chunk_size: int) -> List[bytes]:
+    return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+def _run(func: Callable[[List[bytes]], int], chunks: List[bytes],
+         size: int) -> float:
+    """Returns the throughput in MB/s."""
+    start = time.perf_counter()
+    func(chunks)
+    elapsed = time.perf_counter() - start
+
+    return size / _MB / elapsed
+
+def main():
+    """Entry point"""
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+    # A historical ticks reply alike message with lots of fields
+    large = comm.make_msg("96\0" + "1614556800\0\0" * (num * _MB // 12))
+    # Lots of small messages (e.g. live ticks) received in large reads
+    small = b"".join(
+        comm.make_msg(f"99\0{i}\0{i % 7}\0") for i in range(num * _MB // 20))
+
+    print(f"Benchmark - framing ({num}MB per scenario)")
+    print(f"{'scenario':<24}{'legacy (MB/s)':>16}{'buffer (MB/s)':>16}")
+    for name, data, chunk_size in (("1 message, 4KB reads", large, 4096),
+                                   ("small msgs, 64KB reads", small, 65536),):
+        chunks = _split(data, chunk_size)
+        legacy = _run(_legacy, chunks, len(data))
+        current = _run(_frame_buffer, chunks, len(data))
+        print(f"{name:<24}{legacy:>16.1f}{current:>16.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark of the request ID allocation of `IBWrapper`.
+
+Compares `ReqIdAllocator` with the legacy `IBWrapper.next_req_id` which
+scanned all the request queues on every call. Each round allocates the IDs
+of `num` concurrent requests, then releases all of them.
+
+Usage:
+    python -m benchmarks.req_id_allocator [num_of_ids]
+"""
+import queue
+import sys
+import time
+from typing import Dict
+
+from ibpy_native._internal import _req_id
+from ibpy_native.utils import finishable_queue as fq
+
+class LegacyAllocator():
+    """Request ID lookup of `IBWrapper.next_req_id` as it used to be."""
+    def __init__(self):
+        self._req_queue: Dict[int, fq.FinishableQueue] = {}
+
+    def allocate(self) -> int:
+        """Finds the next usable ID & occupies it with a queue."""
+        usable_id = 0
+        req_id = None
+
+        for key, f_queue in self._req_queue.items():
+            if f_queue.finished:
+                req_id = key
+                break
+
+            if key > usable_id:
+                usable_id = key
+
+        if req_id is None:
+            req_id = usable_id + 1
+            self._req_queue[req_id] = fq.FinishableQueue(queue.Queue())
+        else:
+            self._req_queue[req_id].reset()
+
+        return req_id
+
+    def release(self, req_id: int):
+        """Marks the queue associated with the ID as finished."""
+        self._req_queue[req_id].finish()
+
+def _run(allocator, num: int, rounds: int) -> float:
+    """Returns the average time spent per allocate-release cycle in
+    microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(rounds):
+        ids = [allocator.allocate() for _ in range(num)]
+        for req_id in ids:
+            allocator.release(req_id)
+    elapsed = time.perf_counter() - start
+
+    return elapsed / (num * rounds) * 1e6
+
+def main():
+    """Entry point"""
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    # The legacy scan is O(n) per call, keep it to a feasible size
+    legacy_num = min(num, 5000)
+
+    print("Benchmark - request ID allocation")
+    print(f"{'allocator':<12}{'IDs':>10}{'us/cycle':>12}")
+    legacy = _run(LegacyAllocator(), legacy_num, 1)
+    print(f"{'legacy':<12}{legacy_num:>10}{legacy:>12.3f}")
+    for size in sorted({legacy_num, num}):
+        current = _run(_req_id.ReqIdAllocator(), size, 2)
+        print(f"{'allocator':<12}{size:>10}{current:>12.3f}")
+
+if __name__ == "__main__":
+    main()
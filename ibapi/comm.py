@@ -12,7 +12,8 @@ This module has tools for implementing the IB low level messaging.
 import struct
 import logging
 
-from ibapi.common import UNSET_INTEGER, UNSET_DOUBLE
+from ibapi.common import UNSET_INTEGER, UNSET_DOUBLE, MAX_MSG_LEN
+from ibapi.utils import BadMessage
 
 logger = logging.getLogger(__name__)
 
@@ -53,18 +54,92 @@ def read_msg(buf:bytes) -> tuple:
 
     if len(buf) < 4:
         return (0, "", buf)
-    size = struct.unpack("!I", buf[0:4])[0]
+    size = struct.unpack_from("!I", buf)[0]
     logger.debug("read_msg: size: %d", size)
     if len(buf) - 4 >= size:
-        text = struct.unpack("!%ds" % size, buf[4:4+size])[0]
+        text = bytes(buf[4:4+size])
         return (size, text, buf[4+size:])
     else:
         return (size, "", buf)
 
 
+class FrameBuffer:
+    """ Assembles the size prefixed messages received from the socket.
+
+    Data is received straight into the preallocated storage (see writable()
+    and commit()) and complete messages are handed out as memoryviews of it,
+    so no byte is copied while framing. The storage is append only: once it
+    is full, the incomplete tail is moved to a new, large enough storage and
+    the old one is left to the views handed out, which stay valid.
+
+    The size prefix comes from the other side, so a message longer than
+    MAX_MSG_LEN raises BadMessage before any storage is allocated for it. """
+
+    def __init__(self, capacity:int=65536):
+        self._capacity = capacity
+        self._buf = bytearray(capacity)
+        self._start = 0     # start of the first incomplete message
+        self._end = 0       # end of the data received
+
+    def __len__(self):
+        """ number of bytes received but not handed out yet """
+        return self._end - self._start
+
+    def writable(self, min_size:int=4096) -> memoryview:
+        """ returns the free space for at least min_size bytes to be received
+        into, e.g. with socket.recv_into() """
+
+        if len(self._buf) - self._end < min_size:
+            pending = self._end - self._start
+            needed = pending + min_size
+            # make room for the whole message at once if the size is known
+            if pending >= 4:
+                size = self._check_size(self._start)
+                needed = max(needed, 4 + size)
+            new_buf = bytearray(max(self._capacity, needed))
+            new_buf[:pending] = memoryview(self._buf)[self._start:self._end]
+            self._buf = new_buf
+            self._start = 0
+            self._end = pending
+
+        return memoryview(self._buf)[self._end:]
+
+    def commit(self, size:int):
+        """ marks size bytes written into the last writable() as received """
+        self._end += size
+
+    def feed(self, data:bytes):
+        """ copies the data received elsewhere into the buffer """
+        size = len(data)
+        self.writable(size)[:size] = data
+        self.commit(size)
+
+    def frames(self):
+        """ yields the payload of every complete message as a memoryview """
+        buf = self._buf
+        view = memoryview(buf)
+        while self._end - self._start >= 4:
+            size = self._check_size(self._start)
+            msg_end = self._start + 4 + size
+            if msg_end > self._end:
+                break
+            msg = view[self._start+4:msg_end]
+            self._start = msg_end
+            yield msg
+
+    def _check_size(self, offset:int) -> int:
+        """ returns the size prefix at offset, rejecting the oversized """
+        size = struct.unpack_from("!I", self._buf, offset)[0]
+        if size > MAX_MSG_LEN:
+            raise BadMessage("message size %d exceeds MAX_MSG_LEN" % size)
+        return size
+
+
 def read_fields(buf:bytes) -> tuple:
     if isinstance(buf, str):
         buf = buf.encode()
+    elif isinstance(buf, memoryview):
+        buf = buf.tobytes()
 
     """ msg payload is made of fields terminated/separated by NULL chars """
     fields = buf.split(b"\0")
@@ -106,6 +106,29 @@ class Connection:
 
         return buf
 
+    def recvMsgInto(self, buf):
+        """ receives into the writable buffer (e.g. a memoryview) and returns
+        the number of bytes received, 0 on timeout or if not connected """
+        if not self.isConnected():
+            logger.debug("recvMsgInto attempted while not connected")
+            return 0
+        try:
+            size = self.socket.recv_into(buf)
+            # receiving 0 bytes outside a timeout means the connection is either
+            # closed or broken
+            if size == 0:
+                logger.debug("socket either closed or broken, disconnecting")
+                self.disconnect()
+        except socket.timeout:
+            logger.debug("socket timeout from recvMsgInto %s", sys.exc_info())
+            size = 0
+        except socket.error:
+            logger.debug("socket broken, disconnecting")
+            self.disconnect()
+            size = 0
+
+        return size
+
     def _recvAllMsg(self):
         cont = True
         allbuf = b""
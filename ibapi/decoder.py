@@ -40,11 +40,42 @@ class HandleInfo(Object):
         return s
 
 
+def decodeAscii7(field:bytes) -> str:
+    """ decodes a string field sent by servers encoding messages in ASCII7,
+    equivalent to decoding with 'unicode-escape' """
+    if b"\\" not in field:
+        # nothing to unescape, 'unicode-escape' maps the other bytes as latin-1
+        return field.decode('latin-1')
+    try:
+        return field.decode('unicode-escape')
+    except UnicodeDecodeError:
+        return field.decode('latin-1')
+
+
+def decodeUtf8(field:bytes) -> str:
+    """ decodes a string field sent by servers encoding messages in UTF-8 """
+    try:
+        return field.decode('UTF-8')
+    except UnicodeDecodeError:
+        return field.decode('latin-1')
+
+
 class Decoder(Object):
     def __init__(self, wrapper, serverVersion):
         self.wrapper = wrapper
-        self.serverVersion = serverVersion
+        self.msgId2decoder = {}
         self.discoverParams()
+        self.serverVersion = serverVersion
+
+    @property
+    def serverVersion(self):
+        return self._serverVersion
+
+    @serverVersion.setter
+    def serverVersion(self, serverVersion):
+        # decoders depend on the server version, rebuild them
+        self._serverVersion = serverVersion
+        self.buildDecoders()
 
 
     def processTickPriceMsg(self, fields):
@@ -1260,26 +1291,80 @@ class Decoder(Object):
         logger.debug("calling %s with %s %s", method, self.wrapper, args)
         method(*args)
 
+    def buildDecoders(self):
+        """ builds a decode function per msg id once, so that interpret()
+        needs neither reflection nor per field logging to dispatch a msg """
+        msgId2decoder = {}
+        for (msgId, handleInfo) in self.msgId2handleInfo.items():
+            if handleInfo.wrapperMeth is not None:
+                decoder = self.makeWrapperDecoder(handleInfo)
+            else:
+                decoder = self.makeProcessDecoder(handleInfo)
+            if decoder is not None:
+                msgId2decoder[msgId] = decoder
+        self.msgId2decoder = msgId2decoder
+
+    def makeWrapperDecoder(self, handleInfo):
+        """ specialized equivalent of interpretWithSignature() """
+        if handleInfo.wrapperParams is None:
+            logger.debug("no param info in %s", handleInfo)
+            return None
+
+        if self.serverVersion is not None and \
+                self.serverVersion >= MIN_SERVER_VER_ENCODE_MSG_ASCII7:
+            decodeStr = decodeAscii7
+        else:
+            decodeStr = decodeUtf8
+
+        converters = []
+        for (pname, param) in handleInfo.wrapperParams.items():
+            if pname != "self":
+                if param.annotation is int:
+                    converters.append(int)
+                elif param.annotation is float:
+                    converters.append(float)
+                else:
+                    converters.append(decodeStr)
+        converters = tuple(converters)
+
+        nIgnoreFields = 2 #bypass msgId and versionId
+        nFields = nIgnoreFields + len(converters)
+        methName = handleInfo.wrapperMeth.__name__
+
+        def decodeMsg(fields):
+            if len(fields) != nFields:
+                logger.error("diff len fields and params %d %d for fields: %s and handleInfo: %s",
+                             len(fields), nFields - 1, fields, handleInfo)
+                return
+            # looked up per msg, so that methods patched on the wrapper
+            # later are still called
+            getattr(self.wrapper, methName)(
+                *[conv(field) for (conv, field)
+                  in zip(converters, fields[nIgnoreFields:])])
+
+        return decodeMsg
+
+    def makeProcessDecoder(self, handleInfo):
+        processMeth = handleInfo.processMeth.__get__(self, Decoder)
+
+        def decodeMsg(fields):
+            processMeth(iter(fields))
+
+        return decodeMsg
+
     def interpret(self, fields):
         if len(fields) == 0:
             logger.debug("no fields")
             return
 
-        sMsgId = fields[0]
-        nMsgId = int(sMsgId)
-
-        handleInfo = self.msgId2handleInfo.get(nMsgId, None)
+        decoder = self.msgId2decoder.get(int(fields[0]), None)
 
-        if handleInfo is None:
+        if decoder is None:
             logger.debug("%s: no handleInfo", fields)
             return
 
         try:
-            if handleInfo.wrapperMeth is not None:
-                logger.debug("In interpret(), handleInfo: %s", handleInfo)
-                self.interpretWithSignature(fields, handleInfo)
-            elif handleInfo.processMeth is not None:
-                handleInfo.processMeth(self, iter(fields))
+            decoder(fields)
         except BadMessage:
                 theBadMsg = ",".join(fields)
                 self.wrapper.error(NO_VALID_ID, BAD_MESSAGE.code(),
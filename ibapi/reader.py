@@ -15,6 +15,7 @@ import logging
 from threading import Thread
 
 from ibapi import comm
+from ibapi.utils import BadMessage
 
 
 logger = logging.getLogger(__name__)
@@ -29,26 +30,25 @@ class EReader(Thread):
     def run(self):
         try:
             logger.debug("EReader thread started")
-            buf = b""
+            frames = comm.FrameBuffer()
             while self.conn.isConnected():
 
-                data = self.conn.recvMsg()
-                logger.debug("reader loop, recvd size %d", len(data))
-                buf += data
+                size = self.conn.recvMsgInto(frames.writable())
+                logger.debug("reader loop, recvd size %d", size)
+                frames.commit(size)
 
-                while len(buf) > 0:
-                    (size, msg, buf) = comm.read_msg(buf)
-                    #logger.debug("resp %s", buf.decode('ascii'))
-                    logger.debug("size:%d msg.size:%d msg:|%s| buf:%s|", size,
-                        len(msg), buf, "|")
+                # messages are handed out as views of the frame buffer
+                for msg in frames.frames():
+                    logger.debug("msg.size:%d", len(msg))
+                    self.msg_queue.put(msg)
 
-                    if msg:
-                        self.msg_queue.put(msg)
-                    else:
-                        logger.debug("more incoming packet(s) are needed ")
-                        break
+                logger.debug("pending size:%d", len(frames))
 
             logger.debug("EReader thread finished")
+        except BadMessage as err:
+            # the stream can't be framed any further
+            logger.error("EReader: %s", err.text)
+            self.conn.disconnect()
         except:
             logger.exception('unhandled exception in EReader thread')
 
@@ -1,18 +1,29 @@
 """Code implementation for `EClient` related stuffs"""
 # pylint: disable=protected-access
+import asyncio
 import datetime
-from typing import Any, List, Union
+import queue
+from typing import (Any, AsyncIterator, Callable, Dict, List, Optional,
+                    Sequence, Union)
 
 from ibapi import client as ib_client
+from ibapi import comm
+from ibapi import common as ib_common
 from ibapi import contract as ib_contract
+from ibapi import errors as ib_errors
 from ibapi import order as ib_order
-from ibapi import wrapper as ib_wrapper
+from ibapi import server_versions
+from ibapi import utils as ib_utils
 
 from ibpy_native import error
+from ibpy_native import models
+from ibpy_native._internal import _columnar
+from ibpy_native._internal import _decoder
 from ibpy_native._internal import _global
+from ibpy_native._internal import _pacing
+from ibpy_native._internal import _transport
 from ibpy_native._internal import _typing
 from ibpy_native._internal import _wrapper
-from ibpy_native.interfaces import listeners
 from ibpy_native.utils import datatype
 from ibpy_native.utils import finishable_queue as fq
 
@@ -23,14 +34,135 @@ class IBClient(ib_client.EClient):
     Args:
         wrapper (:obj:`ibpy_native._internal._wrapper.IBWrapper`): The wrapper
             object to handle messages return from IB Gateway.
+        timeout (:obj:`float`, optional): Default seconds to wait for the
+            response of a request. `None` to wait without limit. Defaults to
+            `60`.
+        pacing (:obj:`ibpy_native._internal._pacing.PacingScheduler`,
+            optional): Scheduler to space out the historical data requests
+            within the pacing limitations of IB. Defaults to `None` to use
+            one with IB's default limitations.
     """
-    def __init__(self, wrapper: _wrapper.IBWrapper):
+    def __init__(self, wrapper: _wrapper.IBWrapper,
+                 timeout: Optional[float]=_global.REQ_TIMEOUT,
+                 pacing: Optional[_pacing.PacingScheduler]=None):
         self._wrapper = wrapper
+        self._timeout = timeout
+        self._pacing = (_pacing.PacingScheduler() if pacing is None
+                        else pacing)
         super().__init__(wrapper)
 
+    @property
+    def timeout(self) -> Optional[float]:
+        """:obj:`float`, optional: Default seconds to wait for the response of
+        a request. `None` if requests wait without limit.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: Optional[float]):
+        self._timeout = value
+
+    @property
+    def pacing(self) -> _pacing.PacingScheduler:
+        """:obj:`ibpy_native._internal._pacing.PacingScheduler`: Scheduler of
+        the historical data requests.
+        """
+        return self._pacing
+
+    #region - Connection
+    def connect(self, host: str, port: int, clientId: int):
+        # pylint: disable=invalid-name
+        """Connects to IB TWS/Gateway.
+
+        Args:
+            host (str): Hostname of IB TWS/Gateway.
+            port (int): Socket port of IB TWS/Gateway.
+            clientId (int): Client ID of the API connection.
+        """
+        super().connect(host, port, clientId)
+
+        if self.decoder is not None:
+            # Messages received are queued until `run` is called, so the
+            # decoder can be swapped before any of them got decoded.
+            self.decoder = _decoder.IBDecoder(self.wrapper,
+                                              self.serverVersion())
+
+    async def connect_async(self, host: str, port: int, client_id: int):
+        """Connects to IB TWS/Gateway with the `asyncio` based transport.
+
+        Messages received are framed, decoded and dispatched to the wrapper
+        directly on the running event loop, in place of the `EReader` thread
+        and the message loop of `run`. Drops of the connection are detected
+        by the transport without polling.
+
+        Args:
+            host (str): Hostname of IB TWS/Gateway.
+            port (int): Socket port of IB TWS/Gateway.
+            client_id (int): Client ID of the API connection.
+
+        Raises:
+            ibpy_native.error.IBError: If the handshake with IB TWS/Gateway is
+                not completed before timeout, or the connection is dropped
+                during the handshake.
+
+        Note:
+            `run` should NOT be called for connection established via this
+            function.
+        """
+        loop = asyncio.get_running_loop()
+        handshake = loop.create_future()
+
+        self.host = host
+        self.port = port
+        self.clientId = client_id
+        self.conn = _transport.AsyncConnection(host=host, port=port)
+        self.decoder = _decoder.IBDecoder(self.wrapper, self.serverVersion())
+
+        try:
+            await self.conn.connect(
+                on_message=lambda msg: self._on_message(msg, handshake),
+                on_lost=lambda: self._on_connection_lost(handshake)
+            )
+        except OSError:
+            self.wrapper.error(ib_common.NO_VALID_ID,
+                               ib_errors.CONNECT_FAIL.code(),
+                               ib_errors.CONNECT_FAIL.msg())
+            self.disconnect()
+            return
+
+        self.setConnState(ib_client.EClient.CONNECTING)
+
+        version = (f"v{server_versions.MIN_CLIENT_VER}"
+                   f"..{server_versions.MAX_CLIENT_VER}")
+        if self.connectionOptions:
+            version += f" {self.connectionOptions}"
+        self.conn.sendMsg(
+            str.encode("API\0", "ascii") + comm.make_msg(version))
+
+        try:
+            server_version, conn_time = await asyncio.wait_for(
+                handshake, timeout=self._timeout)
+        except asyncio.TimeoutError as err:
+            self.disconnect()
+            raise error.IBError(
+                rid=ib_common.NO_VALID_ID,
+                err_code=error.IBErrorCode.REQ_TIMEOUT,
+                err_str="No handshake response from IB TWS/Gateway"
+            ) from err
+
+        self.connTime = conn_time
+        self.serverVersion_ = int(server_version)
+        self.decoder.serverVersion = self.serverVersion()
+        self.setConnState(ib_client.EClient.CONNECTED)
+
+        self.startApi()
+        self.wrapper.connectAck()
+    #endregion - Connection
+
     #region - Contract
     async def resolve_contract(
-        self, req_id: int, contract: ib_contract.Contract
+        self, req_id: int, contract: ib_contract.Contract,
+        timeout: Optional[float]=None
     ) -> ib_contract.Contract:
         """From a partially formed contract, returns a fully fledged version.
 
@@ -38,6 +170,8 @@ class IBClient(ib_client.EClient):
             req_id (int): Request ID (ticker ID in IB API).
             contract (:obj:`ibapi.contract.Contract`): `Contract` object with
                 partially completed info (e.g. symbol, currency, etc...)
+            timeout (:obj:`float`, optional): Seconds to wait for the
+                response. Defaults to `None` to use the client's default.
 
         Returns:
             :obj:`ibapi.contract.Contract`: Fully resolved IB contract.
@@ -46,7 +180,8 @@ class IBClient(ib_client.EClient):
             ibpy_native.error.IBError: If
                 - queue associated with `req_id` is being used by other tasks;
                 - there's any error returned from IB;
-                - no item found in received result.
+                - no item found in received result;
+                - no response received before timeout.
         """
 
         # Make place to store the data that will be returned
@@ -58,10 +193,12 @@ class IBClient(ib_client.EClient):
         self.reqContractDetails(reqId=req_id, contract=contract)
 
         # Run until we get a valid contract(s)
-        res = await f_queue.get()
+        res = await self._wait_for_response(req_id=req_id, f_queue=f_queue,
+                                            timeout=timeout)
 
         if res:
             if f_queue.status is fq.Status.ERROR:
+                self._wrapper.release_req_id(req_id)
                 if isinstance(res[-1], error.IBError):
                     raise res[-1]
 
@@ -77,7 +214,8 @@ class IBClient(ib_client.EClient):
         )
 
     async def resolve_contracts(
-        self, req_id: int, contract: ib_contract.Contract
+        self, req_id: int, contract: ib_contract.Contract,
+        timeout: Optional[float]=None
     ) -> List[ib_contract.ContractDetails]:
         """Search the fully fledged contracts with details from a partially
         formed `ibapi.contract.Contract` object.
@@ -86,6 +224,8 @@ class IBClient(ib_client.EClient):
             req_id (int): Request ID (ticker ID in IB API).
             contract (:obj:`ibapi.contract.Contract`): `Contract` object with
                 partially completed info (e.g. symbol, currency, etc...)
+            timeout (:obj:`float`, optional): Seconds to wait for the
+                response. Defaults to `None` to use the client's default.
 
         Returns:
             :obj:`list` of `ibapi.contract.ContractDetails`: Fully fledged IB
@@ -95,7 +235,8 @@ class IBClient(ib_client.EClient):
             ibpy_native.error.IBError: If
                 - queue associated with `req_id` is being used by other tasks;
                 - there's any error returned from IB;
-                - no item found in received result.
+                - no item found in received result;
+                - no response received before timeout.
         """
         # Prepare queue to store the data that will be returned
         try:
@@ -106,11 +247,13 @@ class IBClient(ib_client.EClient):
         self.reqContractDetails(reqId=req_id, contract=contract)
 
         res: List[Union[ib_contract.ContractDetails, error.IBError]] = (
-            await f_queue.get()
+            await self._wait_for_response(req_id=req_id, f_queue=f_queue,
+                                          timeout=timeout)
         )
 
         if res:
             if f_queue.status is fq.Status.ERROR:
+                self._wrapper.release_req_id(req_id)
                 if isinstance(res[-1], error.IBError):
                     raise res[-1]
 
@@ -123,15 +266,21 @@ class IBClient(ib_client.EClient):
     #endregion - Contract
 
     #region - Orders
-    async def req_next_order_id(self) -> int:
+    async def req_next_order_id(self, timeout: Optional[float]=None) -> int:
         """Request the next valid order ID from IB.
 
+        Args:
+            timeout (:obj:`float`, optional): Seconds to wait for the
+                response. Defaults to `None` to use the client's default.
+
         Returns:
             int: The next valid order ID returned from IB.
 
         Raises:
-            ibpy_native.error.IBError: If queue associated with `req_id` -1 is
-                being used by other task.
+            ibpy_native.error.IBError: If
+                - queue associated with `req_id` -1 is being used by other
+                task;
+                - no response received before timeout.
         """
         try:
             f_queue = self._wrapper.get_request_queue(
@@ -140,21 +289,27 @@ class IBClient(ib_client.EClient):
             raise err
         # Request next valid order ID
         self.reqIds(numIds=-1) # `numIds` has deprecated
-        await f_queue.get()
+        await self._wait_for_response(req_id=_global.IDX_NEXT_ORDER_ID,
+                                      f_queue=f_queue, timeout=timeout)
 
         return self._wrapper.orders_manager.next_order_id
 
-    async def req_open_orders(self):
+    async def req_open_orders(self, timeout: Optional[float]=None):
         """Request all active orders submitted by the client application
         connected with the exact same client ID with which the orders were sent
         to the TWS/Gateway.
 
+        Args:
+            timeout (:obj:`float`, optional): Seconds to wait for the
+                response. Defaults to `None` to use the client's default.
+
         Raises:
             ibpy_native.error.IBError: If
                 - queue destinated for the open orders requests is being used
                 by other on-going task/request;
                 - connection with IB TWS/Gateway is dropped while waiting for
-                the task to finish.
+                the task to finish;
+                - no response received before timeout.
         """
         try:
             queue = self._wrapper.get_request_queue(
@@ -163,7 +318,8 @@ class IBClient(ib_client.EClient):
             raise err
 
         self.reqOpenOrders()
-        result = await queue.get()
+        result = await self._wait_for_response(
+            req_id=_global.IDX_OPEN_ORDERS, f_queue=queue, timeout=timeout)
         if queue.status is fq.Status.ERROR:
             if isinstance(result[-1], error.IBError):
                 raise result[-1]
@@ -214,7 +370,8 @@ class IBClient(ib_client.EClient):
     #region - Historical data
     async def resolve_head_timestamp(
         self, req_id: int, contract: ib_contract.Contract,
-        show: datatype.EarliestDataPoint=datatype.EarliestDataPoint.TRADES
+        show: datatype.EarliestDataPoint=datatype.EarliestDataPoint.TRADES,
+        timeout: Optional[float]=None
     ) -> int:
         """Fetch the earliest available data point for a given instrument
         from IB.
@@ -226,6 +383,8 @@ class IBClient(ib_client.EClient):
             show (:obj:`ibpy_native.utils.datatype.EarliestDataPoint`,
                 optional): Type of data for head timestamp. Defaults to
                 `EarliestDataPoint.TRADES`.
+            timeout (:obj:`float`, optional): Seconds to wait for the
+                response. Defaults to `None` to use the client's default.
 
         Returns:
             int: Unix timestamp of the earliest available datapoint.
@@ -234,16 +393,27 @@ class IBClient(ib_client.EClient):
             ibpy_native.error.IBError: If
                 - queue associated with `req_id` is being used by other tasks;
                 - there's any error returned from IB;
+                - no response received before timeout.
         """
         try:
             f_queue = self._wrapper.get_request_queue(req_id=req_id)
         except error.IBError as err:
             raise err
 
-        self.reqHeadTimeStamp(reqId=req_id, contract=contract,
-                              whatToShow=show.value, useRTH=0, formatDate=2)
+        await self._acquire_pacing(f_queue=f_queue, contract=contract,
+                                   what_to_show=show.value,
+                                   params=("HEAD_TIMESTAMP",))
+        try:
+            self.reqHeadTimeStamp(reqId=req_id, contract=contract,
+                                  whatToShow=show.value, useRTH=0,
+                                  formatDate=2)
 
-        res = await f_queue.get()
+            res = await self._wait_for_response(
+                req_id=req_id, f_queue=f_queue, timeout=timeout,
+                on_timeout=lambda: self.cancelHeadTimeStamp(reqId=req_id)
+            )
+        finally:
+            self._pacing.release()
 
         # Cancel the head time stamp request to release the ID after the
         # request queue is finished
@@ -251,7 +421,9 @@ class IBClient(ib_client.EClient):
 
         if res:
             if f_queue.status is fq.Status.ERROR:
+                self._wrapper.release_req_id(req_id)
                 if isinstance(res[-1], error.IBError):
+                    self._pacing.on_error(res[-1])
                     raise res[-1]
 
                 raise self._unknown_error(req_id=req_id)
@@ -272,7 +444,8 @@ class IBClient(ib_client.EClient):
     async def req_historical_ticks(
         self, req_id: int, contract: ib_contract.Contract,
         start_date_time: datetime.datetime,
-        show: datatype.HistoricalTicks=datatype.HistoricalTicks.TRADES
+        show: datatype.HistoricalTicks=datatype.HistoricalTicks.TRADES,
+        timeout: Optional[float]=None, columnar: bool=False
     ) -> _typing.ResHistoricalTicks:
         """Request historical tick data of the given instrument from IB.
 
@@ -285,19 +458,26 @@ class IBClient(ib_client.EClient):
             show (:obj:`ibpy_native.utils.datatype.HistoricalTicks`, optional):
                 Type of data to be requested. Defaults to
                 `HistoricalTicks.TRADES`.
+            timeout (:obj:`float`, optional): Seconds to wait for the
+                response. Defaults to `None` to use the client's default.
+            columnar (bool, optional): Parses the ticks into a `TickArray` of
+                NumPy arrays instead of objects per tick. Requires `numpy`.
+                Defaults to `False`.
 
         Returns:
             :obj:`ibpy_native._internal._typing.ResHistoricalTicks`: Tick data
-                returned from IB.
+                returned from IB. `TickArray` if `columnar` is `True`.
 
         Raises:
+            ImportError: If `columnar` is `True` but `numpy` is not installed.
             ValueError: If argument `start_date_time` is an aware `datetime`
                 object.
             ibpy_native.error.IBError: If
                 - queue associated with argument `req_id` is being used by other
                 task;
                 - there's any error returned from IB;
-                - Data received from IB is indicated as incomplete.
+                - Data received from IB is indicated as incomplete;
+                - no response received before timeout.
 
         Notes:
             Around 1000 ticks will be returned from IB. Ticks returned will
@@ -307,6 +487,8 @@ class IBClient(ib_client.EClient):
         if start_date_time.tzinfo is not None:
             raise ValueError("Value of argument `start_date_time` must not "
                              "be an aware `datetime` object.")
+        if columnar:
+            _columnar.check_available()
         # Pre-processing
         try:
             f_queue = self._wrapper.get_request_queue(req_id)
@@ -314,20 +496,36 @@ class IBClient(ib_client.EClient):
             raise err
 
         converted_start_time = _global.TZ.localize(start_date_time)
+        self._wrapper.set_columnar(req_id=req_id, columnar=columnar)
 
-        self.reqHistoricalTicks(
-            reqId=req_id, contract=contract,
-            startDateTime=converted_start_time.strftime(_global.TIME_FMT),
-            endDateTime="", numberOfTicks=1000, whatToShow=show.value,
-            useRth=0, ignoreSize=False, miscOptions=[]
-        )
+        start = converted_start_time.strftime(_global.TIME_FMT)
 
-        result: _typing.WrapperResHistoricalTicks = await f_queue.get()
+        await self._acquire_pacing(f_queue=f_queue, contract=contract,
+                                   what_to_show=show.value,
+                                   params=("TICKS", start))
+        try:
+            self.reqHistoricalTicks(
+                reqId=req_id, contract=contract, startDateTime=start,
+                endDateTime="", numberOfTicks=1000, whatToShow=show.value,
+                useRth=0, ignoreSize=False, miscOptions=[]
+            )
+
+            # IB API provides no cancellation for historical ticks request,
+            # the ID of a timed out request is retired so the late response
+            # never reaches another request.
+            result: _typing.WrapperResHistoricalTicks = (
+                await self._wait_for_response(req_id=req_id, f_queue=f_queue,
+                                              timeout=timeout)
+            )
+        finally:
+            self._pacing.release()
 
         if result:
             if f_queue.status is fq.Status.ERROR:
                 # Handle error returned from IB
+                self._wrapper.release_req_id(req_id)
                 if isinstance(result[-1], error.IBError):
+                    self._pacing.on_error(result[-1])
                     raise result[-1]
 
             if not result[1]:
@@ -338,58 +536,294 @@ class IBClient(ib_client.EClient):
                 )
 
             return result[0]
-    #endregion - Historical data
 
-    #region - Stream live tick data
-    async def stream_live_ticks(
+    async def req_historical_bars(
         self, req_id: int, contract: ib_contract.Contract,
-        listener: listeners.LiveTicksListener,
-        tick_type: datatype.LiveTicks=datatype.LiveTicks.LAST
-    ):
-        """Request to stream live tick data.
+        end_date_time: datetime.datetime, duration: str,
+        bar_size: datatype.BarSize=datatype.BarSize.MIN_1,
+        show: datatype.HistoricalBars=datatype.HistoricalBars.TRADES,
+        use_rth: bool=False, timeout: Optional[float]=None
+    ) -> models.BarArray:
+        """Request historical bars of the given instrument from IB.
 
         Args:
             req_id (int): Request ID (ticker ID in IB API).
             contract (:obj:`ibapi.contract.Contract`): `Contract` object with
                 sufficient info to identify the instrument.
-            listener (:obj:`ibpy_native.interfaces.listeners
-                .LiveTicksListener`): Callback listener for receiving ticks,
-                finish signal, and error from IB API.
-            tick_type (:obj:`ibpy_native.utils.datatype.LiveTicks`, optional):
-                Type of tick to be requested. Defaults to `LiveTicks.LAST`.
+            end_date_time (:obj:`datetime.datetime`): Time of the end of the
+                period requested.
+            duration (str): Period to go back from `end_date_time` in IB's
+                format (e.g. `1800 S`, `1 D`, `1 W`, `1 M`, `1 Y`).
+            bar_size (:obj:`ibpy_native.utils.datatype.BarSize`, optional):
+                Size of the bars. Defaults to `BarSize.MIN_1`.
+            show (:obj:`ibpy_native.utils.datatype.HistoricalBars`, optional):
+                Type of data to be requested. Defaults to
+                `HistoricalBars.TRADES`.
+            use_rth (bool, optional): Returns the bars within regular trading
+                hours only. Defaults to `False`.
+            timeout (:obj:`float`, optional): Seconds to wait for the
+                response. Defaults to `None` to use the client's default.
+
+        Returns:
+            :obj:`ibpy_native.models.BarArray`: Bars returned from IB. Empty if
+                IB has no data for the period.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If argument `end_date_time` is an aware `datetime`
+                object.
+            ibpy_native.error.IBError: If
+                - queue associated with argument `req_id` is being used by other
+                task;
+                - there's any error returned from IB;
+                - no response received before timeout.
+        """
+        # Error checking
+        if end_date_time.tzinfo is not None:
+            raise ValueError("Value of argument `end_date_time` must not be "
+                             "an aware `datetime` object.")
+        _columnar.check_available()
+        # Pre-processing
+        try:
+            f_queue = self._wrapper.get_request_queue(req_id)
+        except error.IBError as err:
+            raise err
+
+        end = _global.TZ.localize(end_date_time).strftime(_global.TIME_FMT)
+
+        await self._acquire_pacing(
+            f_queue=f_queue, contract=contract, what_to_show=show.value,
+            params=("BARS", end, duration, bar_size.value, use_rth)
+        )
+        try:
+            self.reqHistoricalData(
+                reqId=req_id, contract=contract, endDateTime=end,
+                durationStr=duration, barSizeSetting=bar_size.value,
+                whatToShow=show.value, useRTH=int(use_rth), formatDate=2,
+                keepUpToDate=False, chartOptions=[]
+            )
+
+            res = await self._wait_for_response(
+                req_id=req_id, f_queue=f_queue, timeout=timeout,
+                on_timeout=lambda: self.cancelHistoricalData(reqId=req_id)
+            )
+        finally:
+            self._pacing.release()
+
+        if f_queue.status is fq.Status.ERROR:
+            self._wrapper.release_req_id(req_id)
+            if isinstance(res[-1], error.IBError):
+                if self._is_no_data(err=res[-1]):
+                    return models.BarArray()
+
+                self._pacing.on_error(res[-1])
+                raise res[-1]
+
+            raise self._unknown_error(req_id=req_id)
+
+        return models.BarArray.from_objects(bars=res, tz=_global.TZ)
+    #endregion - Historical data
+
+    #region - Market data
+    def req_quote(self, req_id: int, contract: ib_contract.Contract,
+                  table: models.QuoteTable, row: int, generic_ticks: str=""):
+        """Request to stream the top of book market data of the contract into
+        a row of the quote table.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            table (:obj:`ibpy_native.models.QuoteTable`): Table to keep the
+                quotes.
+            row (int): Index of the row allocated for the request.
+            generic_ticks (str, optional): Comma separated IDs of the generic
+                ticks to be requested in addition. Defaults to `""`.
 
         Raises:
             ibpy_native.error.IBError: If queue associated with `req_id` is
                 being used by other tasks.
+        """
+        try:
+            self._wrapper.get_request_queue(req_id)
+        except error.IBError as err:
+            raise err
 
-        Note:
-            The value `ibpy_native.utils.datatype.LiveTicks.ALL_LAST` of
-            argument `tick_type` has additional trade types such as combos,
-            derivatives, and average price trades which are not included in
-            `ibpy_native.utils.datatype.LiveTicks.LAST`.
-            Also, this function depends on `live_ticks_listener` to return
-            live ticks received. The listener should be set explicitly.
+        self._wrapper.set_quote_row(req_id=req_id, table=table, row=row)
+        self.reqMktData(reqId=req_id, contract=contract,
+                        genericTickList=generic_ticks, snapshot=False,
+                        regulatorySnapshot=False, mktDataOptions=[])
+
+    def cancel_quote(self, req_id: int):
+        """Stop the market data stream of the quote requested.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+
+        Raises:
+            ibpy_native.error.IBError: If there's no `FinishableQueue` object
+                associated with the specified `req_id` found in the internal
+                `IBWrapper` object.
+        """
+        f_queue = self._wrapper.get_request_queue_no_throw(req_id=req_id)
+
+        if f_queue is not None:
+            self.cancelMktData(reqId=req_id)
+            self._wrapper.set_quote_row(req_id=req_id, table=None)
+            f_queue.finish() # Releases the request ID
+        else:
+            raise error.IBError(
+                rid=req_id, err_code=error.IBErrorCode.RES_NOT_FOUND,
+                err_str=f"Task associated with request ID {req_id} not found"
+            )
+
+    def req_order_book(self, req_id: int, contract: ib_contract.Contract,
+                       book: models.OrderBook, smart_depth: bool=False):
+        """Request to stream the market depth of the contract into the order
+        book.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            book (:obj:`ibpy_native.models.OrderBook`): Book to apply the
+                market depth to. Its' `num_rows` levels are requested.
+            smart_depth (bool, optional): Aggregates the depth of the
+                exchanges via SMART. Defaults to `False`.
+
+        Raises:
+            ibpy_native.error.IBError: If queue associated with `req_id` is
+                being used by other tasks.
         """
         try:
-            f_queue = self._wrapper.get_request_queue(req_id)
+            self._wrapper.get_request_queue(req_id)
         except error.IBError as err:
             raise err
 
-        self.reqTickByTickData(
-            reqId=req_id, contract=contract, tickType=tick_type.value,
-            numberOfTicks=0, ignoreSize=True
-        )
+        self._wrapper.set_order_book(req_id=req_id, book=book)
+        self.reqMktDepth(reqId=req_id, contract=contract,
+                         numRows=book.num_rows, isSmartDepth=smart_depth,
+                         mktDepthOptions=[])
+
+    def cancel_order_book(self, req_id: int, smart_depth: bool=False):
+        """Stop the market depth stream of the order book requested.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            smart_depth (bool, optional): If the depth was requested via
+                SMART. Defaults to `False`.
+
+        Raises:
+            ibpy_native.error.IBError: If there's no `FinishableQueue` object
+                associated with the specified `req_id` found in the internal
+                `IBWrapper` object.
+        """
+        f_queue = self._wrapper.get_request_queue_no_throw(req_id=req_id)
+
+        if f_queue is not None:
+            self.cancelMktDepth(reqId=req_id, isSmartDepth=smart_depth)
+            self._wrapper.set_order_book(req_id=req_id, book=None)
+            f_queue.finish() # Releases the request ID
+        else:
+            raise error.IBError(
+                rid=req_id, err_code=error.IBErrorCode.RES_NOT_FOUND,
+                err_str=f"Task associated with request ID {req_id} not found"
+            )
 
-        async for elm in f_queue.stream():
-            if isinstance(elm, (ib_wrapper.HistoricalTick,
-                                ib_wrapper.HistoricalTickLast,
-                                ib_wrapper.HistoricalTickBidAsk,)):
-                listener.on_tick_receive(req_id=req_id, tick=elm)
-            elif isinstance(elm, error.IBError):
-                listener.on_err(err=elm)
-            elif elm is fq.Status.FINISHED:
-                listener.on_finish(req_id=req_id)
+    async def realtime_bars(
+        self, req_ids: Sequence[int],
+        contracts: Sequence[ib_contract.Contract],
+        buffers: Sequence[models.BarBuffer],
+        show: datatype.HistoricalBars=datatype.HistoricalBars.TRADES,
+        use_rth: bool=False, max_wait: float=0
+    ) -> AsyncIterator[Dict[int, Union[models.BarArray, error.IBError]]]:
+        """Streams the 5 seconds real-time bars of the contracts, which are
+        appended into the buffers as soon as they're received.
+
+        Errors returned for a contract are yielded as the entry of the
+        contract, while the other contracts keep streaming. The subscriptions
+        are cancelled on IB side once the iterator is closed.
+
+        Args:
+            req_ids (:obj:`Sequence[int]`): Request IDs (ticker IDs in IB API)
+                for the contracts.
+            contracts (:obj:`Sequence[ibapi.contract.Contract]`): `Contract`
+                objects with sufficient info to identify the instruments.
+            buffers (:obj:`Sequence[ibpy_native.models.BarBuffer]`): Buffer
+                to append the bars of each contract to.
+            show (:obj:`ibpy_native.utils.datatype.HistoricalBars`, optional):
+                Type of data, one of `TRADES`, `MIDPOINT`, `BID` or `ASK`.
+                Defaults to `HistoricalBars.TRADES`.
+            use_rth (bool, optional): Returns bars within regular trading
+                hours only. Defaults to `False`.
+            max_wait (float, optional): Seconds to wait for the bars of other
+                contracts before yielding. Defaults to `0`.
+
+        Yields:
+            :obj:`Dict[int, Union[BarArray, IBError]]`: Bars received since
+                the last yield, viewing the buffers, or the error returned
+                from IB, keyed by the index of the contracts.
 
+        Raises:
+            ibpy_native.error.IBError: If queue associated with any of the
+                `req_ids` is being used by other tasks, or the connection is
+                dropped.
+        """
+        notify = fq.FinishableQueue(queue_to_finish=queue.Queue())
+        # Number of bars yielded per contract
+        yielded = [len(buffer) for buffer in buffers]
+        # Queues of the requests, which are finished to release the IDs once
+        # the iterator is closed
+        f_queues: List[fq.FinishableQueue] = []
+        sent = 0
+        try:
+            for req_id in req_ids:
+                f_queues.append(self._wrapper.get_request_queue(req_id))
+
+            for key, (req_id, contract) in enumerate(zip(req_ids, contracts)):
+                self._wrapper.set_bar_buffer(req_id=req_id,
+                                             buffer=buffers[key],
+                                             notify=notify, key=key)
+                self.reqRealTimeBars(reqId=req_id, contract=contract,
+                                     barSize=5, whatToShow=show.value,
+                                     useRTH=use_rth, realTimeBarsOptions=[])
+                sent += 1
+
+            batches = notify.stream_batches(max_wait=max_wait)
+            try:
+                async for batch in batches:
+                    updates = {}
+                    for key in dict.fromkeys(elm for elm in batch
+                                             if isinstance(elm, int)):
+                        end = len(buffers[key])
+                        updates[key] = buffers[key].to_array(
+                            start=yielded[key], end=end)
+                        yielded[key] = end
+                    if updates:
+                        yield updates
+
+                    # Errors of the contracts, `(key, err)`
+                    errs = dict(elm for elm in batch
+                                if isinstance(elm, tuple))
+                    if errs:
+                        yield errs
+
+                    # Error terminating the stream can only be the last
+                    # element of a batch
+                    if isinstance(batch[-1], error.IBError):
+                        raise batch[-1]
+            finally:
+                await batches.aclose()
+        finally:
+            for idx, f_queue in enumerate(f_queues):
+                if idx < sent:
+                    self.cancelRealTimeBars(reqId=req_ids[idx])
+                self._wrapper.set_bar_buffer(req_id=req_ids[idx],
+                                             buffer=None)
+                f_queue.finish() # Releases the request ID
+    #endregion - Market data
+
+    #region - Stream live tick data
     def cancel_live_ticks_stream(self, req_id: int):
         """Stop the live tick data stream that's currently streaming.
 
@@ -414,6 +848,147 @@ class IBClient(ib_client.EClient):
     #endregion - Stream live tick data
 
     #region - Private functions
+    def _on_connection_lost(self, handshake: asyncio.Future):
+        """Handles the connection dropped while using the `asyncio` based
+        transport.
+        """
+        if not handshake.done():
+            handshake.set_exception(error.IBError(
+                rid=ib_common.NO_VALID_ID,
+                err_code=error.IBErrorCode.NOT_CONNECTED,
+                err_str=_global.MSG_NOT_CONNECTED
+            ))
+
+        self.disconnect()
+
+    def _on_message(self, msg: memoryview, handshake: asyncio.Future):
+        """Decodes & dispatches a message received via the `asyncio` based
+        transport.
+
+        Args:
+            msg (memoryview): Message payload without the length prefix.
+            handshake (:obj:`asyncio.Future`): Future to be set with the
+                server version & connection time once received.
+        """
+        if len(msg) > ib_common.MAX_MSG_LEN:
+            self.wrapper.error(ib_common.NO_VALID_ID,
+                               ib_errors.BAD_LENGTH.code(),
+                               f"{ib_errors.BAD_LENGTH.msg()}:{len(msg)}")
+            self.disconnect()
+            return
+
+        fields = comm.read_fields(msg)
+
+        # Messages (e.g. news) may arrive before the server version
+        if not handshake.done() and len(fields) == 2:
+            handshake.set_result(fields)
+            return
+
+        try:
+            self.decoder.interpret(fields)
+        except ib_utils.BadMessage:
+            self.disconnect()
+        except Exception as err: # pylint: disable=broad-except
+            # Keeps the connection alive on errors raised by the callbacks
+            asyncio.get_event_loop().call_exception_handler({
+                "message": "Exception raised while handling message from IB",
+                "exception": err,
+            })
+
+    async def _acquire_pacing(self, f_queue: fq.FinishableQueue,
+                              contract: ib_contract.Contract,
+                              what_to_show: str, params: tuple=()):
+        """Waits until the historical data request can be sent within the
+        pacing limitations. `self._pacing.release` must be called once the
+        request is finished.
+
+        The queue is marked as finished if the awaiting task is cancelled, so
+        the request ID can be reused.
+
+        Args:
+            f_queue (:obj:`ibpy_native.utils.finishable_queue
+                .FinishableQueue`): Queue associated with the request.
+            contract (:obj:`ibapi.contract.Contract`): Contract requested.
+            what_to_show (str): Type of data requested.
+            params (tuple, optional): Other parameters to identify identical
+                requests. Defaults to `()`.
+        """
+        key = _pacing.pacing_key(contract=contract, what_to_show=what_to_show)
+
+        try:
+            await self._pacing.acquire(contract_key=key,
+                                       request_key=key + params)
+        except asyncio.CancelledError:
+            f_queue.finish()
+            raise
+
+    async def _wait_for_response(
+        self, req_id: int, f_queue: fq.FinishableQueue,
+        timeout: Optional[float]=None,
+        on_timeout: Optional[Callable[[], None]]=None
+    ) -> list:
+        """Awaits the elements of a request from its' `FinishableQueue` with
+        timeout applied.
+
+        Once timed out or the awaiting task is cancelled, the request is
+        cancelled via `on_timeout` if IB provides the way, and the queue is
+        marked as finished so the request ID can be reused. Requests without
+        `on_timeout` may still be responded by IB, so their IDs are retired
+        instead of being reused.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            f_queue (:obj:`ibpy_native.utils.finishable_queue
+                .FinishableQueue`): Queue associated with the request.
+            timeout (:obj:`float`, optional): Seconds to wait for the
+                response. Defaults to `None` to use the client's default.
+            on_timeout (:obj:`Callable[[], None]`, optional): Callback to
+                cancel the request on IB side. Defaults to `None`.
+
+        Returns:
+            list: The list of element(s) returned from the queue.
+
+        Raises:
+            ibpy_native.error.IBError: If no response received before timeout.
+        """
+        if timeout is None:
+            timeout = self._timeout
+
+        try:
+            return await asyncio.wait_for(f_queue.get(), timeout=timeout)
+        except asyncio.TimeoutError as err:
+            self._abandon_request(req_id=req_id, f_queue=f_queue,
+                                  on_timeout=on_timeout)
+
+            raise error.IBError(
+                rid=req_id, err_code=error.IBErrorCode.REQ_TIMEOUT,
+                err_str=f"Request timed out after {timeout} seconds"
+            ) from err
+        except asyncio.CancelledError:
+            self._abandon_request(req_id=req_id, f_queue=f_queue,
+                                  on_timeout=on_timeout)
+
+            raise
+
+    def _abandon_request(self, req_id: int, f_queue: fq.FinishableQueue,
+                         on_timeout: Optional[Callable[[], None]]):
+        """Stops awaiting the request, which is cancelled on IB side via
+        `on_timeout`, or has its ID retired if it can't be cancelled.
+        """
+        if on_timeout is not None:
+            on_timeout()
+            f_queue.finish() # Releases the ID for reuse
+        else:
+            self._wrapper.release_req_id(req_id=req_id, reusable=False)
+
+    @staticmethod
+    def _is_no_data(err: error.IBError) -> bool:
+        """Checks if the error returned from IB indicates there's no data
+        for the period requested.
+        """
+        return (err.err_code == error.IBErrorCode.HISTORICAL_DATA_SERVICE and
+                "no data" in err.err_str.lower())
+
     def _unknown_error(self, req_id: int, extra: Any = None):
         """Constructs `IBError` with error code `UNKNOWN`
 
@@ -0,0 +1,98 @@
+"""Columnar decoding of the historical ticks messages into NumPy arrays.
+
+`numpy` is an optional dependency, required only if the columnar mode is
+used. Install it via `pip install ibpy-native[numpy]`.
+"""
+from typing import Any, Sequence, Tuple
+
+from ibapi import message
+
+from ibpy_native.models import tick_array
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+# Field names of the columns in the order they're sent by IB, per message ID.
+# `None` marks the field to be skipped.
+_COLUMNS = {
+    # time, (unused), price, size
+    message.IN.HISTORICAL_TICKS: ("time", None, "price", "size"),
+    # time, attribute bitmask (askPastHigh, bidPastLow), bid & ask
+    message.IN.HISTORICAL_TICKS_BID_ASK: (
+        "time", "mask", "priceBid", "priceAsk", "sizeBid", "sizeAsk"),
+    # time, attribute bitmask (pastLimit, unreported), trade
+    message.IN.HISTORICAL_TICKS_LAST: (
+        "time", "mask", "price", "size", "exchange", "specialConditions"),
+}
+
+# IDs of the messages can be parsed in columnar mode
+MSG_IDS: Tuple[int, ...] = tuple(_COLUMNS)
+
+_TYPES = {
+    "time": "i8",
+    "mask": "u1",
+    "price": "f8",
+    "size": "i8",
+    "priceBid": "f8",
+    "priceAsk": "f8",
+    "sizeBid": "i8",
+    "sizeAsk": "i8",
+    "exchange": "U",
+    "specialConditions": "U",
+}
+
+def check_available():
+    """Checks if the columnar mode can be used.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+    """
+    if np is None:
+        raise ImportError("Columnar mode requires `numpy`. Install it via "
+                          "`pip install ibpy-native[numpy]`.")
+
+def parse_historical_ticks(fields: Sequence[bytes]) -> Tuple[int, Any, bool]:
+    """Parses the fields of a `HISTORICAL_TICKS`, `HISTORICAL_TICKS_BID_ASK`,
+    or `HISTORICAL_TICKS_LAST` message into a `TickArray` of NumPy arrays,
+    without creating any object per tick.
+
+    Args:
+        fields (:obj:`Sequence[bytes]`): All fields of the message, including
+            the message ID.
+
+    Returns:
+        :obj:`Tuple[int, ibpy_native.models.TickArray, bool]`: The request
+            ID, the ticks, and the flag indicates if all ticks of the request
+            are received.
+    """
+    columns = _COLUMNS[int(fields[0])]
+    req_id = int(fields[1])
+    count = int(fields[2])
+    width = len(columns)
+    end = 3 + count * width
+
+    arrays = {}
+    for idx, name in enumerate(columns):
+        if name is not None:
+            # Fields of a column are strided by the number of columns
+            arrays[name] = _convert(fields[3 + idx:end:width], _TYPES[name])
+
+    ticks = tick_array.TickArray(columns=arrays)
+    done = bool(int(fields[end] or 0))
+
+    return (req_id, ticks, done)
+
+def _convert(column: Sequence[bytes], dtype: str) -> Any:
+    """Converts a column of raw fields into the target type."""
+    if dtype == "U":
+        # Same as `ibapi.utils.decode` does for `str`
+        return np.char.decode(np.array(column, dtype=bytes), "utf-8",
+                              "backslashreplace")
+
+    try:
+        return np.array(column, dtype=dtype)
+    except ValueError:
+        # Empty fields are decoded as `0` as `ibapi.utils.decode` does
+        return np.array([field or b"0" for field in column], dtype=dtype)
@@ -0,0 +1,40 @@
+"""Code implementation of the customised `Decoder`."""
+from typing import Callable, Optional
+
+from ibapi import decoder
+
+from ibpy_native._internal import _columnar
+
+class IBDecoder(decoder.Decoder):
+    """`Decoder` parses the historical ticks messages of the requests marked
+    as columnar in `IBWrapper` into NumPy arrays, instead of creating objects
+    for every tick.
+
+    Args:
+        wrapper (:obj:`ibpy_native._internal._wrapper.IBWrapper`): The wrapper
+            object to handle messages return from IB Gateway.
+        serverVersion (int): Version of the connected IB TWS/Gateway.
+    """
+    def buildDecoders(self):
+        super().buildDecoders()
+
+        for msg_id in _columnar.MSG_IDS:
+            self.msgId2decoder[msg_id] = self._make_columnar_decoder(
+                default=self.msgId2decoder.get(msg_id))
+
+    #region - Private functions
+    def _make_columnar_decoder(
+        self, default: Optional[Callable[[tuple], None]]
+    ) -> Callable[[tuple], None]:
+        """Wraps the default decode function of a historical ticks message to
+        parse it in columnar mode if it's requested so.
+        """
+        def decode_msg(fields: tuple):
+            if self.wrapper.is_columnar(req_id=int(fields[1])):
+                req_id, ticks, done = _columnar.parse_historical_ticks(fields)
+                self.wrapper.historicalTicksColumnar(req_id, ticks, done)
+            elif default is not None:
+                default(fields)
+
+        return decode_msg
+    #endregion - Private functions
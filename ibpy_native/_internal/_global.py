@@ -9,6 +9,9 @@ TIME_FMT: Final[str] = "%Y%m%d %H:%M:%S"
 # Timezone to match the one set in IB Gateway/TWS at login
 TZ: datetime.tzinfo = pytz.timezone("America/New_York")
 
+# Default seconds to wait for the response of a request
+REQ_TIMEOUT: Final[float] = 60
+
 IDX_NEXT_ORDER_ID: Final[int] = -1
 IDX_OPEN_ORDERS: Final[int] = -2
 
@@ -0,0 +1,259 @@
+"""Code implementation of the live ticks subscriptions shared across
+consumers.
+"""
+import asyncio
+import itertools
+import queue
+from typing import Any, Dict, Hashable, List, Optional, Union
+
+from ibapi import contract as ib_contract
+from ibapi import wrapper as ib_wrapper
+
+from ibpy_native import error
+from ibpy_native import models
+from ibpy_native._internal import _client
+from ibpy_native._internal import _pacing
+from ibpy_native._internal import _wrapper
+from ibpy_native.utils import datatype
+from ibpy_native.utils import finishable_queue as fq
+
+class LiveTicksHub():
+    """Shares the tick-by-tick data subscriptions with IB across consumers.
+
+    Consumers of the same contract & `LiveTicks` type share a single
+    subscription, which ticks are decoded once and fanned out to the queue of
+    each consumer by the wrapper, on the thread receiving them from IB. The
+    subscription is reference-counted, and cancelled on IB side once the last
+    consumer leaves.
+
+    Args:
+        client (:obj:`ibpy_native._internal._client.IBClient`): Client to
+            request the subscriptions.
+        wrapper (:obj:`ibpy_native._internal._wrapper.IBWrapper`): Wrapper
+            to allocate the request IDs.
+    """
+    def __init__(self, client: _client.IBClient, wrapper: _wrapper.IBWrapper):
+        self._client = client
+        self._wrapper = wrapper
+        self._stream_ids = itertools.count(1)
+        self._subscriptions: Dict[Hashable, _Subscription] = {}
+        # Stream ID -> subscription consumed
+        self._streams: Dict[int, _Subscription] = {}
+
+    @property
+    def subscriptions(self) -> int:
+        """int: Number of subscriptions with IB."""
+        return len(self._subscriptions)
+
+    def subscribe(
+        self, contract: ib_contract.Contract, tick_type: datatype.LiveTicks,
+        max_pending: int=0,
+        overflow: datatype.OverflowPolicy=datatype.OverflowPolicy.BLOCK,
+        buffer_size: int=0
+    ) -> int:
+        """Adds a consumer to the subscription of the contract & tick type,
+        which is requested from IB if it's the 1st consumer.
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            tick_type (:obj:`ibpy_native.utils.datatype.LiveTicks`): Type of
+                ticks.
+            max_pending (int, optional): Max number of ticks received but not
+                yet consumed by this consumer. `0` for unlimited. Defaults to
+                `0`.
+            overflow (:obj:`ibpy_native.utils.datatype.OverflowPolicy`,
+                optional): Policy to apply on ticks arrive while there are
+                already `max_pending` ticks pending. Defaults to
+                `OverflowPolicy.BLOCK`.
+            buffer_size (int, optional): Capacity of the ring buffer to keep
+                the recent ticks of the subscription, if it has no buffer
+                yet. `0` for no buffer. Defaults to `0`.
+
+        Returns:
+            int: Stream ID of the consumer.
+
+        Raises:
+            ImportError: If `buffer_size` is set but `numpy` is not
+                installed.
+        """
+        key = _pacing.pacing_key(contract=contract,
+                                 what_to_show=tick_type.value)
+        subscription = self._subscriptions.get(key)
+        requested = subscription is not None
+        if not requested:
+            subscription = _Subscription(
+                key=key, req_id=self._wrapper.allocate_req_id())
+        if buffer_size > 0 and subscription.buffer is None:
+            subscription.buffer = models.TickRingBuffer(
+                capacity=buffer_size,
+                bid_ask=tick_type is datatype.LiveTicks.BID_ASK
+            )
+            self._wrapper.set_tick_buffer(req_id=subscription.req_id,
+                                          buffer=subscription.buffer)
+
+        stream_id = next(self._stream_ids)
+        consumer = fq.FinishableQueue(queue_to_finish=queue.Queue())
+        consumer.set_bound(maxsize=max_pending, overflow=overflow)
+        subscription.consumers[stream_id] = consumer
+        self._streams[stream_id] = subscription
+
+        if not requested:
+            # Requested right away with the consumer in place, so it can be
+            # stopped as soon as this function returns
+            self._request(subscription=subscription, contract=contract,
+                          tick_type=tick_type)
+
+        return stream_id
+
+    def has_stream(self, stream_id: int) -> bool:
+        """Checks if the consumer is still subscribed.
+
+        Args:
+            stream_id (int): Stream ID of the consumer.
+
+        Returns:
+            bool: `True` if the consumer is subscribed.
+        """
+        return stream_id in self._streams
+
+    def get_queue(self, stream_id: int) -> fq.FinishableQueue:
+        """Returns the queue of ticks delivered to the consumer.
+
+        Args:
+            stream_id (int): Stream ID of the consumer.
+
+        Returns:
+            :obj:`ibpy_native.utils.finishable_queue.FinishableQueue`: The
+                queue.
+
+        Raises:
+            ibpy_native.error.IBError: If the stream ID has no consumer
+                associated with.
+        """
+        return self._get_subscription(stream_id).consumers[stream_id]
+
+    def get_buffer(self, stream_id: int) -> Optional[models.TickRingBuffer]:
+        """Returns the ring buffer of the recent ticks of the subscription
+        consumed.
+
+        Args:
+            stream_id (int): Stream ID of the consumer.
+
+        Returns:
+            :obj:`ibpy_native.models.TickRingBuffer`, optional: The buffer
+                shared by the consumers of the subscription. `None` if none
+                of them requested a buffer.
+
+        Raises:
+            ibpy_native.error.IBError: If the stream ID has no consumer
+                associated with.
+        """
+        return self._get_subscription(stream_id).buffer
+
+    def unsubscribe(self, stream_id: int):
+        """Removes the consumer from its subscription, with the `FINISHED`
+        signal sent to its queue. The subscription is cancelled on IB side if
+        it's the last consumer.
+
+        Args:
+            stream_id (int): Stream ID of the consumer.
+
+        Raises:
+            ibpy_native.error.IBError: If the stream ID has no consumer
+                associated with.
+        """
+        subscription = self._get_subscription(stream_id)
+        del self._streams[stream_id]
+        # The signal also releases the thread blocked on the bound of the
+        # consumer, while the listener still receives it
+        subscription.consumers.pop(stream_id).put(fq.Status.FINISHED)
+
+        if not subscription.consumers:
+            del self._subscriptions[subscription.key]
+            self._wrapper.set_tick_buffer(req_id=subscription.req_id,
+                                          buffer=None)
+            # Ends the fan out task with the `FINISHED` signal
+            self._client.cancel_live_ticks_stream(req_id=subscription.req_id)
+
+    #region - Private functions
+    def _get_subscription(self, stream_id: int) -> "_Subscription":
+        subscription = self._streams.get(stream_id)
+        if subscription is None:
+            raise error.IBError(
+                rid=stream_id, err_code=error.IBErrorCode.RES_NOT_FOUND,
+                err_str=f"Stream with ID {stream_id} not found"
+            )
+
+        return subscription
+
+    def _request(self, subscription: "_Subscription",
+                 contract: ib_contract.Contract,
+                 tick_type: datatype.LiveTicks):
+        """Requests the subscription from IB, with the ticks fanned out to
+        the consumers by the wrapper.
+        """
+        f_queue = self._wrapper.get_request_queue(req_id=subscription.req_id)
+        self._subscriptions[subscription.key] = subscription
+        self._wrapper.set_tick_consumers(req_id=subscription.req_id,
+                                         consumers=subscription.consumers)
+        self._client.reqTickByTickData(
+            reqId=subscription.req_id, contract=contract,
+            tickType=tick_type.value, numberOfTicks=0, ignoreSize=True
+        )
+        subscription.task = asyncio.ensure_future(
+            self._watch(subscription=subscription, f_queue=f_queue))
+
+    async def _watch(self, subscription: "_Subscription",
+                     f_queue: fq.FinishableQueue):
+        """Awaits the subscription until it's finished or terminated by
+        error, then notifies all its' consumers.
+        """
+        signal = fq.Status.FINISHED
+        try:
+            async for element in f_queue.stream():
+                # Ticks only arrive here after the consumers are removed
+                if isinstance(element, error.IBError):
+                    signal = element
+        finally:
+            # Also ends the consumers if the task is cancelled
+            self._close(subscription=subscription, f_queue=f_queue,
+                        signal=signal)
+
+    def _close(self, subscription: "_Subscription",
+               f_queue: fq.FinishableQueue,
+               signal: Union[fq.Status, error.IBError]):
+        if self._subscriptions.get(subscription.key) is subscription:
+            del self._subscriptions[subscription.key]
+        self._wrapper.set_tick_buffer(req_id=subscription.req_id,
+                                      buffer=None)
+        self._wrapper.set_tick_consumers(req_id=subscription.req_id,
+                                         consumers=None)
+        if not f_queue.finished:
+            # Terminated by error or cancelled
+            self._client.cancelTickByTickData(reqId=subscription.req_id)
+            f_queue.finish() # Releases the request ID
+
+        for stream_id, consumer in subscription.consumers.items():
+            self._streams.pop(stream_id, None)
+            consumer.put(element=signal)
+        subscription.consumers.clear()
+    #endregion - Private functions
+
+class _Subscription():
+    """Subscription with IB shared by the consumers."""
+    def __init__(self, key: Hashable, req_id: int):
+        self.key = key
+        self.req_id = req_id
+        self.consumers: Dict[int, fq.FinishableQueue] = {}
+        self.buffer: Optional[models.TickRingBuffer] = None
+        self.task: Optional[asyncio.Future] = None
+
+def ticks_of(batch: List[Any]) -> List[Any]:
+    """Returns the ticks in a batch streamed from the queue of a consumer,
+    without the finish signal or error.
+    """
+    return [elm for elm in batch
+            if isinstance(elm, (ib_wrapper.HistoricalTick,
+                                ib_wrapper.HistoricalTickLast,
+                                ib_wrapper.HistoricalTickBidAsk,))]
@@ -0,0 +1,218 @@
+"""Code implementation of the pacing of historical data requests."""
+import asyncio
+import collections
+import time
+from typing import Deque, Dict, Hashable, List, Tuple
+
+from ibapi import contract as ib_contract
+
+from ibpy_native import error
+from ibpy_native.utils import datatype
+
+class PacingScheduler():
+    """Spaces out the historical data requests to stay within the pacing
+    limitations of IB, tracked in sliding windows:
+        - no identical requests within `identical_window` seconds;
+        - no more than `max_per_contract` requests of the same contract,
+        exchange & data type within `contract_window` seconds;
+        - no more than `max_requests` requests within `window` seconds;
+        - no more than `max_active` requests awaiting response at once.
+
+    Requests exceeding any budget are queued until the earliest time they can
+    be sent without violation. All requests are held for `cooldown` seconds
+    once IB reports a pacing violation.
+
+    Args:
+        max_requests (int, optional): Max number of requests within `window`.
+            Defaults to `60`.
+        window (float, optional): Seconds of the window for `max_requests`.
+            Defaults to `600`.
+        max_per_contract (int, optional): Max number of requests of the same
+            contract, exchange & data type within `contract_window`. Defaults
+            to `5`.
+        contract_window (float, optional): Seconds of the window for
+            `max_per_contract`. Defaults to `2`.
+        identical_window (float, optional): Seconds to wait before sending an
+            identical request again. Defaults to `15`.
+        max_active (int, optional): Max number of requests awaiting response
+            at once. Defaults to `50`.
+        cooldown (float, optional): Seconds to hold all requests after a
+            pacing violation. Defaults to `60`.
+    """
+    def __init__(self, max_requests: int=60, window: float=600,
+                 max_per_contract: int=5, contract_window: float=2,
+                 identical_window: float=15, max_active: int=50,
+                 cooldown: float=60):
+        self._max_requests = max_requests
+        self._window = window
+        self._max_per_contract = max_per_contract
+        self._contract_window = contract_window
+        self._identical_window = identical_window
+        self._max_active = max_active
+        self._cooldown = cooldown
+
+        # Time of the requests sent within `window`
+        self._sent: Deque[float] = collections.deque()
+        # Contract key -> time of the requests sent within `contract_window`
+        self._contract_sent: Dict[Hashable, Deque[float]] = {}
+        # Request key -> time sent, within `identical_window`
+        self._identical: Dict[Hashable, float] = {}
+        self._identical_order: Deque[Tuple[float, Hashable]] = (
+            collections.deque())
+
+        self._active = 0
+        self._waiting = 0
+        self._violations = 0
+        self._resume_time = 0.0
+        self._waiters: List[asyncio.Future] = []
+
+    @property
+    def metrics(self) -> datatype.PacingMetrics:
+        """:obj:`ibpy_native.utils.datatype.PacingMetrics`: Current usage of
+        the pacing budgets.
+        """
+        now = time.monotonic()
+        self._prune(now)
+
+        return datatype.PacingMetrics(
+            requests=len(self._sent), max_requests=self._max_requests,
+            active=self._active, max_active=self._max_active,
+            waiting=self._waiting, violations=self._violations,
+            cooldown=max(self._resume_time - now, 0)
+        )
+
+    async def acquire(self, contract_key: Hashable, request_key: Hashable):
+        """Waits until the request can be sent without violating the pacing
+        limitations, and records it as sent. `release` must be called once
+        the request is finished.
+
+        Args:
+            contract_key (:obj:`Hashable`): Key of the contract, exchange &
+                data type requested. Generated via `pacing_key`.
+            request_key (:obj:`Hashable`): Key to identify identical requests.
+        """
+        self._waiting += 1
+        try:
+            while True:
+                now = time.monotonic()
+                self._prune(now)
+                delay = self._delay(now, contract_key, request_key)
+                if delay <= 0 and self._active < self._max_active:
+                    break
+
+                # Wakes up once the budgets allow, or a slot of the active
+                # requests is released
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+                try:
+                    await asyncio.wait_for(
+                        waiter, timeout=delay if delay > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+        finally:
+            self._waiting -= 1
+
+        self._sent.append(now)
+        self._contract_sent.setdefault(
+            contract_key, collections.deque()).append(now)
+        self._identical[request_key] = now
+        self._identical_order.append((now, request_key))
+        self._active += 1
+
+    def release(self):
+        """Marks a request acquired as finished, so the next request queued
+        can be sent.
+        """
+        self._active = max(self._active - 1, 0)
+
+        waiters = self._waiters
+        self._waiters = []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def on_error(self, err: error.IBError):
+        """Holds all requests for `cooldown` seconds if the error returned
+        from IB is a pacing violation.
+
+        Args:
+            err (:obj:`ibpy_native.error.IBError`): Error returned from IB.
+        """
+        if not is_pacing_violation(err):
+            return
+
+        self._violations += 1
+        self._resume_time = max(self._resume_time,
+                                time.monotonic() + self._cooldown)
+
+    #region - Private functions
+    def _prune(self, now: float):
+        """Drops the records those are out of their windows."""
+        while self._sent and self._sent[0] <= now - self._window:
+            self._sent.popleft()
+
+        while (self._identical_order and
+               self._identical_order[0][0] <= now - self._identical_window):
+            sent_time, key = self._identical_order.popleft()
+            if self._identical.get(key) == sent_time:
+                del self._identical[key]
+
+    def _delay(self, now: float, contract_key: Hashable,
+               request_key: Hashable) -> float:
+        """Returns the seconds to wait before the request can be sent."""
+        delay = self._resume_time - now
+
+        if len(self._sent) >= self._max_requests:
+            delay = max(delay, self._sent[0] + self._window - now)
+
+        sent = self._contract_sent.get(contract_key)
+        if sent is not None:
+            while sent and sent[0] <= now - self._contract_window:
+                sent.popleft()
+            if not sent:
+                del self._contract_sent[contract_key]
+            elif len(sent) >= self._max_per_contract:
+                delay = max(delay, sent[0] + self._contract_window - now)
+
+        if request_key in self._identical:
+            delay = max(delay, self._identical[request_key] +
+                        self._identical_window - now)
+
+        return delay
+    #endregion - Private functions
+
+def pacing_key(contract: ib_contract.Contract,
+               what_to_show: str) -> Hashable:
+    """Generates the key of the contract, exchange & data type of a request
+    for `PacingScheduler`.
+
+    Args:
+        contract (:obj:`ibapi.contract.Contract`): Contract requested.
+        what_to_show (str): Type of data requested.
+
+    Returns:
+        :obj:`Hashable`: The key.
+    """
+    if contract.conId:
+        instrument = (contract.conId,)
+    else:
+        instrument = (contract.symbol, contract.secType, contract.currency,
+                      contract.lastTradeDateOrContractMonth, contract.strike,
+                      contract.right, contract.localSymbol)
+
+    return instrument + (contract.exchange, what_to_show)
+
+def is_pacing_violation(err: error.IBError) -> bool:
+    """Checks if the error returned from IB is a pacing violation.
+
+    Args:
+        err (:obj:`ibpy_native.error.IBError`): Error returned from IB.
+
+    Returns:
+        bool: `True` if it's a pacing violation.
+    """
+    return (err.err_code == error.IBErrorCode.HISTORICAL_DATA_SERVICE and
+            "pacing violation" in err.err_str.lower())
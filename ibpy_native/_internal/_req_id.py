@@ -0,0 +1,103 @@
+"""Code implementation of the request ID allocation."""
+import collections
+import threading
+from typing import Deque, Set
+
+class ReqIdAllocator():
+    """Thread-safe allocator of request IDs (ticker ID in IB API).
+
+    IDs are reserved atomically on allocation, so concurrent tasks never get
+    the same ID. Released IDs are recycled through a FIFO free list before
+    any new ID is issued, except the ones retired as their requests may still
+    be responded by IB. All operations run in O(1).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_id = 1  # Smallest ID that has never been issued
+        self._free: Deque[int] = collections.deque()
+        # IDs actually available in `self._free`. Entries of `self._free`
+        # claimed directly via `reserve` are removed from here only, and get
+        # skipped lazily on `allocate`.
+        self._free_set: Set[int] = set()
+        self._in_use: Set[int] = set()
+        # IDs never to be recycled until reset
+        self._retired: Set[int] = set()
+
+    @property
+    def in_use(self) -> int:
+        """int: Number of IDs currently reserved."""
+        return len(self._in_use)
+
+    @property
+    def retired(self) -> int:
+        """int: Number of IDs retired from recycling."""
+        return len(self._retired)
+
+    def allocate(self) -> int:
+        """Reserves & returns an usable request ID.
+
+        Returns:
+            int: The ID reserved. The smallest released ID is NOT guaranteed;
+                IDs are recycled in the order they're released.
+        """
+        with self._lock:
+            while self._free:
+                req_id = self._free.popleft()
+                if req_id in self._free_set:
+                    self._free_set.remove(req_id)
+                    self._in_use.add(req_id)
+
+                    return req_id
+
+            req_id = self._next_id
+            self._next_id += 1
+            self._in_use.add(req_id)
+
+            return req_id
+
+    def reserve(self, req_id: int):
+        """Marks the specified ID as in use, for request IDs picked by the
+        caller instead of via `allocate`.
+
+        Args:
+            req_id (int): Request ID to be reserved.
+        """
+        with self._lock:
+            self._free_set.discard(req_id)
+            self._retired.discard(req_id)
+            self._in_use.add(req_id)
+
+            if req_id >= self._next_id:
+                self._next_id = req_id + 1
+
+    def release(self, req_id: int, reusable: bool=True):
+        """Returns the ID to the free list. IDs not in use are ignored, so
+        releasing an ID twice is harmless.
+
+        Args:
+            req_id (int): Request ID to be released.
+            reusable (bool, optional): `False` to retire the ID instead of
+                recycling it, for the requests which may still be responded
+                by IB (e.g. timed out without a way to cancel), so the late
+                responses never reach another request. Defaults to `True`.
+        """
+        with self._lock:
+            if req_id in self._in_use:
+                self._in_use.remove(req_id)
+                if reusable:
+                    self._free.append(req_id)
+                    self._free_set.add(req_id)
+                else:
+                    self._retired.add(req_id)
+
+    def reset(self):
+        """Releases all IDs, including the retired ones, and restarts the
+        allocation from ID 1 (e.g. the connection is dropped, so no request
+        is left on IB side).
+        """
+        with self._lock:
+            self._next_id = 1
+            self._free.clear()
+            self._free_set.clear()
+            self._in_use.clear()
+            self._retired.clear()
@@ -0,0 +1,137 @@
+"""Code implementation of the `asyncio` based socket transport to replace the
+`EReader` thread and the message loop of `EClient.run`.
+"""
+# pylint: disable=invalid-name
+import asyncio
+import threading
+from typing import Callable, Optional
+
+from ibapi import comm
+from ibapi import utils as ib_utils
+
+# Min. free space to offer for every read from the socket
+_MIN_RECV_SIZE = 4096
+
+class IBProtocol(asyncio.BufferedProtocol):
+    """Splits the byte stream received from IB TWS/Gateway into messages
+    according to their' 4 bytes length prefix. Data is received straight into
+    `ibapi.comm.FrameBuffer` and messages are handed out as views of it.
+    The connection is aborted once a length prefix beyond
+    `ibapi.common.MAX_MSG_LEN` is received, as the stream can't be framed
+    any further.
+
+    Args:
+        on_message (:obj:`Callable[[memoryview], None]`): Callback to receive
+            every complete message payload without the length prefix.
+        on_lost (:obj:`Callable[[], None]`): Callback to be invoked once the
+            connection is closed or dropped.
+    """
+    def __init__(self, on_message: Callable[[memoryview], None],
+                 on_lost: Callable[[], None]):
+        self._on_message = on_message
+        self._on_lost = on_lost
+        self._frames = comm.FrameBuffer()
+        self._transport: Optional[asyncio.BaseTransport] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport):
+        self._transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._frames.writable(max(sizehint, _MIN_RECV_SIZE))
+
+    def buffer_updated(self, nbytes: int):
+        self._frames.commit(nbytes)
+
+        try:
+            for msg in self._frames.frames():
+                self._on_message(msg)
+        except ib_utils.BadMessage:
+            if self._transport is not None:
+                self._transport.abort() # Invokes `connection_lost`
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self._on_lost()
+
+class AsyncConnection():
+    """Socket connection runs on an `asyncio` event loop. Provides the same
+    interface as `ibapi.connection.Connection` for `EClient` to send requests
+    with.
+
+    Args:
+        host (str): Hostname of IB TWS/Gateway.
+        port (int): Socket port of IB TWS/Gateway.
+    """
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._transport: Optional[asyncio.Transport] = None
+        self._on_lost: Optional[Callable[[], None]] = None
+
+    async def connect(self, on_message: Callable[[memoryview], None],
+                      on_lost: Callable[[], None]):
+        """Opens the connection on the running event loop.
+
+        Args:
+            on_message (:obj:`Callable[[memoryview], None]`): Callback to
+                receive every message from IB. Invoked on the event loop.
+            on_lost (:obj:`Callable[[], None]`): Callback to be invoked if the
+                connection is dropped by the other side or network failure.
+                Not invoked for connection closed via `disconnect`.
+
+        Raises:
+            OSError: If the connection cannot be established.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._on_lost = on_lost
+
+        self._transport, _ = await self._loop.create_connection(
+            lambda: IBProtocol(on_message=on_message,
+                               on_lost=self._connection_lost),
+            host=self.host, port=self.port
+        )
+
+    def disconnect(self):
+        """Closes the connection."""
+        transport = self._transport
+        self._transport = None
+
+        if transport is not None:
+            self._call_on_loop(transport.close)
+
+    def isConnected(self) -> bool:
+        """bool: `True` if the connection is opened."""
+        return self._transport is not None
+
+    def sendMsg(self, msg: bytes) -> int:
+        """Writes the message to the socket. Safe to be called from threads
+        other than the one running the event loop.
+
+        Args:
+            msg (bytes): Message with the length prefix.
+
+        Returns:
+            int: Number of bytes to be sent. `0` if not connected.
+        """
+        transport = self._transport
+        if transport is None:
+            return 0
+
+        self._call_on_loop(transport.write, msg)
+
+        return len(msg)
+
+    #region - Private functions
+    def _call_on_loop(self, func: Callable, *args):
+        if threading.get_ident() == self._loop_thread:
+            func(*args)
+        else:
+            self._loop.call_soon_threadsafe(func, *args)
+
+    def _connection_lost(self):
+        if self._transport is not None: # Dropped by the other side
+            self._transport = None
+            self._on_lost()
+    #endregion - Private functions
@@ -1,8 +1,9 @@
 """Code implementation of IB API resposes handling."""
 # pylint: disable=protected-access
+import functools
 import threading
 import queue
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ibapi import contract as ib_contract
 from ibapi import order as ib_order
@@ -12,6 +13,7 @@ from ibapi import wrapper
 from ibpy_native import error
 from ibpy_native import models
 from ibpy_native._internal import _global
+from ibpy_native._internal import _req_id
 from ibpy_native._internal import _typing
 from ibpy_native.interfaces import delegates
 from ibpy_native.interfaces import listeners
@@ -46,6 +48,22 @@ class IBWrapper(wrapper.EWrapper):
     ):
         self._lock = threading.Lock()
         self._req_queue: Dict[int, fq.FinishableQueue] = {}
+        self._req_id_allocator = _req_id.ReqIdAllocator()
+        # IDs of the requests to have their results parsed in columnar mode
+        self._columnar_reqs: Set[int] = set()
+        # Ring buffers to keep the recent live ticks of the requests
+        self._tick_buffers: Dict[int, models.TickRingBuffer] = {}
+        # Request ID -> queues of the consumers to fan the live ticks out to
+        self._tick_consumers: Dict[int, Dict[int, fq.FinishableQueue]] = {}
+        # Request ID -> quote table & row to write the market data into
+        self._quote_rows: Dict[int, Tuple[models.QuoteTable, int]] = {}
+        # Request ID -> order book to apply the market depth to
+        self._order_books: Dict[int, models.OrderBook] = {}
+        # Request ID -> buffer to append the real-time bars to, queue to
+        # notify & key to identify the request in the queue
+        self._bar_buffers: Dict[
+            int, Tuple[models.BarBuffer, fq.FinishableQueue, int]
+        ] = {}
 
         self._accounts_manager = accounts_manager
         self._orders_manager = orders_manager
@@ -62,35 +80,48 @@ class IBWrapper(wrapper.EWrapper):
         super().__init__()
 
     @property
-    def next_req_id(self) -> int:
-        """The next usable request ID (ticker ID in IB API).
+    def orders_manager(self) -> delegates.OrdersManagementDelegate:
+        """:obj:`ibpy_native.interfaces.delegates.order
+        .OrdersManagementDelegate`: The internal orders manager.
+        """
+        return self._orders_manager
+
+    #region - Request IDs
+    def allocate_req_id(self) -> int:
+        """Reserves an usable request ID (ticker ID in IB API).
 
-        Finds the next available request ID by looking up if there's any
-        finished `FinishableQueue` in internal queue dictionary `__req_queue`.
-        If so, returns the ID of the first finished `FinishableQueue` found.
-        Returns the last ID in `__req_queue` + 1 if otherwise.
+        The ID returned is reserved for the caller, so concurrent tasks never
+        get the same ID. IDs are released for reuse once the
+        `FinishableQueue` associated is finished, or via `release_req_id`.
 
         Returns:
-            int: The next usable request ID.
+            int: The request ID reserved.
         """
-        usable_id = 0
+        return self._req_id_allocator.allocate()
 
-        if self._req_queue:
-            for key, f_queue in self._req_queue.items():
-                if f_queue.finished:
-                    return key
+    def release_req_id(self, req_id: int, reusable: bool=True):
+        """Releases the request ID for reuse, e.g. the request is terminated
+        by error. The `FinishableQueue` associated, if any, is marked as
+        finished.
 
-                if key > usable_id:
-                    usable_id = key
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            reusable (bool, optional): `False` to retire the ID instead, for
+                the requests which may still be responded by IB. Late
+                responses are left in the finished queue, which is never
+                reset for another request. Defaults to `True`.
+        """
+        if not reusable:
+            # Retired before the queue releases it via the callback
+            self._req_id_allocator.release(req_id, reusable=False)
 
-        return usable_id + 1
+        f_queue = self._req_queue.get(req_id)
 
-    @property
-    def orders_manager(self) -> delegates.OrdersManagementDelegate:
-        """:obj:`ibpy_native.interfaces.delegates.order
-        .OrdersManagementDelegate`: The internal orders manager.
-        """
-        return self._orders_manager
+        if f_queue is not None and not f_queue.finished:
+            f_queue.finish() # Releases the ID via the callback
+        else:
+            self._req_id_allocator.release(req_id)
+    #endregion - Request IDs
 
     #region - Getters
     def get_request_queue(self, req_id: int) -> fq.FinishableQueue:
@@ -132,6 +163,48 @@ class IBWrapper(wrapper.EWrapper):
                 `FinishableQueue` object.
         """
         return self._req_queue[req_id] if req_id in self._req_queue else None
+
+    def is_columnar(self, req_id: int) -> bool:
+        """Checks if the results of request `req_id` are to be parsed in
+        columnar mode.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+
+        Returns:
+            bool: `True` if the request is marked as columnar.
+        """
+        return req_id in self._columnar_reqs
+
+    def get_quote_row(self, req_id: int) -> Optional[
+        Tuple[models.QuoteTable, int]
+    ]:
+        """Returns the row of the quote table the market data of request
+        `req_id` is written into.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+
+        Returns:
+            :obj:`Optional[Tuple[ibpy_native.models.QuoteTable, int]]`: The
+                table & index of the row. `None` if the request has no row
+                set, or the rows set are cleared on disconnect.
+        """
+        return self._quote_rows.get(req_id)
+
+    def get_order_book(self, req_id: int) -> Optional[models.OrderBook]:
+        """Returns the order book the market depth of request `req_id` is
+        applied to.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+
+        Returns:
+            :obj:`Optional[ibpy_native.models.OrderBook]`: The book. `None`
+                if the request has no book set, or the books set are cleared
+                on disconnect.
+        """
+        return self._order_books.get(req_id)
     #endregion - Getters
 
     #region - Setters
@@ -155,6 +228,106 @@ class IBWrapper(wrapper.EWrapper):
                 .NotificationListener`): Listener for IB notifications.
         """
         self._notification_listener = listener
+
+    def set_columnar(self, req_id: int, columnar: bool):
+        """Marks if the results of request `req_id` should be parsed into
+        NumPy arrays instead of objects per tick.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            columnar (bool): `True` for columnar mode.
+        """
+        if columnar:
+            self._columnar_reqs.add(req_id)
+        else:
+            self._columnar_reqs.discard(req_id)
+
+    def set_tick_buffer(self, req_id: int,
+                        buffer: Optional[models.TickRingBuffer]):
+        """Sets the ring buffer to keep the recent live ticks of request
+        `req_id`, which are appended as soon as they're received.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            buffer (:obj:`ibpy_native.models.TickRingBuffer`, optional): The
+                buffer. `None` to remove the buffer set.
+        """
+        if buffer is None:
+            self._tick_buffers.pop(req_id, None)
+        else:
+            self._tick_buffers[req_id] = buffer
+
+    def set_tick_consumers(
+        self, req_id: int, consumers: Optional[Dict[int, fq.FinishableQueue]]
+    ):
+        """Sets the queues of the consumers to put the live ticks of request
+        `req_id` into, instead of the queue of the request. Ticks are put on
+        the thread receiving them from IB, so the bound of each consumer's
+        queue applies to the incoming messages.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            consumers (:obj:`Dict[int, FinishableQueue]`, optional): Queues
+                of the consumers. The mapping is shared, so consumers added
+                or removed later are reflected. `None` to remove the
+                consumers set.
+        """
+        if consumers is None:
+            self._tick_consumers.pop(req_id, None)
+        else:
+            self._tick_consumers[req_id] = consumers
+
+    def set_quote_row(self, req_id: int, table: Optional[models.QuoteTable],
+                      row: int=0):
+        """Sets the row of the quote table to write the market data of
+        request `req_id` into.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            table (:obj:`ibpy_native.models.QuoteTable`, optional): The table.
+                `None` to stop writing the market data of the request.
+            row (int, optional): Index of the row. Defaults to `0`.
+        """
+        if table is None:
+            self._quote_rows.pop(req_id, None)
+        else:
+            self._quote_rows[req_id] = (table, row)
+
+    def set_order_book(self, req_id: int, book: Optional[models.OrderBook]):
+        """Sets the order book to apply the market depth of request `req_id`
+        to.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            book (:obj:`ibpy_native.models.OrderBook`, optional): The book.
+                `None` to stop applying the market depth of the request.
+        """
+        if book is None:
+            self._order_books.pop(req_id, None)
+        else:
+            self._order_books[req_id] = book
+
+    def set_bar_buffer(self, req_id: int,
+                       buffer: Optional[models.BarBuffer],
+                       notify: Optional[fq.FinishableQueue]=None, key: int=0):
+        """Sets the buffer to append the real-time bars of request `req_id`
+        to.
+
+        Args:
+            req_id (int): Request ID (ticker ID in IB API).
+            buffer (:obj:`ibpy_native.models.BarBuffer`, optional): The
+                buffer. `None` to stop appending the bars of the request.
+            notify (:obj:`ibpy_native.utils.finishable_queue
+                .FinishableQueue`, optional): Queue to put `key` into once a
+                bar is appended, or `(key, err)` for the error returned for
+                the request. Defaults to `None`.
+            key (int, optional): Key to identify the request in `notify`.
+                Defaults to `0`.
+        """
+        if buffer is None:
+            self._bar_buffers.pop(req_id, None)
+        else:
+            self._bar_buffers[req_id] = (buffer, notify, key)
     #endregion - Setters
 
     #region - Override functions from `wrapper.EWrapper`
@@ -169,6 +342,20 @@ class IBWrapper(wrapper.EWrapper):
         elif reqId != -1 and errorCode == error.IBErrorCode.ORDER_REJECTED:
             self._orders_manager.on_order_rejected(order_id=reqId,
                                                    reason=errorString)
+        elif reqId != -1 and reqId in self._quote_rows:
+            table, row = self._quote_rows[reqId]
+            table.on_error(row=row, err=err)
+        elif reqId != -1 and reqId in self._bar_buffers:
+            _, notify, key = self._bar_buffers[reqId]
+            # Not a signal, so the other requests notifying the same queue
+            # are not terminated
+            notify.put(element=(key, err))
+        elif reqId != -1 and reqId in self._order_books:
+            if errorCode == error.IBErrorCode.MKT_DEPTH_RESET:
+                # Levels are to be resent by IB
+                self._order_books[reqId].clear()
+            else:
+                self._order_books[reqId].on_error(err)
         elif reqId != -1 and reqId in self._req_queue:
             self._req_queue[reqId].put(element=err)
         elif reqId == -1 and errorCode == error.IBErrorCode.NOT_CONNECTED:
@@ -274,6 +461,14 @@ class IBWrapper(wrapper.EWrapper):
         self._req_queue[reqId].put(element=headTimestamp)
         self._req_queue[reqId].put(element=fq.Status.FINISHED)
 
+    #region - Fetch historical bars
+    def historicalData(self, reqId: int, bar: wrapper.BarData):
+        self._req_queue[reqId].put(element=bar)
+
+    def historicalDataEnd(self, reqId: int, start: str, end: str):
+        self._req_queue[reqId].put(element=fq.Status.FINISHED)
+    #endregion - Fetch historical bars
+
     #region - Fetch historical tick data
     def historicalTicks(self, reqId: int,
                         ticks: List[wrapper.HistoricalTick], done: bool):
@@ -290,9 +485,66 @@ class IBWrapper(wrapper.EWrapper):
                             done: bool):
         self._handle_historical_ticks_results(req_id=reqId, ticks=ticks,
                                               done=done)
+
+    def historicalTicksColumnar(self, reqId: int, ticks: Any, done: bool):
+        """Receives the historical ticks parsed in columnar mode.
+
+        Args:
+            reqId (int): Request ID (ticker ID in IB API).
+            ticks (:obj:`ibpy_native.models.TickArray`): Ticks received.
+            done (bool): `True` if all ticks of the request are received.
+        """
+        self._handle_historical_ticks_results(req_id=reqId, ticks=ticks,
+                                              done=done)
     #endregion - Fetch historical tick data
     #endregion - Historical data
 
+    #region - Market data
+    def tickPrice(self, reqId: int, tickType: int, price: float,
+                  attrib: wrapper.TickAttrib):
+        self._handle_quote_tick(req_id=reqId, tick_type=tickType, value=price)
+
+    def tickSize(self, reqId: int, tickType: int, size: int):
+        self._handle_quote_tick(req_id=reqId, tick_type=tickType, value=size)
+
+    def tickString(self, reqId: int, tickType: int, value: str):
+        self._handle_quote_tick(req_id=reqId, tick_type=tickType, value=value)
+
+    def tickGeneric(self, reqId: int, tickType: int, value: float):
+        self._handle_quote_tick(req_id=reqId, tick_type=tickType, value=value)
+
+    def marketDataType(self, reqId: int, marketDataType: int):
+        quote = self._quote_rows.get(reqId)
+        if quote is not None:
+            table, row = quote
+            table.on_data_type(row=row, data_type=marketDataType)
+
+    def updateMktDepth(self, reqId: int, position: int, operation: int,
+                       side: int, price: float, size: int):
+        book = self._order_books.get(reqId)
+        if book is not None:
+            book.apply(position=position, operation=operation, side=side,
+                       price=price, size=size)
+
+    def updateMktDepthL2(self, reqId: int, position: int, marketMaker: str,
+                         operation: int, side: int, price: float, size: int,
+                         isSmartDepth: bool):
+        book = self._order_books.get(reqId)
+        if book is not None:
+            book.apply(position=position, operation=operation, side=side,
+                       price=price, size=size, market_maker=marketMaker)
+
+    def realtimeBar(self, reqId: int, time: int, open_: float, high: float,
+                    low: float, close: float, volume: int, wap: float,
+                    count: int):
+        bar_buffer = self._bar_buffers.get(reqId)
+        if bar_buffer is not None:
+            buffer, notify, key = bar_buffer
+            buffer.append(time=time, open_=open_, high=high, low=low,
+                          close=close, volume=volume, wap=wap, count=count)
+            notify.put(element=key)
+    #endregion - Market data
+
     #region - Stream live tick data
     def tickByTickAllLast(self, reqId: int, tickType: int, time: int,
                           price: float, size: int,
@@ -340,23 +592,32 @@ class IBWrapper(wrapper.EWrapper):
             ibpy_native.error.IBError: If a `FinishableQueue` already exists at
                 `self.__req_queue[req_id]` and it's not finished.
         """
-        if req_id in self._req_queue:
-            if (self._req_queue[req_id].finished
-                or (req_id == _global.IDX_NEXT_ORDER_ID
-                    and (self._req_queue[_global.IDX_NEXT_ORDER_ID].status
-                         is fq.Status.INIT))
-                or (req_id == _global.IDX_OPEN_ORDERS
-                    and (self._req_queue[_global.IDX_OPEN_ORDERS].status
-                         is fq.Status.INIT))):
-                self._req_queue[req_id].reset()
+        with self._lock:
+            if req_id in self._req_queue:
+                if (self._req_queue[req_id].finished
+                    or (req_id == _global.IDX_NEXT_ORDER_ID
+                        and (self._req_queue[_global.IDX_NEXT_ORDER_ID].status
+                             is fq.Status.INIT))
+                    or (req_id == _global.IDX_OPEN_ORDERS
+                        and (self._req_queue[_global.IDX_OPEN_ORDERS].status
+                             is fq.Status.INIT))):
+                    self._req_queue[req_id].reset()
+                else:
+                    raise error.IBError(
+                        rid=req_id, err_code=error.IBErrorCode.QUEUE_IN_USE,
+                        err_str=f"Requested queue with ID {str(req_id)} is "
+                                "currently in use"
+                    )
             else:
-                raise error.IBError(
-                    rid=req_id, err_code=error.IBErrorCode.QUEUE_IN_USE,
-                    err_str=f"Requested queue with ID {str(req_id)} is "
-                            "currently in use"
+                # Releases the ID for reuse once the request is finished
+                self._req_queue[req_id] = fq.FinishableQueue(
+                    queue_to_finish=queue.Queue(),
+                    on_finished=functools.partial(
+                        self._req_id_allocator.release, req_id)
                 )
-        else:
-            self._req_queue[req_id] = fq.FinishableQueue(queue.Queue())
+
+            if req_id > 0:
+                self._req_id_allocator.reserve(req_id)
 
     def _on_disconnected(self):
         """Stop all active requests."""
@@ -375,6 +636,11 @@ class IBWrapper(wrapper.EWrapper):
                     err_str=_global.MSG_NOT_CONNECTED
                 )
                 f_queue.put(element=err)
+        for _, notify, key in self._bar_buffers.values():
+            notify.put(element=error.IBError(
+                rid=key, err_code=error.IBErrorCode.NOT_CONNECTED,
+                err_str=_global.MSG_NOT_CONNECTED
+            ))
 
         self._reset()
         self._orders_manager.on_disconnected()
@@ -385,6 +651,13 @@ class IBWrapper(wrapper.EWrapper):
 
     def _reset(self):
         self._req_queue.clear()
+        self._req_id_allocator.reset()
+        self._columnar_reqs.clear()
+        self._tick_buffers.clear()
+        self._tick_consumers.clear()
+        self._quote_rows.clear()
+        self._order_books.clear()
+        self._bar_buffers.clear()
         self._req_queue[_global.IDX_NEXT_ORDER_ID] = fq.FinishableQueue(
             queue_to_finish=queue.Queue())
         self._req_queue[_global.IDX_OPEN_ORDERS] = fq.FinishableQueue(
@@ -406,8 +679,29 @@ class IBWrapper(wrapper.EWrapper):
                            tick: _typing.HistoricalTickTypes):
         """Handles live ticks passed to functions `tickByTickAllLast`,
         `tickByTickBidAsk`, and `tickByTickMidPoint` by putting the ticks
-        received into corresponding queue.
+        received into corresponding ring buffer (if any) & queue, or the
+        queues of the consumers of the request.
+        """
+        buffer = self._tick_buffers.get(req_id)
+        if buffer is not None:
+            buffer.append(tick)
+
+        consumers = self._tick_consumers.get(req_id)
+        if consumers is None:
+            self._req_queue[req_id].put(element=tick)
+        else:
+            # Copy as consumers can be added or removed on the event loop
+            for consumer in list(consumers.values()):
+                consumer.put(element=tick)
+
+    def _handle_quote_tick(self, req_id: int, tick_type: int, value: Any):
+        """Handles market data passed to functions `tickPrice`, `tickSize`,
+        `tickString`, and `tickGeneric` by writing the values into the row of
+        corresponding quote table.
         """
-        self._req_queue[req_id].put(element=tick)
+        quote = self._quote_rows.get(req_id)
+        if quote is not None:
+            table, row = quote
+            table.on_tick(row=row, tick_type=tick_type, value=value)
     #endregion - Ticks handling
     #endregion - Private functions
@@ -3,10 +3,14 @@ IB API.
 """
 # pylint: disable=protected-access
 import asyncio
+import collections
 import datetime
+import itertools
+import math
 import time
 import threading
-from typing import AsyncIterator, Awaitable, List, Optional
+from typing import (Any, AsyncGenerator, AsyncIterator, Awaitable, Dict, List,
+                    Optional, Sequence, Tuple, Union)
 
 from ibapi import contract as ib_contract
 from ibapi import order as ib_order
@@ -16,11 +20,47 @@ from ibpy_native import interfaces
 from ibpy_native import manager
 from ibpy_native import models
 from ibpy_native._internal import _client
+from ibpy_native._internal import _columnar
 from ibpy_native._internal import _global
+from ibpy_native._internal import _live_ticks_hub
 from ibpy_native._internal import _wrapper
 from ibpy_native.interfaces import delegates
 from ibpy_native.interfaces import listeners
 from ibpy_native.utils import datatype
+from ibpy_native.utils import finishable_queue as fq
+from ibpy_native.utils import head_timestamp_cache
+from ibpy_native.utils import tick_store
+from ibpy_native.utils import trading_hours
+
+# Seconds the trading schedule of a contract is cached for
+_SCHEDULE_TTL = 86400
+
+_DAY = datetime.timedelta(days=1)
+# Longest duration IB allows per request of each bar size, with the time
+# period it covers at least
+_BAR_CHUNKS: Dict[datatype.BarSize, Tuple[str, datetime.timedelta]] = {
+    datatype.BarSize.SEC_1: ("1800 S", datetime.timedelta(seconds=1800)),
+    datatype.BarSize.SEC_5: ("3600 S", datetime.timedelta(seconds=3600)),
+    datatype.BarSize.SEC_10: ("14400 S", datetime.timedelta(seconds=14400)),
+    datatype.BarSize.SEC_15: ("14400 S", datetime.timedelta(seconds=14400)),
+    datatype.BarSize.SEC_30: ("28800 S", datetime.timedelta(seconds=28800)),
+    datatype.BarSize.MIN_1: ("86400 S", _DAY),
+    datatype.BarSize.MIN_2: ("2 D", 2 * _DAY),
+    datatype.BarSize.MIN_3: ("1 W", 7 * _DAY),
+    datatype.BarSize.MIN_5: ("1 W", 7 * _DAY),
+    datatype.BarSize.MIN_10: ("1 W", 7 * _DAY),
+    datatype.BarSize.MIN_15: ("1 W", 7 * _DAY),
+    datatype.BarSize.MIN_20: ("1 W", 7 * _DAY),
+    datatype.BarSize.MIN_30: ("1 M", 28 * _DAY),
+    datatype.BarSize.HOUR_1: ("1 M", 28 * _DAY),
+    datatype.BarSize.HOUR_2: ("1 M", 28 * _DAY),
+    datatype.BarSize.HOUR_3: ("1 M", 28 * _DAY),
+    datatype.BarSize.HOUR_4: ("1 M", 28 * _DAY),
+    datatype.BarSize.HOUR_8: ("1 M", 28 * _DAY),
+    datatype.BarSize.DAY_1: ("1 Y", 365 * _DAY),
+    datatype.BarSize.WEEK_1: ("1 Y", 365 * _DAY),
+    datatype.BarSize.MONTH_1: ("1 Y", 365 * _DAY),
+}
 
 class IBBridge(interfaces.IBridge):
     """Public class to bridge between `ibpy-native` & IB API.
@@ -77,6 +117,25 @@ class IBBridge(interfaces.IBridge):
         )
 
         self._client = _client.IBClient(wrapper=self._wrapper)
+        self._live_ticks_hub = _live_ticks_hub.LiveTicksHub(
+            client=self._client, wrapper=self._wrapper)
+        self._tick_store: Optional[tick_store.TickStore] = None
+        self._head_timestamps: Optional[
+            head_timestamp_cache.HeadTimestampCache
+        ] = head_timestamp_cache.HeadTimestampCache()
+        # conId -> (trading schedule, time cached)
+        self._schedules: Dict[
+            int, Tuple[Optional[trading_hours.TradingSchedule], float]
+        ] = {}
+        # conId -> lookup of trading schedule in flight, shared by the tasks
+        # awaiting the same schedule
+        self._schedule_lookups: Dict[int, asyncio.Future] = {}
+        self._quote_table: Optional[models.QuoteTable] = None
+        # Row in quote table -> request ID
+        self._quote_reqs: Dict[int, int] = {}
+        self._book_ids = itertools.count(1)
+        # Book ID -> order book, if it's via SMART & request ID
+        self._order_books: Dict[int, Tuple[models.OrderBook, bool, int]] = {}
 
         if auto_conn:
             self.connect()
@@ -129,6 +188,48 @@ class IBBridge(interfaces.IBridge):
                 .NotificationListener`): Listener for IB notifications.
         """
         self._wrapper.set_on_notify_listener(listener=listener)
+
+    def set_request_timeout(self, timeout: Optional[float]):
+        """Set the default seconds to wait for the response of a request
+        before it's abandoned with error `REQ_TIMEOUT`.
+
+        Note:
+            Default timeout `60` seconds will be used if this function has
+            never been called.
+
+        Args:
+            timeout (:obj:`float`, optional): Seconds to wait. `None` to wait
+                without limit.
+        """
+        self._client.timeout = timeout
+
+    def set_tick_store(self, store: Optional[tick_store.TickStore]):
+        """Set the local store of historical ticks. Time ranges covered by
+        the store are served from disk by `req_historical_ticks`, and only
+        the gaps are requested from IB & stored.
+
+        Args:
+            store (:obj:`ibpy_native.utils.tick_store.TickStore`, optional):
+                The store. `None` to always request IB.
+        """
+        self._tick_store = store
+
+    def set_head_timestamp_cache(
+        self, cache: Optional[head_timestamp_cache.HeadTimestampCache]
+    ):
+        """Set the cache of head timestamps used by
+        `get_earliest_data_point`.
+
+        Note:
+            An in-memory cache with TTL of 1 day is used if this function has
+            never been called.
+
+        Args:
+            cache (:obj:`ibpy_native.utils.head_timestamp_cache
+                .HeadTimestampCache`, optional): The cache. `None` to always
+                request IB.
+        """
+        self._head_timestamps = cache
     #endregion - Setters
 
     #region - Connections
@@ -142,6 +243,24 @@ class IBBridge(interfaces.IBridge):
             threading.Thread(name="ib_loop", target=self._client.run).start()
             threading.Thread(name="heart_beat", target=self._heart_beat).start()
 
+    async def connect_async(self):
+        """Connect the bridge to a running & logged in TWS/IB Gateway instance
+        with messages from IB being handled on the running event loop, instead
+        of the background threads used by `connect`.
+
+        Note:
+            The bridge should be initialised with `auto_conn=False` to use
+            this function.
+
+        Raises:
+            ibpy_native.error.IBError: If the handshake with IB TWS/Gateway is
+                not completed before timeout, or the connection is dropped
+                during the handshake.
+        """
+        if not self.is_connected:
+            await self._client.connect_async(host=self._host, port=self._port,
+                                             client_id=self._client_id)
+
     def disconnect(self):
         """Disconnect the bridge from the connected TWS/IB Gateway instance.
         """
@@ -203,12 +322,15 @@ class IBBridge(interfaces.IBridge):
         try:
             res: List[ib_contract.ContractDetails] = (
                 await self._client.resolve_contracts(
-                    req_id=self._wrapper.next_req_id, contract=contract
+                    req_id=self._wrapper.allocate_req_id(), contract=contract
                 )
             )
         except error.IBError as err:
             raise err
 
+        for details in res:
+            self._cache_trading_schedule(details)
+
         return  res
 
     #region - Orders
@@ -305,14 +427,27 @@ class IBBridge(interfaces.IBridge):
         Raises:
             ibpy_native.error.IBError: If there is either connection related
                 issue, IB returns 0 or multiple results.
+
+        Note:
+            Result is served from the head timestamp cache if `contract` has
+            `conId` and the earliest data point has been cached.
         """
-        try:
-            result = await self._client.resolve_head_timestamp(
-                req_id=self._wrapper.next_req_id, contract=contract,
-                show=data_type
-            )
-        except error.IBError as err:
-            raise err
+        cache = self._head_timestamps if contract.conId else None
+        result = (None if cache is None
+                  else cache.get(con_id=contract.conId, data_type=data_type))
+
+        if result is None:
+            try:
+                result = await self._client.resolve_head_timestamp(
+                    req_id=self._wrapper.allocate_req_id(), contract=contract,
+                    show=data_type
+                )
+            except error.IBError as err:
+                raise err
+
+            if cache is not None:
+                cache.set(con_id=contract.conId, data_type=data_type,
+                          timestamp=result)
 
         data_point = datetime.datetime.fromtimestamp(
             timestamp=result, tz=_global.TZ)
@@ -324,11 +459,18 @@ class IBBridge(interfaces.IBridge):
         start: Optional[datetime.datetime]=None,
         end: Optional[datetime.datetime]=None,
         tick_type: datatype.HistoricalTicks=datatype.HistoricalTicks.TRADES,
-        retry: int=0
+        retry: int=0, columnar: bool=False, concurrency: int=1,
+        shard_size: Optional[datetime.timedelta]=None, prefetch: int=0,
+        head_lookup: bool=True, skip_closed: bool=True
     ) -> AsyncIterator[datatype.ResHistoricalTicks]:
         """Retrieve historical tick data for specificed instrument/contract
         from IB.
 
+        Ticks are requested page by page sequentially by default. If
+        `concurrency` is greater than 1, the time period is split into shards
+        which are downloaded concurrently over separated requests, and the
+        pages are still yielded in time order.
+
         Args:
             contract (:obj:`ibapi.contract.Contract`): `Contract` object with
                 sufficient info to identify the instrument.
@@ -343,6 +485,25 @@ class IBBridge(interfaces.IBridge):
                 `HistoricalTicks.TRADES`.
             retry (int): Max retry attempts if error occur before terminating
                 the task and rasing the error.
+            columnar (bool, optional): Parses the ticks into a `TickArray` of
+                NumPy arrays instead of objects per tick. Requires `numpy`.
+                Defaults to `False`.
+            concurrency (int, optional): Max number of shards to be downloaded
+                at the same time. Defaults to `1` to download sequentially.
+            shard_size (:obj:`datetime.timedelta`, optional): Time period
+                covered by each shard. Defaults to `None` to split the period
+                evenly by `concurrency`, with shards no longer than 1 day.
+            prefetch (int, optional): Number of pages to be fetched ahead in
+                background while the current page is being processed.
+                Defaults to `0` to fetch the next page only once the current
+                one is consumed.
+            head_lookup (bool, optional): Looks up the earliest data point to
+                start from if `start` is earlier. `False` to skip the lookup if
+                `start` is given. Defaults to `True`.
+            skip_closed (bool, optional): Jumps to the next trading session
+                according to `ContractDetails.tradingHours` of `contract` if
+                no tick is returned, instead of moving forward in 30 minutes
+                steps. Requires `contract.conId`. Defaults to `True`.
 
         Yields:
             :obj:ibpy_native.utils.datatype.ResHistoricalTicks`: Tick data
@@ -350,8 +511,10 @@ class IBBridge(interfaces.IBridge):
                 within the specified time period are received.
 
         Raises:
+            ImportError: If `columnar` is `True` but `numpy` is not installed.
             ValueError: If either argument `start` or `end` is not an native
-                `datetime` object;
+                `datetime` object, `concurrency` is less than 1, or
+                `prefetch` is negative;
             ibpy_native.error.IBError: If
                 - `contract` passed in is unresolvable;
                 - there is any issue raised from the request function while
@@ -366,94 +529,318 @@ class IBBridge(interfaces.IBridge):
             if end.tzinfo is not None:
                 raise ValueError("Value of argument `start` & `end` must be an "
                                  "native `datetime` object.")
+        if concurrency < 1:
+            raise ValueError("Value of argument `concurrency` must be at "
+                             "least 1.")
+        if prefetch < 0:
+            raise ValueError("Value of argument `prefetch` must not be "
+                             "negative.")
         # Prep start and end time
-        try:
-            if tick_type is datatype.HistoricalTicks.TRADES:
-                head_time = await self.get_earliest_data_point(contract)
-            else:
-                head_time_ask = await self.get_earliest_data_point(
-                    contract, data_type=datatype.EarliestDataPoint.ASK)
-                head_time_bid = await self.get_earliest_data_point(
-                    contract, data_type=datatype.EarliestDataPoint.BID)
-                head_time = (head_time_ask if head_time_ask < head_time_bid
-                             else head_time_bid)
-        except error.IBError as err:
-            raise err
+        if start is None or head_lookup:
+            try:
+                if tick_type is datatype.HistoricalTicks.TRADES:
+                    head_time = await self.get_earliest_data_point(contract)
+                else:
+                    # Looks up both in parallel
+                    head_time_ask, head_time_bid = await asyncio.gather(
+                        self.get_earliest_data_point(
+                            contract,
+                            data_type=datatype.EarliestDataPoint.ASK),
+                        self.get_earliest_data_point(
+                            contract,
+                            data_type=datatype.EarliestDataPoint.BID)
+                    )
+                    head_time = (head_time_ask if head_time_ask < head_time_bid
+                                 else head_time_bid)
+            except error.IBError as err:
+                raise err
 
-        start_date_time = (head_time if start is None or head_time > start
-                           else start)
+            start_date_time = (head_time if start is None or head_time > start
+                               else start)
+        else:
+            start_date_time = start
         end_date_time = datetime.datetime.now() if end is None else end
 
         # Request tick data
-        finished = False
-        retry_attemps = 0
+        if self._tick_store is not None and contract.conId:
+            pages = self._fetch_ticks_cached(
+                contract=contract, start=start_date_time, end=end_date_time,
+                tick_type=tick_type, retry=retry, columnar=columnar,
+                concurrency=concurrency, shard_size=shard_size,
+                skip_closed=skip_closed
+            )
+        else:
+            pages = self._fetch_pages(
+                contract=contract, start=start_date_time, end=end_date_time,
+                tick_type=tick_type, retry=retry, columnar=columnar,
+                concurrency=concurrency, shard_size=shard_size,
+                skip_closed=skip_closed
+            )
+        if prefetch > 0:
+            pages = self._prefetch(pages=pages, depth=prefetch)
 
-        while not finished:
+        try:
+            async for page in pages:
+                yield page
+        finally:
+            # Cancels the shards & prefetch in flight if closed early
+            await pages.aclose()
+
+    async def sync_historical_ticks(
+        self, contract: ib_contract.Contract,
+        tick_type: datatype.HistoricalTicks, start: datetime.datetime,
+        end: Optional[datetime.datetime]=None,
+        store: Optional[tick_store.TickStore]=None, retry: int=0,
+        concurrency: int=1, shard_size: Optional[datetime.timedelta]=None,
+        checkpoint: int=100000
+    ) -> datatype.ResSyncHistoricalTicks:
+        """Downloads the historical ticks within the time period those are
+        missing from the tick store into the store.
+
+        Ticks received are stored every `checkpoint` ticks, so a sync
+        interrupted resumes from the last checkpoint on next call.
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): Resolved `Contract`
+                object with `conId`.
+            tick_type (:obj:`ibpy_native.utils.datatype.HistoricalTicks`):
+                Type of tick data.
+            start (:obj:`datetime.datetime`): Datetime for the earliest tick
+                data to be synced.
+            end (:obj:`datetime.datetime`, optional): Datetime for the latest
+                tick data to be synced. If is `None`, the end time will be set
+                as now. Defaults to `None`.
+            store (:obj:`ibpy_native.utils.tick_store.TickStore`, optional):
+                Store to sync the ticks into. Defaults to `None` to use the
+                one set via `set_tick_store`.
+            retry (int): Max retry attempts if error occur before terminating
+                the task and rasing the error.
+            concurrency (int, optional): Max number of shards to be downloaded
+                at the same time. Defaults to `1`.
+            shard_size (:obj:`datetime.timedelta`, optional): Time period
+                covered by each shard. Defaults to `None`.
+            checkpoint (int, optional): Number of ticks received to be stored
+                at once. Defaults to `100000`.
+
+        Returns:
+            :obj:`ibpy_native.utils.datatype.ResSyncHistoricalTicks`: Time
+                ranges downloaded and the number of ticks.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If either argument `start` or `end` is not an native
+                `datetime` object, `contract` has no `conId`, or no store is
+                available;
+            ibpy_native.error.IBError: If there is any issue raised from the
+                request function and max retry attemps has been reached.
+        """
+        # Error checking
+        if start.tzinfo is not None or (end is not None and
+                                        end.tzinfo is not None):
+            raise ValueError("Value of argument `start` & `end` must be an "
+                             "native `datetime` object.")
+        if not contract.conId:
+            raise ValueError("Value of argument `contract` must be resolved "
+                             "with `conId`.")
+        if store is None:
+            store = self._tick_store
+        if store is None:
+            raise ValueError("No `TickStore` to sync the ticks into.")
+
+        start_time = math.ceil(_global.TZ.localize(start).timestamp())
+        # Ticks of the latest second may not be all received by IB yet
+        end_time = int(time.time()) - 1
+        if end is not None:
+            end_time = min(end_time,
+                           math.floor(_global.TZ.localize(end).timestamp()))
+
+        gaps = store.missing(con_id=contract.conId, tick_type=tick_type,
+                             start=start_time, end=end_time)
+        num_ticks = 0
+
+        for gap_start, gap_end in gaps:
+            cursor = gap_start
+            pending = []
+            num_pending = 0
+
+            pages = self._fetch_pages(
+                contract=contract, start=_to_datetime(gap_start),
+                end=_to_datetime(gap_end), tick_type=tick_type, retry=retry,
+                columnar=True, concurrency=concurrency, shard_size=shard_size,
+                skip_closed=True
+            )
             try:
-                ticks = await self._client.req_historical_ticks(
-                    req_id=self._wrapper.next_req_id, contract=contract,
-                    start_date_time=start_date_time, show=tick_type
-                )
-            except error.IBError as err:
-                if err.err_code == error.IBErrorCode.NOT_CONNECTED.value:
-                    raise err
-                if retry_attemps < retry:
-                    retry_attemps += 1
-                    continue
+                async for page in pages:
+                    pending.append(page.ticks)
+                    num_pending += len(page.ticks)
+                    num_ticks += len(page.ticks)
+
+                    if (num_pending >= checkpoint and len(page.ticks) > 0
+                            and not page.completed):
+                        # Ticks returned always cover a full second, all ticks
+                        # up to the last one received are in the store after
+                        # this. Parts stored by concurrent downloads are
+                        # skipped.
+                        last_time = int(page.ticks["time"][-1])
+                        store.fill(con_id=contract.conId, tick_type=tick_type,
+                                   start=cursor, end=last_time,
+                                   ticks=models.TickArray.concatenate(pending))
+                        cursor = last_time + 1
+                        pending = []
+                        num_pending = 0
+            finally:
+                await pages.aclose()
+
+            store.fill(con_id=contract.conId, tick_type=tick_type,
+                       start=cursor, end=gap_end,
+                       ticks=models.TickArray.concatenate(pending))
+
+        return datatype.ResSyncHistoricalTicks(
+            gaps=[(_to_datetime(gap_start), _to_datetime(gap_end))
+                  for gap_start, gap_end in gaps],
+            ticks=num_ticks
+        )
 
-                raise err
+    async def req_historical_bars(
+        self, contract: ib_contract.Contract, start: datetime.datetime,
+        end: Optional[datetime.datetime]=None,
+        bar_size: datatype.BarSize=datatype.BarSize.MIN_1,
+        show: datatype.HistoricalBars=datatype.HistoricalBars.TRADES,
+        use_rth: bool=False, concurrency: int=4, retry: int=0
+    ) -> models.BarArray:
+        """Retrieve historical bars for specificed instrument/contract from
+        IB.
+
+        The time period is split into chunks of the longest duration IB
+        allows for `bar_size`, which are requested concurrently within the
+        pacing limitations and joined in time order.
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            start (:obj:`datetime.datetime`): The time of the earliest bar to
+                be included.
+            end (:obj:`datetime.datetime`, optional): The bars start before
+                this time are included. Defaults to `None` for the current
+                time.
+            bar_size (:obj:`ibpy_native.utils.datatype.BarSize`, optional):
+                Size of the bars. Defaults to `BarSize.MIN_1`.
+            show (:obj:`ibpy_native.utils.datatype.HistoricalBars`, optional):
+                Type of data requested. Defaults to `HistoricalBars.TRADES`.
+            use_rth (bool, optional): Returns the bars within regular trading
+                hours only. Defaults to `False`.
+            concurrency (int, optional): Max number of chunks being requested
+                at the same time. Defaults to `4`.
+            retry (int): Max retry attempts of each chunk if error occur
+                before terminating the task and rasing the error.
+
+        Returns:
+            :obj:`ibpy_native.models.BarArray`: The bars in time order.
 
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If
+                - `tzinfo` of `start` or `end` is not `None`;
+                - `start` is not earlier than `end`;
+                - value of `concurrency` is less than 1.
+            ibpy_native.error.IBError: If there is any issue raised from the
+                request function and max retry attemps has been reached.
+        """
+        # Error checking
+        if start.tzinfo is not None or (end is not None and
+                                        end.tzinfo is not None):
+            raise ValueError("Value of argument `start` & `end` must be an "
+                             "native `datetime` object.")
+        end_date_time = datetime.datetime.now() if end is None else end
+        if start >= end_date_time:
+            raise ValueError("Value of argument `start` must be earlier than "
+                             "`end`.")
+        if concurrency < 1:
+            raise ValueError("Value of argument `concurrency` must be at "
+                             "least 1.")
+
+        duration, span = _BAR_CHUNKS[bar_size]
+        chunks = []
+        chunk_start = start
+        while chunk_start < end_date_time:
+            chunk_end = min(chunk_start + span, end_date_time)
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_chunk(chunk_start: datetime.datetime,
+                              chunk_end: datetime.datetime
+                             ) -> models.BarArray:
             retry_attemps = 0
+            async with semaphore:
+                while True:
+                    try:
+                        bars = await self._client.req_historical_bars(
+                            req_id=self._wrapper.allocate_req_id(),
+                            contract=contract, end_date_time=chunk_end,
+                            duration=duration, bar_size=bar_size, show=show,
+                            use_rth=use_rth
+                        )
+                        break
+                    except error.IBError as err:
+                        if (err.err_code ==
+                                error.IBErrorCode.NOT_CONNECTED.value or
+                                retry_attemps >= retry):
+                            raise err
+                        retry_attemps += 1
+
+            # Trims the bars returned beyond the chunk as the duration
+            # covers more than the chunk
+            times = bars["time"]
+            return bars[
+                times.searchsorted(
+                    _global.TZ.localize(chunk_start).timestamp()):
+                times.searchsorted(
+                    _global.TZ.localize(chunk_end).timestamp())
+            ]
+
+        tasks = [asyncio.ensure_future(fetch_chunk(*chunk))
+                 for chunk in chunks]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            # Stops the remaining chunks once any of them failed
+            for task in tasks:
+                task.cancel()
 
-            if ticks:
-                # Drop the 1st tick as tick time of it is `start_date_time`
-                # - 1 second
-                if len(ticks) > 1:
-                    del ticks[0]
-                # Determine if it should fetch next batch of data
-                last_tick_time = datetime.datetime.fromtimestamp(
-                    timestamp=ticks[-1].time, tz=_global.TZ
-                ).replace(tzinfo=None)
+        return models.BarArray.concatenate(results)
 
-                if last_tick_time >= end_date_time:
-                    # All ticks within the specified time period are received
-                    finished = True
-                    for i in range(len(ticks) - 1, -1, -1):
-                        data_time = datetime.datetime.fromtimestamp(
-                            timestamp=ticks[i].time, tz=_global.TZ
-                        ).replace(tzinfo=None)
-                        if data_time > end_date_time:
-                            del ticks[i]
-                        else:
-                            break
-                else:
-                    # Ready for next request
-                    start_date_time = (last_tick_time +
-                                       datetime.timedelta(seconds=1))
-            else: # If no tick is returned
-                delta = datetime.timedelta(minutes=start_date_time.minute % 30,
-                                           seconds=start_date_time.second)
-                if delta.total_seconds() == 0: # Plus 30 minutes
-                    start_date_time = (start_date_time +
-                                       datetime.timedelta(minutes=30))
-                else: # Round up to next 30 minutes point
-                    start_date_time = (
-                        start_date_time + (datetime.datetime.min -
-                        start_date_time) % datetime.timedelta(minutes=30)
-                    )
+    def get_pacing_metrics(self) -> datatype.PacingMetrics:
+        """Returns the current usage of the pacing budgets of historical data
+        requests.
 
-            # Yield the result
-            yield datatype.ResHistoricalTicks(ticks=ticks, completed=finished)
+        Requests exceeding the pacing limitations of IB are queued until they
+        can be sent without violation, and all requests are held for a
+        cooldown period once IB reports a pacing violation.
+
+        Returns:
+            :obj:`ibpy_native.utils.datatype.PacingMetrics`: Usage of the
+                budgets.
+        """
+        return self._client.pacing.metrics
     #endregion - Historical data
 
     #region - Live data
     async def stream_live_ticks(
         self, contract: ib_contract.Contract,
         listener: listeners.LiveTicksListener,
-        tick_type: datatype.LiveTicks=datatype.LiveTicks.LAST
+        tick_type: datatype.LiveTicks=datatype.LiveTicks.LAST,
+        max_pending: int=0,
+        overflow: datatype.OverflowPolicy=datatype.OverflowPolicy.BLOCK,
+        buffer_size: int=0
     ) -> int:
         """Request to stream live tick data.
 
+        Streams & the iterators of `live_ticks` of the same contract & tick
+        type share a single subscription with IB, which is cancelled once the
+        last of them is stopped.
+
         Args:
             contract (:obj:`ibapi.contract.Contract`): `Contract` object with
                 sufficient info to identify the instrument.
@@ -462,21 +849,105 @@ class IBBridge(interfaces.IBridge):
                 error from IB API.
             tick_type (:obj:`ibpy_native.utils.datatype.LiveTicks`, optional):
                 Type of ticks to be requested. Defaults to `LiveTicks.Last`.
+            max_pending (int, optional): Max number of ticks received but not
+                yet delivered to the listener. `0` for unlimited. Defaults to
+                `0`.
+            overflow (:obj:`ibpy_native.utils.datatype.OverflowPolicy`,
+                optional): Policy to apply on ticks arrive while there are
+                already `max_pending` ticks pending. Number of ticks discarded
+                can be checked via `get_live_ticks_dropped`. Defaults to
+                `OverflowPolicy.BLOCK`, which holds up the incoming messages
+                from IB until the listener catches up. Messages dispatched on
+                the event loop (i.e. connected via `connect_async`) can't be
+                held up; ticks beyond the bound are still queued.
+            buffer_size (int, optional): Capacity of the ring buffer to keep
+                the recent ticks as they're received, which can be read via
+                `get_live_ticks_buffer`. The buffer is shared by the streams
+                of the same contract & tick type, so the capacity requested
+                by the 1st stream applies. `0` for no buffer. Defaults to `0`.
 
         Returns:
-            int: Request identifier. This will be needed to stop the stream
+            int: Stream identifier. This will be needed to stop the stream
                 started by this function.
         """
-        req_id = self._wrapper.next_req_id
-
-        asyncio.create_task(
-            self._client.stream_live_ticks(
-                req_id=req_id, contract=contract, listener=listener,
-                tick_type=tick_type
-            )
+        stream_id = self._live_ticks_hub.subscribe(
+            contract=contract, tick_type=tick_type, max_pending=max_pending,
+            overflow=overflow, buffer_size=buffer_size
         )
+        asyncio.create_task(self._deliver_live_ticks(
+            stream_id=stream_id,
+            f_queue=self._live_ticks_hub.get_queue(stream_id),
+            listener=listener
+        ))
+
+        return stream_id
+
+    async def live_ticks(
+        self, contract: ib_contract.Contract,
+        tick_type: datatype.LiveTicks=datatype.LiveTicks.LAST,
+        max_batch: int=1000, max_wait: float=0, max_pending: int=0,
+        overflow: datatype.OverflowPolicy=datatype.OverflowPolicy.BLOCK,
+        columnar: bool=False
+    ) -> AsyncIterator[Union[List[Any], models.TickArray]]:
+        """Streams live tick data as an async iterator of batches, so ticks
+        are pulled at the consumer's own pace.
+
+        Iterators & streams of the same contract & tick type share a single
+        subscription with IB, which is cancelled once the last of them is
+        closed (e.g. via `aclose`, or leaving the `async for` loop with an
+        exception).
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            tick_type (:obj:`ibpy_native.utils.datatype.LiveTicks`, optional):
+                Type of ticks to be requested. Defaults to `LiveTicks.Last`.
+            max_batch (int, optional): Max number of ticks in each batch.
+                Defaults to `1000`.
+            max_wait (float, optional): Seconds to wait for more ticks to fill
+                up a batch before yielding it. Defaults to `0`.
+            max_pending (int, optional): Max number of ticks received but not
+                yet yielded. `0` for unlimited. Defaults to `0`.
+            overflow (:obj:`ibpy_native.utils.datatype.OverflowPolicy`,
+                optional): Policy to apply on ticks arrive while there are
+                already `max_pending` ticks pending. Defaults to
+                `OverflowPolicy.BLOCK`, which holds up the incoming messages
+                from IB as `stream_live_ticks` does.
+            columnar (bool, optional): Yields the batches as `TickArray`
+                instead of lists of tick objects. Requires `numpy`. Defaults
+                to `False`.
+
+        Yields:
+            :obj:`Union[list, ibpy_native.models.TickArray]`: Ticks received
+                since the last batch.
+
+        Raises:
+            ImportError: If `columnar` is `True` but `numpy` is not installed.
+            ibpy_native.error.IBError: If there's any error returned from IB.
+        """
+        if columnar:
+            _columnar.check_available()
 
-        return req_id
+        stream_id = self._live_ticks_hub.subscribe(
+            contract=contract, tick_type=tick_type, max_pending=max_pending,
+            overflow=overflow
+        )
+        batches = self._live_ticks_hub.get_queue(stream_id).stream_batches(
+            max_batch=max_batch, max_wait=max_wait)
+        try:
+            async for batch in batches:
+                ticks = _live_ticks_hub.ticks_of(batch)
+                if ticks:
+                    yield (models.TickArray.from_objects(ticks) if columnar
+                           else ticks)
+
+                # Finish signal or error can only be the last element
+                if isinstance(batch[-1], error.IBError):
+                    raise batch[-1]
+        finally:
+            await batches.aclose()
+            if self._live_ticks_hub.has_stream(stream_id):
+                self._live_ticks_hub.unsubscribe(stream_id)
 
     def stop_live_ticks_stream(self, stream_id: int):
         """Stop the specificed live tick data stream that's currently streaming.
@@ -489,12 +960,284 @@ class IBBridge(interfaces.IBridge):
                 stream associated with.
         """
         try:
-            self._client.cancel_live_ticks_stream(req_id=stream_id)
+            self._live_ticks_hub.unsubscribe(stream_id)
+        except error.IBError as err:
+            raise err
+
+    def get_live_ticks_dropped(self, stream_id: int) -> int:
+        """Returns the number of ticks discarded by the overflow policy of the
+        specified live tick data stream.
+
+        Args:
+            stream_id (int): Identifier for the stream.
+
+        Returns:
+            int: Number of ticks discarded so far.
+
+        Raises:
+            ibpy_native.error.IBError: If the specificed identifier has no
+                stream associated with.
+        """
+        try:
+            return self._live_ticks_hub.get_queue(stream_id).dropped
         except error.IBError as err:
             raise err
+
+    def get_live_ticks_buffer(
+        self, stream_id: int
+    ) -> Optional[models.TickRingBuffer]:
+        """Returns the ring buffer of the recent ticks received by the
+        specified live tick data stream.
+
+        Args:
+            stream_id (int): Identifier for the stream.
+
+        Returns:
+            :obj:`ibpy_native.models.TickRingBuffer`, optional: The buffer.
+                `None` if no buffer was requested via `buffer_size` of
+                `stream_live_ticks`.
+
+        Raises:
+            ibpy_native.error.IBError: If the specificed identifier has no
+                stream associated with.
+        """
+        try:
+            return self._live_ticks_hub.get_buffer(stream_id)
+        except error.IBError as err:
+            raise err
+
+    def subscribe_quotes(self, contracts: Sequence[ib_contract.Contract],
+                         generic_ticks: str="") -> List[int]:
+        """Request to stream the top of book market data (bid, ask, last,
+        sizes, etc.) of the contracts into the quote table, which can be read
+        via `get_quote_table`.
+
+        Each contract gets a row of the table, which is updated in place as
+        the ticks are received. Consumers can poll the rows updated since the
+        last poll via `QuoteTable.changed_since` instead of handling every
+        tick.
+
+        Args:
+            contracts (:obj:`Sequence[ibapi.contract.Contract]`): `Contract`
+                objects with sufficient info to identify the instruments.
+            generic_ticks (str, optional): Comma separated IDs of the generic
+                ticks to be requested in addition. Defaults to `""`.
+
+        Returns:
+            :obj:`List[int]`: Indices of the rows in the quote table, in the
+                order of the contracts. These will be needed to unsubscribe
+                the quotes.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        table = self.get_quote_table()
+
+        rows = []
+        for contract in contracts:
+            row = table.add_row()
+            req_id = self._wrapper.allocate_req_id()
+            self._quote_reqs[row] = req_id
+            self._client.req_quote(req_id=req_id, contract=contract,
+                                   table=table, row=row,
+                                   generic_ticks=generic_ticks)
+            rows.append(row)
+
+        return rows
+
+    def unsubscribe_quotes(self, rows: Sequence[int]):
+        """Stop streaming the market data of the quotes subscribed.
+
+        Args:
+            rows (:obj:`Sequence[int]`): Indices of the rows in the quote
+                table returned by `subscribe_quotes`.
+
+        Raises:
+            ibpy_native.error.IBError: If any of the rows has no subscription
+                associated with.
+        """
+        for row in rows:
+            if row not in self._quote_reqs:
+                raise error.IBError(
+                    rid=row, err_code=error.IBErrorCode.RES_NOT_FOUND,
+                    err_str=f"Quote subscription of row {row} not found"
+                )
+
+            req_id = self._quote_reqs.pop(row)
+            # Subscriptions are dropped on disconnect, and the request ID may
+            # be reused by other requests since
+            subscribed = self._wrapper.get_quote_row(req_id)
+            if (subscribed is not None and subscribed[0] is self._quote_table
+                    and subscribed[1] == row):
+                self._client.cancel_quote(req_id=req_id)
+            self._quote_table.remove_row(row)
+
+    def get_quote_table(self) -> models.QuoteTable:
+        """Returns the table of the quotes subscribed via `subscribe_quotes`.
+
+        Returns:
+            :obj:`ibpy_native.models.QuoteTable`: The table.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        if self._quote_table is None:
+            self._quote_table = models.QuoteTable()
+
+        return self._quote_table
+
+    def subscribe_order_book(self, contract: ib_contract.Contract,
+                             num_rows: int=10,
+                             smart_depth: bool=False) -> int:
+        """Request to stream the market depth of the contract into an order
+        book, which can be read via `get_order_book`.
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            num_rows (int, optional): Number of levels per side. Defaults to
+                `10`.
+            smart_depth (bool, optional): Aggregates the depth of the
+                exchanges via SMART. Defaults to `False`.
+
+        Returns:
+            int: Identifier of the book. This will be needed to read and to
+                unsubscribe the book.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        book = models.OrderBook(num_rows=num_rows)
+        book_id = next(self._book_ids)
+        req_id = self._wrapper.allocate_req_id()
+        self._order_books[book_id] = (book, smart_depth, req_id)
+        self._client.req_order_book(req_id=req_id, contract=contract,
+                                    book=book, smart_depth=smart_depth)
+
+        return book_id
+
+    def get_order_book(self, book_id: int) -> models.OrderBook:
+        """Returns the order book subscribed via `subscribe_order_book`.
+
+        Args:
+            book_id (int): Identifier of the book.
+
+        Returns:
+            :obj:`ibpy_native.models.OrderBook`: The book, which is updated in
+                place as the market depth is received.
+
+        Raises:
+            ibpy_native.error.IBError: If the specificed identifier has no
+                book associated with.
+        """
+        return self._get_order_book(book_id)[0]
+
+    def unsubscribe_order_book(self, book_id: int):
+        """Stop streaming the market depth of the order book.
+
+        Args:
+            book_id (int): Identifier of the book.
+
+        Raises:
+            ibpy_native.error.IBError: If the specificed identifier has no
+                book associated with.
+        """
+        book, smart_depth, req_id = self._get_order_book(book_id)
+        del self._order_books[book_id]
+        # Subscriptions are dropped on disconnect, and the request ID may be
+        # reused by other requests since
+        if self._wrapper.get_order_book(req_id) is book:
+            self._client.cancel_order_book(req_id=req_id,
+                                           smart_depth=smart_depth)
+
+    async def stream_realtime_bars(
+        self, contracts: Sequence[ib_contract.Contract],
+        show: datatype.HistoricalBars=datatype.HistoricalBars.TRADES,
+        use_rth: bool=False, max_wait: float=0,
+        buffers: Optional[Sequence[models.BarBuffer]]=None
+    ) -> AsyncIterator[Dict[int, Union[models.BarArray, error.IBError]]]:
+        """Streams the 5 seconds real-time bars of the contracts as an async
+        iterator, with the bars of each contract appended into a growable
+        columnar buffer.
+
+        Errors returned from IB for a contract (e.g. no market data
+        permissions) are yielded as the entry of the contract, while the
+        other contracts keep streaming. The subscriptions are cancelled on IB
+        side once the iterator is closed (e.g. via `aclose`, or leaving the
+        `async for` loop with an exception).
+
+        Args:
+            contracts (:obj:`Sequence[ibapi.contract.Contract]`): `Contract`
+                objects with sufficient info to identify the instruments.
+            show (:obj:`ibpy_native.utils.datatype.HistoricalBars`, optional):
+                Type of data, one of `TRADES`, `MIDPOINT`, `BID` or `ASK`.
+                Defaults to `HistoricalBars.TRADES`.
+            use_rth (bool, optional): Returns bars within regular trading
+                hours only. Defaults to `False`.
+            max_wait (float, optional): Seconds to wait for the bars of other
+                contracts before yielding. Defaults to `0`.
+            buffers (:obj:`Sequence[ibpy_native.models.BarBuffer]`, optional):
+                Buffer to append the bars of each contract to, which keeps
+                the history of the bars accessible via `BarBuffer.to_array`.
+                Defaults to `None` to create new buffers.
+
+        Yields:
+            :obj:`Dict[int, Union[BarArray, IBError]]`: Bars received since
+                the last yield, viewing the buffers, or the error returned
+                from IB, keyed by the index of the contracts.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If the number of `buffers` doesn't match with the
+                `contracts`.
+            ibpy_native.error.IBError: If the connection with IB is dropped.
+        """
+        if buffers is None:
+            buffers = [models.BarBuffer() for _ in contracts]
+        elif len(buffers) != len(contracts):
+            raise ValueError("Number of `buffers` must match with the "
+                             "`contracts`.")
+
+        bars = self._client.realtime_bars(
+            req_ids=[self._wrapper.allocate_req_id() for _ in contracts],
+            contracts=contracts, buffers=buffers, show=show, use_rth=use_rth,
+            max_wait=max_wait
+        )
+        try:
+            async for updates in bars:
+                yield updates
+        finally:
+            await bars.aclose()
     #endregion - Live data
 
     #region - Private functions
+    async def _deliver_live_ticks(self, stream_id: int,
+                                  f_queue: fq.FinishableQueue,
+                                  listener: listeners.LiveTicksListener):
+        """Delivers the ticks of a live ticks stream to the listener until
+        the stream is stopped or terminated by error.
+        """
+        async for batch in f_queue.stream_batches(max_batch=1000):
+            ticks = _live_ticks_hub.ticks_of(batch)
+            if ticks:
+                listener.on_ticks_receive(req_id=stream_id, ticks=ticks)
+
+            # Finish signal or error can only be the last element of a batch
+            if isinstance(batch[-1], error.IBError):
+                listener.on_err(err=batch[-1])
+            elif batch[-1] is fq.Status.FINISHED:
+                listener.on_finish(req_id=stream_id)
+
+    def _get_order_book(self,
+                        book_id: int) -> Tuple[models.OrderBook, bool, int]:
+        if book_id not in self._order_books:
+            raise error.IBError(
+                rid=book_id, err_code=error.IBErrorCode.RES_NOT_FOUND,
+                err_str=f"Order book with ID {book_id} not found"
+            )
+
+        return self._order_books[book_id]
+
     def _heart_beat(self):
         """Infinity loop to monitor connection with TWS/Gateway."""
         while True:
@@ -502,4 +1245,446 @@ class IBBridge(interfaces.IBridge):
             if not self._client.isConnected():
                 break
             self._client.reqCurrentTime()
+
+    async def _trading_schedule(
+        self, contract: ib_contract.Contract
+    ) -> Optional[trading_hours.TradingSchedule]:
+        """Returns the trading schedule of the contract, from the cache or
+        the contract details requested from IB.
+
+        Returns:
+            :obj:`ibpy_native.utils.trading_hours.TradingSchedule`, optional:
+                The schedule. `None` if `contract` has no `conId` or the
+                schedule is unavailable.
+        """
+        if not contract.conId:
+            return None
+
+        cached = self._schedules.get(contract.conId)
+        if cached is not None and time.time() - cached[1] < _SCHEDULE_TTL:
+            return cached[0]
+
+        con_id = contract.conId
+        lookup = self._schedule_lookups.get(con_id)
+        if lookup is None:
+            lookup = asyncio.ensure_future(
+                self._lookup_trading_schedule(contract))
+            self._schedule_lookups[con_id] = lookup
+            lookup.add_done_callback(
+                lambda _: self._schedule_lookups.pop(con_id, None))
+
+        # Cancelling a task awaiting doesn't cancel the lookup shared
+        return await asyncio.shield(lookup)
+
+    async def _lookup_trading_schedule(
+        self, contract: ib_contract.Contract
+    ) -> Optional[trading_hours.TradingSchedule]:
+        """Requests the contract details from IB for the trading schedule."""
+        try:
+            res = await self._client.resolve_contracts(
+                req_id=self._wrapper.allocate_req_id(), contract=contract)
+        except error.IBError:
+            # Steps forward without the schedule
+            self._schedules[contract.conId] = (None, time.time())
+            return None
+
+        for details in res:
+            self._cache_trading_schedule(details)
+
+        return self._schedules.get(contract.conId, (None,))[0]
+
+    def _cache_trading_schedule(self, details: ib_contract.ContractDetails):
+        try:
+            schedule = trading_hours.TradingSchedule.from_contract_details(
+                details)
+        except ValueError:
+            # Trading hours in unexpected format
+            schedule = None
+
+        self._schedules[details.contract.conId] = (schedule, time.time())
+
+    def _fetch_pages(
+        self, contract: ib_contract.Contract, start: datetime.datetime,
+        end: datetime.datetime, tick_type: datatype.HistoricalTicks,
+        retry: int, columnar: bool, concurrency: int,
+        shard_size: Optional[datetime.timedelta], skip_closed: bool
+    ) -> AsyncGenerator[datatype.ResHistoricalTicks, None]:
+        """Fetches the ticks within the time period from IB, in shards if
+        `concurrency` is greater than 1 or sequentially otherwise.
+        """
+        if concurrency > 1:
+            return self._fetch_ticks_sharded(
+                contract=contract, start=start, end=end, tick_type=tick_type,
+                retry=retry, columnar=columnar, concurrency=concurrency,
+                shard_size=shard_size, skip_closed=skip_closed
+            )
+
+        return self._fetch_ticks(
+            contract=contract, start=start, end=end, tick_type=tick_type,
+            retry=retry, columnar=columnar, skip_closed=skip_closed
+        )
+
+    async def _fetch_ticks_cached(
+        self, contract: ib_contract.Contract, start: datetime.datetime,
+        end: datetime.datetime, tick_type: datatype.HistoricalTicks,
+        retry: int, columnar: bool, concurrency: int,
+        shard_size: Optional[datetime.timedelta], skip_closed: bool
+    ) -> AsyncIterator[datatype.ResHistoricalTicks]:
+        """Serves the ticks within the time period from the tick store, and
+        fetches the gaps not covered from IB.
+
+        Ticks of a gap are stored once the whole gap is received, except the
+        parts stored by other downloads meanwhile. Ticks of the latest second
+        are not stored as IB may not have received all of them yet.
+        """
+        store = self._tick_store
+        # Tick time is in whole seconds
+        start_time = math.ceil(_global.TZ.localize(start).timestamp())
+        end_time = math.floor(_global.TZ.localize(end).timestamp())
+        parts = store.lookup(con_id=contract.conId, tick_type=tick_type,
+                             start=start_time, end=end_time)
+        if not parts:
+            yield datatype.ResHistoricalTicks(ticks=[], completed=True)
+
+        for idx, (part_start, part_end, ticks) in enumerate(parts):
+            is_last = idx == len(parts) - 1
+
+            if ticks is not None:
+                yield datatype.ResHistoricalTicks(
+                    ticks=ticks if columnar else list(ticks),
+                    completed=is_last)
+                continue
+
+            covered_end = min(part_end, int(time.time()) - 1)
+            received = []
+            pages = self._fetch_pages(
+                contract=contract, start=_to_datetime(part_start),
+                end=_to_datetime(part_end), tick_type=tick_type,
+                retry=retry, columnar=columnar, concurrency=concurrency,
+                shard_size=shard_size, skip_closed=skip_closed
+            )
+            try:
+                async for page in pages:
+                    received.append(page.ticks if columnar else
+                                    models.TickArray.from_objects(page.ticks))
+                    yield datatype.ResHistoricalTicks(
+                        ticks=page.ticks,
+                        completed=is_last and page.completed)
+            finally:
+                await pages.aclose()
+
+            if covered_end >= part_start:
+                ticks = models.TickArray.concatenate(received)
+                if len(ticks) > 0:
+                    ticks = ticks[ticks["time"] <= covered_end]
+                # Gap could be stored by concurrent downloads meanwhile
+                store.fill(con_id=contract.conId, tick_type=tick_type,
+                           start=part_start, end=covered_end, ticks=ticks)
+
+    async def _fetch_ticks(
+        self, contract: ib_contract.Contract, start: datetime.datetime,
+        end: datetime.datetime, tick_type: datatype.HistoricalTicks,
+        retry: int, columnar: bool, end_inclusive: bool=True,
+        skip_closed: bool=False
+    ) -> AsyncIterator[datatype.ResHistoricalTicks]:
+        """Fetches the ticks within the time period page by page, with the
+        ticks outside the period trimmed.
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            start (:obj:`datetime.datetime`): Datetime for the earliest tick
+                data to be included.
+            end (:obj:`datetime.datetime`): Datetime for the latest tick data.
+            tick_type (:obj:`ibpy_native.utils.datatype.HistoricalTicks`):
+                Type of tick data.
+            retry (int): Max retry attempts if error occur before terminating
+                the task and rasing the error.
+            columnar (bool): Parses the ticks into a `TickArray`.
+            end_inclusive (bool, optional): If the ticks at `end` should be
+                included. `False` for shards those are followed by the next
+                one starting at `end`. Defaults to `True`.
+            skip_closed (bool, optional): Skips the time the market is closed
+                according to the trading hours of `contract`, if no tick is
+                returned. Defaults to `False`.
+
+        Yields:
+            :obj:ibpy_native.utils.datatype.ResHistoricalTicks`: Tick data
+                received from IB.
+
+        Raises:
+            ibpy_native.error.IBError: If there is any issue raised from the
+                request function and max retry attemps has been reached.
+        """
+        start_date_time = start
+        end_time = _global.TZ.localize(end).timestamp()
+        finished = False
+        retry_attemps = 0
+
+        while not finished:
+            try:
+                ticks = await self._client.req_historical_ticks(
+                    req_id=self._wrapper.allocate_req_id(), contract=contract,
+                    start_date_time=start_date_time, show=tick_type,
+                    columnar=columnar
+                )
+            except error.IBError as err:
+                if err.err_code == error.IBErrorCode.NOT_CONNECTED.value:
+                    raise err
+                if retry_attemps < retry:
+                    # Retry is held by the pacing scheduler of the client
+                    # until the cooldown of pacing violation is over
+                    retry_attemps += 1
+                    continue
+
+                raise err
+
+            retry_attemps = 0
+
+            # Ticks of `start_date_time` - 1 second are returned as the 1st
+            # tick, which have been received already or are out of the period
+            last_tick_time = _last_tick_time(ticks)
+            ticks = self._trim_ticks(
+                ticks, lower=_global.TZ.localize(start_date_time).timestamp()
+            )
+
+            if len(ticks) > 0:
+                # Determine if it should fetch next batch of data
+                if last_tick_time >= end_time:
+                    # All ticks within the specified time period are received
+                    finished = True
+                    # Trim the ticks later than `end`
+                    ticks = self._trim_ticks(ticks, upper=end_time,
+                                             upper_inclusive=end_inclusive)
+                else:
+                    # Ready for next request
+                    start_date_time = datetime.datetime.fromtimestamp(
+                        timestamp=last_tick_time + 1, tz=_global.TZ
+                    ).replace(tzinfo=None)
+            else: # If no tick is returned
+                delta = datetime.timedelta(minutes=start_date_time.minute % 30,
+                                           seconds=start_date_time.second)
+                if delta.total_seconds() == 0: # Plus 30 minutes
+                    start_date_time = (start_date_time +
+                                       datetime.timedelta(minutes=30))
+                else: # Round up to next 30 minutes point
+                    start_date_time = (
+                        start_date_time + (datetime.datetime.min -
+                        start_date_time) % datetime.timedelta(minutes=30)
+                    )
+                schedule = (await self._trading_schedule(contract)
+                            if skip_closed else None)
+                if schedule is not None:
+                    # Jump to the next session if the market is closed
+                    start_date_time = _to_datetime(schedule.next_open(
+                        _global.TZ.localize(start_date_time).timestamp()))
+                # No tick left within the period
+                finished = (start_date_time > end if end_inclusive
+                            else start_date_time >= end)
+
+            # Yield the result
+            yield datatype.ResHistoricalTicks(ticks=ticks, completed=finished)
+
+    async def _fetch_ticks_sharded(
+        self, contract: ib_contract.Contract, start: datetime.datetime,
+        end: datetime.datetime, tick_type: datatype.HistoricalTicks,
+        retry: int, columnar: bool, concurrency: int,
+        shard_size: Optional[datetime.timedelta], skip_closed: bool
+    ) -> AsyncIterator[datatype.ResHistoricalTicks]:
+        """Fetches the ticks within the time period in shards concurrently,
+        and yields the pages in time order.
+
+        Shards are downloaded within a sliding window of size `concurrency`,
+        so at most `concurrency` shards are buffered while the earliest one is
+        being consumed.
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            start (:obj:`datetime.datetime`): Datetime for the earliest tick
+                data to be included.
+            end (:obj:`datetime.datetime`): Datetime for the latest tick data
+                to be included.
+            tick_type (:obj:`ibpy_native.utils.datatype.HistoricalTicks`):
+                Type of tick data.
+            retry (int): Max retry attempts of each shard.
+            columnar (bool): Parses the ticks into a `TickArray`.
+            concurrency (int): Max number of shards to be downloaded at the
+                same time.
+            shard_size (:obj:`datetime.timedelta`, optional): Time period
+                covered by each shard.
+            skip_closed (bool): Skips the time the market is closed.
+
+        Yields:
+            :obj:ibpy_native.utils.datatype.ResHistoricalTicks`: Tick data
+                received from IB.
+
+        Raises:
+            ibpy_native.error.IBError: If there is any issue raised from the
+                request function and max retry attemps has been reached.
+        """
+        if shard_size is None:
+            shard_size = min((end - start) / concurrency,
+                             datetime.timedelta(days=1))
+
+        shards = []
+        shard_start = start
+        while shard_start < end and shard_size > datetime.timedelta(0):
+            shard_end = min(shard_start + shard_size, end)
+            shards.append((shard_start, shard_end))
+            shard_start = shard_end
+        if not shards:
+            shards.append((start, end))
+
+        async def download(idx: int, pages: asyncio.Queue):
+            try:
+                async for page in self._fetch_ticks(
+                    contract=contract, start=shards[idx][0],
+                    end=shards[idx][1], tick_type=tick_type, retry=retry,
+                    columnar=columnar, end_inclusive=idx == len(shards) - 1,
+                    skip_closed=skip_closed
+                ):
+                    pages.put_nowait(page)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err: # pylint: disable=broad-except
+                pages.put_nowait(err)
+            else:
+                pages.put_nowait(None)
+
+        window = collections.deque()
+        next_idx = 0
+
+        try:
+            while next_idx < len(shards) or window:
+                # Fill up the window
+                while next_idx < len(shards) and len(window) < concurrency:
+                    pages = asyncio.Queue()
+                    window.append(
+                        (asyncio.ensure_future(download(next_idx, pages)),
+                         pages, next_idx == len(shards) - 1)
+                    )
+                    next_idx += 1
+
+                _, pages, is_last = window[0]
+                while True:
+                    page = await pages.get()
+                    if page is None:
+                        break
+                    if isinstance(page, Exception):
+                        raise page
+                    if len(page.ticks) > 0 or (is_last and page.completed):
+                        yield datatype.ResHistoricalTicks(
+                            ticks=page.ticks,
+                            completed=is_last and page.completed
+                        )
+                window.popleft()
+        finally:
+            for task, _, _ in window:
+                task.cancel()
+
+    @staticmethod
+    async def _prefetch(pages: AsyncGenerator[Any, None],
+                        depth: int) -> AsyncIterator[Any]:
+        """Iterates `pages` in a background task which keeps up to `depth`
+        pages fetched ahead of the consumer.
+
+        The background task is cancelled once this generator is closed, e.g.
+        the consumer breaks the loop early.
+
+        Args:
+            pages (:obj:`AsyncGenerator`): Pages to be fetched.
+            depth (int): Max number of pages to be buffered.
+
+        Yields:
+            Pages from `pages` in the same order.
+
+        Raises:
+            Exception: Any exception raised from `pages`.
+        """
+        buffer = asyncio.Queue(maxsize=depth)
+
+        async def fetch():
+            try:
+                async for page in pages:
+                    await buffer.put((page, None))
+            except asyncio.CancelledError:
+                raise
+            except Exception as err: # pylint: disable=broad-except
+                await buffer.put((None, err))
+            else:
+                await buffer.put((None, None))
+            finally:
+                # Stops the pending requests of `pages` on cancellation
+                await pages.aclose()
+
+        task = asyncio.ensure_future(fetch())
+
+        try:
+            while True:
+                page, err = await buffer.get()
+                if err is not None:
+                    raise err
+                if page is None:
+                    break
+
+                yield page
+        finally:
+            task.cancel()
+
+    @staticmethod
+    def _trim_ticks(ticks: Any, lower: Optional[float]=None,
+                    upper: Optional[float]=None,
+                    upper_inclusive: bool=True) -> Any:
+        """Trims the ticks out of the time period from both ends.
+
+        Args:
+            ticks: Ticks sorted by time, as list or `TickArray`.
+            lower (float, optional): Timestamp of the earliest tick to keep.
+                Defaults to `None`.
+            upper (float, optional): Timestamp of the latest tick to keep.
+                Defaults to `None`.
+            upper_inclusive (bool, optional): If the ticks at `upper` should
+                be kept. Defaults to `True`.
+
+        Returns:
+            Ticks within the time period, of the same type as `ticks`.
+        """
+        if isinstance(ticks, models.TickArray):
+            # Binary search on the time column without building tick objects
+            times = ticks["time"]
+            head = 0 if lower is None else int(times.searchsorted(lower))
+            cut = len(ticks) if upper is None else max(head, int(
+                times.searchsorted(
+                    upper, side="right" if upper_inclusive else "left")))
+
+            return (ticks if head == 0 and cut == len(ticks)
+                    else ticks[head:cut])
+
+        head = 0
+        cut = len(ticks)
+        if lower is not None:
+            while head < cut and ticks[head].time < lower:
+                head += 1
+        if upper is not None:
+            while cut > head and (
+                    ticks[cut - 1].time > upper or
+                    (not upper_inclusive and ticks[cut - 1].time == upper)):
+                cut -= 1
+
+        return ticks if head == 0 and cut == len(ticks) else ticks[head:cut]
     #endregion - Private functions
+
+def _last_tick_time(ticks: Any) -> int:
+    """Returns the time of the last tick, or `0` if there's no tick."""
+    if len(ticks) == 0:
+        return 0
+    if isinstance(ticks, models.TickArray):
+        return int(ticks["time"][-1])
+
+    return ticks[-1].time
+
+def _to_datetime(timestamp: float) -> datetime.datetime:
+    """Converts the epoch time to native `datetime` in the timezone set."""
+    return datetime.datetime.fromtimestamp(
+        timestamp, tz=_global.TZ).replace(tzinfo=None)
@@ -7,8 +7,10 @@ class IBErrorCode(enum.IntEnum):
     # Error codes defined by IB
     DUPLICATE_TICKER_ID = 102
     DUPLICATE_ORDER_ID = 103
+    HISTORICAL_DATA_SERVICE = 162
     INVALID_CONTRACT = 200
     ORDER_REJECTED = 201
+    MKT_DEPTH_RESET = 317
     ORDER_MESSAGE = 399
     NOT_CONNECTED = 504
     # Self-defined error codes
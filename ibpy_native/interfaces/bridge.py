@@ -1,15 +1,19 @@
 """Interface module for `IBBridge`."""
 import abc
 import datetime
-from typing import AsyncIterator, List, Optional
+from typing import (Any, AsyncIterator, Dict, List, Optional, Sequence,
+                    Union)
 
 from ibapi import contract as ib_contract
 from ibapi import order as ib_order
 
+from ibpy_native import error
 from ibpy_native import models
 from ibpy_native.interfaces import delegates
 from ibpy_native.interfaces import listeners
 from ibpy_native.utils import datatype
+from ibpy_native.utils import head_timestamp_cache
+from ibpy_native.utils import tick_store
 
 class IBridge(metaclass=abc.ABCMeta):
     """Public interface of the class that bridge between `ibpy-native` & IB API.
@@ -86,6 +90,43 @@ class IBridge(metaclass=abc.ABCMeta):
         """
         return NotImplemented
 
+    @abc.abstractmethod
+    def set_request_timeout(self, timeout: Optional[float]):
+        """Set the default seconds to wait for the response of a request
+        before it's abandoned with error `REQ_TIMEOUT`.
+
+        Args:
+            timeout (:obj:`float`, optional): Seconds to wait. `None` to wait
+                without limit.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def set_tick_store(self, store: Optional[tick_store.TickStore]):
+        """Set the local store of historical ticks. Time ranges covered by
+        the store are served from disk by `req_historical_ticks`, and only
+        the gaps are requested from IB & stored.
+
+        Args:
+            store (:obj:`ibpy_native.utils.tick_store.TickStore`, optional):
+                The store. `None` to always request IB.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def set_head_timestamp_cache(
+        self, cache: Optional[head_timestamp_cache.HeadTimestampCache]
+    ):
+        """Set the cache of head timestamps used by
+        `get_earliest_data_point`.
+
+        Args:
+            cache (:obj:`ibpy_native.utils.head_timestamp_cache
+                .HeadTimestampCache`, optional): The cache. `None` to always
+                request IB.
+        """
+        return NotImplemented
+
     #region - Connections
     @abc.abstractmethod
     def connect(self):
@@ -93,6 +134,14 @@ class IBridge(metaclass=abc.ABCMeta):
         """
         return NotImplemented
 
+    @abc.abstractmethod
+    async def connect_async(self):
+        """Connect the bridge to a running & logged in TWS/IB Gateway instance
+        with messages from IB being handled on the running event loop, instead
+        of the background threads used by `connect`.
+        """
+        return NotImplemented
+
     @abc.abstractmethod
     def disconnect(self):
         """Disconnect the bridge from the connected TWS/IB Gateway instance.
@@ -226,11 +275,18 @@ class IBridge(metaclass=abc.ABCMeta):
         start: Optional[datetime.datetime]=None,
         end: Optional[datetime.datetime]=None,
         tick_type: datatype.HistoricalTicks=datatype.HistoricalTicks.TRADES,
-        retry: int=0
+        retry: int=0, columnar: bool=False, concurrency: int=1,
+        shard_size: Optional[datetime.timedelta]=None, prefetch: int=0,
+        head_lookup: bool=True, skip_closed: bool=True
     ) -> AsyncIterator[datatype.ResHistoricalTicks]:
         """Retrieve historical tick data for specificed instrument/contract
         from IB.
 
+        Ticks are requested page by page sequentially by default. If
+        `concurrency` is greater than 1, the time period is split into shards
+        which are downloaded concurrently over separated requests, and the
+        pages are still yielded in time order.
+
         Args:
             contract (:obj:`ibapi.contract.Contract`): `Contract` object with
                 sufficient info to identify the instrument.
@@ -245,6 +301,25 @@ class IBridge(metaclass=abc.ABCMeta):
                 `HistoricalTicks.TRADES`.
             retry (int): Max retry attempts if error occur before terminating
                 the task and rasing the error.
+            columnar (bool, optional): Parses the ticks into a `TickArray` of
+                NumPy arrays instead of objects per tick. Requires `numpy`.
+                Defaults to `False`.
+            concurrency (int, optional): Max number of shards to be downloaded
+                at the same time. Defaults to `1` to download sequentially.
+            shard_size (:obj:`datetime.timedelta`, optional): Time period
+                covered by each shard. Defaults to `None` to split the period
+                evenly by `concurrency`, with shards no longer than 1 day.
+            prefetch (int, optional): Number of pages to be fetched ahead in
+                background while the current page is being processed.
+                Defaults to `0` to fetch the next page only once the current
+                one is consumed.
+            head_lookup (bool, optional): Looks up the earliest data point to
+                start from if `start` is earlier. `False` to skip the lookup if
+                `start` is given. Defaults to `True`.
+            skip_closed (bool, optional): Jumps to the next trading session
+                according to `ContractDetails.tradingHours` of `contract` if
+                no tick is returned, instead of moving forward in 30 minutes
+                steps. Requires `contract.conId`. Defaults to `True`.
 
         Yields:
             :obj:ibpy_native.utils.datatype.ResHistoricalTicks`: Tick data
@@ -252,6 +327,95 @@ class IBridge(metaclass=abc.ABCMeta):
                 within the specified time period are received.
         """
         return NotImplemented
+
+    @abc.abstractmethod
+    async def sync_historical_ticks(
+        self, contract: ib_contract.Contract,
+        tick_type: datatype.HistoricalTicks, start: datetime.datetime,
+        end: Optional[datetime.datetime]=None,
+        store: Optional[tick_store.TickStore]=None, retry: int=0,
+        concurrency: int=1, shard_size: Optional[datetime.timedelta]=None,
+        checkpoint: int=100000
+    ) -> datatype.ResSyncHistoricalTicks:
+        """Downloads the historical ticks within the time period those are
+        missing from the tick store into the store.
+
+        Ticks received are stored every `checkpoint` ticks, so a sync
+        interrupted resumes from the last checkpoint on next call.
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): Resolved `Contract`
+                object with `conId`.
+            tick_type (:obj:`ibpy_native.utils.datatype.HistoricalTicks`):
+                Type of tick data.
+            start (:obj:`datetime.datetime`): Datetime for the earliest tick
+                data to be synced.
+            end (:obj:`datetime.datetime`, optional): Datetime for the latest
+                tick data to be synced. If is `None`, the end time will be set
+                as now. Defaults to `None`.
+            store (:obj:`ibpy_native.utils.tick_store.TickStore`, optional):
+                Store to sync the ticks into. Defaults to `None` to use the
+                one set via `set_tick_store`.
+            retry (int): Max retry attempts if error occur before terminating
+                the task and rasing the error.
+            concurrency (int, optional): Max number of shards to be downloaded
+                at the same time. Defaults to `1`.
+            shard_size (:obj:`datetime.timedelta`, optional): Time period
+                covered by each shard. Defaults to `None`.
+            checkpoint (int, optional): Number of ticks received to be stored
+                at once. Defaults to `100000`.
+
+        Returns:
+            :obj:`ibpy_native.utils.datatype.ResSyncHistoricalTicks`: Time
+                ranges downloaded and the number of ticks.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    async def req_historical_bars(
+        self, contract: ib_contract.Contract, start: datetime.datetime,
+        end: Optional[datetime.datetime]=None,
+        bar_size: datatype.BarSize=datatype.BarSize.MIN_1,
+        show: datatype.HistoricalBars=datatype.HistoricalBars.TRADES,
+        use_rth: bool=False, concurrency: int=4, retry: int=0
+    ) -> models.BarArray:
+        """Retrieve historical bars for specificed instrument/contract from
+        IB, in chunks requested concurrently within the pacing limitations.
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            start (:obj:`datetime.datetime`): The time of the earliest bar to
+                be included.
+            end (:obj:`datetime.datetime`, optional): The bars start before
+                this time are included. Defaults to `None` for the current
+                time.
+            bar_size (:obj:`ibpy_native.utils.datatype.BarSize`, optional):
+                Size of the bars. Defaults to `BarSize.MIN_1`.
+            show (:obj:`ibpy_native.utils.datatype.HistoricalBars`, optional):
+                Type of data requested. Defaults to `HistoricalBars.TRADES`.
+            use_rth (bool, optional): Returns the bars within regular trading
+                hours only. Defaults to `False`.
+            concurrency (int, optional): Max number of chunks being requested
+                at the same time. Defaults to `4`.
+            retry (int): Max retry attempts of each chunk if error occur
+                before terminating the task and rasing the error.
+
+        Returns:
+            :obj:`ibpy_native.models.BarArray`: The bars in time order.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def get_pacing_metrics(self) -> datatype.PacingMetrics:
+        """Returns the current usage of the pacing budgets of historical data
+        requests.
+
+        Returns:
+            :obj:`ibpy_native.utils.datatype.PacingMetrics`: Usage of the
+                budgets.
+        """
+        return NotImplemented
     #endregion - Historical data
 
     #region - Live data
@@ -259,10 +423,16 @@ class IBridge(metaclass=abc.ABCMeta):
     async def stream_live_ticks(
         self, contract: ib_contract.Contract,
         listener: listeners.LiveTicksListener,
-        tick_type: datatype.LiveTicks=datatype.LiveTicks.LAST
+        tick_type: datatype.LiveTicks=datatype.LiveTicks.LAST,
+        max_pending: int=0,
+        overflow: datatype.OverflowPolicy=datatype.OverflowPolicy.BLOCK,
+        buffer_size: int=0
     ) -> int:
         """Request to stream live tick data.
 
+        Streams & the iterators of `live_ticks` of the same contract & tick
+        type share a single subscription with IB.
+
         Args:
             contract (:obj:`ibapi.contract.Contract`): `Contract` object with
                 sufficient info to identify the instrument.
@@ -271,13 +441,66 @@ class IBridge(metaclass=abc.ABCMeta):
                 error from IB API.
             tick_type (:obj:`ibpy_native.utils.datatype.LiveTicks`, optional):
                 Type of ticks to be requested. Defaults to `LiveTicks.Last`.
+            max_pending (int, optional): Max number of ticks received but not
+                yet delivered to the listener. `0` for unlimited. Defaults to
+                `0`.
+            overflow (:obj:`ibpy_native.utils.datatype.OverflowPolicy`,
+                optional): Policy to apply on ticks arrive while there are
+                already `max_pending` ticks pending. Number of ticks discarded
+                can be checked via `get_live_ticks_dropped`. Defaults to
+                `OverflowPolicy.BLOCK`, which holds up the incoming messages
+                from IB until the listener catches up. Messages dispatched on
+                the event loop (i.e. connected via `connect_async`) can't be
+                held up; ticks beyond the bound are still queued.
+            buffer_size (int, optional): Capacity of the ring buffer to keep
+                the recent ticks as they're received, which can be read via
+                `get_live_ticks_buffer`. The buffer is shared by the streams
+                of the same contract & tick type, so the capacity requested
+                by the 1st stream applies. `0` for no buffer. Defaults to `0`.
 
         Returns:
-            int: Request identifier. This will be needed to stop the stream
+            int: Stream identifier. This will be needed to stop the stream
                 started by this function.
         """
         return NotImplemented
 
+    @abc.abstractmethod
+    async def live_ticks(
+        self, contract: ib_contract.Contract,
+        tick_type: datatype.LiveTicks=datatype.LiveTicks.LAST,
+        max_batch: int=1000, max_wait: float=0, max_pending: int=0,
+        overflow: datatype.OverflowPolicy=datatype.OverflowPolicy.BLOCK,
+        columnar: bool=False
+    ) -> AsyncIterator[Union[List[Any], models.TickArray]]:
+        """Streams live tick data as an async iterator of batches. The
+        subscription shared with `stream_live_ticks` is cancelled once the
+        last of its iterators & streams is closed.
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            tick_type (:obj:`ibpy_native.utils.datatype.LiveTicks`, optional):
+                Type of ticks to be requested. Defaults to `LiveTicks.Last`.
+            max_batch (int, optional): Max number of ticks in each batch.
+                Defaults to `1000`.
+            max_wait (float, optional): Seconds to wait for more ticks to fill
+                up a batch before yielding it. Defaults to `0`.
+            max_pending (int, optional): Max number of ticks received but not
+                yet yielded. `0` for unlimited. Defaults to `0`.
+            overflow (:obj:`ibpy_native.utils.datatype.OverflowPolicy`,
+                optional): Policy to apply on ticks arrive while there are
+                already `max_pending` ticks pending. Defaults to
+                `OverflowPolicy.BLOCK`.
+            columnar (bool, optional): Yields the batches as `TickArray`
+                instead of lists of tick objects. Requires `numpy`. Defaults
+                to `False`.
+
+        Yields:
+            :obj:`Union[list, ibpy_native.models.TickArray]`: Ticks received
+                since the last batch.
+        """
+        return NotImplemented
+
     @abc.abstractmethod
     def stop_live_ticks_stream(self, stream_id: int):
         """Stop the specificed live tick data stream that's currently streaming.
@@ -286,3 +509,186 @@ class IBridge(metaclass=abc.ABCMeta):
             stream_id (int): Identifier for the stream.
         """
         return NotImplemented
+
+    @abc.abstractmethod
+    def get_live_ticks_dropped(self, stream_id: int) -> int:
+        """Returns the number of ticks discarded by the overflow policy of the
+        specified live tick data stream.
+
+        Args:
+            stream_id (int): Identifier for the stream.
+
+        Returns:
+            int: Number of ticks discarded so far.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def get_live_ticks_buffer(
+        self, stream_id: int
+    ) -> Optional[models.TickRingBuffer]:
+        """Returns the ring buffer of the recent ticks received by the
+        specified live tick data stream.
+
+        Args:
+            stream_id (int): Identifier for the stream.
+
+        Returns:
+            :obj:`ibpy_native.models.TickRingBuffer`, optional: The buffer.
+                `None` if no buffer was requested via `buffer_size` of
+                `stream_live_ticks`.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def subscribe_quotes(self, contracts: Sequence[ib_contract.Contract],
+                         generic_ticks: str="") -> List[int]:
+        """Request to stream the top of book market data (bid, ask, last,
+        sizes, etc.) of the contracts into the quote table, which can be read
+        via `get_quote_table`.
+
+        Each contract gets a row of the table, which is updated in place as
+        the ticks are received. Consumers can poll the rows updated since the
+        last poll via `QuoteTable.changed_since` instead of handling every
+        tick.
+
+        Args:
+            contracts (:obj:`Sequence[ibapi.contract.Contract]`): `Contract`
+                objects with sufficient info to identify the instruments.
+            generic_ticks (str, optional): Comma separated IDs of the generic
+                ticks to be requested in addition. Defaults to `""`.
+
+        Returns:
+            :obj:`List[int]`: Indices of the rows in the quote table, in the
+                order of the contracts. These will be needed to unsubscribe
+                the quotes.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def unsubscribe_quotes(self, rows: Sequence[int]):
+        """Stop streaming the market data of the quotes subscribed.
+
+        Args:
+            rows (:obj:`Sequence[int]`): Indices of the rows in the quote
+                table returned by `subscribe_quotes`.
+
+        Raises:
+            ibpy_native.error.IBError: If any of the rows has no subscription
+                associated with.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def get_quote_table(self) -> models.QuoteTable:
+        """Returns the table of the quotes subscribed via `subscribe_quotes`.
+
+        Returns:
+            :obj:`ibpy_native.models.QuoteTable`: The table.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def subscribe_order_book(self, contract: ib_contract.Contract,
+                             num_rows: int=10,
+                             smart_depth: bool=False) -> int:
+        """Request to stream the market depth of the contract into an order
+        book, which can be read via `get_order_book`.
+
+        Args:
+            contract (:obj:`ibapi.contract.Contract`): `Contract` object with
+                sufficient info to identify the instrument.
+            num_rows (int, optional): Number of levels per side. Defaults to
+                `10`.
+            smart_depth (bool, optional): Aggregates the depth of the
+                exchanges via SMART. Defaults to `False`.
+
+        Returns:
+            int: Identifier of the book. This will be needed to read and to
+                unsubscribe the book.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def get_order_book(self, book_id: int) -> models.OrderBook:
+        """Returns the order book subscribed via `subscribe_order_book`.
+
+        Args:
+            book_id (int): Identifier of the book.
+
+        Returns:
+            :obj:`ibpy_native.models.OrderBook`: The book, which is updated in
+                place as the market depth is received.
+
+        Raises:
+            ibpy_native.error.IBError: If the specificed identifier has no
+                book associated with.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    def unsubscribe_order_book(self, book_id: int):
+        """Stop streaming the market depth of the order book.
+
+        Args:
+            book_id (int): Identifier of the book.
+
+        Raises:
+            ibpy_native.error.IBError: If the specificed identifier has no
+                book associated with.
+        """
+        return NotImplemented
+
+    @abc.abstractmethod
+    async def stream_realtime_bars(
+        self, contracts: Sequence[ib_contract.Contract],
+        show: datatype.HistoricalBars=datatype.HistoricalBars.TRADES,
+        use_rth: bool=False, max_wait: float=0,
+        buffers: Optional[Sequence[models.BarBuffer]]=None
+    ) -> AsyncIterator[Dict[int, Union[models.BarArray, error.IBError]]]:
+        """Streams the 5 seconds real-time bars of the contracts as an async
+        iterator, with the bars of each contract appended into a growable
+        columnar buffer.
+
+        Errors returned from IB for a contract (e.g. no market data
+        permissions) are yielded as the entry of the contract, while the
+        other contracts keep streaming. The subscriptions are cancelled on IB
+        side once the iterator is closed (e.g. via `aclose`, or leaving the
+        `async for` loop with an exception).
+
+        Args:
+            contracts (:obj:`Sequence[ibapi.contract.Contract]`): `Contract`
+                objects with sufficient info to identify the instruments.
+            show (:obj:`ibpy_native.utils.datatype.HistoricalBars`, optional):
+                Type of data, one of `TRADES`, `MIDPOINT`, `BID` or `ASK`.
+                Defaults to `HistoricalBars.TRADES`.
+            use_rth (bool, optional): Returns bars within regular trading
+                hours only. Defaults to `False`.
+            max_wait (float, optional): Seconds to wait for the bars of other
+                contracts before yielding. Defaults to `0`.
+            buffers (:obj:`Sequence[ibpy_native.models.BarBuffer]`, optional):
+                Buffer to append the bars of each contract to, which keeps
+                the history of the bars accessible via `BarBuffer.to_array`.
+                Defaults to `None` to create new buffers.
+
+        Yields:
+            :obj:`Dict[int, Union[BarArray, IBError]]`: Bars received since
+                the last yield, viewing the buffers, or the error returned
+                from IB, keyed by the index of the contracts.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+            ValueError: If the number of `buffers` doesn't match with the
+                `contracts`.
+            ibpy_native.error.IBError: If the connection with IB is dropped.
+        """
+        return NotImplemented
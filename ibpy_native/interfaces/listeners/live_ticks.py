@@ -1,7 +1,7 @@
 """Listener interfaces for live market data related functions."""
 # pylint: disable=protected-access
 import abc
-from typing import Union
+from typing import List, Union
 
 from ibapi import wrapper
 
@@ -24,6 +24,26 @@ class LiveTicksListener(base.BaseListener):
         """
         return NotImplemented
 
+    def on_ticks_receive(self, req_id: int, ticks: List[Union[
+            wrapper.HistoricalTick, wrapper.HistoricalTickBidAsk,
+            wrapper.HistoricalTickLast,
+        ]]):
+        """Callback on receives a batch of new live tick records.
+
+        Ticks arrived together (e.g. during a burst) are delivered in one
+        call. Override this function to process the whole batch at once;
+        otherwise `on_tick_receive` will be invoked for each tick.
+
+        Args:
+            req_id (int): Request identifier (or ticker ID in IB API).
+            ticks (:obj:`List[Union[ibapi.wrapper.HistoricalTick,
+                ibapi.wrapper.HistoricalTickBidAsk,
+                ibapi.wrapper.HistoricalTickLast]]`): Tick data received, in
+                the order of arrival.
+        """
+        for tick in ticks:
+            self.on_tick_receive(req_id=req_id, tick=tick)
+
     @abc.abstractmethod
     def on_finish(self, req_id: int):
         """Callback on `FINISHED` status is received.
@@ -103,46 +103,51 @@ class AccountsManager(delegates.AccountsManagementDelegate):
         last_elm: Optional[Union[models.RawAccountValueData,
                                  models.RawPortfolioData,]] = None
 
-        async for elm in self._account_updates_queue.stream():
-            if isinstance(elm, (models.RawAccountValueData,
-                                models.RawPortfolioData,)):
-                if elm.account != account.account_id:
-                    # Skip the current element incase the data received doesn't
-                    # belong to the account specified, which shouldn't happen
-                    # at all but just in case.
+        # Account values & portfolio data come in bursts, drains all the rows
+        # already arrived at once.
+        async for batch in self._account_updates_queue.stream_batches():
+            for elm in batch:
+                if isinstance(elm, (models.RawAccountValueData,
+                                    models.RawPortfolioData,)):
+                    if elm.account != account.account_id:
+                        # Skip the current element incase the data received
+                        # doesn't belong to the account specified, which
+                        # shouldn't happen at all but just in case.
+                        continue
+
+                    if isinstance(elm, models.RawAccountValueData):
+                        self._update_account_value(account=account, data=elm)
+                    elif isinstance(elm, models.RawPortfolioData):
+                        account.update_portfolio(
+                            contract_id=elm.contract.conId, data=elm)
+                elif isinstance(elm, str):
+                    if last_elm is None:
+                        # This case should not happen as the account update
+                        # time is always received after the updated data.
+                        continue
+
+                    if re.fullmatch(r"\d{2}:\d{2}", elm):
+                        time = datetime.datetime.strptime(elm,
+                                                          "%H:%M").time()
+                        time = time.replace(tzinfo=_global.TZ)
+
+                        if isinstance(last_elm,
+                                      (str, models.RawAccountValueData)):
+                            # This timestamp represents the last update system
+                            # time of the account values updated.
+                            account.last_update_time = time
+                        elif isinstance(last_elm, models.RawPortfolioData):
+                            # This timestamp represents the last update system
+                            # time of the portfolio data updated.
+                            account.positions[
+                                last_elm.contract.conId
+                            ].last_update_time = time
+                else:
+                    # In case if there's any unexpected element being passed
+                    # into this queue.
                     continue
 
-                if isinstance(elm, models.RawAccountValueData):
-                    self._update_account_value(account=account, data=elm)
-                elif isinstance(elm, models.RawPortfolioData):
-                    account.update_portfolio(contract_id=elm.contract.conId,
-                                             data=elm)
-            elif isinstance(elm, str):
-                if last_elm is None:
-                    # This case should not happen as the account update time
-                    # is always received after the updated data.
-                    continue
-
-                if re.fullmatch(r"\d{2}:\d{2}", elm):
-                    time = datetime.datetime.strptime(elm, "%H:%M").time()
-                    time = time.replace(tzinfo=_global.TZ)
-
-                    if isinstance(last_elm, (str, models.RawAccountValueData)):
-                        # This timestamp represents the last update system time
-                        # of the account values updated.
-                        account.last_update_time = time
-                    elif isinstance(last_elm, models.RawPortfolioData):
-                        # This timestamp represents the last update system time
-                        # of the portfolio data updated.
-                        account.positions[
-                            last_elm.contract.conId
-                        ].last_update_time = time
-            else:
-                # In case if there's any unexpected element being passed
-                # into this queue.
-                continue
-
-            last_elm = elm
+                last_elm = elm
 
     async def unsub_account_updates(self):
         """Unsubscribes to account updates."""
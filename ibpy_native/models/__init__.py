@@ -1,6 +1,12 @@
 """Expose models on package level."""
 from .account import Account
+from .bar_array import BarArray
+from .bar_buffer import BarBuffer
 from .order import OpenOrder
+from .order_book import OrderBook
 from .portfolio import Position
+from .quote_table import QuoteTable
 from .raw_data import RawAccountValueData
 from .raw_data import RawPortfolioData
+from .tick_array import TickArray
+from .tick_ring_buffer import TickRingBuffer
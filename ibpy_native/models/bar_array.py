@@ -0,0 +1,178 @@
+"""Model class for historical bars stored in columns."""
+import datetime
+from collections import abc
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from ibapi import common
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+# Field names & types of the columns, shared with `BarBuffer`
+FIELDS: Dict[str, str] = {
+    "time": "i8",  # Epoch time of the start of the bar
+    "open": "f8",
+    "high": "f8",
+    "low": "f8",
+    "close": "f8",
+    "volume": "f8",
+    "wap": "f8",  # Volume weighted average price
+    "count": "i8",  # Number of trades
+}
+
+class BarArray(abc.Sequence):
+    """Historical bars (OHLCV) stored as contiguous arrays per field, instead
+    of an object per bar.
+
+    Indexing with an integer returns the bar as a `BarData` object which is
+    created on access, with `date` in epoch seconds. Slicing returns another
+    `BarArray` viewing the same memory. Indexing with a field name returns the
+    array of the field.
+
+    Fields: `time`, `open`, `high`, `low`, `close`, `volume`, `wap` & `count`.
+
+    Args:
+        columns (:obj:`Dict[str, numpy.ndarray]`, optional): 1-D arrays of
+            same length per field. Defaults to `None` for no bar.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+    """
+    def __init__(self, columns: Optional[Dict[str, Any]]=None):
+        if np is None:
+            raise ImportError("`BarArray` requires `numpy`. Install it via "
+                              "`pip install ibpy-native[numpy]`.")
+
+        if columns is None:
+            columns = {name: np.empty(0, dtype=dtype)
+                       for name, dtype in FIELDS.items()}
+        self._columns = columns
+        self._len = len(columns["time"])
+
+    @classmethod
+    def from_objects(cls, bars: Sequence[common.BarData],
+                     tz: datetime.tzinfo) -> "BarArray":
+        """Creates a `BarArray` from the `BarData` objects returned by IB API.
+
+        Args:
+            bars (:obj:`Sequence[ibapi.common.BarData]`): Bars requested with
+                `formatDate` 2, which have `date` in epoch seconds, or in
+                `YYYYMMDD` for daily or longer bars.
+            tz (:obj:`datetime.tzinfo`): Timezone of the dates in `YYYYMMDD`.
+
+        Returns:
+            :obj:`ibpy_native.models.BarArray`: The bars.
+        """
+        return cls(columns={
+            "time": np.array([_parse_date(bar.date, tz) for bar in bars],
+                             dtype="i8"),
+            "open": np.array([bar.open for bar in bars], dtype="f8"),
+            "high": np.array([bar.high for bar in bars], dtype="f8"),
+            "low": np.array([bar.low for bar in bars], dtype="f8"),
+            "close": np.array([bar.close for bar in bars], dtype="f8"),
+            "volume": np.array([bar.volume for bar in bars], dtype="f8"),
+            "wap": np.array([bar.average for bar in bars], dtype="f8"),
+            "count": np.array([bar.barCount for bar in bars], dtype="i8"),
+        })
+
+    @classmethod
+    def concatenate(cls, arrays: Sequence["BarArray"]) -> "BarArray":
+        """Joins the bars of the arrays (e.g. chunks of a request) into one
+        `BarArray`.
+
+        Args:
+            arrays (:obj:`Sequence[BarArray]`): Arrays to be joined.
+
+        Returns:
+            :obj:`ibpy_native.models.BarArray`: Bars of all arrays in order.
+        """
+        arrays = [array for array in arrays if len(array) > 0]
+        if not arrays:
+            return cls()
+        if len(arrays) == 1:
+            return arrays[0]
+
+        return cls(columns={
+            name: np.concatenate([array[name] for array in arrays])
+            for name in FIELDS
+        })
+
+    @property
+    def fields(self) -> List[str]:
+        """:obj:`List[str]`: Names of the fields stored."""
+        return list(self._columns)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Returns the arrays of all fields without copying.
+
+        Returns:
+            :obj:`Dict[str, numpy.ndarray]`: Arrays keyed by the field names.
+        """
+        return dict(self._columns)
+
+    def to_pandas(self) -> Any:
+        """Returns the bars as a `pandas.DataFrame` backed by the same
+        memory, with a column per field.
+
+        Returns:
+            :obj:`pandas.DataFrame`: The bars.
+
+        Raises:
+            ImportError: If `pandas` is not installed.
+        """
+        import pandas as pd # pylint: disable=import-outside-toplevel
+
+        return pd.DataFrame(self._columns, copy=False)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, key: Union[int, slice, str, Any]) -> Any:
+        if isinstance(key, str):
+            return self._columns[key]
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self._len
+            if not 0 <= key < self._len:
+                raise IndexError("BarArray index out of range")
+
+            return self._to_object(key)
+
+        # Slices (views), index & boolean arrays
+        return BarArray(columns={name: column[key] for name, column
+                                 in self._columns.items()})
+
+    def __iter__(self) -> Iterator[common.BarData]:
+        for idx in range(self._len):
+            yield self._to_object(idx)
+
+    def __repr__(self) -> str:
+        return f"BarArray(len={self._len})"
+
+    #region - Private functions
+    def _to_object(self, idx: int) -> common.BarData:
+        """Creates the `BarData` object of the bar at `idx`."""
+        cols = self._columns
+
+        bar = common.BarData()
+        bar.date = str(int(cols["time"][idx]))
+        bar.open = float(cols["open"][idx])
+        bar.high = float(cols["high"][idx])
+        bar.low = float(cols["low"][idx])
+        bar.close = float(cols["close"][idx])
+        bar.volume = float(cols["volume"][idx])
+        bar.average = float(cols["wap"][idx])
+        bar.barCount = int(cols["count"][idx])
+
+        return bar
+    #endregion - Private functions
+
+def _parse_date(date: str, tz: datetime.tzinfo) -> int:
+    """Converts the `date` of `BarData` into epoch seconds."""
+    if len(date) == 8: # YYYYMMDD
+        return int(tz.localize(datetime.datetime.strptime(date, "%Y%m%d"))
+                   .timestamp())
+
+    return int(date)
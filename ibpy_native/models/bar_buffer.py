@@ -0,0 +1,110 @@
+"""Model class for the bars of a stream, appended into growable columns."""
+from typing import Optional
+
+from ibpy_native.models import bar_array
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+class BarBuffer:
+    """Bars of a stream (e.g. real-time bars of a contract) appended into
+    NumPy arrays per field, which double their capacity once full.
+
+    Bars are appended in amortized O(1) by a single writer (e.g. the thread
+    receiving messages from IB), while the history can be read from any
+    thread as `BarArray` views without copying. Growing the buffer copies the
+    bars into new arrays before they're used, so views taken earlier remain
+    valid.
+
+    Args:
+        capacity (int, optional): Number of bars preallocated. Defaults to
+            `1024`.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+    """
+    def __init__(self, capacity: int=1024):
+        if np is None:
+            raise ImportError("`BarBuffer` requires `numpy`. Install it via "
+                              "`pip install ibpy-native[numpy]`.")
+
+        self._columns = {name: np.empty(max(capacity, 1), dtype=dtype)
+                         for name, dtype in bar_array.FIELDS.items()}
+        self._len = 0
+
+    @property
+    def capacity(self) -> int:
+        """int: Number of bars can be kept before growing."""
+        return len(self._columns["time"])
+
+    def append(self, time: int, open_: float, high: float, low: float,
+               close: float, volume: float, wap: float, count: int):
+        """Appends a bar.
+
+        Args:
+            time (int): Epoch time of the start of the bar.
+            open_ (float): Open price.
+            high (float): High price.
+            low (float): Low price.
+            close (float): Close price.
+            volume (float): Volume.
+            wap (float): Volume weighted average price.
+            count (int): Number of trades.
+        """
+        idx = self._len
+        if idx == self.capacity:
+            self._grow()
+
+        cols = self._columns
+        cols["time"][idx] = time
+        cols["open"][idx] = open_
+        cols["high"][idx] = high
+        cols["low"][idx] = low
+        cols["close"][idx] = close
+        cols["volume"][idx] = volume
+        cols["wap"][idx] = wap
+        cols["count"][idx] = count
+
+        # Publishes the bar only after all fields are written
+        self._len = idx + 1
+
+    def to_array(self, start: int=0,
+                 end: Optional[int]=None) -> bar_array.BarArray:
+        """Returns the bars appended as a `BarArray` viewing the buffer.
+
+        Args:
+            start (int, optional): Index of the 1st bar. Defaults to `0`.
+            end (int, optional): Index after the last bar. Defaults to `None`
+                for all bars appended so far.
+
+        Returns:
+            :obj:`ibpy_native.models.BarArray`: The bars, without copying.
+        """
+        # Length is read before the columns, which contain at least as many
+        # bars even if the buffer has grown in between
+        length = self._len
+        columns = self._columns
+        end = length if end is None else min(end, length)
+
+        return bar_array.BarArray(columns={
+            name: column[start:end] for name, column in columns.items()
+        })
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"BarBuffer(len={self._len}, capacity={self.capacity})"
+
+    #region - Private functions
+    def _grow(self):
+        """Doubles the capacity."""
+        columns = {}
+        for name, column in self._columns.items():
+            columns[name] = np.empty(len(column) * 2, dtype=column.dtype)
+            columns[name][:self._len] = column[:self._len]
+
+        self._columns = columns
+    #endregion - Private functions
@@ -0,0 +1,264 @@
+"""Model class for the market depth (order book) of an instrument, stored in
+columns.
+"""
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from ibpy_native import error
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+# Operations & sides defined by IB for `updateMktDepth` & `updateMktDepthL2`
+_INSERT, _UPDATE, _DELETE = 0, 1, 2
+_ASK, _BID = 0, 1
+
+class OrderBook:
+    """Market depth of an instrument, with the price levels of each side kept
+    in preallocated NumPy arrays.
+
+    Insert, update & delete operations from IB are applied in place by
+    shifting the levels within the arrays, so updates neither allocate nor
+    re-sort. Levels are kept in the positions given by IB, i.e. from the best
+    price outwards.
+
+    For L2 (market maker) depth, a price can be quoted on multiple levels by
+    different market makers; `aggregate` sums up their sizes per price.
+
+    Args:
+        num_rows (int, optional): Max number of levels per side. Defaults to
+            `10`.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+        ValueError: If `num_rows` is less than 1.
+    """
+    def __init__(self, num_rows: int=10):
+        if np is None:
+            raise ImportError("`OrderBook` requires `numpy`. Install it via "
+                              "`pip install ibpy-native[numpy]`.")
+        if num_rows < 1:
+            raise ValueError("Number of rows must be at least 1.")
+
+        self._lock = threading.Lock()
+        self._num_rows = num_rows
+        # Side -> price, size & market maker of the levels
+        self._sides = {side: _Levels(num_rows) for side in (_ASK, _BID)}
+        self._version = 0
+        self._error: Optional[error.IBError] = None
+
+    @property
+    def num_rows(self) -> int:
+        """int: Max number of levels per side."""
+        return self._num_rows
+
+    @property
+    def version(self) -> int:
+        """int: Number of operations applied, which can be compared to tell
+        if the book is changed.
+        """
+        return self._version
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        """Returns the best bid in O(1).
+
+        Returns:
+            :obj:`Tuple[float, float]`, optional: Price & size. `None` if
+                there's no bid.
+        """
+        return self._sides[_BID].top()
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        """Returns the best ask in O(1).
+
+        Returns:
+            :obj:`Tuple[float, float]`, optional: Price & size. `None` if
+                there's no ask.
+        """
+        return self._sides[_ASK].top()
+
+    def bids(self) -> Dict[str, Any]:
+        """Returns the bid levels, from the best price outwards.
+
+        Returns:
+            :obj:`Dict[str, numpy.ndarray]`: Read-only views (not copies) of
+                the `price`, `size` & `market_maker` of the levels, which are
+                changed by updates applied later. Use `snapshot` for a
+                consistent copy of both sides.
+        """
+        return self._sides[_BID].views()
+
+    def asks(self) -> Dict[str, Any]:
+        """Returns the ask levels, from the best price outwards.
+
+        Returns:
+            :obj:`Dict[str, numpy.ndarray]`: Read-only views (not copies) of
+                the `price`, `size` & `market_maker` of the levels, which are
+                changed by updates applied later. Use `snapshot` for a
+                consistent copy of both sides.
+        """
+        return self._sides[_ASK].views()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns a consistent copy of the book.
+
+        Returns:
+            :obj:`Dict[str, Dict[str, numpy.ndarray]]`: Copies of the levels
+                keyed by side (`bids` & `asks`).
+        """
+        with self._lock:
+            return {
+                "bids": {name: column.copy() for name, column
+                         in self._sides[_BID].views().items()},
+                "asks": {name: column.copy() for name, column
+                         in self._sides[_ASK].views().items()},
+            }
+
+    def aggregate(self, side: str) -> Dict[str, Any]:
+        """Sums up the sizes of the levels of the same price across market
+        makers.
+
+        Args:
+            side (str): `bids` or `asks`.
+
+        Returns:
+            :obj:`Dict[str, numpy.ndarray]`: `price` & total `size` of each
+                distinct price, from the best price outwards.
+
+        Raises:
+            ValueError: If `side` is neither `bids` nor `asks`.
+        """
+        if side not in ("bids", "asks"):
+            raise ValueError(f"Unknown side `{side}`.")
+
+        levels = self.snapshot()[side]
+        prices = levels["price"]
+        if len(prices) == 0:
+            return {"price": prices, "size": levels["size"]}
+
+        # Sorts by price, so the levels of the same price are next to each
+        # other
+        order = np.argsort(-prices if side == "bids" else prices,
+                           kind="stable")
+        prices = prices[order]
+        idx = np.concatenate(
+            ([0], np.flatnonzero(prices[1:] != prices[:-1]) + 1))
+
+        return {"price": prices[idx],
+                "size": np.add.reduceat(levels["size"][order], idx)}
+
+    def apply(self, position: int, operation: int, side: int, price: float,
+              size: float, market_maker: str=""):
+        """Applies an operation received via `updateMktDepth` or
+        `updateMktDepthL2`.
+
+        Args:
+            position (int): Position of the level.
+            operation (int): `0` for insert, `1` for update, and `2` for
+                delete.
+            side (int): `0` for ask, `1` for bid.
+            price (float): Price of the level.
+            size (float): Size of the level.
+            market_maker (str, optional): Market maker of the level for L2
+                depth. Defaults to `""`.
+        """
+        with self._lock:
+            levels = self._sides[side]
+            if operation == _INSERT:
+                levels.insert(position, price, size, market_maker)
+            elif operation == _UPDATE:
+                levels.update(position, price, size, market_maker)
+            elif operation == _DELETE:
+                levels.delete(position)
+            self._version += 1
+
+    def clear(self):
+        """Removes all levels (e.g. the depth is reset by IB)."""
+        with self._lock:
+            for levels in self._sides.values():
+                levels.count = 0
+            self._version += 1
+
+    def on_error(self, err: error.IBError):
+        """Records the error returned for the subscription of the book.
+
+        Args:
+            err (:obj:`ibpy_native.error.IBError`): The error.
+        """
+        self._error = err
+
+    def get_error(self) -> Optional[error.IBError]:
+        """Returns the last error returned for the subscription of the book.
+
+        Returns:
+            :obj:`ibpy_native.error.IBError`, optional: The error. `None` if
+                no error is returned.
+        """
+        return self._error
+
+    def __repr__(self) -> str:
+        return (f"OrderBook(bids={self._sides[_BID].count}, "
+                f"asks={self._sides[_ASK].count})")
+
+class _Levels:
+    """Price levels of a side of the book."""
+    __slots__ = ("price", "size", "market_maker", "count")
+
+    def __init__(self, num_rows: int):
+        self.price = np.zeros(num_rows, dtype="f8")
+        self.size = np.zeros(num_rows, dtype="f8")
+        self.market_maker = np.empty(num_rows, dtype="O")
+        self.count = 0
+
+    def top(self) -> Optional[Tuple[float, float]]:
+        if self.count == 0:
+            return None
+
+        return float(self.price[0]), float(self.size[0])
+
+    def views(self) -> Dict[str, Any]:
+        views = {"price": self.price[:self.count],
+                 "size": self.size[:self.count],
+                 "market_maker": self.market_maker[:self.count]}
+        for view in views.values():
+            view.flags.writeable = False
+
+        return views
+
+    def insert(self, position: int, price: float, size: float,
+               market_maker: str):
+        capacity = len(self.price)
+        position = min(position, self.count)
+        if position >= capacity:
+            return
+
+        # Shifts the levels below down by 1, dropping the last one if full
+        end = min(self.count, capacity - 1)
+        for column in (self.price, self.size, self.market_maker):
+            column[position + 1:end + 1] = column[position:end]
+        self.count = end + 1
+        self._set(position, price, size, market_maker)
+
+    def update(self, position: int, price: float, size: float,
+               market_maker: str):
+        if position >= self.count: # Level not inserted yet
+            return
+
+        self._set(position, price, size, market_maker)
+
+    def delete(self, position: int):
+        if position >= self.count:
+            return
+
+        # Shifts the levels below up by 1
+        for column in (self.price, self.size, self.market_maker):
+            column[position:self.count - 1] = column[position + 1:self.count]
+        self.count -= 1
+
+    def _set(self, position: int, price: float, size: float,
+             market_maker: str):
+        self.price[position] = price
+        self.size[position] = size
+        self.market_maker[position] = market_maker
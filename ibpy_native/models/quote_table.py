@@ -0,0 +1,275 @@
+"""Model class for the top of book quotes of the market data subscriptions,
+stored in columns.
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from ibapi import ticktype
+
+from ibpy_native import error
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+_T = ticktype.TickTypeEnum
+
+# Field names & types of the columns
+_FIELDS: Dict[str, str] = {
+    "bid": "f8",
+    "ask": "f8",
+    "last": "f8",
+    "bid_size": "f8",
+    "ask_size": "f8",
+    "last_size": "f8",
+    "open": "f8",
+    "high": "f8",
+    "low": "f8",
+    "close": "f8",
+    "volume": "f8",
+    "halted": "f8",
+    "last_time": "i8",  # Epoch time of the last trade
+    "update_time": "f8",  # Epoch time the row is last updated locally
+    "data_type": "i1",  # Market data type (e.g. 3 for delayed)
+    "version": "i8",
+}
+
+# IB tick type -> field. Delayed ticks update the same fields.
+_TICK_FIELDS: Dict[int, str] = {
+    _T.BID: "bid", _T.DELAYED_BID: "bid",
+    _T.ASK: "ask", _T.DELAYED_ASK: "ask",
+    _T.LAST: "last", _T.DELAYED_LAST: "last",
+    _T.BID_SIZE: "bid_size", _T.DELAYED_BID_SIZE: "bid_size",
+    _T.ASK_SIZE: "ask_size", _T.DELAYED_ASK_SIZE: "ask_size",
+    _T.LAST_SIZE: "last_size", _T.DELAYED_LAST_SIZE: "last_size",
+    _T.OPEN: "open", _T.DELAYED_OPEN: "open",
+    _T.HIGH: "high", _T.DELAYED_HIGH: "high",
+    _T.LOW: "low", _T.DELAYED_LOW: "low",
+    _T.CLOSE: "close", _T.DELAYED_CLOSE: "close",
+    _T.VOLUME: "volume", _T.DELAYED_VOLUME: "volume",
+    _T.HALTED: "halted", _T.DELAYED_HALTED: "halted",
+    _T.LAST_TIMESTAMP: "last_time", _T.DELAYED_LAST_TIMESTAMP: "last_time",
+}
+
+class QuoteTable:
+    """Top of book quotes of the market data subscriptions, kept in
+    preallocated NumPy arrays per field with a row per subscription.
+
+    Ticks from IB are written into the rows in place. Every update stamps the
+    row with a new version from a counter of the table, so consumers can poll
+    the rows changed since the version they last saw via `changed_since`,
+    instead of handling every tick.
+
+    Fields: `bid`, `ask`, `last`, `bid_size`, `ask_size`, `last_size`, `open`,
+    `high`, `low`, `close`, `volume`, `halted`, `last_time`, `update_time`,
+    `data_type` & `version`. Prices & sizes not received yet are `NaN`.
+
+    Args:
+        capacity (int, optional): Number of rows preallocated. The table grows
+            once all rows are in use. Defaults to `64`.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+
+    Note:
+        Columns returned by `table[field]` are views updated in place, until
+        the table grows. Growing reallocates the columns, so views taken
+        before then no longer receive the updates; take the views again after
+        adding rows, or use `snapshot` for copies.
+    """
+    def __init__(self, capacity: int=64):
+        if np is None:
+            raise ImportError("`QuoteTable` requires `numpy`. Install it via "
+                              "`pip install ibpy-native[numpy]`.")
+
+        self._lock = threading.Lock()
+        self._columns = _empty_columns(max(capacity, 1))
+        self._free_rows: List[int] = []
+        self._size = 0  # Number of rows ever allocated
+        self._version = 0
+        self._errors: Dict[int, error.IBError] = {}
+
+    @property
+    def version(self) -> int:
+        """int: Version of the latest update."""
+        return self._version
+
+    @property
+    def fields(self) -> List[str]:
+        """:obj:`List[str]`: Names of the fields stored."""
+        return list(self._columns)
+
+    def add_row(self) -> int:
+        """Allocates a row for a new subscription.
+
+        Returns:
+            int: Index of the row.
+        """
+        with self._lock:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = self._size
+                self._size += 1
+                if row == len(self._columns["version"]):
+                    self._grow()
+
+            self._reset_row(row)
+            self._errors.pop(row, None)
+
+        return row
+
+    def remove_row(self, row: int):
+        """Releases the row of a subscription cancelled, to be reused. The
+        row is cleared with a new version, so consumers polling via
+        `changed_since` see the removal.
+
+        Args:
+            row (int): Index of the row.
+        """
+        with self._lock:
+            self._reset_row(row)
+            self._touch(row)
+            self._free_rows.append(row)
+
+    def on_tick(self, row: int, tick_type: int, value: Any):
+        """Writes a tick received via `tickPrice`, `tickSize`, `tickString`
+        or `tickGeneric` into the row. Tick types without a field are
+        ignored.
+
+        Args:
+            row (int): Index of the row.
+            tick_type (int): Tick type ID defined in IB API.
+            value (:obj:`Union[float, int, str]`): Value of the tick.
+        """
+        field = _TICK_FIELDS.get(tick_type)
+        if field is None:
+            return
+        if isinstance(value, str): # Timestamps via `tickString`
+            value = int(value)
+
+        with self._lock:
+            self._columns[field][row] = value
+            self._touch(row)
+
+    def on_data_type(self, row: int, data_type: int):
+        """Records the market data type of the row (e.g. delayed).
+
+        Args:
+            row (int): Index of the row.
+            data_type (int): Market data type ID defined in IB API.
+        """
+        with self._lock:
+            self._columns["data_type"][row] = data_type
+            self._touch(row)
+
+    def on_error(self, row: int, err: error.IBError):
+        """Records the error returned for the subscription of the row.
+
+        Args:
+            row (int): Index of the row.
+            err (:obj:`ibpy_native.error.IBError`): The error.
+        """
+        with self._lock:
+            self._errors[row] = err
+            self._touch(row)
+
+    def get_error(self, row: int) -> Optional[error.IBError]:
+        """Returns the last error returned for the subscription of the row.
+
+        Args:
+            row (int): Index of the row.
+
+        Returns:
+            :obj:`ibpy_native.error.IBError`, optional: The error. `None` if
+                no error is returned.
+        """
+        return self._errors.get(row)
+
+    def changed_since(self, version: int) -> Any:
+        """Returns the rows updated after the specified version.
+
+        Args:
+            version (int): Version seen by the consumer, e.g. the `version` of
+                the table at last poll. `0` for all rows ever updated.
+
+        Returns:
+            :obj:`numpy.ndarray`: Indices of the rows, including the ones
+                removed, which quotes are cleared.
+        """
+        return np.flatnonzero(self._columns["version"][:self._size] > version)
+
+    def snapshot(self, rows: Optional[Any]=None) -> Dict[str, Any]:
+        """Returns a consistent copy of the quotes.
+
+        Args:
+            rows (:obj:`Sequence[int]`, optional): Indices of the rows to copy
+                (e.g. returned by `changed_since`). Defaults to `None` for all
+                rows allocated.
+
+        Returns:
+            :obj:`Dict[str, numpy.ndarray]`: Arrays keyed by the field names.
+        """
+        with self._lock:
+            if rows is None:
+                return {name: column[:self._size].copy()
+                        for name, column in self._columns.items()}
+
+            return {name: column[rows] for name, column
+                    in self._columns.items()}
+
+    def get_row(self, row: int) -> Dict[str, Any]:
+        """Returns the quote of a row.
+
+        Args:
+            row (int): Index of the row.
+
+        Returns:
+            :obj:`Dict[str, Any]`: Values keyed by the field names.
+        """
+        with self._lock:
+            return {name: column[row].item() for name, column
+                    in self._columns.items()}
+
+    def __len__(self) -> int:
+        return self._size - len(self._free_rows)
+
+    def __getitem__(self, field: str) -> Any:
+        # View of the column, which is updated in place until the table grows
+        return self._columns[field][:self._size]
+
+    def __repr__(self) -> str:
+        return f"QuoteTable(len={len(self)}, version={self._version})"
+
+    #region - Private functions
+    def _touch(self, row: int):
+        self._version += 1
+        self._columns["version"][row] = self._version
+        self._columns["update_time"][row] = time.time()
+
+    def _reset_row(self, row: int):
+        # Version is kept, so a removal not seen yet isn't hidden on reuse
+        for name, column in self._columns.items():
+            if name != "version":
+                column[row] = np.nan if column.dtype.kind == "f" else 0
+
+    def _grow(self):
+        """Doubles the number of rows preallocated."""
+        capacity = len(self._columns["version"]) * 2
+        columns = _empty_columns(capacity)
+        for name, column in self._columns.items():
+            columns[name][:len(column)] = column
+
+        self._columns = columns
+    #endregion - Private functions
+
+def _empty_columns(capacity: int) -> Dict[str, Any]:
+    columns = {}
+    for name, dtype in _FIELDS.items():
+        columns[name] = np.zeros(capacity, dtype=dtype)
+        if columns[name].dtype.kind == "f":
+            columns[name][:] = np.nan
+
+    return columns
@@ -0,0 +1,223 @@
+"""Model class for historical ticks stored in columns."""
+from collections import abc
+from typing import Any, Dict, Iterator, List, Sequence, Union
+
+from ibapi import wrapper
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+class TickArray(abc.Sequence):
+    """Historical ticks stored as contiguous arrays per field, instead of an
+    object per tick.
+
+    Indexing with an integer returns the tick as the `HistoricalTick`,
+    `HistoricalTickBidAsk`, or `HistoricalTickLast` object which is created on
+    access. Slicing returns another `TickArray` viewing the same memory.
+    Indexing with a field name returns the array of the field.
+
+    Fields (in IB API naming):
+        - TRADES/MIDPOINT: `time`, `price`, `size`;
+        - BID_ASK: `time`, `mask`, `priceBid`, `priceAsk`, `sizeBid`,
+        `sizeAsk`;
+        - LAST: `time`, `mask`, `price`, `size`, `exchange`,
+        `specialConditions`.
+
+    `mask` is the bitmask of the tick attributes. Bit 0 is `askPastHigh` or
+    `pastLimit`; bit 1 is `bidPastLow` or `unreported`.
+
+    Args:
+        columns (:obj:`Dict[str, numpy.ndarray]`): 1-D arrays of same length
+            per field.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+    """
+    def __init__(self, columns: Dict[str, Any]):
+        if np is None:
+            raise ImportError("`TickArray` requires `numpy`. Install it via "
+                              "`pip install ibpy-native[numpy]`.")
+
+        self._columns = columns
+        self._len = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_objects(cls, ticks: Sequence[Any]) -> "TickArray":
+        """Creates a `TickArray` from the tick objects returned by IB API.
+
+        Args:
+            ticks (:obj:`Sequence`): `HistoricalTick`, `HistoricalTickBidAsk`,
+                or `HistoricalTickLast` objects of the same type.
+
+        Returns:
+            :obj:`ibpy_native.models.TickArray`: The ticks. Without any field
+                if `ticks` is empty.
+        """
+        if not ticks:
+            return cls(columns={})
+
+        columns = {"time": np.array([tick.time for tick in ticks], dtype="i8")}
+        if isinstance(ticks[0], wrapper.HistoricalTickBidAsk):
+            columns["mask"] = np.array(
+                [tick.tickAttribBidAsk.askPastHigh |
+                 tick.tickAttribBidAsk.bidPastLow << 1 for tick in ticks],
+                dtype="u1")
+            for name in ("priceBid", "priceAsk"):
+                columns[name] = np.array(
+                    [getattr(tick, name) for tick in ticks], dtype="f8")
+            for name in ("sizeBid", "sizeAsk"):
+                columns[name] = np.array(
+                    [getattr(tick, name) for tick in ticks], dtype="i8")
+        elif isinstance(ticks[0], wrapper.HistoricalTickLast):
+            columns["mask"] = np.array(
+                [tick.tickAttribLast.pastLimit |
+                 tick.tickAttribLast.unreported << 1 for tick in ticks],
+                dtype="u1")
+            columns["price"] = np.array([tick.price for tick in ticks],
+                                        dtype="f8")
+            columns["size"] = np.array([tick.size for tick in ticks],
+                                       dtype="i8")
+            for name in ("exchange", "specialConditions"):
+                columns[name] = np.array(
+                    [getattr(tick, name) for tick in ticks], dtype="U")
+        else:
+            columns["price"] = np.array([tick.price for tick in ticks],
+                                        dtype="f8")
+            columns["size"] = np.array([tick.size for tick in ticks],
+                                       dtype="i8")
+
+        return cls(columns=columns)
+
+    @classmethod
+    def concatenate(cls, arrays: Sequence["TickArray"]) -> "TickArray":
+        """Joins the ticks of the arrays (e.g. pages of a request) into one
+        `TickArray`.
+
+        Args:
+            arrays (:obj:`Sequence[TickArray]`): Arrays with the same fields.
+                Arrays without any field are skipped.
+
+        Returns:
+            :obj:`ibpy_native.models.TickArray`: Ticks of all arrays in order.
+        """
+        arrays = [array for array in arrays if array.fields]
+        if not arrays:
+            return cls(columns={})
+        if len(arrays) == 1:
+            return arrays[0]
+
+        return cls(columns={
+            name: np.concatenate([array[name] for array in arrays])
+            for name in arrays[0].fields
+        })
+
+    @property
+    def fields(self) -> List[str]:
+        """:obj:`List[str]`: Names of the fields stored."""
+        return list(self._columns)
+
+    @property
+    def objects(self) -> Sequence[Any]:
+        """:obj:`Sequence`: Lazy view of the ticks as IB API objects, which
+        are created only once accessed.
+        """
+        return _ObjectsView(self)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Returns the arrays of all fields without copying.
+
+        Returns:
+            :obj:`Dict[str, numpy.ndarray]`: Arrays keyed by the field names.
+        """
+        return dict(self._columns)
+
+    def to_pandas(self) -> Any:
+        """Returns the ticks as a `pandas.DataFrame` backed by the same
+        memory, with a column per field.
+
+        Returns:
+            :obj:`pandas.DataFrame`: The ticks.
+
+        Raises:
+            ImportError: If `pandas` is not installed.
+        """
+        import pandas as pd # pylint: disable=import-outside-toplevel
+
+        return pd.DataFrame(self._columns, copy=False)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, key: Union[int, slice, str, Any]) -> Any:
+        if isinstance(key, str):
+            return self._columns[key]
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self._len
+            if not 0 <= key < self._len:
+                raise IndexError("TickArray index out of range")
+
+            return self._to_object(key)
+
+        # Slices (views), index & boolean arrays
+        return TickArray(columns={name: column[key] for name, column
+                                  in self._columns.items()})
+
+    def __iter__(self) -> Iterator[Any]:
+        for idx in range(self._len):
+            yield self._to_object(idx)
+
+    def __repr__(self) -> str:
+        return f"TickArray(fields={self.fields}, len={self._len})"
+
+    #region - Private functions
+    def _to_object(self, idx: int) -> Any:
+        """Creates the IB API object of the tick at `idx`."""
+        cols = self._columns
+
+        if "priceBid" in cols:
+            tick = wrapper.HistoricalTickBidAsk()
+            mask = int(cols["mask"][idx])
+            tick.tickAttribBidAsk.askPastHigh = mask & 1 != 0
+            tick.tickAttribBidAsk.bidPastLow = mask & 2 != 0
+            tick.priceBid = float(cols["priceBid"][idx])
+            tick.priceAsk = float(cols["priceAsk"][idx])
+            tick.sizeBid = int(cols["sizeBid"][idx])
+            tick.sizeAsk = int(cols["sizeAsk"][idx])
+        elif "exchange" in cols:
+            tick = wrapper.HistoricalTickLast()
+            mask = int(cols["mask"][idx])
+            tick.tickAttribLast.pastLimit = mask & 1 != 0
+            tick.tickAttribLast.unreported = mask & 2 != 0
+            tick.price = float(cols["price"][idx])
+            tick.size = int(cols["size"][idx])
+            tick.exchange = str(cols["exchange"][idx])
+            tick.specialConditions = str(cols["specialConditions"][idx])
+        else:
+            tick = wrapper.HistoricalTick()
+            tick.price = float(cols["price"][idx])
+            tick.size = int(cols["size"][idx])
+
+        tick.time = int(cols["time"][idx])
+
+        return tick
+    #endregion - Private functions
+
+class _ObjectsView(abc.Sequence):
+    """Read-only sequence creates the tick objects of a `TickArray` on
+    access.
+    """
+    def __init__(self, ticks: TickArray):
+        self._ticks = ticks
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if isinstance(key, slice):
+            return [self._ticks[idx]
+                    for idx in range(*key.indices(len(self._ticks)))]
+
+        return self._ticks[key]
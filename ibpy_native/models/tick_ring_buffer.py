@@ -0,0 +1,174 @@
+"""Model class for the recent live ticks kept in a fixed-capacity ring
+buffer.
+"""
+from typing import Any, Dict, List, Optional
+
+from ibpy_native.models import tick_array
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+# Field names & types of the columns, per kind of ticks
+_FIELDS: Dict[str, str] = {
+    "time": "i8",
+    "price": "f8",
+    "size": "i8",
+}
+_BID_ASK_FIELDS: Dict[str, str] = {
+    "time": "i8",
+    "mask": "u1",  # askPastHigh | bidPastLow << 1
+    "priceBid": "f8",
+    "priceAsk": "f8",
+    "sizeBid": "i8",
+    "sizeAsk": "i8",
+}
+
+class TickRingBuffer:
+    """The most recent live ticks of a subscription, stored in preallocated
+    NumPy arrays per field which are overwritten once the capacity is
+    reached.
+
+    Ticks are appended in O(1) by a single writer (e.g. the thread receiving
+    messages from IB), while snapshots can be read from any thread without
+    locking the writer. The writer claims a slot before writing it and
+    publishes it afterwards, so ticks overwritten while a snapshot is being
+    copied are detected & left out of the snapshot.
+
+    Fields (in IB API naming, same as `TickArray`):
+        - Trades & midpoints: `time`, `price`, `size`;
+        - Bid/ask: `time`, `mask`, `priceBid`, `priceAsk`, `sizeBid`,
+        `sizeAsk`.
+
+    Args:
+        capacity (int): Max number of ticks kept.
+        bid_ask (bool, optional): `True` to keep `HistoricalTickBidAsk`
+            ticks. Defaults to `False` for `HistoricalTick` and
+            `HistoricalTickLast` ticks.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+        ValueError: If `capacity` is less than 1.
+    """
+    def __init__(self, capacity: int, bid_ask: bool=False):
+        if np is None:
+            raise ImportError("`TickRingBuffer` requires `numpy`. Install it "
+                              "via `pip install ibpy-native[numpy]`.")
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+
+        self._capacity = capacity
+        self._bid_ask = bid_ask
+        self._columns = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype
+            in (_BID_ASK_FIELDS if bid_ask else _FIELDS).items()
+        }
+        # Number of ticks the writer has started writing
+        self._claimed = 0
+        # Number of ticks written completely
+        self._published = 0
+
+    @property
+    def capacity(self) -> int:
+        """int: Max number of ticks kept."""
+        return self._capacity
+
+    @property
+    def fields(self) -> List[str]:
+        """:obj:`List[str]`: Names of the fields stored."""
+        return list(self._columns)
+
+    @property
+    def total(self) -> int:
+        """int: Number of ticks appended since created, including those
+        overwritten.
+        """
+        return self._published
+
+    def append(self, tick: Any):
+        """Appends a tick, overwriting the oldest one if the buffer is full.
+
+        Args:
+            tick (:obj:`Union[HistoricalTick, HistoricalTickBidAsk,
+                HistoricalTickLast]`): Live tick of the kind of the buffer.
+        """
+        seq = self._claimed
+        self._claimed = seq + 1
+
+        idx = seq % self._capacity
+        cols = self._columns
+        cols["time"][idx] = tick.time
+        if self._bid_ask:
+            cols["mask"][idx] = (tick.tickAttribBidAsk.askPastHigh |
+                                 tick.tickAttribBidAsk.bidPastLow << 1)
+            cols["priceBid"][idx] = tick.priceBid
+            cols["priceAsk"][idx] = tick.priceAsk
+            cols["sizeBid"][idx] = tick.sizeBid
+            cols["sizeAsk"][idx] = tick.sizeAsk
+        else:
+            cols["price"][idx] = tick.price
+            cols["size"][idx] = tick.size
+
+        self._published = seq + 1
+
+    def last(self, n: Optional[int]=None) -> tick_array.TickArray:
+        """Returns a snapshot of the most recent ticks.
+
+        Args:
+            n (int, optional): Max number of ticks to return. Defaults to
+                `None` for all ticks kept.
+
+        Returns:
+            :obj:`ibpy_native.models.TickArray`: Copy of the ticks in time
+                order.
+        """
+        end = self._published
+
+        return self._snapshot(start=0 if n is None else end - n, end=end)
+
+    def since(self, time: int) -> tick_array.TickArray:
+        """Returns a snapshot of the ticks received at or after `time`.
+
+        Args:
+            time (int): Epoch time in seconds.
+
+        Returns:
+            :obj:`ibpy_native.models.TickArray`: Copy of the ticks in time
+                order.
+        """
+        end = self._published
+        start = max(end - self._capacity, 0)
+        times = self._columns["time"][np.arange(start, end) % self._capacity]
+
+        return self._snapshot(
+            start=start + int(np.searchsorted(times, time, side="left")),
+            end=end
+        )
+
+    def __len__(self) -> int:
+        return min(self._published, self._capacity)
+
+    def __repr__(self) -> str:
+        return (f"TickRingBuffer(capacity={self._capacity}, "
+                f"len={len(self)})")
+
+    #region - Private functions
+    def _snapshot(self, start: int, end: int) -> tick_array.TickArray:
+        """Copies the ticks with sequence number in `[start, end)`, which
+        are still kept.
+        """
+        start = max(start, end - self._capacity, 0)
+        idx = np.arange(start, end) % self._capacity
+        columns = {name: column[idx] for name, column
+                   in self._columns.items()}
+
+        # Slots claimed by the writer during the copy may have been
+        # overwritten by newer ticks
+        lost = self._claimed - self._capacity - start
+        if lost > 0:
+            columns = {name: column[lost:] for name, column
+                       in columns.items()}
+
+        return tick_array.TickArray(columns=columns)
+    #endregion - Private functions
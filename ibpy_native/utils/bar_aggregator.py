@@ -0,0 +1,271 @@
+"""Incremental aggregation of ticks into bars of multiple intervals."""
+import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from ibapi import common
+from ibapi import wrapper
+
+from ibpy_native.models import bar_array
+from ibpy_native.models import tick_array
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+class BarAggregator:
+    """Aggregates ticks into OHLCV bars with VWAP, for several intervals at
+    once.
+
+    Bars are aligned to the multiples of their intervals since epoch, and
+    are emitted once a tick of the next interval arrives. Intervals without
+    any tick produce no bar. Ticks are expected in time order; late ticks are
+    added to the bar being built.
+
+    Trades (`HistoricalTick` & `HistoricalTickLast`) are aggregated by price &
+    size. Bid/ask ticks are aggregated by their midpoint without volume, in
+    which case `wap` of the bars is the average of the prices.
+
+    Args:
+        intervals (:obj:`Sequence[Union[int, datetime.timedelta]]`): Length
+            of the bars, in seconds or `timedelta`.
+
+    Raises:
+        ValueError: If any interval is shorter than 1 second.
+    """
+    def __init__(self,
+                 intervals: Sequence[Union[int, datetime.timedelta]]):
+        self._intervals: List[int] = []
+        for interval in intervals:
+            if isinstance(interval, datetime.timedelta):
+                interval = int(interval.total_seconds())
+            if interval < 1:
+                raise ValueError("Intervals must be at least 1 second.")
+            self._intervals.append(interval)
+
+        self._bars: Dict[int, Optional[_Bar]] = {
+            interval: None for interval in self._intervals
+        }
+
+    @property
+    def intervals(self) -> List[int]:
+        """:obj:`List[int]`: Length of the bars in seconds."""
+        return list(self._intervals)
+
+    def get_current(self, interval: int) -> Optional[common.BarData]:
+        """Returns the bar being built, which is not closed yet.
+
+        Args:
+            interval (int): Length of the bar in seconds.
+
+        Returns:
+            :obj:`ibapi.common.BarData`, optional: The bar with `date` in
+                epoch seconds. `None` if no tick received for the interval.
+        """
+        bar = self._bars[interval]
+
+        return None if bar is None else bar.to_object()
+
+    def update(
+        self, tick: Union[wrapper.HistoricalTick, wrapper.HistoricalTickBidAsk,
+                          wrapper.HistoricalTickLast]
+    ) -> List[Tuple[int, common.BarData]]:
+        """Adds a tick to the bars, in O(1) per interval.
+
+        Args:
+            tick (:obj:`Union[HistoricalTick, HistoricalTickBidAsk,
+                HistoricalTickLast]`): Historical or live tick.
+
+        Returns:
+            :obj:`List[Tuple[int, ibapi.common.BarData]]`: Interval & the
+                bars closed by the tick, with `date` in epoch seconds.
+        """
+        if isinstance(tick, wrapper.HistoricalTickBidAsk):
+            price = (tick.priceBid + tick.priceAsk) / 2
+            size = 0
+        else:
+            price = tick.price
+            size = tick.size
+
+        closed = []
+        for interval in self._intervals:
+            start = tick.time - tick.time % interval
+            bar = self._bars[interval]
+
+            if bar is None or start > bar.start:
+                if bar is not None:
+                    closed.append((interval, bar.to_object()))
+                self._bars[interval] = _Bar(start, price, size)
+            else:
+                bar.add(price, size)
+
+        return closed
+
+    def update_array(self, ticks: tick_array.TickArray
+                    ) -> Dict[int, bar_array.BarArray]:
+        """Adds the ticks of a page to the bars with vectorized aggregation.
+
+        Args:
+            ticks (:obj:`ibpy_native.models.TickArray`): Ticks in time order.
+
+        Returns:
+            :obj:`Dict[int, ibpy_native.models.BarArray]`: The bars closed by
+                the ticks, keyed by interval.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        if np is None:
+            raise ImportError("`BarAggregator.update_array` requires `numpy`. "
+                              "Install it via "
+                              "`pip install ibpy-native[numpy]`.")
+        if len(ticks) == 0:
+            return {interval: bar_array.BarArray()
+                    for interval in self._intervals}
+
+        times = ticks["time"]
+        if "priceBid" in ticks.fields:
+            prices = (ticks["priceBid"] + ticks["priceAsk"]) / 2
+            sizes = np.zeros(len(ticks))
+        else:
+            prices = ticks["price"].astype("f8")
+            sizes = ticks["size"].astype("f8")
+        values = prices * sizes
+
+        closed = {}
+        for interval in self._intervals:
+            bar = self._bars[interval]
+            # Late ticks are added to the bar being built, as `update` does
+            starts = np.maximum.accumulate(times - times % interval)
+            if bar is not None:
+                starts = np.maximum(starts, bar.start)
+            # Index of the 1st tick of each bar
+            idx = np.concatenate(
+                ([0], np.flatnonzero(starts[1:] != starts[:-1]) + 1))
+            last_idx = np.concatenate((idx[1:], [len(times)])) - 1
+            columns = {
+                "time": starts[idx].astype("i8"),
+                "open": prices[idx],
+                "high": np.maximum.reduceat(prices, idx),
+                "low": np.minimum.reduceat(prices, idx),
+                "close": prices[last_idx],
+                "volume": np.add.reduceat(sizes, idx),
+                "value": np.add.reduceat(values, idx),
+                "price_sum": np.add.reduceat(prices, idx),
+                "count": np.diff(np.concatenate((idx, [len(times)]))),
+            }
+
+            if bar is not None:
+                columns = bar.merge_columns(columns)
+
+            # The last bar stays open for the ticks to come
+            self._bars[interval] = _Bar.from_columns(columns, -1)
+            closed[interval] = bar_array.BarArray(columns={
+                "time": columns["time"][:-1],
+                "open": columns["open"][:-1],
+                "high": columns["high"][:-1],
+                "low": columns["low"][:-1],
+                "close": columns["close"][:-1],
+                "volume": columns["volume"][:-1],
+                "wap": _wap(columns["value"][:-1], columns["volume"][:-1],
+                            columns["price_sum"][:-1], columns["count"][:-1]),
+                "count": columns["count"][:-1].astype("i8"),
+            })
+
+        return closed
+
+    def flush(self) -> List[Tuple[int, common.BarData]]:
+        """Closes the bars being built.
+
+        Returns:
+            :obj:`List[Tuple[int, ibapi.common.BarData]]`: Interval & the
+                bars closed.
+        """
+        closed = [(interval, bar.to_object())
+                  for interval, bar in self._bars.items() if bar is not None]
+        self._bars = {interval: None for interval in self._intervals}
+
+        return closed
+
+class _Bar:
+    """Mutable state of the bar being built."""
+    __slots__ = ("start", "open", "high", "low", "close", "volume", "value",
+                 "price_sum", "count")
+
+    def __init__(self, start: int, price: float, size: float):
+        self.start = start
+        self.open = self.high = self.low = self.close = price
+        self.volume = size
+        self.value = price * size
+        self.price_sum = price
+        self.count = 1
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Any], idx: int) -> "_Bar":
+        bar = cls(int(columns["time"][idx]), 0, 0)
+        bar.open = float(columns["open"][idx])
+        bar.high = float(columns["high"][idx])
+        bar.low = float(columns["low"][idx])
+        bar.close = float(columns["close"][idx])
+        bar.volume = float(columns["volume"][idx])
+        bar.value = float(columns["value"][idx])
+        bar.price_sum = float(columns["price_sum"][idx])
+        bar.count = int(columns["count"][idx])
+
+        return bar
+
+    def add(self, price: float, size: float):
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += size
+        self.value += price * size
+        self.price_sum += price
+        self.count += 1
+
+    def merge_columns(self, columns: Dict[str, Any]) -> Dict[str, Any]:
+        """Merges the bar into the 1st bar of the columns if it's of the same
+        interval, or inserts it before the 1st bar otherwise.
+        """
+        if columns["time"][0] == self.start:
+            first = {
+                "time": self.start, "open": self.open,
+                "high": max(self.high, columns["high"][0]),
+                "low": min(self.low, columns["low"][0]),
+                "close": columns["close"][0],
+                "volume": self.volume + columns["volume"][0],
+                "value": self.value + columns["value"][0],
+                "price_sum": self.price_sum + columns["price_sum"][0],
+                "count": self.count + columns["count"][0],
+            }
+            rest = slice(1, None)
+        else:
+            first = {name: getattr(self, "start" if name == "time" else name)
+                     for name in columns}
+            rest = slice(None)
+
+        return {name: np.concatenate((np.array([first[name]],
+                                                dtype=column.dtype),
+                                      column[rest]))
+                for name, column in columns.items()}
+
+    def to_object(self) -> common.BarData:
+        bar = common.BarData()
+        bar.date = str(self.start)
+        bar.open = self.open
+        bar.high = self.high
+        bar.low = self.low
+        bar.close = self.close
+        bar.volume = self.volume
+        bar.average = (self.value / self.volume if self.volume
+                       else self.price_sum / self.count)
+        bar.barCount = self.count
+
+        return bar
+
+def _wap(value: Any, volume: Any, price_sum: Any, count: Any) -> Any:
+    """Vectorized VWAP, or the average price for bars without volume."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(volume != 0, value / volume, price_sum / count)
@@ -1,6 +1,7 @@
 """Enums/Types for parameters or return objects."""
+import datetime
 import enum
-from typing import List, NamedTuple, Union
+from typing import Any, List, NamedTuple, Tuple, Union
 
 from ibapi import wrapper
 
@@ -12,6 +13,43 @@ class EarliestDataPoint(enum.Enum):
     ASK = "ASK"
     TRADES = "TRADES"
 
+@enum.unique
+class BarSize(enum.Enum):
+    """Bar sizes supported for fetching historical bars."""
+    SEC_1 = "1 secs"
+    SEC_5 = "5 secs"
+    SEC_10 = "10 secs"
+    SEC_15 = "15 secs"
+    SEC_30 = "30 secs"
+    MIN_1 = "1 min"
+    MIN_2 = "2 mins"
+    MIN_3 = "3 mins"
+    MIN_5 = "5 mins"
+    MIN_10 = "10 mins"
+    MIN_15 = "15 mins"
+    MIN_20 = "20 mins"
+    MIN_30 = "30 mins"
+    HOUR_1 = "1 hour"
+    HOUR_2 = "2 hours"
+    HOUR_3 = "3 hours"
+    HOUR_4 = "4 hours"
+    HOUR_8 = "8 hours"
+    DAY_1 = "1 day"
+    WEEK_1 = "1 week"
+    MONTH_1 = "1 month"
+
+@enum.unique
+class HistoricalBars(enum.Enum):
+    """Data type options defined for fetching historical bars."""
+    TRADES = "TRADES"
+    MIDPOINT = "MIDPOINT"
+    BID = "BID"
+    ASK = "ASK"
+    BID_ASK = "BID_ASK"
+    ADJUSTED_LAST = "ADJUSTED_LAST"
+    HISTORICAL_VOLATILITY = "HISTORICAL_VOLATILITY"
+    OPTION_IMPLIED_VOLATILITY = "OPTION_IMPLIED_VOLATILITY"
+
 @enum.unique
 class HistoricalTicks(enum.Enum):
     """Data type options defined for fetching historical ticks."""
@@ -26,17 +64,56 @@ class LiveTicks(enum.Enum):
     BID_ASK = "BidAsk"
     MIDPOINT = "MidPoint"
     LAST = "Last"
+
+@enum.unique
+class OverflowPolicy(enum.Enum):
+    """Policies to handle new elements arrive at a full bounded queue."""
+    BLOCK = "block"  # Blocks the producer until there's free space
+    DROP_OLDEST = "drop_oldest"  # Discards the oldest pending element
+    DROP_NEWEST = "drop_newest"  # Discards the element just arrived
+    CONFLATE = "conflate"  # Discards all pending elements but the latest one
 #endregion - Argument options
 
 #region - Return type
 class ResHistoricalTicks(NamedTuple):
-    """Return type of function `bridge.IBBridge.get_historical_ticks_v2`."""
-    ticks: List[Union[
-        wrapper.HistoricalTick,
-        wrapper.HistoricalTickBidAsk,
-        wrapper.HistoricalTickLast
-    ]]
+    """Return type of function `bridge.IBBridge.get_historical_ticks_v2`.
+
+    `ticks` is a `ibpy_native.models.TickArray` if the ticks are requested in
+    columnar mode, which keeps the list of objects available as a lazy view via
+    `TickArray.objects`.
+    """
+    ticks: Union[
+        List[Union[wrapper.HistoricalTick,
+                   wrapper.HistoricalTickBidAsk,
+                   wrapper.HistoricalTickLast]],
+        Any
+    ]
     completed: bool
+
+class ResSyncHistoricalTicks(NamedTuple):
+    """Return type of function `bridge.IBBridge.sync_historical_ticks`."""
+    # Time ranges downloaded from IB, in native `datetime`
+    gaps: List[Tuple[datetime.datetime, datetime.datetime]]
+    ticks: int  # Number of ticks downloaded
+
+class TickStoreStats(NamedTuple):
+    """Statistics of `ibpy_native.utils.tick_store.TickStore`."""
+    hits: int  # Number of time ranges served from disk
+    misses: int  # Number of uncovered time ranges to be fetched from IB
+    hit_ticks: int  # Number of ticks served from disk
+    evictions: int  # Number of segments evicted
+    segments: int  # Number of segments stored
+    size: int  # Total size of the segments stored in bytes
+
+class PacingMetrics(NamedTuple):
+    """Usage of the pacing budgets of historical data requests."""
+    requests: int  # Number of requests sent within the window
+    max_requests: int  # Max number of requests within the window
+    active: int  # Number of requests awaiting response
+    max_active: int  # Max number of requests awaiting response at once
+    waiting: int  # Number of requests queued to be sent
+    violations: int  # Number of pacing violations reported by IB
+    cooldown: float  # Seconds left to hold requests after a violation
 #endregion - Return type
 
 #region - Order related
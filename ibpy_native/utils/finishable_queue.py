@@ -4,7 +4,9 @@ import enum
 import queue
 import threading
 
-from typing import AsyncIterator, Any
+from typing import AsyncIterator, Any, Callable, List, Optional, Tuple
+
+from ibpy_native.utils import datatype
 
 # Queue status
 class Status(enum.Enum):
@@ -19,14 +21,55 @@ class FinishableQueue():
     the async tasks by managing its' status based on elements retrieve from the
     `Queue` object.
 
+    Coroutines awaiting on the queue are suspended on the event loop and get
+    woken up by `put` via `loop.call_soon_threadsafe`, so no thread from the
+    default executor is occupied while waiting for new elements.
+
+    The queue can optionally be bounded. Only the data elements count towards
+    the bound; the `FINISHED` signal and exceptions are always accepted.
+
     Args:
         queue_to_finish (:obj:`queue.Queue`): queue object assigned to handle
-            the async task
+            the async task. Should be unbounded, use argument `maxsize`
+            instead to bound the `FinishableQueue`.
+        maxsize (int, optional): Max number of pending data elements. `0` for
+            unbounded. Defaults to `0`.
+        overflow (:obj:`ibpy_native.utils.datatype.OverflowPolicy`, optional):
+            Policy to apply on elements put into a full queue. Defaults to
+            `OverflowPolicy.BLOCK`.
+        on_finished (:obj:`Callable[[], None]`, optional): Callback to be
+            invoked every time the queue turns into status `FINISHED`.
+            Defaults to `None`.
+
+    Note:
+        `OverflowPolicy.BLOCK` blocks the thread calling `put`, so it only
+        takes effect while the elements are put from a thread without running
+        event loop. Elements put from an event loop (e.g. via the `asyncio`
+        based transport) are accepted beyond the bound instead of blocking
+        the loop, and are counted in `overruns`.
     """
-    def __init__(self, queue_to_finish: queue.Queue):
+    def __init__(
+        self, queue_to_finish: queue.Queue, maxsize: int=0,
+        overflow: datatype.OverflowPolicy=datatype.OverflowPolicy.BLOCK,
+        on_finished: Optional[Callable[[], None]]=None
+    ):
         self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
         self._queue = queue_to_finish
         self._status = Status.INIT
+        # Futures of the coroutines waiting for new element to arrive, paired
+        # with the event loop each of them is running on.
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop,
+                                  asyncio.Future]] = []
+        # Bounding
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._size = 0  # Number of pending data elements
+        self._dropped = 0
+        self._overruns = 0
+        # Whether a signal is queued, after which nothing is consumed
+        self._signalled = False
+        self._on_finished = on_finished
 
     @property
     def status(self) -> Status:
@@ -46,12 +89,81 @@ class FinishableQueue():
         """
         return self._status is Status.FINISHED
 
+    @property
+    def maxsize(self) -> int:
+        """int: Max number of pending data elements. `0` if unbounded."""
+        return self._maxsize
+
+    @property
+    def overflow(self) -> datatype.OverflowPolicy:
+        """:obj:`ibpy_native.utils.datatype.OverflowPolicy`: Policy applied
+        on elements put into the queue while it's full.
+        """
+        return self._overflow
+
+    @property
+    def dropped(self) -> int:
+        """int: Number of data elements discarded by the overflow policy since
+        the queue is initialised or last reset.
+        """
+        return self._dropped
+
+    @property
+    def overruns(self) -> int:
+        """int: Number of data elements accepted beyond the bound with policy
+        `OverflowPolicy.BLOCK`, as they're put from an event loop which can't
+        be blocked, since the queue is initialised or last reset.
+        """
+        return self._overruns
+
+    def set_bound(
+        self, maxsize: int,
+        overflow: datatype.OverflowPolicy=datatype.OverflowPolicy.BLOCK
+    ):
+        """Bounds the number of pending data elements.
+
+        Args:
+            maxsize (int): Max number of pending data elements. `0` for
+                unbounded.
+            overflow (:obj:`ibpy_native.utils.datatype.OverflowPolicy`,
+                optional): Policy to apply on elements put into a full queue.
+                Defaults to `OverflowPolicy.BLOCK`.
+        """
+        with self._not_full:
+            self._maxsize = maxsize
+            self._overflow = overflow
+            self._not_full.notify_all()
+
     def reset(self):
         """Reset the status to `READY` for reusing the queue if the
-        status is marked as either `INIT` or `FINISHED`
+        status is marked as either `INIT` or `FINISHED`. The queue becomes
+        unbounded and the dropped & overruns counters are cleared. Stale elements left by
+        the previous task (e.g. late responses of a timed out request) are
+        discarded.
         """
         if self.finished or self._status is Status.INIT:
-            self._status = Status.READY
+            with self._not_full:
+                self._clear()
+                self._status = Status.READY
+                self._maxsize = 0
+                self._overflow = datatype.OverflowPolicy.BLOCK
+                self._dropped = 0
+                self._overruns = 0
+                self._signalled = False
+                self._not_full.notify_all()
+
+    def finish(self):
+        """Marks the queue as `FINISHED` and discards all pending elements,
+        so the queue can be reused by another task without waiting for the
+        finish signal of the current one (e.g. the request is timed out).
+        Consumer still awaiting on the queue receives the `FINISHED` signal.
+        """
+        with self._not_full:
+            self._clear()
+            self._queue.put(Status.FINISHED)
+
+        self._set_status(Status.FINISHED)
+        self._wake_waiters()
 
     def put(self, element: Any):
         """Setter to put element to internal synchronised queue."""
@@ -59,7 +171,17 @@ class FinishableQueue():
             with self._lock:
                 self._status = Status.READY
 
-        self._queue.put(element)
+        if _is_signal(element):
+            with self._not_full:
+                self._queue.put(element)
+                # Releases the producers blocked on the bound, as elements
+                # after the signal won't be consumed
+                self._signalled = True
+                self._not_full.notify_all()
+        elif not self._put_data(element):
+            return
+
+        self._wake_waiters()
 
     async def get(self) -> list:
         """Returns a list of elements retrieved from queue once the FINISHED
@@ -69,20 +191,15 @@ class FinishableQueue():
             list: The list of element(s) returned from the queue.
         """
         contents_of_queue = []
-        loop = asyncio.get_event_loop()
 
         while not self.finished and self.status is not Status.ERROR:
-            current_element = await loop.run_in_executor(
-                None, self._queue.get
-            )
+            current_element = await self._next_element()
 
             if current_element is Status.FINISHED:
-                with self._lock:
-                    self._status = Status.FINISHED
+                self._set_status(Status.FINISHED)
             else:
                 if isinstance(current_element, BaseException):
-                    with self._lock:
-                        self._status = Status.ERROR
+                    self._set_status(Status.ERROR)
 
                 contents_of_queue.append(current_element)
 
@@ -92,18 +209,217 @@ class FinishableQueue():
         """Yields the elements in queue as soon as an element has been put into
         the queue.
         """
-        loop = asyncio.get_event_loop()
-
         while not self.finished and self.status is not Status.ERROR:
-            current_element = await loop.run_in_executor(
-                None, self._queue.get
-            )
+            current_element = await self._next_element()
 
             if current_element is Status.FINISHED:
-                with self._lock:
-                    self._status = current_element
+                self._set_status(Status.FINISHED)
             elif isinstance(current_element, BaseException):
-                with self._lock:
-                    self._status = Status.ERROR
+                self._set_status(Status.ERROR)
 
             yield current_element
+
+    async def stream_batches(self, max_batch: int=1000,
+                             max_wait: float=0) -> AsyncIterator[List[Any]]:
+        """Yields the elements in queue in batches. Each batch contains all
+        elements already in the queue at the time it's drained, up to
+        `max_batch` elements.
+
+        Args:
+            max_batch (int, optional): Max number of elements in each batch.
+                Defaults to `1000`.
+            max_wait (float, optional): Seconds to keep waiting for more
+                elements to fill up the batch after the 1st element of the
+                batch is received. Defaults to `0`, which yields the batch
+                right after the elements already queued are drained.
+
+        Yields:
+            :obj:`List[Any]`: Elements retrieved from the queue. The
+                `FINISHED` signal or exception received, if any, is always the
+                last element of the batch.
+        """
+        loop = asyncio.get_event_loop()
+
+        while not self.finished and self.status is not Status.ERROR:
+            batch = [await self._next_element()]
+            deadline = loop.time() + max_wait
+
+            while len(batch) < max_batch and not _is_signal(batch[-1]):
+                try:
+                    batch.append(self._get_nowait())
+                except queue.Empty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(self._wait_for_element(),
+                                               timeout=timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+            if batch[-1] is Status.FINISHED:
+                self._set_status(Status.FINISHED)
+            elif isinstance(batch[-1], BaseException):
+                self._set_status(Status.ERROR)
+
+            yield batch
+
+    #region - Private functions
+    def _set_status(self, status: Status):
+        """Updates the status & releases the producer blocked on the bound if
+        the queue is no longer being consumed.
+        """
+        with self._not_full:
+            turns_finished = (status is Status.FINISHED
+                              and self._status is not Status.FINISHED)
+            self._status = status
+            self._not_full.notify_all()
+
+        if turns_finished and self._on_finished is not None:
+            self._on_finished()
+
+    def _put_data(self, element: Any) -> bool:
+        """Puts a data element into the queue with respect to the bound.
+
+        Returns:
+            bool: `False` if the element is discarded, `True` otherwise.
+        """
+        with self._not_full:
+            if self._maxsize > 0 and self._size >= self._maxsize:
+                if self._overflow is datatype.OverflowPolicy.BLOCK:
+                    # Blocking the thread running an event loop could stall
+                    # the consumer forever, so the bound is exceeded instead.
+                    while (not _in_event_loop()
+                           and self._maxsize > 0
+                           and self._size >= self._maxsize
+                           and self._status not in (Status.FINISHED,
+                                                    Status.ERROR)
+                           and not self._signalled):
+                        self._not_full.wait()
+                    if (self._status in (Status.FINISHED, Status.ERROR)
+                            or self._signalled):
+                        # Nobody is going to consume the element.
+                        self._dropped += 1
+                        return False
+                    if self._maxsize > 0 and self._size >= self._maxsize:
+                        self._overruns += 1
+                elif self._overflow is datatype.OverflowPolicy.DROP_NEWEST:
+                    self._dropped += 1
+                    return False
+                elif self._overflow is datatype.OverflowPolicy.DROP_OLDEST:
+                    self._discard_pending_data(count=1)
+                elif self._overflow is datatype.OverflowPolicy.CONFLATE:
+                    self._discard_pending_data(count=self._size)
+
+            self._size += 1
+            self._queue.put(element)
+
+        return True
+
+    def _clear(self):
+        """Discards all pending elements. Must be called while holding
+        `self._lock`.
+        """
+        with self._queue.mutex:
+            self._queue.queue.clear()
+
+        self._size = 0
+
+    def _discard_pending_data(self, count: int):
+        """Discards the oldest pending data elements. Must be called while
+        holding `self._lock`.
+        """
+        removed = 0
+        with self._queue.mutex:
+            pending = self._queue.queue
+            kept = []
+            while pending and removed < count:
+                elm = pending.popleft()
+                if _is_signal(elm):
+                    kept.append(elm)
+                else:
+                    removed += 1
+            pending.extendleft(reversed(kept))
+
+        self._size -= removed
+        self._dropped += removed
+
+    def _get_nowait(self) -> Any:
+        """Retrieves an element from the internal queue without blocking.
+
+        Raises:
+            queue.Empty: If there's no element in the queue.
+        """
+        element = self._queue.get_nowait()
+
+        if not _is_signal(element):
+            with self._not_full:
+                self._size -= 1
+                self._not_full.notify()
+
+        return element
+
+    async def _next_element(self) -> Any:
+        """Retrieves the next element from the internal queue. Suspends the
+        calling coroutine until an element is available if the queue is empty.
+        """
+        while True:
+            try:
+                return self._get_nowait()
+            except queue.Empty:
+                await self._wait_for_element()
+
+    async def _wait_for_element(self):
+        """Suspends the calling coroutine until the next `put` call."""
+        loop = asyncio.get_event_loop()
+        waiter = loop.create_future()
+
+        with self._lock:
+            # Checks again while holding the lock as the element could have
+            # arrived between the `get_nowait` call and here.
+            if not self._queue.empty():
+                return
+            self._waiters.append((loop, waiter))
+
+        try:
+            await waiter
+        finally:
+            with self._lock:
+                if (loop, waiter) in self._waiters:
+                    self._waiters.remove((loop, waiter))
+
+    def _wake_waiters(self):
+        """Schedules all waiting coroutines to be resumed on their own event
+        loops. Safe to be called from any thread.
+        """
+        with self._lock:
+            if not self._waiters:
+                return
+            waiters = self._waiters
+            self._waiters = []
+
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_release_waiter, waiter)
+            except RuntimeError:
+                # Event loop is closed, so there's nothing to resume.
+                continue
+    #endregion - Private functions
+
+def _is_signal(element: Any) -> bool:
+    """Checks if the element is a control signal instead of data."""
+    return element is Status.FINISHED or isinstance(element, BaseException)
+
+def _in_event_loop() -> bool:
+    """Checks if the current thread is running an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+
+    return True
+
+def _release_waiter(waiter: asyncio.Future):
+    """Marks the waiter future as done if it's still being waited."""
+    if not waiter.done():
+        waiter.set_result(None)
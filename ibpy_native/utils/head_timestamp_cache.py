@@ -0,0 +1,111 @@
+"""Cache of the head timestamps (earliest data points) of contracts."""
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from ibpy_native.utils import datatype
+
+class HeadTimestampCache:
+    """Caches the head timestamps returned from IB in memory, and optionally
+    in a JSON file to be reused across sessions.
+
+    Args:
+        ttl (:obj:`float`, optional): Seconds a head timestamp cached stays
+            valid. `None` to never expire. Defaults to 1 day.
+        path (str, optional): JSON file to persist the cache. Entries in the
+            file are loaded on initial. Defaults to `None` to cache in memory
+            only.
+    """
+    def __init__(self, ttl: Optional[float]=86400, path: Optional[str]=None):
+        self._ttl = ttl
+        self._path = path
+        self._lock = threading.Lock()
+        # `{conId}/{EarliestDataPoint}` -> [head timestamp, time cached]
+        self._entries: Dict[str, List[float]] = {}
+
+        if path is not None:
+            try:
+                with open(path) as file:
+                    self._entries = json.load(file)
+            except FileNotFoundError:
+                pass
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """:obj:`float`, optional: Seconds a head timestamp cached stays
+        valid.
+        """
+        return self._ttl
+
+    def get(self, con_id: int,
+            data_type: datatype.EarliestDataPoint) -> Optional[int]:
+        """Returns the head timestamp cached.
+
+        Args:
+            con_id (int): Contract ID.
+            data_type (:obj:`ibpy_native.utils.datatype.EarliestDataPoint`):
+                Type of data.
+
+        Returns:
+            :obj:`int`, optional: Epoch time of the head timestamp. `None` if
+                it's not cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(_key(con_id, data_type))
+
+        if entry is None:
+            return None
+        if self._ttl is not None and time.time() - entry[1] > self._ttl:
+            return None
+
+        return int(entry[0])
+
+    def set(self, con_id: int, data_type: datatype.EarliestDataPoint,
+            timestamp: int):
+        """Caches the head timestamp.
+
+        Args:
+            con_id (int): Contract ID.
+            data_type (:obj:`ibpy_native.utils.datatype.EarliestDataPoint`):
+                Type of data.
+            timestamp (int): Epoch time of the head timestamp.
+        """
+        with self._lock:
+            self._entries[_key(con_id, data_type)] = [timestamp, time.time()]
+            self._save()
+
+    def invalidate(self, con_id: Optional[int]=None,
+                   data_type: Optional[datatype.EarliestDataPoint]=None):
+        """Removes the head timestamps cached.
+
+        Args:
+            con_id (:obj:`int`, optional): Contract ID. `None` to remove the
+                ones of all contracts. Defaults to `None`.
+            data_type (:obj:`ibpy_native.utils.datatype.EarliestDataPoint`,
+                optional): Type of data. `None` to remove the ones of all
+                types. Defaults to `None`.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                key_con_id, key_type = key.split("/")
+                if ((con_id is None or key_con_id == str(con_id)) and
+                        (data_type is None or key_type == data_type.value)):
+                    del self._entries[key]
+            self._save()
+
+    #region - Private functions
+    def _save(self):
+        if self._path is None:
+            return
+
+        # Replaces the file atomically to not leave a broken file on crash
+        tmp_file = f"{self._path}.tmp"
+        with open(tmp_file, "w") as file:
+            json.dump(self._entries, file)
+        os.replace(tmp_file, self._path)
+    #endregion - Private functions
+
+def _key(con_id: int, data_type: datatype.EarliestDataPoint) -> str:
+    return f"{con_id}/{data_type.value}"
@@ -0,0 +1,346 @@
+"""Local on-disk store of historical ticks.
+
+Ticks are stored in immutable segments, each covers a time range of a
+contract (`conId`) & `HistoricalTicks` type, with a `.npy` file per field.
+Segments are only added for the time ranges not covered yet, and removed as a
+whole on eviction. Requires `numpy`.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ibpy_native.models import tick_array
+from ibpy_native.utils import datatype
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None
+
+_INDEX_FILE = "index.json"
+
+class TickStore:
+    """Stores the historical ticks downloaded on disk, so the time ranges
+    covered can be served without requesting IB again.
+
+    Time ranges are in epoch seconds, both ends inclusive. Access time of
+    the segments looked up is kept in memory, and persisted for the LRU order
+    of next sessions once the index is written on store, eviction or
+    `close`.
+
+    Args:
+        path (str): Directory to store the ticks. Created if not exists.
+        max_size (int, optional): Max total size of the segments in bytes.
+            Least recently used segments are evicted once exceeded. Defaults
+            to `0` for no limit.
+
+    Raises:
+        ImportError: If `numpy` is not installed.
+    """
+    def __init__(self, path: str, max_size: int=0):
+        if np is None:
+            raise ImportError("`TickStore` requires `numpy`. Install it via "
+                              "`pip install ibpy-native[numpy]`.")
+
+        self._path = path
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._hit_ticks = 0
+        self._evictions = 0
+
+        os.makedirs(path, exist_ok=True)
+        # Segments sorted by start time per key
+        self._index: Dict[str, List[Dict[str, Any]]] = self._read_index()
+        # If the access time of any segment is not persisted yet
+        self._accessed = False
+
+    @property
+    def path(self) -> str:
+        """str: Directory of the store."""
+        return self._path
+
+    @property
+    def stats(self) -> datatype.TickStoreStats:
+        """:obj:`ibpy_native.utils.datatype.TickStoreStats`: Statistics of
+        the store since it's opened.
+        """
+        with self._lock:
+            segments = [segment for segments in self._index.values()
+                        for segment in segments]
+
+            return datatype.TickStoreStats(
+                hits=self._hits, misses=self._misses,
+                hit_ticks=self._hit_ticks, evictions=self._evictions,
+                segments=len(segments),
+                size=sum(segment["size"] for segment in segments)
+            )
+
+    def lookup(
+        self, con_id: int, tick_type: datatype.HistoricalTicks,
+        start: int, end: int
+    ) -> List[Tuple[int, int, Optional[tick_array.TickArray]]]:
+        """Splits the time range into the parts covered by the store and the
+        gaps those are not.
+
+        Args:
+            con_id (int): Contract ID.
+            tick_type (:obj:`ibpy_native.utils.datatype.HistoricalTicks`):
+                Type of tick data.
+            start (int): Epoch time of the earliest tick.
+            end (int): Epoch time of the latest tick.
+
+        Returns:
+            :obj:`List[Tuple[int, int, Optional[TickArray]]]`: Start & end
+                time of each part in time order, with the ticks stored, or
+                `None` for the gaps to be fetched from IB.
+        """
+        parts = []
+        cursor = start
+
+        with self._lock:
+            for segment in self._index.get(_key(con_id, tick_type), []):
+                if segment["end"] < cursor:
+                    continue
+                if segment["start"] > end:
+                    break
+
+                if segment["start"] > cursor:
+                    parts.append((cursor, segment["start"] - 1, None))
+                    self._misses += 1
+                    cursor = segment["start"]
+
+                part_end = min(segment["end"], end)
+                ticks = self._load(segment)
+                if len(ticks) > 0:
+                    times = ticks["time"]
+                    ticks = ticks[times.searchsorted(cursor):
+                                  times.searchsorted(part_end, side="right")]
+
+                parts.append((cursor, part_end, ticks))
+                segment["last_access"] = time.time()
+                self._accessed = True
+                self._hits += 1
+                self._hit_ticks += len(ticks)
+                cursor = part_end + 1
+
+            if cursor <= end:
+                parts.append((cursor, end, None))
+                self._misses += 1
+
+        return parts
+
+    def missing(self, con_id: int, tick_type: datatype.HistoricalTicks,
+                start: int, end: int) -> List[Tuple[int, int]]:
+        """Finds the gaps of the time range those are not covered by the
+        store, without loading any tick.
+
+        Args:
+            con_id (int): Contract ID.
+            tick_type (:obj:`ibpy_native.utils.datatype.HistoricalTicks`):
+                Type of tick data.
+            start (int): Epoch time of the start of the range.
+            end (int): Epoch time of the end of the range.
+
+        Returns:
+            :obj:`List[Tuple[int, int]]`: Start & end time of the gaps in time
+                order, with the contiguous ones merged.
+        """
+        with self._lock:
+            gaps = self._gaps(key=_key(con_id, tick_type), start=start,
+                              end=end)
+            self._misses += len(gaps)
+
+        return gaps
+
+    def append(self, con_id: int, tick_type: datatype.HistoricalTicks,
+               start: int, end: int, ticks: tick_array.TickArray):
+        """Stores the ticks of a time range not covered by the store yet.
+
+        Args:
+            con_id (int): Contract ID.
+            tick_type (:obj:`ibpy_native.utils.datatype.HistoricalTicks`):
+                Type of tick data.
+            start (int): Epoch time of the start of the range.
+            end (int): Epoch time of the end of the range.
+            ticks (:obj:`ibpy_native.models.TickArray`): All ticks within
+                the range.
+
+        Raises:
+            ValueError: If the range overlaps with the ones stored.
+        """
+        key = _key(con_id, tick_type)
+
+        with self._lock:
+            for segment in self._index.get(key, []):
+                if segment["start"] <= end and start <= segment["end"]:
+                    raise ValueError(
+                        f"Time range {start}-{end} overlaps with segment "
+                        f"{segment['start']}-{segment['end']} stored.")
+
+            self._add_segment(con_id=con_id, tick_type=tick_type,
+                              start=start, end=end, ticks=ticks)
+            self._evict()
+            self._write_index()
+
+    def fill(self, con_id: int, tick_type: datatype.HistoricalTicks,
+             start: int, end: int,
+             ticks: tick_array.TickArray) -> List[Tuple[int, int]]:
+        """Stores the ticks of the parts of a time range not covered by the
+        store yet, e.g. the range is stored by another download meanwhile.
+        Parts covered already are skipped.
+
+        Args:
+            con_id (int): Contract ID.
+            tick_type (:obj:`ibpy_native.utils.datatype.HistoricalTicks`):
+                Type of tick data.
+            start (int): Epoch time of the start of the range.
+            end (int): Epoch time of the end of the range.
+            ticks (:obj:`ibpy_native.models.TickArray`): All ticks within
+                the range.
+
+        Returns:
+            :obj:`List[Tuple[int, int]]`: Start & end time of the parts
+                stored.
+        """
+        with self._lock:
+            gaps = self._gaps(key=_key(con_id, tick_type), start=start,
+                              end=end)
+            for gap_start, gap_end in gaps:
+                part = ticks
+                if len(ticks) > 0 and (gap_start, gap_end) != (start, end):
+                    times = ticks["time"]
+                    part = ticks[times.searchsorted(gap_start):
+                                 times.searchsorted(gap_end, side="right")]
+                self._add_segment(con_id=con_id, tick_type=tick_type,
+                                  start=gap_start, end=gap_end, ticks=part)
+
+            if gaps:
+                self._evict()
+                self._write_index()
+
+        return gaps
+
+    def clear(self):
+        """Removes all segments stored."""
+        with self._lock:
+            for segments in self._index.values():
+                for segment in segments:
+                    self._remove(segment)
+            self._index = {}
+            self._write_index()
+
+    def close(self):
+        """Persists the access time of the segments looked up since the
+        index is last written, for the LRU order of next sessions.
+        """
+        with self._lock:
+            if self._accessed:
+                self._write_index()
+
+    #region - Private functions
+    def _gaps(self, key: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """Finds the gaps of the time range not covered. Must be called while
+        holding `self._lock`.
+        """
+        gaps = []
+        cursor = start
+
+        for segment in self._index.get(key, []):
+            if segment["end"] < cursor:
+                continue
+            if segment["start"] > end:
+                break
+
+            if segment["start"] > cursor:
+                gaps.append((cursor, segment["start"] - 1))
+            cursor = max(cursor, segment["end"] + 1)
+
+        if cursor <= end:
+            gaps.append((cursor, end))
+
+        return gaps
+
+    def _add_segment(self, con_id: int, tick_type: datatype.HistoricalTicks,
+                     start: int, end: int, ticks: tick_array.TickArray):
+        """Writes the ticks as a new segment into the index. Must be called
+        while holding `self._lock`.
+        """
+        rel_path = os.path.join(str(con_id), tick_type.name, f"{start}-{end}")
+        seg_path = os.path.join(self._path, rel_path)
+        os.makedirs(seg_path, exist_ok=True)
+        size = 0
+        for name, column in ticks.to_numpy().items():
+            file = os.path.join(seg_path, f"{name}.npy")
+            np.save(file, column)
+            size += os.path.getsize(file)
+
+        segments = self._index.setdefault(_key(con_id, tick_type), [])
+        segments.append({
+            "start": start, "end": end, "path": rel_path,
+            "fields": ticks.fields, "size": size,
+            "last_access": time.time(),
+        })
+        segments.sort(key=lambda segment: segment["start"])
+
+    def _load(self, segment: Dict[str, Any]) -> tick_array.TickArray:
+        """Loads the segment with the files memory-mapped."""
+        seg_path = os.path.join(self._path, segment["path"])
+
+        return tick_array.TickArray(columns={
+            name: np.load(os.path.join(seg_path, f"{name}.npy"),
+                          mmap_mode="r")
+            for name in segment["fields"]
+        })
+
+    def _evict(self):
+        """Evicts the least recently used segments until the total size is
+        within `max_size`.
+        """
+        if self._max_size <= 0:
+            return
+
+        segments = sorted(
+            ((segment["last_access"], key, segment)
+             for key, segments in self._index.items()
+             for segment in segments),
+            key=lambda item: item[0]
+        )
+        size = sum(segment["size"] for _, _, segment in segments)
+
+        for _, key, segment in segments:
+            if size <= self._max_size:
+                break
+
+            self._index[key].remove(segment)
+            self._remove(segment)
+            size -= segment["size"]
+            self._evictions += 1
+
+    def _remove(self, segment: Dict[str, Any]):
+        shutil.rmtree(os.path.join(self._path, segment["path"]),
+                      ignore_errors=True)
+
+    def _read_index(self) -> Dict[str, List[Dict[str, Any]]]:
+        try:
+            with open(os.path.join(self._path, _INDEX_FILE)) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _write_index(self):
+        # Replaces the index atomically to not leave a broken file on crash
+        tmp_file = os.path.join(self._path, f"{_INDEX_FILE}.tmp")
+        with open(tmp_file, "w") as file:
+            json.dump(self._index, file)
+        os.replace(tmp_file, os.path.join(self._path, _INDEX_FILE))
+        self._accessed = False
+    #endregion - Private functions
+
+def _key(con_id: int, tick_type: datatype.HistoricalTicks) -> str:
+    return f"{con_id}/{tick_type.name}"
@@ -0,0 +1,194 @@
+"""Trading sessions parsed from `ContractDetails.tradingHours` /
+`ContractDetails.liquidHours`.
+"""
+import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pytz
+
+from ibapi import contract as ib_contract
+
+_DAY = datetime.timedelta(days=1)
+# Max number of days to look ahead for the next session
+_MAX_DAYS = 31
+
+# Abbreviations used in `ContractDetails.timeZoneId` by older TWS versions
+# (e.g. "EST (Eastern Standard Time)")
+_TZ_ABBREVIATIONS = {
+    "EST": "US/Eastern",
+    "EDT": "US/Eastern",
+    "CST": "US/Central",
+    "CDT": "US/Central",
+    "MST": "US/Mountain",
+    "PST": "US/Pacific",
+    "GMT": "GMT",
+    "BST": "Europe/London",
+    "MET": "MET",
+    "CET": "CET",
+    "JST": "Asia/Tokyo",
+    "HKT": "Asia/Hong_Kong",
+    "AET": "Australia/Sydney",
+}
+
+class TradingSchedule:
+    """Trading sessions of a contract, to find the time the market opens
+    next.
+
+    Sessions listed by IB only cover the days around the time of request.
+    For the days not listed, the market is assumed to open at the earliest
+    time observed on the same week day until the end of day. Week days without
+    any session listed are treated as open all day (e.g. holidays), except
+    weekends. So no trading session is skipped for the days not listed.
+
+    Args:
+        sessions (:obj:`List[Tuple[datetime.datetime, datetime.datetime]]`):
+            Start & end of the sessions listed, in native `datetime` of the
+            exchange timezone.
+        days (:obj:`List[datetime.datetime]`): Days listed, including the
+            closed ones.
+        tz (:obj:`datetime.tzinfo`): Timezone of the exchange.
+    """
+    # pylint: disable=invalid-name
+    def __init__(
+        self, sessions: List[Tuple[datetime.datetime, datetime.datetime]],
+        days: List[datetime.datetime], tz: datetime.tzinfo
+    ):
+        self._tz = tz
+        # Sessions of the days listed, split at midnight
+        self._listed: Dict[datetime.date, List[Tuple[float, float]]] = {
+            day.date(): [] for day in days
+        }
+        opens: List[Optional[datetime.timedelta]] = [None] * 7
+
+        for start, end in sorted(sessions):
+            while start < end:
+                midnight = _midnight(start) + _DAY
+                piece_end = min(end, midnight)
+                if start.date() in self._listed:
+                    self._listed[start.date()].append(
+                        (self._timestamp(start), self._timestamp(piece_end)))
+
+                    weekday = start.weekday()
+                    offset = start - _midnight(start)
+                    if opens[weekday] is None or offset < opens[weekday]:
+                        opens[weekday] = offset
+                start = piece_end
+
+        weekends_closed = {day.weekday() for day in days
+                           if day.weekday() >= 5}
+        self._opens = [
+            offset if (offset is not None or weekday in weekends_closed)
+            else datetime.timedelta(0)
+            for weekday, offset in enumerate(opens)
+        ]
+
+    @classmethod
+    def from_contract_details(
+        cls, details: ib_contract.ContractDetails, liquid: bool=False
+    ) -> Optional["TradingSchedule"]:
+        """Parses the trading hours of the contract details.
+
+        Args:
+            details (:obj:`ibapi.contract.ContractDetails`): Contract details
+                returned from IB.
+            liquid (bool, optional): Uses `liquidHours` (regular trading
+                hours) instead of `tradingHours`. Defaults to `False`.
+
+        Returns:
+            :obj:`TradingSchedule`, optional: The schedule. `None` if no
+                session is listed.
+        """
+        hours = details.liquidHours if liquid else details.tradingHours
+
+        return cls.parse(hours=hours, time_zone=details.timeZoneId)
+
+    @classmethod
+    def parse(cls, hours: str,
+              time_zone: str) -> Optional["TradingSchedule"]:
+        """Parses the trading hours in IB's format.
+
+        Both formats are supported, e.g.
+            - `20210301:1700-20210302:1600;20210306:CLOSED`;
+            - `20210301:0930-1200,1300-1600;20210306:CLOSED`.
+
+        Args:
+            hours (str): Trading hours returned from IB.
+            time_zone (str): `timeZoneId` of the contract details.
+
+        Returns:
+            :obj:`TradingSchedule`, optional: The schedule. `None` if no
+                session is listed.
+        """
+        sessions = []
+        days = []
+
+        for day_hours in filter(None, hours.split(";")):
+            date, _, ranges = day_hours.partition(":")
+            day = datetime.datetime.strptime(date, "%Y%m%d")
+            days.append(day)
+            if ranges == "CLOSED":
+                continue
+
+            for session in filter(None, ranges.split(",")):
+                start, _, end = session.partition("-")
+                start_time = _combine(day, start)
+                if ":" in end:
+                    end_date, _, end = end.partition(":")
+                    end_time = _combine(
+                        datetime.datetime.strptime(end_date, "%Y%m%d"), end)
+                else:
+                    end_time = _combine(day, end)
+                    if end_time <= start_time:
+                        end_time += _DAY
+
+                sessions.append((start_time, end_time))
+
+        if not sessions:
+            return None
+
+        return cls(sessions=sessions, days=days, tz=_timezone(time_zone))
+
+    def next_open(self, timestamp: float) -> float:
+        """Finds the time the market is open at or after `timestamp`.
+
+        Args:
+            timestamp (float): Epoch time.
+
+        Returns:
+            float: `timestamp` if the market is open at the time, or the start
+                of the next session otherwise.
+        """
+        day = _midnight(datetime.datetime.fromtimestamp(timestamp, tz=self._tz)
+                        .replace(tzinfo=None))
+
+        for _ in range(_MAX_DAYS):
+            if day.date() in self._listed:
+                for start, end in self._listed[day.date()]:
+                    if timestamp < end:
+                        return max(timestamp, start)
+            elif self._opens[day.weekday()] is not None:
+                return max(timestamp,
+                           self._timestamp(day + self._opens[day.weekday()]))
+
+            day += _DAY
+
+        return timestamp
+
+    #region - Private functions
+    def _timestamp(self, date_time: datetime.datetime) -> float:
+        return self._tz.localize(date_time).timestamp()
+    #endregion - Private functions
+
+def _combine(day: datetime.datetime, hhmm: str) -> datetime.datetime:
+    return day.replace(hour=int(hhmm[:2]), minute=int(hhmm[2:4]))
+
+def _midnight(date_time: datetime.datetime) -> datetime.datetime:
+    return date_time.replace(hour=0, minute=0, second=0, microsecond=0)
+
+def _timezone(time_zone: str) -> datetime.tzinfo:
+    try:
+        return pytz.timezone(time_zone)
+    except pytz.UnknownTimeZoneError:
+        abbreviation = time_zone.split(" ")[0] if time_zone else ""
+
+        return pytz.timezone(_TZ_ABBREVIATIONS.get(abbreviation, "UTC"))
@@ -10,6 +10,7 @@ from ibapi import contract
 
 import ibpy_native
 from ibpy_native import error
+from ibpy_native import models
 from ibpy_native.interfaces import listeners
 from ibpy_native.utils import datatype
 
@@ -56,33 +57,26 @@ async def main():
     gbp_usd_fx = contract_results[0].contract
     print(f"Contract - {gbp_usd_fx}")
 
-    tickers = []
+    pages = []
     try:
         async for data in bridge.req_historical_ticks(
             contract=gbp_usd_fx,
             start=datetime.datetime(year=2021, month=1, day=4, hour=10),
             end=datetime.datetime(year=2021, month=1, day=4, hour=10, minute=5),
             tick_type=datatype.HistoricalTicks.BID_ASK,
-            retry=5
+            retry=5,
+            columnar=True
         ):
             print(".", end="", flush=True)
-            for tick in data.ticks:
-                time = (datetime.datetime.fromtimestamp(tick.time)
-                        .astimezone(pytz.timezone("America/New_York")))
-                tickers.append({
-                    "time": time,
-                    "bid_price": tick.priceBid,
-                    "ask_price": tick.priceAsk,
-                    "bid_size": tick.sizeBid,
-                    "ask_size": tick.sizeAsk,
-                })
+            pages.append(data.ticks)
     except error.IBError as err:
         print(err)
 
         return
 
-    cols = ["time", "bid_price", "ask_price", "bid_size", "ask_size"]
-    dataframe = pd.DataFrame(data=tickers, columns=cols)
+    dataframe = models.TickArray.concatenate(pages).to_pandas()
+    dataframe["time"] = (pd.to_datetime(dataframe["time"], unit="s", utc=True)
+                         .dt.tz_convert(pytz.timezone("America/New_York")))
     print(dataframe)
 
     bridge.disconnect()
@@ -101,7 +101,8 @@ setup(
     #   py_modules=["my_module"],
     #
     packages=find_packages(
-        exclude=["contrib", "docs", "samples", "tests", "tests.*"]
+        exclude=["benchmarks", "contrib", "docs", "samples", "tests",
+                 "tests.*"]
     ),  # Required
     # Specify which Python versions you support. In contrast to the
     # 'Programming Language' classifiers above, 'pip install' will check this
@@ -129,7 +130,7 @@ setup(
     #
     # Similar to `install_requires` above, these must be valid existing
     # projects.
-    extras_require={"dev": []},  # Optional
+    extras_require={"dev": [], "numpy": ["numpy"]},  # Optional
     # If there are data files included in your packages that need to be
     # installed, specify them here.
     #
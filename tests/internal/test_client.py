@@ -6,13 +6,17 @@ import threading
 import unittest
 from dateutil import relativedelta
 
+from ibapi import comm
 from ibapi import contract
+from ibapi import server_versions
 from ibapi import wrapper
 
 from ibpy_native import error
 from ibpy_native import manager
+from ibpy_native import models
 from ibpy_native._internal import _client
 from ibpy_native._internal import _global
+from ibpy_native._internal import _pacing
 from ibpy_native._internal import _wrapper
 from ibpy_native.utils import datatype
 from ibpy_native.utils import finishable_queue as fq
@@ -129,7 +133,7 @@ class TestContract(unittest.TestCase):
         thread.start()
 
     def setUp(self):
-        self._req_id = self._wrapper.next_req_id
+        self._req_id = self._wrapper.allocate_req_id()
 
     @utils.async_test
     async def test_resolve_contracts(self):
@@ -201,7 +205,7 @@ class TestHistoricalData(unittest.TestCase):
         thread.start()
 
     def setUp(self):
-        self._req_id = self._wrapper.next_req_id
+        self._req_id = self._wrapper.allocate_req_id()
         self._end = (datetime.datetime.now() + relativedelta.relativedelta(
             weekday=relativedelta.FR(-1))
         ).replace(hour=12, minute=0).astimezone(_global.TZ)
@@ -335,6 +339,32 @@ class TestHistoricalData(unittest.TestCase):
                 show=datatype.HistoricalTicks.BID_ASK
             )
 
+    @utils.async_test
+    async def test_req_historical_bars(self):
+        """Test function `req_historical_bars`."""
+        result = await self._client.req_historical_bars(
+            req_id=self._req_id, contract=sample_contracts.gbp_usd_fx(),
+            end_date_time=self._end.replace(tzinfo=None), duration="1800 S",
+            bar_size=datatype.BarSize.MIN_1,
+            show=datatype.HistoricalBars.MIDPOINT
+        )
+
+        self.assertIsInstance(result, models.BarArray)
+        self.assertEqual(len(result), 30)
+
+    @utils.async_test
+    async def test_req_historical_bars_err(self):
+        """Test function `req_historical_bars`.
+
+        * `IBError` raised due to unresolvable IB `Contract`
+        """
+        with self.assertRaises(error.IBError):
+            await self._client.req_historical_bars(
+                req_id=self._req_id, contract=contract.Contract(),
+                end_date_time=self._end.replace(tzinfo=None),
+                duration="1800 S"
+            )
+
     @classmethod
     def tearDownClass(cls):
         cls._client.disconnect()
@@ -360,60 +390,28 @@ class TestLiveData(unittest.TestCase):
         thread.start()
 
     def setUp(self):
-        self._req_id = self._wrapper.next_req_id
-        self._listener = utils.MockLiveTicksListener()
-
-    @utils.async_test
-    async def test_stream_live_ticks(self):
-        """Test function `stream_live_ticks`."""
-        # Prepare function & tasks for the test
-        async def cancel_req():
-            while not self._listener.ticks: # Wait until a tick received
-                await asyncio.sleep(0.1)
-            await self._stop_streaming(req_id=self._req_id)
-
-        cancel_task = asyncio.create_task(cancel_req())
-
-        try:
-            await self._start_streaming(req_id=self._req_id)
-            await cancel_task
-        except error.IBError as err:
-            for task in asyncio.all_tasks():
-                task.cancel()
-            self.fail(err.err_str)
-
-        self.assertIsInstance(self._listener.ticks[0],
-                              wrapper.HistoricalTickBidAsk)
-
-    @utils.async_test
-    async def test_stream_live_ticks_err(self):
-        """Test function `stream_live_ticks`.
-
-        * Should raise `IBError` as queue associated with `_req_id` being
-          occupied.
-        """
-        # Mock queue occupation
-        self._wrapper.get_request_queue(req_id=self._req_id)
-        with self.assertRaises(error.IBError):
-            await self._client.stream_live_ticks(
-                req_id=self._req_id, contract=sample_contracts.gbp_usd_fx(),
-                listener=self._listener, tick_type=datatype.LiveTicks.BID_ASK
-            )
+        self._req_id = self._wrapper.allocate_req_id()
 
     @utils.async_test
     async def test_cancel_live_ticks_stream(self):
         """Test function `cancel_live_ticks_stream`."""
-        try:
-            await self._start_streaming(req_id=self._req_id)
-            await asyncio.sleep(0.5)
-            self._client.cancel_live_ticks_stream(req_id=self._req_id)
-        except error.IBError as err:
-            for task in asyncio.all_tasks():
-                task.cancel()
-            self.fail(err.err_str)
-
-        await asyncio.sleep(0.5)
-        self.assertTrue(self._listener.finished)
+        f_queue = self._wrapper.get_request_queue(req_id=self._req_id)
+        self._client.reqTickByTickData(
+            reqId=self._req_id, contract=sample_contracts.gbp_usd_fx(),
+            tickType=datatype.LiveTicks.BID_ASK.value, numberOfTicks=0,
+            ignoreSize=True
+        )
+
+        received = []
+        async for batch in f_queue.stream_batches():
+            if isinstance(batch[-1], error.IBError):
+                self.fail(batch[-1].err_str)
+            received.extend(batch)
+            if not f_queue.finished:
+                self._client.cancel_live_ticks_stream(req_id=self._req_id)
+
+        self.assertIsInstance(received[0], wrapper.HistoricalTickBidAsk)
+        self.assertTrue(f_queue.finished)
 
     @utils.async_test
     async def test_cancel_live_ticks_stream_err(self):
@@ -428,14 +426,203 @@ class TestLiveData(unittest.TestCase):
     def tearDownClass(cls):
         cls._client.disconnect()
 
-    async def _start_streaming(self, req_id: int) -> asyncio.Task:
-        return asyncio.create_task(self._client.stream_live_ticks(
-                req_id, contract=sample_contracts.gbp_usd_fx(),
-                listener=self._listener, tick_type=datatype.LiveTicks.BID_ASK
-            )
+class TestRequestTimeout(unittest.TestCase):
+    """Unit tests for the timeout of requests in `IBClient`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._wrapper = _wrapper.IBWrapper(
+            accounts_manager=utils.MockAccountsManagementDelegate(),
+            orders_manager=manager.OrdersManager()
         )
+        self._client = _client.IBClient(self._wrapper, timeout=0.1)
+        # Requests sent are never responded
+        self._client.reqContractDetails = lambda reqId, contract: None
+        self._client.reqHeadTimeStamp = lambda **kwargs: None
+        self._cancelled = []
+        self._client.cancelHeadTimeStamp = (
+            lambda reqId: self._cancelled.append(reqId))
+
+    @utils.async_test
+    async def test_timeout(self):
+        """Test the client default timeout.
+
+        * `IBError` with error code `REQ_TIMEOUT` should be raised.
+        * Request ID should not be reused, as the request can't be cancelled
+          and may still be responded.
+        """
+        req_id = self._wrapper.allocate_req_id()
+
+        with self.assertRaises(error.IBError) as ctx:
+            await self._client.resolve_contract(
+                req_id=req_id, contract=sample_contracts.gbp_usd_fx())
+
+        self.assertEqual(ctx.exception.err_code,
+                         error.IBErrorCode.REQ_TIMEOUT)
+        self.assertNotEqual(self._wrapper.allocate_req_id(), req_id)
+
+        # Late response is left in the queue of the request timed out
+        self._wrapper.contractDetailsEnd(req_id)
+        self.assertIsNot(
+            self._wrapper.get_request_queue_no_throw(req_id).status,
+            fq.Status.READY)
+
+    @utils.async_test
+    async def test_timeout_cancellable(self):
+        """Test the timeout of request can be cancelled on IB side.
+
+        * Request ID should be reusable after timeout.
+        """
+        req_id = self._wrapper.allocate_req_id()
+
+        with self.assertRaises(error.IBError):
+            await self._client.resolve_head_timestamp(
+                req_id=req_id, contract=sample_contracts.us_stock())
+
+        self.assertEqual(self._cancelled, [req_id])
+        self.assertEqual(self._wrapper.allocate_req_id(), req_id)
+
+    @utils.async_test
+    async def test_error(self):
+        """Test the request terminated by error returned from IB.
+
+        * Request ID should be reusable after the error.
+        """
+        req_id = self._wrapper.allocate_req_id()
+        self._client.reqContractDetails = (
+            lambda reqId, contract: self._wrapper.error(
+                reqId, 200, "No security definition has been found"))
+
+        with self.assertRaises(error.IBError):
+            await self._client.resolve_contracts(
+                req_id=req_id, contract=sample_contracts.gbp_usd_fx())
+
+        self.assertEqual(self._wrapper.allocate_req_id(), req_id)
+
+    @utils.async_test
+    async def test_timeout_per_call(self):
+        """Test the timeout specified per call.
+
+        * Request should be cancelled on IB side after timeout.
+        """
+        req_id = self._wrapper.allocate_req_id()
+        self._client.timeout = None
+
+        with self.assertRaises(error.IBError) as ctx:
+            await self._client.resolve_head_timestamp(
+                req_id=req_id, contract=sample_contracts.us_stock(),
+                timeout=0.05)
+
+        self.assertEqual(ctx.exception.err_code,
+                         error.IBErrorCode.REQ_TIMEOUT)
+        self.assertEqual(self._cancelled, [req_id])
+
+    @utils.async_test
+    async def test_cancelled(self):
+        """Test cancelling the task awaiting the response.
+
+        * Request should be cancelled on IB side.
+        * Request ID should be reusable after cancellation.
+        """
+        req_id = self._wrapper.allocate_req_id()
+        self._client.timeout = None
+        task = asyncio.ensure_future(self._client.resolve_head_timestamp(
+            req_id=req_id, contract=sample_contracts.us_stock()))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(self._cancelled, [req_id])
+        self.assertEqual(self._wrapper.allocate_req_id(), req_id)
+
+    @utils.async_test
+    async def test_cancelled_pacing(self):
+        """Test cancelling the task queued by the pacing scheduler.
+
+        * Request should not be sent.
+        * Request ID should be reusable after cancellation.
+        """
+        self._client = _client.IBClient(
+            self._wrapper, pacing=_pacing.PacingScheduler(max_active=0))
+        sent = []
+        self._client.reqHeadTimeStamp = lambda **kwargs: sent.append(kwargs)
+        req_id = self._wrapper.allocate_req_id()
+        task = asyncio.ensure_future(self._client.resolve_head_timestamp(
+            req_id=req_id, contract=sample_contracts.us_stock()))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self._client.pacing.metrics.waiting, 1)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(sent, [])
+        self.assertEqual(self._wrapper.allocate_req_id(), req_id)
+
+class TestAsyncTransport(unittest.TestCase):
+    """Unit tests for the `asyncio` based transport of `IBClient`.
+
+    Connection with IB is NOT REQUIRED. A local server mimics the handshake
+    of IB TWS/Gateway.
+    """
+    def setUp(self):
+        self._listener = utils.MockConnectionListener()
+        self._wrapper = _wrapper.IBWrapper(
+            accounts_manager=utils.MockAccountsManagementDelegate(),
+            orders_manager=manager.OrdersManager(),
+            connection_listener=self._listener
+        )
+        self._client = _client.IBClient(self._wrapper, timeout=1)
+
+    @utils.async_test
+    async def test_connect_async(self):
+        """Test function `connect_async`.
+
+        * Messages split across packets should be framed & dispatched.
+        * Connection dropped by the other side should be detected.
+        """
+        close_conn = asyncio.Event()
+
+        async def handle(reader: asyncio.StreamReader,
+                         writer: asyncio.StreamWriter):
+            await reader.readexactly(4) # "API\0"
+            size = int.from_bytes(await reader.readexactly(4), "big")
+            await reader.readexactly(size)
+
+            writer.write(comm.make_msg(
+                f"{server_versions.MAX_CLIENT_VER}\0"
+                "20210301 00:00:00 EST\0"
+            ))
+            msg = comm.make_msg("15\x001\x00DU0001,DU0002\x00")
+            writer.write(msg[:6])
+            await writer.drain()
+            await asyncio.sleep(0.05)
+            writer.write(msg[6:])
+            await writer.drain()
+
+            await close_conn.wait()
+            writer.close()
+
+        server = await asyncio.start_server(handle, host="127.0.0.1", port=0)
+        port = server.sockets[0].getsockname()[1]
+
+        await self._client.connect_async(host="127.0.0.1", port=port,
+                                         client_id=1)
+        self.assertTrue(self._client.isConnected())
+
+        await asyncio.sleep(0.2)
+        self.assertEqual(
+            list(self._wrapper._accounts_manager.accounts.keys()),
+            ["DU0001", "DU0002"]
+        )
+
+        close_conn.set()
+        await asyncio.sleep(0.2)
+        self.assertFalse(self._client.isConnected())
+        self.assertFalse(self._listener.connected)
 
-    async def _stop_streaming(self, req_id: int):
-        self._client.cancelTickByTickData(reqId=req_id)
-        await asyncio.sleep(2)
-        self._wrapper.get_request_queue_no_throw(req_id).put(fq.Status.FINISHED)
+        server.close()
+        await server.wait_closed()
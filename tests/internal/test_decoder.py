@@ -0,0 +1,203 @@
+"""Unit tests for module `ibpy_native._internal._decoder`."""
+import unittest
+
+from ibapi import decoder
+from ibapi import message
+from ibapi import server_versions
+from ibapi import wrapper
+
+from ibpy_native import manager
+from ibpy_native._internal import _decoder
+from ibpy_native._internal import _wrapper
+
+from tests.toolkit import utils
+
+class TestIBDecoder(unittest.TestCase):
+    """Unit tests for class `IBDecoder`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._wrapper = _wrapper.IBWrapper(
+            accounts_manager=utils.MockAccountsManagementDelegate(),
+            orders_manager=manager.OrdersManager()
+        )
+        self._decoder = _decoder.IBDecoder(self._wrapper,
+                                           server_versions.MAX_CLIENT_VER)
+        self._req_id = self._wrapper.allocate_req_id()
+        self._queue = self._wrapper.get_request_queue(req_id=self._req_id)
+
+    @utils.async_test
+    async def test_historical_ticks_bid_ask(self):
+        """Test decoding message `HISTORICAL_TICKS_BID_ASK` in columnar mode.
+
+        * Ticks should be parsed into a `TickArray` with the attribute
+        bitmask & empty fields decoded as `0`.
+        """
+        self._wrapper.set_columnar(req_id=self._req_id, columnar=True)
+        self._decoder.interpret((
+            str(message.IN.HISTORICAL_TICKS_BID_ASK).encode(),
+            str(self._req_id).encode(), b"2",
+            b"1614556800", b"0", b"1.2101", b"1.2102", b"100", b"",
+            b"1614556801", b"3", b"1.2103", b"1.2104", b"200", b"300",
+            b"1",
+        ))
+
+        ticks, done = await self._queue.get()
+
+        self.assertTrue(done)
+        self.assertEqual(ticks["time"].tolist(), [1614556800, 1614556801])
+        self.assertEqual(ticks["mask"].tolist(), [0, 3])
+        self.assertEqual(ticks["priceAsk"].tolist(), [1.2102, 1.2104])
+        self.assertEqual(ticks["sizeAsk"].tolist(), [0, 300])
+        self.assertEqual(ticks[-1].sizeBid, 200)
+
+    @utils.async_test
+    async def test_historical_ticks_last(self):
+        """Test decoding message `HISTORICAL_TICKS_LAST` in columnar mode."""
+        self._wrapper.set_columnar(req_id=self._req_id, columnar=True)
+        self._decoder.interpret((
+            str(message.IN.HISTORICAL_TICKS_LAST).encode(),
+            str(self._req_id).encode(), b"1",
+            b"1614556800", b"2", b"123.45", b"10", b"ISLAND", b"",
+            b"0",
+        ))
+
+        ticks, done = await self._queue.get()
+
+        self.assertFalse(done)
+        self.assertEqual(ticks["exchange"].tolist(), ["ISLAND"])
+        self.assertEqual(ticks["specialConditions"].tolist(), [""])
+
+    @utils.async_test
+    async def test_historical_ticks_objects(self):
+        """Test decoding message `HISTORICAL_TICKS` not in columnar mode.
+
+        * Ticks should be decoded into objects as `ibapi` does.
+        """
+        self._decoder.interpret((
+            str(message.IN.HISTORICAL_TICKS).encode(),
+            str(self._req_id).encode(), b"1",
+            b"1614556800", b"", b"1.5", b"10",
+            b"1",
+        ))
+
+        ticks, _ = await self._queue.get()
+
+        self.assertIsInstance(ticks[0], wrapper.HistoricalTick)
+        self.assertEqual(ticks[0].price, 1.5)
+
+class TestWrapperDecoders(unittest.TestCase):
+    """Unit tests for the decode functions built per message by
+    `ibapi.decoder.Decoder`, against the reflection based
+    `interpretWithSignature` they replace.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def test_ascii7(self):
+        """Test decoding string fields sent in ASCII7.
+
+        * Escaped & unescaped fields should be decoded as `unicode-escape`.
+        """
+        for value in (b"caf\\u00e9", b"caf\xe9", b"a\\\\b", b"plain"):
+            self._assert_same(
+                version=server_versions.MIN_SERVER_VER_ENCODE_MSG_ASCII7,
+                fields=self._tick_string(value)
+            )
+
+        calls = self._decode(
+            version=server_versions.MIN_SERVER_VER_ENCODE_MSG_ASCII7,
+            fields=self._tick_string(b"caf\\u00e9"))
+        self.assertEqual(calls, [("tickString", (1, 45, "café"))])
+
+    def test_utf8(self):
+        """Test decoding string fields sent in UTF-8.
+
+        * Fields not in valid UTF-8 should fall back to `latin-1`.
+        """
+        for value in ("café".encode(), b"caf\xff", b"a\\u00e9"):
+            self._assert_same(
+                version=server_versions.MIN_SERVER_VER_ENCODE_MSG_ASCII7 - 1,
+                fields=self._tick_string(value)
+            )
+
+    def test_wrong_field_count(self):
+        """Test decoding message with unexpected number of fields.
+
+        * Message should be discarded without calling the wrapper.
+        """
+        fields = self._tick_string(b"value")
+        for wrong in (fields[:-1], fields + (b"extra",)):
+            self._assert_same(version=server_versions.MAX_CLIENT_VER,
+                              fields=wrong)
+            self.assertEqual(
+                self._decode(version=server_versions.MAX_CLIENT_VER,
+                             fields=wrong), [])
+
+    def test_server_version_change(self):
+        """Test changing the server version after the decoder is built.
+
+        * Decode functions should be rebuilt for the new version.
+        """
+        recorder = _RecordingWrapper()
+        ib_decoder = decoder.Decoder(
+            recorder, server_versions.MIN_SERVER_VER_ENCODE_MSG_ASCII7 - 1)
+        ib_decoder.interpret(self._tick_string(b"caf\\u00e9"))
+
+        ib_decoder.serverVersion = (
+            server_versions.MIN_SERVER_VER_ENCODE_MSG_ASCII7)
+        ib_decoder.interpret(self._tick_string(b"caf\\u00e9"))
+
+        self.assertEqual([args[-1] for _, args in recorder.calls],
+                         ["caf\\u00e9", "café"])
+
+    def test_patched_wrapper_method(self):
+        """Test patching a wrapper method after the decoder is built.
+
+        * Patched method should be called.
+        """
+        recorder = _RecordingWrapper()
+        ib_decoder = decoder.Decoder(recorder,
+                                     server_versions.MAX_CLIENT_VER)
+        patched = []
+        recorder.tickString = lambda *args: patched.append(args)
+
+        ib_decoder.interpret(self._tick_string(b"value"))
+
+        self.assertEqual(patched, [(1, 45, "value")])
+        self.assertEqual(recorder.calls, [])
+
+    #region - Private functions
+    @staticmethod
+    def _tick_string(value: bytes) -> tuple:
+        return (str(message.IN.TICK_STRING).encode(), b"6", b"1", b"45",
+                value)
+
+    @staticmethod
+    def _decode(version: int, fields: tuple, legacy: bool=False) -> list:
+        """Decodes the message & returns the wrapper methods called."""
+        recorder = _RecordingWrapper()
+        ib_decoder = decoder.Decoder(recorder, version)
+        if legacy:
+            ib_decoder.interpretWithSignature(
+                fields, ib_decoder.msgId2handleInfo[int(fields[0])])
+        else:
+            ib_decoder.interpret(fields)
+
+        return recorder.calls
+
+    def _assert_same(self, version: int, fields: tuple):
+        self.assertEqual(
+            self._decode(version=version, fields=fields),
+            self._decode(version=version, fields=fields, legacy=True)
+        )
+    #endregion - Private functions
+
+class _RecordingWrapper(wrapper.EWrapper):
+    """Wrapper records the methods called with their arguments."""
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def tickString(self, reqId, tickType, value):
+        self.calls.append(("tickString", (reqId, tickType, value)))
@@ -0,0 +1,216 @@
+"""Unit tests for module `ibpy_native._internal._live_ticks_hub`."""
+# pylint: disable=protected-access
+import asyncio
+import threading
+import unittest
+
+from ibpy_native import error
+from ibpy_native import manager
+from ibpy_native._internal import _client
+from ibpy_native._internal import _live_ticks_hub
+from ibpy_native._internal import _wrapper
+from ibpy_native.utils import datatype
+from ibpy_native.utils import finishable_queue as fq
+
+from tests.toolkit import sample_contracts
+from tests.toolkit import utils
+
+class TestLiveTicksHub(unittest.TestCase):
+    """Unit tests for class `LiveTicksHub`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._wrapper = _wrapper.IBWrapper(
+            accounts_manager=utils.MockAccountsManagementDelegate(),
+            orders_manager=manager.OrdersManager()
+        )
+        self._client = _client.IBClient(self._wrapper)
+        self._hub = _live_ticks_hub.LiveTicksHub(client=self._client,
+                                                 wrapper=self._wrapper)
+        self._reqs = utils.RequestRecorder(client=self._client,
+                                           req="reqTickByTickData",
+                                           cancel="cancelTickByTickData")
+
+    @utils.async_test
+    async def test_fan_out(self):
+        """Test delivering the ticks of a subscription to all consumers.
+
+        * Consumers of the same contract & tick type should share a single
+          subscription.
+        """
+        ids = [self._hub.subscribe(contract=sample_contracts.gbp_usd_fx(),
+                                   tick_type=datatype.LiveTicks.MIDPOINT)
+               for _ in range(2)]
+        ids.append(self._hub.subscribe(contract=sample_contracts.gbp_usd_fx(),
+                                       tick_type=datatype.LiveTicks.BID_ASK))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(len(self._reqs.requested), 2)
+        self.assertEqual(self._hub.subscriptions, 2)
+
+        req_id = self._reqs.requested[0]
+        for time in range(1614556800, 1614556803):
+            self._wrapper.tickByTickMidPoint(req_id, time, 1.21)
+        await asyncio.sleep(0.01)
+
+        for stream_id in ids[:2]:
+            batches = self._hub.get_queue(stream_id).stream_batches(
+                max_batch=10)
+            batch = await batches.__anext__()
+            await batches.aclose()
+            self.assertEqual([tick.time for tick in batch],
+                             list(range(1614556800, 1614556803)))
+
+        for stream_id in ids:
+            self._hub.unsubscribe(stream_id)
+        await asyncio.sleep(0.01)
+
+    @utils.async_test
+    async def test_unsubscribe(self):
+        """Test removing the consumers from a subscription.
+
+        * Subscription should be cancelled once the last consumer leaves.
+        """
+        ids = [self._hub.subscribe(contract=sample_contracts.gbp_usd_fx(),
+                                   tick_type=datatype.LiveTicks.MIDPOINT)
+               for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        f_queue = self._hub.get_queue(ids[0])
+        self._hub.unsubscribe(ids[0])
+        await f_queue.get()
+        self.assertIs(f_queue.status, fq.Status.FINISHED)
+        self.assertEqual(self._reqs.cancelled, [])
+
+        self._hub.unsubscribe(ids[1])
+        await asyncio.sleep(0.01)
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested)
+        self.assertEqual(self._hub.subscriptions, 0)
+
+        with self.assertRaises(error.IBError):
+            self._hub.unsubscribe(ids[1])
+
+    @utils.async_test
+    async def test_err(self):
+        """Test terminating the subscription by error.
+
+        * Error should be delivered to all consumers.
+        """
+        ids = [self._hub.subscribe(contract=sample_contracts.gbp_usd_fx(),
+                                   tick_type=datatype.LiveTicks.MIDPOINT)
+               for _ in range(2)]
+        await asyncio.sleep(0.01)
+        queues = [self._hub.get_queue(stream_id) for stream_id in ids]
+
+        self._wrapper.error(self._reqs.requested[0], 10190,
+                            "Max number of tick-by-tick requests has been "
+                            "reached.")
+        await asyncio.sleep(0.01)
+
+        for f_queue in queues:
+            result = await f_queue.get()
+            self.assertIsInstance(result[-1], error.IBError)
+        self.assertFalse(self._hub.has_stream(ids[0]))
+        self.assertEqual(self._hub.subscriptions, 0)
+
+    @utils.async_test
+    async def test_unsubscribe_immediately(self):
+        """Test removing the only consumer right after subscribing.
+
+        * Subscription should be requested & cancelled, with its' request ID
+          released.
+        """
+        stream_id = self._hub.subscribe(contract=sample_contracts.gbp_usd_fx(),
+                                        tick_type=datatype.LiveTicks.MIDPOINT)
+        f_queue = self._hub.get_queue(stream_id)
+        self._hub.unsubscribe(stream_id)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(await f_queue.get(), [])
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested)
+        self.assertEqual(self._hub.subscriptions, 0)
+        self.assertEqual(self._wrapper.allocate_req_id(),
+                         self._reqs.requested[0])
+
+    @utils.async_test
+    async def test_bound_block(self):
+        """Test bounding the ticks pending for a consumer.
+
+        * Thread receiving the ticks should be held up until the consumer
+          catches up, without any tick dropped.
+        """
+        stream_id = self._hub.subscribe(
+            contract=sample_contracts.gbp_usd_fx(),
+            tick_type=datatype.LiveTicks.MIDPOINT, max_pending=2,
+            overflow=datatype.OverflowPolicy.BLOCK
+        )
+        f_queue = self._hub.get_queue(stream_id)
+        times = list(range(1614556800, 1614556810))
+        req_id = self._reqs.requested[0]
+        thread = threading.Thread(target=lambda: [
+            self._wrapper.tickByTickMidPoint(req_id, time, 1.21)
+            for time in times
+        ])
+        thread.start()
+        await asyncio.sleep(0.05)
+
+        self.assertTrue(thread.is_alive())
+
+        received = []
+        batches = f_queue.stream_batches(max_batch=100)
+        while len(received) < len(times):
+            batch = await batches.__anext__()
+            self.assertLessEqual(len(batch), 2)
+            received.extend(batch)
+        await batches.aclose()
+        thread.join()
+
+        self.assertEqual([tick.time for tick in received], times)
+        self.assertEqual(f_queue.dropped, 0)
+        self._hub.unsubscribe(stream_id)
+
+    @utils.async_test
+    async def test_bound_block_unsubscribe(self):
+        """Test removing a consumer with the thread receiving the ticks
+        blocked on its' bound.
+
+        * Thread should be released.
+        """
+        stream_id = self._hub.subscribe(
+            contract=sample_contracts.gbp_usd_fx(),
+            tick_type=datatype.LiveTicks.MIDPOINT, max_pending=1,
+            overflow=datatype.OverflowPolicy.BLOCK
+        )
+        req_id = self._reqs.requested[0]
+        thread = threading.Thread(target=lambda: [
+            self._wrapper.tickByTickMidPoint(req_id, time, 1.21)
+            for time in range(1614556800, 1614556803)
+        ], daemon=True)
+        thread.start()
+        thread.join(timeout=0.05)
+        self.assertTrue(thread.is_alive())
+
+        self._hub.unsubscribe(stream_id)
+        thread.join(timeout=1)
+
+        self.assertFalse(thread.is_alive())
+
+    @utils.async_test
+    async def test_cancelled(self):
+        """Test cancelling the task awaiting the subscription.
+
+        * Consumers should receive the `FINISHED` signal.
+        """
+        stream_id = self._hub.subscribe(contract=sample_contracts.gbp_usd_fx(),
+                                        tick_type=datatype.LiveTicks.MIDPOINT)
+        f_queue = self._hub.get_queue(stream_id)
+        await asyncio.sleep(0.01)
+
+        self._hub._streams[stream_id].task.cancel()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(await f_queue.get(), [])
+        self.assertIs(f_queue.status, fq.Status.FINISHED)
+        self.assertFalse(self._hub.has_stream(stream_id))
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested)
@@ -0,0 +1,112 @@
+"""Unit tests for module `ibpy_native._internal._pacing`."""
+import asyncio
+import time
+import unittest
+
+from ibpy_native import error
+from ibpy_native._internal import _pacing
+
+from tests.toolkit import sample_contracts
+from tests.toolkit import utils
+
+class TestPacingScheduler(unittest.TestCase):
+    """Unit tests for class `PacingScheduler`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._key = _pacing.pacing_key(contract=sample_contracts.us_stock(),
+                                       what_to_show="TRADES")
+
+    @utils.async_test
+    async def test_identical(self):
+        """Test spacing out the identical requests."""
+        scheduler = _pacing.PacingScheduler(identical_window=0.1)
+        await scheduler.acquire(contract_key=self._key,
+                                request_key=self._key + ("a",))
+        scheduler.release()
+
+        start = time.monotonic()
+        await scheduler.acquire(contract_key=self._key,
+                                request_key=self._key + ("b",))
+        self.assertLess(time.monotonic() - start, 0.05)
+        await scheduler.acquire(contract_key=self._key,
+                                request_key=self._key + ("a",))
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    @utils.async_test
+    async def test_per_contract(self):
+        """Test the budget of requests of the same contract.
+
+        * Requests of other contracts should not be held.
+        """
+        scheduler = _pacing.PacingScheduler(max_per_contract=2,
+                                            contract_window=0.1)
+        other_key = _pacing.pacing_key(contract=sample_contracts.gbp_usd_fx(),
+                                       what_to_show="TRADES")
+        start = time.monotonic()
+        for idx in range(2):
+            await scheduler.acquire(contract_key=self._key,
+                                    request_key=self._key + (idx,))
+
+        await scheduler.acquire(contract_key=other_key, request_key=other_key)
+        self.assertLess(time.monotonic() - start, 0.05)
+        await scheduler.acquire(contract_key=self._key,
+                                request_key=self._key + (2,))
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    @utils.async_test
+    async def test_window(self):
+        """Test the budget of requests within the window."""
+        scheduler = _pacing.PacingScheduler(max_requests=3, window=0.1)
+        start = time.monotonic()
+        for idx in range(3):
+            await scheduler.acquire(contract_key=idx, request_key=idx)
+
+        self.assertEqual(scheduler.metrics.requests, 3)
+        await scheduler.acquire(contract_key=3, request_key=3)
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    @utils.async_test
+    async def test_max_active(self):
+        """Test the limit of requests awaiting response at once.
+
+        * Queued request should be sent once a request is released.
+        """
+        scheduler = _pacing.PacingScheduler(max_active=1)
+        await scheduler.acquire(contract_key=0, request_key=0)
+        task = asyncio.ensure_future(
+            scheduler.acquire(contract_key=1, request_key=1))
+        await asyncio.sleep(0.01)
+
+        self.assertFalse(task.done())
+        self.assertEqual(scheduler.metrics.waiting, 1)
+        scheduler.release()
+        await asyncio.wait_for(task, timeout=0.1)
+        self.assertEqual(scheduler.metrics.active, 1)
+
+    @utils.async_test
+    async def test_violation(self):
+        """Test holding the requests after a pacing violation.
+
+        * Errors other than pacing violation should be ignored.
+        """
+        scheduler = _pacing.PacingScheduler(cooldown=0.1)
+        scheduler.on_error(error.IBError(
+            rid=1, err_code=error.IBErrorCode.HISTORICAL_DATA_SERVICE,
+            err_str="Historical Market Data Service error message:HMDS query "
+                    "returned no data"
+        ))
+        self.assertEqual(scheduler.metrics.violations, 0)
+
+        scheduler.on_error(error.IBError(
+            rid=1, err_code=error.IBErrorCode.HISTORICAL_DATA_SERVICE,
+            err_str="Historical Market Data Service error message:Historical "
+                    "data request pacing violation"
+        ))
+        self.assertEqual(scheduler.metrics.violations, 1)
+        self.assertGreater(scheduler.metrics.cooldown, 0)
+
+        start = time.monotonic()
+        await scheduler.acquire(contract_key=0, request_key=0)
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
@@ -0,0 +1,89 @@
+"""Unit tests for module `ibpy_native._internal._req_id`."""
+import threading
+import unittest
+
+from ibpy_native._internal import _req_id
+
+class TestReqIdAllocator(unittest.TestCase):
+    """Unit tests for class `ReqIdAllocator`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._allocator = _req_id.ReqIdAllocator()
+
+    def test_allocate(self):
+        """Test function `allocate`.
+
+        * IDs should be issued incrementally from 1.
+        * Released IDs should be reused in the order they're released.
+        """
+        self.assertEqual([self._allocator.allocate() for _ in range(3)],
+                         [1, 2, 3])
+
+        self._allocator.release(3)
+        self._allocator.release(1)
+        self.assertEqual([self._allocator.allocate() for _ in range(3)],
+                         [3, 1, 4])
+
+    def test_allocate_concurrent(self):
+        """Test function `allocate` being called from multiple threads.
+
+        * No ID should be issued twice.
+        """
+        results = []
+
+        def allocate():
+            ids = []
+            for _ in range(1000):
+                ids.append(self._allocator.allocate())
+            results.extend(ids)
+
+        threads = [threading.Thread(target=allocate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(results)), 8000)
+        self.assertEqual(self._allocator.in_use, 8000)
+
+    def test_reserve(self):
+        """Test function `reserve`.
+
+        * IDs reserved directly should never be issued by `allocate`.
+        """
+        self._allocator.reserve(2)
+        self.assertEqual(self._allocator.allocate(), 3)
+
+        self._allocator.release(2)
+        self._allocator.reserve(2) # Claimed again before reuse
+        self.assertEqual(self._allocator.allocate(), 4)
+
+    def test_release(self):
+        """Test function `release`.
+
+        * Releasing an ID twice should not make it be issued twice.
+        """
+        req_id = self._allocator.allocate()
+        self._allocator.release(req_id)
+        self._allocator.release(req_id)
+
+        self.assertEqual(self._allocator.allocate(), req_id)
+        self.assertNotEqual(self._allocator.allocate(), req_id)
+
+    def test_release_retired(self):
+        """Test function `release` with the ID not reusable.
+
+        * Retired ID should not be issued again until reset.
+        """
+        req_id = self._allocator.allocate()
+        self._allocator.release(req_id, reusable=False)
+        self._allocator.release(req_id)
+
+        self.assertNotEqual(self._allocator.allocate(), req_id)
+        self.assertEqual(self._allocator.retired, 1)
+
+        self._allocator.reset()
+        self.assertEqual(self._allocator.retired, 0)
+        self.assertEqual(self._allocator.allocate(), req_id)
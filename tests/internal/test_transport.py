@@ -0,0 +1,78 @@
+"""Unit tests for module `ibpy_native._internal._transport`."""
+import struct
+import unittest
+
+from ibapi import comm
+from ibapi import common
+
+from ibpy_native._internal import _transport
+
+class TestIBProtocol(unittest.TestCase):
+    """Unit tests for class `IBProtocol`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._messages = []
+        self._protocol = _transport.IBProtocol(
+            on_message=lambda msg: self._messages.append(bytes(msg)),
+            on_lost=lambda: None
+        )
+
+    def test_framing(self):
+        """Test the framing of messages received.
+
+        * Messages split across reads or received together in one read should
+        be handed out one by one.
+        """
+        data = b"".join(comm.make_msg(f"{i}\0") for i in range(1000))
+
+        for chunk in (data[:3], data[3:2500], data[2500:]):
+            self._receive(chunk)
+
+        self.assertEqual(self._messages,
+                         [f"{i}\0".encode() for i in range(1000)])
+
+    def test_framing_large(self):
+        """Test the framing of message larger than the buffer.
+
+        * Message views handed out earlier should stay intact after the buffer
+        is grown.
+        """
+        views = []
+        self._protocol = _transport.IBProtocol(on_message=views.append,
+                                               on_lost=lambda: None)
+        large = "x" * 300000
+
+        self._receive(comm.make_msg("first\0") + comm.make_msg(large))
+
+        self.assertEqual([bytes(view) for view in views],
+                         [b"first\0", large.encode()])
+
+    def test_framing_oversized(self):
+        """Test the length prefix beyond `MAX_MSG_LEN`.
+
+        * Connection should be aborted without allocating for the message.
+        """
+        aborted = []
+        self._protocol.connection_made(
+            type("_Transport", (), {"abort": lambda _: aborted.append(1)})())
+
+        self._receive(comm.make_msg("ok\0")
+                      + struct.pack("!I", common.MAX_MSG_LEN + 1) + b"x")
+
+        self.assertEqual(self._messages, [b"ok\0"])
+        self.assertEqual(aborted, [1])
+        self.assertLess(len(self._protocol.get_buffer(-1)),
+                        common.MAX_MSG_LEN)
+
+    #region - Private functions
+    def _receive(self, data: bytes):
+        """Mimics the event loop receiving data into the protocol's buffer."""
+        while data:
+            buf = self._protocol.get_buffer(-1)
+            size = min(len(buf), len(data))
+            buf[:size] = data[:size]
+            self._protocol.buffer_updated(size)
+            data = data[size:]
+    #endregion - Private functions
@@ -5,6 +5,7 @@ import datetime
 import threading
 import unittest
 
+from ibapi import common
 from ibapi import contract
 from ibapi import wrapper
 
@@ -109,28 +110,28 @@ class TestReqQueue(unittest.TestCase):
             orders_manager=manager.OrdersManager()
         )
 
-    def test_next_req_id_0(self):
-        """Test property `next_req_id` for retrieval of next usable
+    def test_allocate_req_id_0(self):
+        """Test function `allocate_req_id` for reservation of next usable
         request ID.
 
         * No ID has been occupied yet.
         """
         # 1st available request ID should always be 1
-        self.assertEqual(self._wrapper.next_req_id, 1)
+        self.assertEqual(self._wrapper.allocate_req_id(), 1)
 
-    def test_next_req_id_1(self):
-        """Test property `next_req_id` for retrieval of next usable
+    def test_allocate_req_id_1(self):
+        """Test function `allocate_req_id` for reservation of next usable
         request ID.
 
         * Request ID 1 has already been occupied.
         """
         self._wrapper.get_request_queue(req_id=1) # Occupy request ID 1
         # Next available request ID should be 2
-        self.assertEqual(self._wrapper.next_req_id, 2)
+        self.assertEqual(self._wrapper.allocate_req_id(), 2)
 
     @utils.async_test
-    async def test_next_req_id_2(self):
-        """Test property `next_req_id` for retrieval of next usable
+    async def test_allocate_req_id_2(self):
+        """Test function `allocate_req_id` for reservation of next usable
         request ID.
 
         * Request ID 1 was occupied but released for reuse.
@@ -141,7 +142,40 @@ class TestReqQueue(unittest.TestCase):
         queue.put(element=fq.Status.FINISHED)
         await queue.get()
         # Next available request ID should reuse 1
-        self.assertEqual(self._wrapper.next_req_id, 1)
+        self.assertEqual(self._wrapper.allocate_req_id(), 1)
+
+    def test_allocate_req_id_3(self):
+        """Test function `allocate_req_id` for reservation of next usable
+        request ID.
+
+        * ID returned should be reserved even if no queue is associated yet.
+        """
+        self.assertNotEqual(self._wrapper.allocate_req_id(),
+                            self._wrapper.allocate_req_id())
+
+    def test_release_req_id(self):
+        """Test function `release_req_id`.
+
+        * IDs should be released whether a queue is associated or not.
+        * Queue associated should be marked as finished.
+        * IDs not reusable should not be issued again.
+        """
+        req_id = self._wrapper.allocate_req_id()
+        self._wrapper.release_req_id(req_id)
+        self.assertEqual(self._wrapper.allocate_req_id(), req_id)
+
+        queue = self._wrapper.get_request_queue(req_id=req_id)
+        queue.put(element=error.IBError(rid=req_id, err_code=200,
+                                        err_str="No security definition"))
+        self._wrapper.release_req_id(req_id)
+        self.assertTrue(queue.finished)
+        self.assertEqual(self._wrapper.allocate_req_id(), req_id)
+
+        # Request may still be responded
+        queue = self._wrapper.get_request_queue(req_id=req_id)
+        self._wrapper.release_req_id(req_id, reusable=False)
+        self.assertTrue(queue.finished)
+        self.assertNotEqual(self._wrapper.allocate_req_id(), req_id)
 
     def test_get_request_queue_0(self):
         """Test getter `get_request_queue`."""
@@ -346,7 +380,7 @@ class TestContract(unittest.TestCase):
 
         * `contractDetailsEnd` will be invoked after `contractDetails`.
         """
-        req_id = self._wrapper.next_req_id
+        req_id = self._wrapper.allocate_req_id()
         queue = self._wrapper.get_request_queue(req_id)
 
         self._client.reqContractDetails(reqId=req_id,
@@ -361,7 +395,7 @@ class TestContract(unittest.TestCase):
     @utils.async_test
     async def test_contract_details_end(self):
         """Test overridden function `contractDetailsEnd`."""
-        req_id = self._wrapper.next_req_id
+        req_id = self._wrapper.allocate_req_id()
         queue = self._wrapper.get_request_queue(req_id)
 
         self._wrapper.contractDetailsEnd(reqId=req_id)
@@ -392,7 +426,7 @@ class TestHistoricalData(unittest.TestCase):
         thread.start()
 
     def setUp(self):
-        self._req_id = self._wrapper.next_req_id
+        self._req_id = self._wrapper.allocate_req_id()
         self._queue = self._wrapper.get_request_queue(req_id=self._req_id)
 
     @utils.async_test
@@ -472,6 +506,68 @@ class TestHistoricalData(unittest.TestCase):
     def tearDownClass(cls):
         cls._client.disconnect()
 
+class TestMarketData(unittest.TestCase):
+    """Unit tests for market data related overridden functions in
+    `IBWrapper`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._wrapper = _wrapper.IBWrapper(
+            accounts_manager=utils.MockAccountsManagementDelegate(),
+            orders_manager=manager.OrdersManager()
+        )
+        self._table = models.QuoteTable()
+        self._row = self._table.add_row()
+        self._wrapper.set_quote_row(req_id=1, table=self._table,
+                                    row=self._row)
+
+    def test_ticks(self):
+        """Test overridden functions `tickPrice`, `tickSize`, `tickString`,
+        `tickGeneric` & `marketDataType`.
+        """
+        self._wrapper.tickPrice(1, 1, 1.2, common.TickAttrib())
+        self._wrapper.tickSize(1, 0, 100)
+        self._wrapper.tickString(1, 45, "1614556800")
+        self._wrapper.tickGeneric(1, 49, 0)
+        self._wrapper.marketDataType(1, 3)
+        # Ticks of other requests should be ignored
+        self._wrapper.tickPrice(2, 1, 1.3, common.TickAttrib())
+
+        quote = self._table.get_row(self._row)
+        self.assertEqual(quote["bid"], 1.2)
+        self.assertEqual(quote["bid_size"], 100)
+        self.assertEqual(quote["last_time"], 1614556800)
+        self.assertEqual(quote["halted"], 0)
+        self.assertEqual(quote["data_type"], 3)
+
+    def test_error(self):
+        """Test overridden function `error` for market data requests.
+
+        * Error should be recorded in the quote table.
+        """
+        self._wrapper.error(1, 354, "Requested market data is not subscribed.")
+        self.assertEqual(self._table.get_error(self._row).err_code, 354)
+
+    def test_mkt_depth(self):
+        """Test overridden functions `updateMktDepth` & `updateMktDepthL2`.
+
+        * Book should be cleared once the depth is reset by IB.
+        """
+        book = models.OrderBook(num_rows=5)
+        self._wrapper.set_order_book(req_id=2, book=book)
+        self._wrapper.updateMktDepth(2, 0, 0, 1, 1.2, 100)
+        self._wrapper.updateMktDepthL2(2, 0, "MM", 0, 0, 1.21, 200, False)
+
+        self.assertEqual(book.best_bid(), (1.2, 100))
+        self.assertEqual(book.asks()["market_maker"].tolist(), ["MM"])
+
+        self._wrapper.error(2, 317, "Market depth data has been RESET. "
+                                    "Please empty deep book contents before "
+                                    "applying any new entries.")
+        self.assertIsNone(book.best_bid())
+        self.assertIsNone(book.get_error())
+
 class TestTickByTickData(unittest.TestCase):
     """Unit tests for Tick-by-Tick data related functions in `IBWrapper`.
 
@@ -495,7 +591,7 @@ class TestTickByTickData(unittest.TestCase):
 
     def setUp(self):
         self._received = False # Indicates if tick received
-        self._req_id = self._wrapper.next_req_id
+        self._req_id = self._wrapper.allocate_req_id()
         self._queue = self._wrapper.get_request_queue(req_id=self._req_id)
 
     @utils.async_test
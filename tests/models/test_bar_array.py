@@ -0,0 +1,79 @@
+"""Unit tests for module `ibpy_native.models.bar_array`."""
+import datetime
+import unittest
+
+import pytz
+
+from ibapi import common
+
+from ibpy_native.models import bar_array
+
+_TZ = pytz.timezone("America/New_York")
+
+def _bars(dates: list) -> list:
+    bars = []
+    for idx, date in enumerate(dates):
+        bar = common.BarData()
+        bar.date = date
+        bar.open = 1.2 + idx
+        bar.high = 1.3 + idx
+        bar.low = 1.1 + idx
+        bar.close = 1.25 + idx
+        bar.volume = 100 * idx
+        bar.average = 1.22 + idx
+        bar.barCount = idx
+        bars.append(bar)
+
+    return bars
+
+class TestBarArray(unittest.TestCase):
+    """Unit tests for class `BarArray`."""
+    def setUp(self):
+        self._bars = bar_array.BarArray.from_objects(
+            bars=_bars(["1614556800", "1614556860", "1614556920"]), tz=_TZ)
+
+    def test_from_objects(self):
+        """Test creating the `BarArray` from `BarData` objects."""
+        self.assertEqual(len(self._bars), 3)
+        self.assertEqual(self._bars["time"].tolist(),
+                         [1614556800, 1614556860, 1614556920])
+        self.assertEqual(self._bars["count"].tolist(), [0, 1, 2])
+        self.assertAlmostEqual(self._bars["wap"][1], 2.22)
+
+    def test_from_objects_daily(self):
+        """Test creating the `BarArray` from daily bars with dates in
+        `YYYYMMDD`.
+        """
+        bars = bar_array.BarArray.from_objects(
+            bars=_bars(["20210301", "20210302"]), tz=_TZ)
+
+        self.assertEqual(
+            bars["time"][1],
+            _TZ.localize(datetime.datetime(2021, 3, 2)).timestamp())
+
+    def test_get_item(self):
+        """Test creating the `BarData` object by index."""
+        bar = self._bars[-1]
+
+        self.assertIsInstance(bar, common.BarData)
+        self.assertEqual(bar.date, "1614556920")
+        self.assertEqual(bar.close, 3.25)
+        self.assertEqual(bar.volume, 200)
+
+    def test_slice(self):
+        """Test slicing the bars."""
+        bars = self._bars[1:]
+
+        self.assertIsInstance(bars, bar_array.BarArray)
+        self.assertEqual(bars["time"].tolist(), [1614556860, 1614556920])
+
+    def test_concatenate(self):
+        """Test joining the bars of multiple arrays.
+
+        * Empty arrays should be skipped.
+        """
+        bars = bar_array.BarArray.concatenate(
+            [self._bars[:1], bar_array.BarArray(), self._bars[1:]])
+
+        self.assertEqual(bars["time"].tolist(), self._bars["time"].tolist())
+        self.assertEqual(len(bar_array.BarArray.concatenate([])), 0)
@@ -0,0 +1,43 @@
+"""Unit tests for module `ibpy_native.models.bar_buffer`."""
+import unittest
+
+from ibpy_native.models import bar_buffer
+
+def _append(buffer: bar_buffer.BarBuffer, times: range):
+    for time in times:
+        buffer.append(time=time, open_=1.2, high=1.3, low=1.1, close=1.25,
+                      volume=100, wap=1.22, count=time % 10)
+
+class TestBarBuffer(unittest.TestCase):
+    """Unit tests for class `BarBuffer`."""
+    def test_append(self):
+        """Test appending the bars.
+
+        * Buffer should grow once full, with the bars appended kept.
+        """
+        buffer = bar_buffer.BarBuffer(capacity=2)
+        _append(buffer, range(1614556800, 1614556825, 5))
+
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer.capacity, 8)
+        self.assertEqual(buffer.to_array()["time"].tolist(),
+                         list(range(1614556800, 1614556825, 5)))
+        self.assertEqual(buffer.to_array()[-1].barCount, 0)
+
+    def test_to_array(self):
+        """Test function `to_array`.
+
+        * Bars should be viewed without copying.
+        * Views taken before growing should remain valid.
+        """
+        buffer = bar_buffer.BarBuffer(capacity=4)
+        _append(buffer, range(1614556800, 1614556820, 5))
+        bars = buffer.to_array(start=1, end=3)
+
+        self.assertEqual(bars["time"].tolist(), [1614556805, 1614556810])
+        self.assertIs(bars["close"].base, buffer.to_array()["close"].base)
+
+        _append(buffer, range(1614556820, 1614556830, 5))
+        self.assertEqual(bars["time"].tolist(), [1614556805, 1614556810])
+        self.assertEqual(len(buffer.to_array(start=4)), 2)
+        self.assertEqual(len(buffer.to_array(end=100)), 6)
@@ -0,0 +1,87 @@
+"""Unit tests for module `ibpy_native.models.order_book`."""
+import unittest
+
+from ibpy_native.models import order_book
+
+# Operations & sides defined by IB
+_INSERT, _UPDATE, _DELETE = 0, 1, 2
+_ASK, _BID = 0, 1
+
+class TestOrderBook(unittest.TestCase):
+    """Unit tests for class `OrderBook`."""
+    def setUp(self):
+        self._book = order_book.OrderBook(num_rows=3)
+
+    def test_insert(self):
+        """Test inserting the levels.
+
+        * Levels below should be shifted down.
+        * Last level should be dropped once the side is full.
+        """
+        self._book.apply(0, _INSERT, _BID, 1.20, 100)
+        self._book.apply(0, _INSERT, _BID, 1.22, 200)
+        self._book.apply(1, _INSERT, _BID, 1.21, 300)
+        self.assertEqual(self._book.bids()["price"].tolist(),
+                         [1.22, 1.21, 1.20])
+
+        self._book.apply(0, _INSERT, _BID, 1.23, 400)
+        self.assertEqual(self._book.bids()["price"].tolist(),
+                         [1.23, 1.22, 1.21])
+        self.assertEqual(self._book.best_bid(), (1.23, 400))
+        self.assertIsNone(self._book.best_ask())
+        self.assertEqual(self._book.version, 4)
+
+    def test_update_delete(self):
+        """Test updating & deleting the levels."""
+        for idx, price in enumerate((1.21, 1.22, 1.23)):
+            self._book.apply(idx, _INSERT, _ASK, price, 100)
+
+        self._book.apply(1, _UPDATE, _ASK, 1.22, 500)
+        self.assertEqual(self._book.asks()["size"].tolist(), [100, 500, 100])
+
+        self._book.apply(0, _DELETE, _ASK, 1.21, 100)
+        self.assertEqual(self._book.asks()["price"].tolist(), [1.22, 1.23])
+        self.assertEqual(self._book.best_ask(), (1.22, 500))
+
+        # Deleting a level not exists should be ignored
+        self._book.apply(5, _DELETE, _ASK, 0, 0)
+        self.assertEqual(len(self._book.asks()["price"]), 2)
+
+        # Updating a level not inserted yet should be ignored
+        self._book.apply(2, _UPDATE, _ASK, 1.25, 100)
+        self.assertEqual(self._book.asks()["price"].tolist(), [1.22, 1.23])
+
+    def test_views(self):
+        """Test the levels returned are read-only views.
+
+        * Views should reflect the updates applied later.
+        """
+        self._book.apply(0, _INSERT, _BID, 1.20, 100)
+        bids = self._book.bids()
+        with self.assertRaises(ValueError):
+            bids["price"][0] = 1.0
+
+        self._book.apply(0, _UPDATE, _BID, 1.20, 300)
+        self.assertEqual(bids["size"][0], 300)
+
+        snapshot = self._book.snapshot()
+        self._book.apply(0, _UPDATE, _BID, 1.20, 400)
+        self.assertEqual(snapshot["bids"]["size"][0], 300)
+
+    def test_aggregate(self):
+        """Test function `aggregate` for L2 depth."""
+        book = order_book.OrderBook(num_rows=5)
+        for idx, (price, size, market_maker) in enumerate((
+                (1.22, 100, "A"), (1.22, 200, "B"), (1.21, 300, "A"),
+                (1.22, 50, "C"), (1.20, 10, "B"))):
+            book.apply(idx, _INSERT, _BID, price, size, market_maker)
+
+        self.assertEqual(book.bids()["market_maker"].tolist(),
+                         ["A", "B", "A", "C", "B"])
+        result = book.aggregate("bids")
+        self.assertEqual(result["price"].tolist(), [1.22, 1.21, 1.20])
+        self.assertEqual(result["size"].tolist(), [350, 300, 10])
+        self.assertEqual(len(book.aggregate("asks")["price"]), 0)
+
+        with self.assertRaises(ValueError):
+            book.aggregate("bid")
@@ -0,0 +1,101 @@
+"""Unit tests for module `ibpy_native.models.quote_table`."""
+import math
+import unittest
+
+from ibapi import ticktype
+
+from ibpy_native import error
+from ibpy_native.models import quote_table
+
+class TestQuoteTable(unittest.TestCase):
+    """Unit tests for class `QuoteTable`."""
+    def setUp(self):
+        self._table = quote_table.QuoteTable(capacity=2)
+
+    def test_on_tick(self):
+        """Test writing the ticks into the rows.
+
+        * Delayed ticks should update the same fields.
+        * Tick types without a field should be ignored.
+        """
+        row = self._table.add_row()
+        self._table.on_tick(row, ticktype.TickTypeEnum.BID, 1.2)
+        self._table.on_tick(row, ticktype.TickTypeEnum.DELAYED_ASK, 1.21)
+        self._table.on_tick(row, ticktype.TickTypeEnum.BID_SIZE, 100)
+        self._table.on_tick(row, ticktype.TickTypeEnum.LAST_TIMESTAMP,
+                            "1614556800")
+        self._table.on_tick(row, ticktype.TickTypeEnum.RT_VOLUME, "1.2;1;")
+
+        quote = self._table.get_row(row)
+        self.assertEqual(quote["bid"], 1.2)
+        self.assertEqual(quote["ask"], 1.21)
+        self.assertEqual(quote["bid_size"], 100)
+        self.assertEqual(quote["last_time"], 1614556800)
+        self.assertTrue(math.isnan(quote["last"]))
+        self.assertEqual(quote["version"], 4)
+        self.assertEqual(self._table.version, 4)
+
+    def test_changed_since(self):
+        """Test function `changed_since`."""
+        rows = [self._table.add_row() for _ in range(3)]
+        for row in rows:
+            self._table.on_tick(row, ticktype.TickTypeEnum.LAST, 1.2)
+        version = self._table.version
+
+        self._table.on_tick(rows[1], ticktype.TickTypeEnum.LAST, 1.21)
+        self.assertEqual(self._table.changed_since(version).tolist(),
+                         [rows[1]])
+        self.assertEqual(self._table.changed_since(0).tolist(), rows)
+        self.assertEqual(
+            self._table.snapshot(self._table.changed_since(version))["last"]
+            .tolist(), [1.21])
+
+    def test_grow(self):
+        """Test growing the table once all rows are in use.
+
+        * Quotes of the existing rows should be kept.
+        """
+        rows = [self._table.add_row() for _ in range(2)]
+        self._table.on_tick(rows[0], ticktype.TickTypeEnum.BID, 1.2)
+        rows.append(self._table.add_row())
+
+        self.assertEqual(rows, [0, 1, 2])
+        self.assertEqual(len(self._table), 3)
+        self.assertEqual(self._table["bid"][0], 1.2)
+
+    def test_remove_row_version(self):
+        """Test polling the rows removed via `changed_since`.
+
+        * Removal should be seen, even the row is reused before the poll.
+        """
+        rows = [self._table.add_row() for _ in range(2)]
+        self._table.on_tick(rows[0], ticktype.TickTypeEnum.BID, 1.2)
+        version = self._table.version
+
+        self._table.remove_row(rows[0])
+        self.assertEqual(self._table.changed_since(version).tolist(),
+                         [rows[0]])
+        self.assertTrue(math.isnan(
+            self._table.snapshot([rows[0]])["bid"][0]))
+
+        self.assertEqual(self._table.add_row(), rows[0])
+        self.assertEqual(self._table.changed_since(version).tolist(),
+                         [rows[0]])
+
+    def test_remove_row(self):
+        """Test releasing the rows.
+
+        * Rows removed should be reused with the quotes cleared.
+        """
+        rows = [self._table.add_row() for _ in range(2)]
+        self._table.on_tick(rows[0], ticktype.TickTypeEnum.BID, 1.2)
+        self._table.on_error(rows[0], error.IBError(
+            rid=1, err_code=354, err_str="Requested market data is not "
+                                         "subscribed."))
+        self.assertEqual(self._table.get_error(rows[0]).err_code, 354)
+
+        self._table.remove_row(rows[0])
+        self.assertEqual(len(self._table), 1)
+        self.assertEqual(self._table.add_row(), rows[0])
+        self.assertTrue(math.isnan(self._table["bid"][rows[0]]))
+        self.assertIsNone(self._table.get_error(rows[0]))
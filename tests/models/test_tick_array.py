@@ -0,0 +1,107 @@
+"""Unit tests for module `ibpy_native.models.tick_array`."""
+import unittest
+
+import numpy as np
+
+from ibapi import wrapper
+
+from ibpy_native.models import tick_array
+
+def _bid_ask(start: int, num: int) -> tick_array.TickArray:
+    return tick_array.TickArray(columns={
+        "time": np.arange(start, start + num, dtype="i8"),
+        "mask": np.array([idx % 4 for idx in range(num)], dtype="u1"),
+        "priceBid": np.full(num, 1.2101),
+        "priceAsk": np.full(num, 1.2102),
+        "sizeBid": np.full(num, 100, dtype="i8"),
+        "sizeAsk": np.full(num, 200, dtype="i8"),
+    })
+
+class TestTickArray(unittest.TestCase):
+    """Unit tests for class `TickArray`."""
+    def setUp(self):
+        self._ticks = _bid_ask(start=1614556800, num=4)
+
+    def test_len_and_fields(self):
+        """Test `len` & field access of the columns."""
+        self.assertEqual(len(self._ticks), 4)
+        self.assertEqual(self._ticks.fields[:2], ["time", "mask"])
+        self.assertEqual(self._ticks["sizeAsk"].tolist(), [200] * 4)
+
+    def test_get_item(self):
+        """Test creating the tick object by index.
+
+        * Attribute bitmask should be set on the tick attributes.
+        """
+        tick = self._ticks[-1]
+
+        self.assertIsInstance(tick, wrapper.HistoricalTickBidAsk)
+        self.assertEqual(tick.time, 1614556803)
+        self.assertEqual(tick.priceAsk, 1.2102)
+        self.assertTrue(tick.tickAttribBidAsk.askPastHigh)
+        self.assertTrue(tick.tickAttribBidAsk.bidPastLow)
+
+        with self.assertRaises(IndexError):
+            _ = self._ticks[4]
+
+    def test_slice(self):
+        """Test slicing.
+
+        * Slices should be views of the same memory.
+        """
+        result = self._ticks[1:3]
+
+        self.assertIsInstance(result, tick_array.TickArray)
+        self.assertEqual(result["time"].tolist(), [1614556801, 1614556802])
+        self.assertTrue(np.shares_memory(result["time"], self._ticks["time"]))
+
+    def test_concatenate(self):
+        """Test joining pages of ticks."""
+        result = tick_array.TickArray.concatenate(
+            [self._ticks, _bid_ask(start=1614556804, num=2)])
+
+        self.assertEqual(len(result), 6)
+        self.assertEqual(result[-1].time, 1614556805)
+        self.assertEqual(len(tick_array.TickArray.concatenate([])), 0)
+
+    def test_from_objects(self):
+        """Test creating `TickArray` from tick objects.
+
+        * Should be convertible back to the same objects.
+        """
+        result = tick_array.TickArray.from_objects(list(self._ticks))
+
+        self.assertEqual(result.fields, self._ticks.fields)
+        for name in result.fields:
+            self.assertEqual(result[name].tolist(),
+                             self._ticks[name].tolist())
+        self.assertEqual(tick_array.TickArray.from_objects([]).fields, [])
+
+    def test_objects(self):
+        """Test the lazy view of tick objects."""
+        objects = self._ticks.objects
+
+        self.assertEqual(len(objects), 4)
+        self.assertEqual([tick.time for tick in objects[1:3]],
+                         [1614556801, 1614556802])
+        self.assertEqual(objects[0].sizeBid, 100)
+
+    def test_to_numpy(self):
+        """Test exporting the columns without copying."""
+        result = self._ticks.to_numpy()
+
+        self.assertIs(result["time"], self._ticks["time"])
+
+    def test_to_pandas(self):
+        """Test exporting the ticks as `DataFrame` without copying."""
+        try:
+            # pylint: disable=import-outside-toplevel, unused-import
+            import pandas
+        except ImportError:
+            self.skipTest("`pandas` is not installed.")
+
+        dataframe = self._ticks.to_pandas()
+
+        self.assertEqual(list(dataframe.columns), self._ticks.fields)
+        self.assertTrue(np.shares_memory(dataframe["priceBid"].to_numpy(),
+                                         self._ticks["priceBid"]))
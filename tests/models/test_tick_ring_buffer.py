@@ -0,0 +1,100 @@
+"""Unit tests for module `ibpy_native.models.tick_ring_buffer`."""
+import threading
+import unittest
+
+from ibapi import wrapper
+
+from ibpy_native.models import tick_ring_buffer
+
+def _tick(time: int) -> wrapper.HistoricalTickLast:
+    tick = wrapper.HistoricalTickLast()
+    tick.time = time
+    tick.price = time / 1000
+    tick.size = time % 100
+
+    return tick
+
+class TestTickRingBuffer(unittest.TestCase):
+    """Unit tests for class `TickRingBuffer`."""
+    def setUp(self):
+        self._buffer = tick_ring_buffer.TickRingBuffer(capacity=5)
+
+    def test_append(self):
+        """Test appending the ticks.
+
+        * Oldest ticks should be overwritten once the buffer is full.
+        """
+        for time in range(1614556800, 1614556803):
+            self._buffer.append(_tick(time))
+        self.assertEqual(len(self._buffer), 3)
+        self.assertEqual(self._buffer.last()["time"].tolist(),
+                         list(range(1614556800, 1614556803)))
+
+        for time in range(1614556803, 1614556808):
+            self._buffer.append(_tick(time))
+        self.assertEqual(len(self._buffer), 5)
+        self.assertEqual(self._buffer.total, 8)
+        ticks = self._buffer.last()
+        self.assertEqual(ticks["time"].tolist(),
+                         list(range(1614556803, 1614556808)))
+        self.assertEqual(ticks[-1].price, 1614556.807)
+
+    def test_last(self):
+        """Test function `last`."""
+        for time in range(1614556800, 1614556807):
+            self._buffer.append(_tick(time))
+
+        self.assertEqual(self._buffer.last(2)["time"].tolist(),
+                         [1614556805, 1614556806])
+        self.assertEqual(len(self._buffer.last(10)), 5)
+        self.assertEqual(len(self._buffer.last(0)), 0)
+
+    def test_since(self):
+        """Test function `since`."""
+        for time in (1614556800, 1614556800, 1614556802, 1614556805):
+            self._buffer.append(_tick(time))
+
+        self.assertEqual(self._buffer.since(1614556801)["time"].tolist(),
+                         [1614556802, 1614556805])
+        self.assertEqual(len(self._buffer.since(1614556800)), 4)
+        self.assertEqual(len(self._buffer.since(1614556806)), 0)
+
+    def test_bid_ask(self):
+        """Test keeping the bid/ask ticks."""
+        buffer = tick_ring_buffer.TickRingBuffer(capacity=2, bid_ask=True)
+        tick = wrapper.HistoricalTickBidAsk()
+        tick.time = 1614556800
+        tick.priceBid = 1.2
+        tick.priceAsk = 1.21
+        tick.sizeBid = 100
+        tick.sizeAsk = 200
+        tick.tickAttribBidAsk.bidPastLow = True
+        buffer.append(tick)
+
+        result = buffer.last()[0]
+        self.assertIsInstance(result, wrapper.HistoricalTickBidAsk)
+        self.assertEqual(result.priceAsk, 1.21)
+        self.assertEqual(result.sizeBid, 100)
+        self.assertTrue(result.tickAttribBidAsk.bidPastLow)
+
+    def test_concurrent_snapshot(self):
+        """Test reading snapshots while ticks are appended by other thread.
+
+        * Snapshots should only contain complete ticks in time order.
+        """
+        buffer = tick_ring_buffer.TickRingBuffer(capacity=64)
+
+        def write():
+            for time in range(20000):
+                buffer.append(_tick(time))
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        while writer.is_alive():
+            ticks = buffer.last()
+            times = ticks["time"]
+            self.assertTrue((times[1:] == times[:-1] + 1).all())
+            self.assertTrue((ticks["size"] == times % 100).all())
+        writer.join()
+
+        self.assertEqual(buffer.last(1)["time"].tolist(), [19999])
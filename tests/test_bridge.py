@@ -2,19 +2,24 @@
 # pylint: disable=protected-access
 import asyncio
 import datetime
+import tempfile
 import unittest
 from dateutil import relativedelta
 
+import numpy as np
 import pytz
 
+from ibapi import common
 from ibapi import contract
 from ibapi import wrapper
 
 from ibpy_native import bridge
 from ibpy_native import error
+from ibpy_native import models
 from ibpy_native._internal import _global
 from ibpy_native.utils import datatype
 from ibpy_native.utils import finishable_queue as fq
+from ibpy_native.utils import tick_store
 
 from tests.toolkit import sample_contracts
 from tests.toolkit import sample_orders
@@ -441,6 +446,944 @@ class TestHistoricalData(unittest.TestCase):
     def tearDownClass(cls):
         cls._bridge.disconnect()
 
+class TestHistoricalTicksDownload(unittest.TestCase):
+    """Unit tests for downloading historical ticks in shards & prefetching
+    via `IBBridge.req_historical_ticks`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._bridge = bridge.IBBridge(host=utils.IB_HOST, port=utils.IB_PORT,
+                                       client_id=utils.IB_CLIENT_ID,
+                                       auto_conn=False)
+        self._start = datetime.datetime(2021, 3, 1, 9, 0)
+        self._end = datetime.datetime(2021, 3, 1, 9, 30)
+        # A tick every 10 seconds from 1 hour before `start`
+        base = int(_global.TZ.localize(self._start).timestamp()) - 3600
+        self._times = list(range(base, base + 3 * 3600, 10))
+        self._requested = []
+        self._contract = sample_contracts.gbp_usd_fx()
+        self._contract.conId = 12087797
+
+        async def head_timestamp(*_, **__):
+            return self._start - datetime.timedelta(hours=1)
+
+        async def req_historical_ticks(req_id, start_date_time,
+                                       columnar=False, **_):
+            self._requested.append(req_id)
+            await asyncio.sleep(0)
+            start = _global.TZ.localize(start_date_time).timestamp()
+            # IB returns the ticks from `start` - 1 second, 5 ticks per page
+            # within 30 minutes in this mock
+            times = [time for time in self._times
+                     if start - 10 <= time < start + 1800][:5]
+            ticks = []
+            for time in times:
+                tick = wrapper.HistoricalTick()
+                tick.time = time
+                ticks.append(tick)
+
+            return models.TickArray.from_objects(ticks) if columnar else ticks
+
+        self._bridge.get_earliest_data_point = head_timestamp
+        self._bridge._client.req_historical_ticks = req_historical_ticks
+
+    async def _download(self, **kwargs) -> list:
+        kwargs.setdefault("contract", sample_contracts.gbp_usd_fx())
+        results = []
+        async for result in self._bridge.req_historical_ticks(
+            start=self._start, end=self._end, **kwargs
+        ):
+            results.append(result)
+
+        return results
+
+    @staticmethod
+    def _timestamp(date_time: datetime.datetime) -> float:
+        return _global.TZ.localize(date_time).timestamp()
+
+    @utils.async_test
+    async def test_sharded(self):
+        """Test downloading the ticks in shards.
+
+        * Ticks should be same as the ones downloaded sequentially, in time
+        order without duplication at shard boundaries.
+        """
+        sequential = await self._download()
+        sharded = await self._download(
+            concurrency=3, shard_size=datetime.timedelta(minutes=7))
+        start = _global.TZ.localize(self._start).timestamp()
+        end = _global.TZ.localize(self._end).timestamp()
+
+        expected = [time for time in self._times if start <= time <= end]
+        self.assertEqual(
+            [tick.time for result in sequential for tick in result.ticks],
+            expected)
+        self.assertEqual(
+            [tick.time for result in sharded for tick in result.ticks],
+            expected)
+        self.assertEqual([result.completed for result in sharded],
+                         [False] * (len(sharded) - 1) + [True])
+
+    @utils.async_test
+    async def test_columnar(self):
+        """Test downloading the ticks in columnar mode.
+
+        * Ticks should be trimmed without building the tick objects.
+        """
+        req_historical_ticks = self._bridge._client.req_historical_ticks
+
+        async def columnar_only(**kwargs):
+            ticks = await req_historical_ticks(**kwargs)
+            ticks._to_object = None # Fails once any tick object is built
+
+            return ticks
+
+        self._bridge._client.req_historical_ticks = columnar_only
+        results = await self._download(contract=self._contract,
+                                       columnar=True)
+
+        self.assertEqual(
+            models.TickArray.concatenate(
+                [result.ticks for result in results])["time"].tolist(),
+            [time for time in self._times
+             if self._timestamp(self._start) <= time <=
+             self._timestamp(self._end)])
+
+    @utils.async_test
+    async def test_sharded_err(self):
+        """Test downloading the ticks in shards.
+
+        * Error raised from a shard should be raised by the generator.
+        """
+        async def req_historical_ticks(req_id, **_):
+            raise error.IBError(rid=req_id, err_code=162, err_str="MOCK_ERR")
+
+        self._bridge._client.req_historical_ticks = req_historical_ticks
+
+        with self.assertRaises(error.IBError):
+            await self._download(concurrency=2)
+
+    @utils.async_test
+    async def test_sharded_close(self):
+        """Test closing the generator of the shards early.
+
+        * Shards in flight should be cancelled without waiting for GC.
+        """
+        pages = self._bridge.req_historical_ticks(
+            contract=sample_contracts.gbp_usd_fx(), start=self._start,
+            end=self._end, concurrency=3,
+            shard_size=datetime.timedelta(minutes=7))
+        await pages.__anext__()
+
+        await pages.aclose()
+        num_requested = len(self._requested)
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(self._requested), num_requested)
+        self.assertEqual(
+            [task for task in asyncio.all_tasks()
+             if task is not asyncio.current_task()], [])
+
+    @utils.async_test
+    async def test_prefetch(self):
+        """Test prefetching the pages in background.
+
+        * Next pages should be requested before the current one is consumed.
+        * Prefetching should stop once the generator is closed.
+        """
+        sequential = await self._download()
+        prefetched = await self._download(prefetch=2)
+        self.assertEqual(
+            [(tick.time, result.completed)
+             for result in prefetched for tick in result.ticks],
+            [(tick.time, result.completed)
+             for result in sequential for tick in result.ticks])
+
+        self._requested.clear()
+        pages = self._bridge.req_historical_ticks(
+            contract=sample_contracts.gbp_usd_fx(), start=self._start,
+            end=self._end, prefetch=2)
+        await pages.__anext__()
+        await asyncio.sleep(0.01)
+        self.assertGreater(len(self._requested), 2)
+
+        await pages.aclose()
+        num_requested = len(self._requested)
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(self._requested), num_requested)
+
+    @utils.async_test
+    async def test_tick_store(self):
+        """Test serving the ticks from `TickStore`.
+
+        * Time range downloaded should be served from the store.
+        * Only the gap not covered should be requested from IB.
+        """
+        with tempfile.TemporaryDirectory() as path:
+            store = tick_store.TickStore(path=path)
+            self._bridge.set_tick_store(store)
+            expected = await self._download(contract=self._contract)
+            self._requested.clear()
+
+            cached = await self._download(contract=self._contract)
+            self.assertEqual(self._requested, [])
+            self.assertEqual(
+                [tick.time for result in cached for tick in result.ticks],
+                [tick.time for result in expected for tick in result.ticks])
+
+            self._end += datetime.timedelta(minutes=10)
+            extended = await self._download(contract=self._contract,
+                                            columnar=True)
+            self.assertTrue(self._requested)
+            self.assertTrue(extended[-1].completed)
+            self.assertEqual(
+                models.TickArray.concatenate(
+                    [result.ticks for result in extended])["time"].tolist(),
+                [time for time in self._times
+                 if self._timestamp(self._start) <= time <=
+                 self._timestamp(self._end)])
+            self.assertEqual(store.stats.hits, 2)
+            self.assertEqual(store.stats.misses, 2)
+
+    @utils.async_test
+    async def test_tick_store_concurrent(self):
+        """Test downloading the same gap concurrently with `TickStore`.
+
+        * Both downloads should complete with all the ticks.
+        * Ticks should be stored once.
+        """
+        with tempfile.TemporaryDirectory() as path:
+            store = tick_store.TickStore(path=path)
+            self._bridge.set_tick_store(store)
+            results = await asyncio.gather(
+                self._download(contract=self._contract, columnar=True),
+                self._download(contract=self._contract, columnar=True,
+                               concurrency=2))
+            parts = store.lookup(con_id=self._contract.conId,
+                                 tick_type=datatype.HistoricalTicks.TRADES,
+                                 start=self._timestamp(self._start),
+                                 end=self._timestamp(self._end))
+
+            expected = [time for time in self._times
+                        if self._timestamp(self._start) <= time <=
+                        self._timestamp(self._end)]
+            for result in results:
+                self.assertEqual(
+                    models.TickArray.concatenate(
+                        [page.ticks for page in result])["time"].tolist(),
+                    expected)
+            self.assertEqual([time for _, _, ticks in parts
+                              for time in ticks["time"].tolist()], expected)
+
+    @utils.async_test
+    async def test_sync(self):
+        """Test syncing the ticks into `TickStore`.
+
+        * Interrupted sync should resume from the last checkpoint.
+        * Nothing should be requested once all ticks are synced.
+        """
+        req_historical_ticks = self._bridge._client.req_historical_ticks
+
+        async def interrupted(**kwargs):
+            if len(self._requested) >= 5:
+                raise error.IBError(rid=kwargs["req_id"], err_code=504,
+                                    err_str="Not connected")
+
+            return await req_historical_ticks(**kwargs)
+
+        with tempfile.TemporaryDirectory() as path:
+            store = tick_store.TickStore(path=path)
+            self._bridge._client.req_historical_ticks = interrupted
+            with self.assertRaises(error.IBError):
+                await self._bridge.sync_historical_ticks(
+                    contract=self._contract,
+                    tick_type=datatype.HistoricalTicks.MIDPOINT,
+                    start=self._start, end=self._end, store=store,
+                    checkpoint=8)
+            # 4 ticks per page returned, so 2 pages per checkpoint
+            self.assertEqual(store.stats.segments, 2)
+
+            self._requested.clear()
+            self._bridge._client.req_historical_ticks = req_historical_ticks
+            result = await self._bridge.sync_historical_ticks(
+                contract=self._contract,
+                tick_type=datatype.HistoricalTicks.MIDPOINT, start=self._start,
+                end=self._end, store=store, checkpoint=8)
+            parts = store.lookup(con_id=self._contract.conId,
+                                 tick_type=datatype.HistoricalTicks.MIDPOINT,
+                                 start=self._timestamp(self._start),
+                                 end=self._timestamp(self._end))
+
+            self.assertEqual(result.gaps[0][0],
+                             self._start + datetime.timedelta(seconds=151))
+            self.assertEqual(result.ticks, 181 - 16)
+            self.assertEqual(
+                [time for _, _, ticks in parts
+                 for time in ticks["time"].tolist()],
+                [time for time in self._times
+                 if self._timestamp(self._start) <= time <=
+                 self._timestamp(self._end)])
+
+            self._requested.clear()
+            result = await self._bridge.sync_historical_ticks(
+                contract=self._contract,
+                tick_type=datatype.HistoricalTicks.MIDPOINT, start=self._start,
+                end=self._end, store=store)
+            self.assertEqual(result, ([], 0))
+            self.assertEqual(self._requested, [])
+
+    @utils.async_test
+    async def test_sync_concurrent(self):
+        """Test syncing the ticks along with other downloads of the same
+        contract & tick type.
+
+        * Syncs & downloads should complete without conflicting on the
+        store, with every tick stored once.
+        """
+        with tempfile.TemporaryDirectory() as path:
+            store = tick_store.TickStore(path=path)
+            self._bridge.set_tick_store(store)
+            await asyncio.gather(
+                self._bridge.sync_historical_ticks(
+                    contract=self._contract,
+                    tick_type=datatype.HistoricalTicks.TRADES,
+                    start=self._start, end=self._end, checkpoint=8),
+                self._bridge.sync_historical_ticks(
+                    contract=self._contract,
+                    tick_type=datatype.HistoricalTicks.TRADES,
+                    start=self._start, end=self._end, checkpoint=5,
+                    concurrency=2),
+                self._download(contract=self._contract, columnar=True)
+            )
+            parts = store.lookup(con_id=self._contract.conId,
+                                 tick_type=datatype.HistoricalTicks.TRADES,
+                                 start=self._timestamp(self._start),
+                                 end=self._timestamp(self._end))
+
+            self.assertEqual(
+                [time for _, _, ticks in parts
+                 for time in ticks["time"].tolist()],
+                [time for time in self._times
+                 if self._timestamp(self._start) <= time <=
+                 self._timestamp(self._end)])
+
+    @utils.async_test
+    async def test_head_timestamp_cache(self):
+        """Test looking up the earliest data point with cache.
+
+        * IB should be requested once per contract & data type.
+        * Lookup should be skipped if `head_lookup` is `False`.
+        """
+        del self._bridge.get_earliest_data_point
+        head_time = int(self._timestamp(self._start)) - 3600
+        requested = []
+
+        async def resolve_head_timestamp(req_id, show, **_):
+            requested.append(show)
+
+            return head_time
+
+        self._bridge._client.resolve_head_timestamp = resolve_head_timestamp
+
+        for _ in range(2):
+            await self._download(contract=self._contract,
+                                 tick_type=datatype.HistoricalTicks.BID_ASK)
+        self.assertCountEqual(requested, [datatype.EarliestDataPoint.ASK,
+                                          datatype.EarliestDataPoint.BID])
+
+        requested.clear()
+        await self._download(contract=self._contract, head_lookup=False)
+        self.assertEqual(requested, [])
+
+    @utils.async_test
+    async def test_skip_closed(self):
+        """Test skipping the time the market is closed if no tick returned.
+
+        * Pagination should jump to the next session across the weekend.
+        """
+        # 1 tick per minute on Friday & Monday
+        friday = int(self._timestamp(datetime.datetime(2021, 2, 26, 15, 0)))
+        monday = int(self._timestamp(datetime.datetime(2021, 3, 1, 9, 30)))
+        self._times = (list(range(friday, friday + 3600, 60)) +
+                       list(range(monday, monday + 3600, 60)))
+        details = contract.ContractDetails()
+        details.contract = self._contract
+        details.timeZoneId = "US/Eastern"
+        details.tradingHours = ("20210226:0930-20210226:1600;"
+                                "20210227:CLOSED;20210228:CLOSED;"
+                                "20210301:0930-20210301:1600")
+        self._bridge._cache_trading_schedule(details)
+
+        self._start = datetime.datetime(2021, 2, 26, 15, 0)
+        self._end = datetime.datetime(2021, 3, 1, 10, 0)
+        results = await self._download(contract=self._contract)
+
+        self.assertEqual(
+            [tick.time for result in results for tick in result.ticks],
+            [time for time in self._times
+             if time <= self._timestamp(self._end)])
+        # 15 pages on Friday & 8 pages on Monday, with only 1 empty page after
+        # Friday's close instead of 1 per 30 minutes over the weekend
+        self.assertEqual(len(self._requested), 24)
+
+    @utils.async_test
+    async def test_trading_schedule_lookup(self):
+        """Test looking up the trading schedule for skipping closed time.
+
+        * Shards should share a single lookup of the contract details.
+        * Trading hours in unexpected format should be ignored.
+        """
+        requested = []
+        details = contract.ContractDetails()
+        details.contract = self._contract
+        details.timeZoneId = "US/Eastern"
+        details.tradingHours = "20210301:09:30-16:00"
+
+        async def resolve_contracts(req_id, **_):
+            requested.append(req_id)
+            await asyncio.sleep(0.01)
+
+            return [details]
+
+        self._bridge._client.resolve_contracts = resolve_contracts
+        # Ticks only in the first 5 minutes, leaves the later shards empty
+        start = int(self._timestamp(self._start))
+        self._times = list(range(start, start + 300, 10))
+        results = await self._download(
+            contract=self._contract, concurrency=3,
+            shard_size=datetime.timedelta(minutes=7))
+
+        self.assertEqual(len(requested), 1)
+        self.assertEqual(
+            [tick.time for result in results for tick in result.ticks],
+            self._times)
+        self.assertEqual(
+            await self._bridge.search_detailed_contracts(self._contract),
+            [details])
+
+    @utils.async_test
+    async def test_sharded_invalid_concurrency(self):
+        """Test downloading the ticks in shards.
+
+        * Expect `ValueError` due to `concurrency` less than 1.
+        """
+        with self.assertRaises(ValueError):
+            await self._download(concurrency=0)
+
+class TestHistoricalBarsDownload(unittest.TestCase):
+    """Unit tests for downloading historical bars in chunks via
+    `IBBridge.req_historical_bars`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._bridge = bridge.IBBridge(host=utils.IB_HOST, port=utils.IB_PORT,
+                                       client_id=utils.IB_CLIENT_ID,
+                                       auto_conn=False)
+        self._start = datetime.datetime(2021, 3, 1, 9, 0)
+        self._end = datetime.datetime(2021, 3, 1, 11, 0)
+        # A bar every minute from 1 day before `start`
+        base = int(_global.TZ.localize(self._start).timestamp()) - 86400
+        self._times = list(range(base, base + 2 * 86400, 60))
+        self._requested = []
+        self._failures = 0
+
+        async def req_historical_bars(end_date_time, duration, **_):
+            self._requested.append((end_date_time, duration))
+            await asyncio.sleep(0)
+            if self._failures > 0:
+                self._failures -= 1
+                raise error.IBError(
+                    rid=1, err_code=error.IBErrorCode.HISTORICAL_DATA_SERVICE,
+                    err_str="Historical Market Data Service error message")
+
+            # IB returns the bars within `duration` before `end_date_time`
+            end = _global.TZ.localize(end_date_time).timestamp()
+            times = [time for time in self._times
+                     if end - int(duration.split()[0]) <= time < end]
+
+            return models.BarArray(columns={
+                "time": np.array(times, dtype="i8"),
+                "open": np.ones(len(times)),
+                "high": np.ones(len(times)),
+                "low": np.ones(len(times)),
+                "close": np.ones(len(times)),
+                "volume": np.zeros(len(times)),
+                "wap": np.ones(len(times)),
+                "count": np.zeros(len(times), dtype="i8"),
+            })
+
+        self._bridge._client.req_historical_bars = req_historical_bars
+
+    def _expected(self) -> list:
+        start = _global.TZ.localize(self._start).timestamp()
+        end = _global.TZ.localize(self._end).timestamp()
+
+        return [time for time in self._times if start <= time < end]
+
+    @utils.async_test
+    async def test_chunks(self):
+        """Test downloading the bars in chunks.
+
+        * Bars should be joined in time order, without the ones returned out
+          of the period or overlapped between chunks.
+        """
+        bars = await self._bridge.req_historical_bars(
+            contract=sample_contracts.gbp_usd_fx(), start=self._start,
+            end=self._end, bar_size=datatype.BarSize.SEC_30)
+
+        self.assertEqual(bars["time"].tolist(), self._expected())
+        # 28800 seconds per request for 30 seconds bars
+        self.assertEqual(self._requested, [(self._end, "28800 S")])
+
+    @utils.async_test
+    async def test_chunks_multiple(self):
+        """Test downloading the bars over multiple chunks."""
+        self._end = self._start + datetime.timedelta(hours=3)
+
+        bars = await self._bridge.req_historical_bars(
+            contract=sample_contracts.gbp_usd_fx(), start=self._start,
+            end=self._end, bar_size=datatype.BarSize.SEC_1, concurrency=2)
+
+        self.assertEqual(bars["time"].tolist(), self._expected())
+        self.assertEqual(len(self._requested), 6)
+
+    @utils.async_test
+    async def test_retry(self):
+        """Test retrying the chunk failed."""
+        self._failures = 1
+
+        bars = await self._bridge.req_historical_bars(
+            contract=sample_contracts.gbp_usd_fx(), start=self._start,
+            end=self._end, bar_size=datatype.BarSize.SEC_30, retry=1)
+
+        self.assertEqual(bars["time"].tolist(), self._expected())
+
+    @utils.async_test
+    async def test_retry_err(self):
+        """Test the chunk failed without retry.
+
+        * Expect `IBError`.
+        """
+        self._failures = 1
+
+        with self.assertRaises(error.IBError):
+            await self._bridge.req_historical_bars(
+                contract=sample_contracts.gbp_usd_fx(), start=self._start,
+                end=self._end, bar_size=datatype.BarSize.SEC_30)
+
+    @utils.async_test
+    async def test_invalid_period(self):
+        """Test downloading the bars with `start` later than `end`.
+
+        * Expect `ValueError`.
+        """
+        with self.assertRaises(ValueError):
+            await self._bridge.req_historical_bars(
+                contract=sample_contracts.gbp_usd_fx(), start=self._end,
+                end=self._start)
+
+class TestLiveTicksIterator(unittest.TestCase):
+    """Unit tests for streaming live ticks via `IBBridge.live_ticks`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._bridge = utils.offline_bridge()
+
+        def send_ticks(req_id: int):
+            for time in range(1614556800, 1614556805):
+                self._bridge._wrapper.tickByTickMidPoint(req_id, time, 1.21)
+
+        def respond(req_id: int, **_):
+            # Ticks arrive after the request is sent
+            asyncio.get_event_loop().call_soon(send_ticks, req_id)
+
+        self._reqs = utils.RequestRecorder(
+            client=self._bridge._client, req="reqTickByTickData",
+            cancel="cancelTickByTickData", respond=respond)
+
+    @utils.async_test
+    async def test_live_ticks(self):
+        """Test function `live_ticks`.
+
+        * Subscription should be cancelled once the consumer leaves the loop.
+        """
+        received = []
+        ticks = self._bridge.live_ticks(contract=sample_contracts.gbp_usd_fx(),
+                                        tick_type=datatype.LiveTicks.MIDPOINT,
+                                        max_batch=2)
+        async for batch in ticks:
+            received.extend(batch)
+            if len(received) >= 4:
+                break
+        await ticks.aclose()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([tick.time for tick in received],
+                         list(range(1614556800, 1614556804)))
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested)
+
+    @utils.async_test
+    async def test_shared_subscription(self):
+        """Test sharing the subscription between iterator & listener.
+
+        * Subscription should be cancelled once both consumers leave.
+        """
+        listener = utils.MockLiveTicksListener()
+        stream_id = await self._bridge.stream_live_ticks(
+            contract=sample_contracts.gbp_usd_fx(), listener=listener,
+            tick_type=datatype.LiveTicks.MIDPOINT
+        )
+        ticks = self._bridge.live_ticks(contract=sample_contracts.gbp_usd_fx(),
+                                        tick_type=datatype.LiveTicks.MIDPOINT)
+        batch = await ticks.__anext__()
+        await ticks.aclose()
+
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(len(listener.ticks), 5)
+        self.assertEqual(len(self._reqs.requested), 1)
+        self.assertEqual(self._reqs.cancelled, [])
+
+        self._bridge.stop_live_ticks_stream(stream_id=stream_id)
+        await asyncio.sleep(0.01)
+        self.assertTrue(listener.finished)
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested)
+
+    @utils.async_test
+    async def test_stop_immediately(self):
+        """Test stopping the stream right after it's started.
+
+        * Listener should be notified with the stream finished, and the
+          subscription cancelled.
+        """
+        listener = utils.MockLiveTicksListener()
+        stream_id = await self._bridge.stream_live_ticks(
+            contract=sample_contracts.gbp_usd_fx(), listener=listener,
+            tick_type=datatype.LiveTicks.MIDPOINT
+        )
+        self._bridge.stop_live_ticks_stream(stream_id=stream_id)
+        await asyncio.sleep(0.01)
+
+        self.assertTrue(listener.finished)
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested)
+
+    @utils.async_test
+    async def test_live_ticks_buffer(self):
+        """Test function `get_live_ticks_buffer`.
+
+        * Ticks should be kept as soon as they're received.
+        """
+        stream_id = await self._bridge.stream_live_ticks(
+            contract=sample_contracts.gbp_usd_fx(),
+            listener=utils.MockLiveTicksListener(),
+            tick_type=datatype.LiveTicks.MIDPOINT, buffer_size=3
+        )
+        buffer = self._bridge.get_live_ticks_buffer(stream_id)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(buffer.last()["time"].tolist(),
+                         list(range(1614556802, 1614556805)))
+
+        self._bridge.stop_live_ticks_stream(stream_id=stream_id)
+        await asyncio.sleep(0.01)
+        with self.assertRaises(error.IBError):
+            self._bridge.get_live_ticks_buffer(stream_id)
+
+class TestQuotes(unittest.TestCase):
+    """Unit tests for top of book market data related functions in
+    `IBBridge`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._bridge = utils.offline_bridge()
+
+        def respond(req_id: int, contract, **_):
+            self._bridge._wrapper.tickPrice(req_id, 1, contract.conId / 10,
+                                            common.TickAttrib())
+
+        self._reqs = utils.RequestRecorder(
+            client=self._bridge._client, req="reqMktData",
+            cancel="cancelMktData", respond=respond)
+
+    def test_subscribe_quotes(self):
+        """Test function `subscribe_quotes`."""
+        contracts = [sample_contracts.us_stock(), sample_contracts.us_future()]
+        contracts[0].conId = 12
+        contracts[1].conId = 13
+        rows = self._bridge.subscribe_quotes(contracts=contracts)
+        table = self._bridge.get_quote_table()
+
+        self.assertEqual(len(self._reqs.requested), 2)
+        self.assertEqual(table.snapshot(rows)["bid"].tolist(), [1.2, 1.3])
+        self.assertEqual(table.changed_since(0).tolist(), rows)
+
+    def test_unsubscribe_quotes(self):
+        """Test function `unsubscribe_quotes`.
+
+        * Should raise `IBError` for rows without subscription.
+        """
+        rows = self._bridge.subscribe_quotes(
+            contracts=[sample_contracts.gbp_usd_fx()])
+        self._bridge.unsubscribe_quotes(rows=rows)
+
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested)
+        self.assertEqual(len(self._bridge.get_quote_table()), 0)
+        with self.assertRaises(error.IBError):
+            self._bridge.unsubscribe_quotes(rows=rows)
+
+    def test_unsubscribe_quotes_disconnected(self):
+        """Test function `unsubscribe_quotes` after disconnected.
+
+        * Row should be removed without cancelling the request, which ID is
+          reused by the subscription after reconnected.
+        """
+        stock = sample_contracts.us_stock()
+        stock.conId = 12
+        rows = self._bridge.subscribe_quotes(contracts=[stock])
+        self._bridge._wrapper.connectionClosed()
+
+        future = sample_contracts.us_future()
+        future.conId = 13
+        new_rows = self._bridge.subscribe_quotes(contracts=[future])
+        self.assertEqual(self._reqs.requested[1], self._reqs.requested[0])
+
+        self._bridge.unsubscribe_quotes(rows=rows)
+
+        table = self._bridge.get_quote_table()
+        self.assertEqual(self._reqs.cancelled, [])
+        self.assertEqual(len(table), 1)
+        self._bridge._wrapper.tickPrice(self._reqs.requested[1], 1, 1.31,
+                                        common.TickAttrib())
+        self.assertEqual(table.get_row(new_rows[0])["bid"], 1.31)
+
+    def test_quotes_err(self):
+        """Test the error returned for a quote subscription.
+
+        * Error should be recorded on the row, without affecting the others.
+        """
+        contracts = [sample_contracts.us_stock(), sample_contracts.us_future()]
+        contracts[0].conId = 12
+        contracts[1].conId = 13
+        rows = self._bridge.subscribe_quotes(contracts=contracts)
+        table = self._bridge.get_quote_table()
+        self._bridge._wrapper.error(self._reqs.requested[0], 354,
+                                    "Requested market data is not "
+                                    "subscribed.")
+
+        self.assertEqual(table.get_error(rows[0]).err_code, 354)
+        self.assertIsNone(table.get_error(rows[1]))
+        self.assertEqual(table.snapshot(rows)["bid"].tolist(), [1.2, 1.3])
+
+    def test_quotes_row_reuse(self):
+        """Test subscribing the quotes after unsubscribing others.
+
+        * Row released should be reused by the new subscription, without
+          the quote & error of the previous one.
+        """
+        stock = sample_contracts.us_stock()
+        stock.conId = 12
+        rows = self._bridge.subscribe_quotes(contracts=[stock])
+        self._bridge._wrapper.error(self._reqs.requested[0], 354,
+                                    "Requested market data is not "
+                                    "subscribed.")
+        self._bridge.unsubscribe_quotes(rows=rows)
+
+        future = sample_contracts.us_future()
+        future.conId = 13
+        self.assertEqual(self._bridge.subscribe_quotes(contracts=[future]),
+                         rows)
+
+        table = self._bridge.get_quote_table()
+        self.assertEqual(table.get_row(rows[0])["bid"], 1.3)
+        self.assertIsNone(table.get_error(rows[0]))
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested[:1])
+
+class TestOrderBook(unittest.TestCase):
+    """Unit tests for market depth related functions in `IBBridge`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._bridge = utils.offline_bridge()
+
+        def respond(req_id: int, numRows: int, **_):
+            # pylint: disable=invalid-name
+            for position in range(numRows):
+                self._bridge._wrapper.updateMktDepth(
+                    req_id, position, 0, 1, 1.2 - position / 100, 100)
+
+        self._reqs = utils.RequestRecorder(
+            client=self._bridge._client, req="reqMktDepth",
+            cancel="cancelMktDepth", respond=respond)
+
+    def test_order_book(self):
+        """Test functions `subscribe_order_book`, `get_order_book` &
+        `unsubscribe_order_book`.
+        """
+        book_id = self._bridge.subscribe_order_book(
+            contract=sample_contracts.gbp_usd_fx(), num_rows=3)
+        book = self._bridge.get_order_book(book_id)
+
+        self.assertEqual(book.bids()["price"].tolist(), [1.2, 1.19, 1.18])
+
+        self._bridge.unsubscribe_order_book(book_id)
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested)
+        with self.assertRaises(error.IBError):
+            self._bridge.get_order_book(book_id)
+
+    def test_order_book_disconnected(self):
+        """Test function `unsubscribe_order_book` after disconnected.
+
+        * Book should be removed without cancelling the request, which ID is
+          reused by the subscription after reconnected.
+        """
+        book_id = self._bridge.subscribe_order_book(
+            contract=sample_contracts.gbp_usd_fx(), num_rows=3)
+        self._bridge._wrapper.connectionClosed()
+        new_book_id = self._bridge.subscribe_order_book(
+            contract=sample_contracts.gbp_usd_fx(), num_rows=3)
+        self.assertNotEqual(new_book_id, book_id)
+        self.assertEqual(self._reqs.requested[1], self._reqs.requested[0])
+
+        self._bridge.unsubscribe_order_book(book_id)
+        self.assertEqual(self._reqs.cancelled, [])
+        with self.assertRaises(error.IBError):
+            self._bridge.get_order_book(book_id)
+
+        self._bridge._wrapper.updateMktDepth(self._reqs.requested[1], 0, 1,
+                                             1, 1.21, 200)
+        self.assertEqual(
+            self._bridge.get_order_book(new_book_id).best_bid(), (1.21, 200))
+
+    def test_order_book_err(self):
+        """Test the error returned for a market depth subscription."""
+        book_id = self._bridge.subscribe_order_book(
+            contract=sample_contracts.gbp_usd_fx(), num_rows=3)
+        self._bridge._wrapper.error(self._reqs.requested[0], 309,
+                                    "Max number (3) of market depth requests "
+                                    "has been reached.")
+
+        self.assertEqual(
+            self._bridge.get_order_book(book_id).get_error().err_code, 309)
+
+    def test_order_book_reset(self):
+        """Test the market depth reset by IB.
+
+        * Levels should be cleared until IB resends them.
+        """
+        book_id = self._bridge.subscribe_order_book(
+            contract=sample_contracts.gbp_usd_fx(), num_rows=3)
+        book = self._bridge.get_order_book(book_id)
+        self._bridge._wrapper.error(self._reqs.requested[0],
+                                    error.IBErrorCode.MKT_DEPTH_RESET,
+                                    "Market depth data has been RESET.")
+
+        self.assertIsNone(book.best_bid())
+        self.assertIsNone(book.get_error())
+
+        self._bridge._wrapper.updateMktDepth(self._reqs.requested[0], 0, 0,
+                                             1, 1.21, 200)
+        self.assertEqual(book.best_bid(), (1.21, 200))
+
+class TestRealtimeBars(unittest.TestCase):
+    """Unit tests for streaming real-time bars via
+    `IBBridge.stream_realtime_bars`.
+
+    Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._bridge = utils.offline_bridge()
+
+        def respond(req_id: int, **_):
+            for time in range(1614556800, 1614556815, 5):
+                self._bridge._wrapper.realtimeBar(
+                    req_id, time, 1.2, 1.3, 1.1, 1.25, req_id, 1.22, 3)
+
+        self._reqs = utils.RequestRecorder(
+            client=self._bridge._client, req="reqRealTimeBars",
+            cancel="cancelRealTimeBars", respond=respond)
+
+    @utils.async_test
+    async def test_stream_realtime_bars(self):
+        """Test function `stream_realtime_bars`.
+
+        * Subscriptions should be cancelled once the iterator is closed.
+        """
+        buffers = [models.BarBuffer(), models.BarBuffer()]
+        bars = self._bridge.stream_realtime_bars(
+            contracts=[sample_contracts.us_stock(),
+                       sample_contracts.gbp_usd_fx()], buffers=buffers)
+        updates = await bars.__anext__()
+        await bars.aclose()
+
+        self.assertEqual(list(updates), [0, 1])
+        self.assertEqual(updates[1]["time"].tolist(),
+                         list(range(1614556800, 1614556815, 5)))
+        self.assertEqual(buffers[0].to_array()["volume"].tolist(),
+                         [self._reqs.requested[0]] * 3)
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested)
+
+        self._bridge._wrapper.realtimeBar(self._reqs.requested[0], 1614556815,
+                                          1.2, 1.3, 1.1, 1.25, 100, 1.22, 3)
+        self.assertEqual(len(buffers[0]), 3)
+
+    @utils.async_test
+    async def test_stream_realtime_bars_err(self):
+        """Test function `stream_realtime_bars`.
+
+        * Error returned for a contract should be yielded as its' entry,
+          without terminating the other contracts.
+        """
+        def respond(req_id: int, **_):
+            if len(self._reqs.requested) == 1:
+                self._bridge._wrapper.error(req_id, 420,
+                                            "Invalid Real-time Query")
+            else:
+                self._bridge._wrapper.realtimeBar(
+                    req_id, 1614556800, 1.2, 1.3, 1.1, 1.25, 100, 1.22, 3)
+
+        self._reqs.respond = respond
+
+        bars = self._bridge.stream_realtime_bars(
+            contracts=[sample_contracts.us_stock(),
+                       sample_contracts.gbp_usd_fx()])
+        updates = await bars.__anext__()
+        self.assertEqual(list(updates), [1])
+        updates = await bars.__anext__()
+        self.assertEqual(list(updates), [0])
+        self.assertEqual(updates[0].err_code, 420)
+
+        self._bridge._wrapper.realtimeBar(self._reqs.requested[1], 1614556805,
+                                          1.2, 1.3, 1.1, 1.25, 100, 1.22, 3)
+        updates = await bars.__anext__()
+        self.assertEqual(updates[1]["time"].tolist(), [1614556805])
+        await bars.aclose()
+
+        self.assertEqual(self._reqs.cancelled, self._reqs.requested)
+
+        with self.assertRaises(ValueError):
+            await self._bridge.stream_realtime_bars(
+                contracts=[sample_contracts.us_stock()], buffers=[]
+            ).__anext__()
+
+    @utils.async_test
+    async def test_stream_realtime_bars_disconnected(self):
+        """Test function `stream_realtime_bars`.
+
+        * Should raise `IBError` once the connection is dropped.
+        """
+        bars = self._bridge.stream_realtime_bars(
+            contracts=[sample_contracts.us_stock()])
+        await bars.__anext__()
+        self._bridge._wrapper.connectionClosed()
+
+        with self.assertRaises(error.IBError) as context:
+            await bars.__anext__()
+        self.assertEqual(context.exception.err_code,
+                         error.IBErrorCode.NOT_CONNECTED)
+
 class TestLiveData(unittest.TestCase):
     """Unit tests for live market data related functions in `IBBridge`.
 
@@ -474,7 +1417,7 @@ class TestLiveData(unittest.TestCase):
         self.assertIsInstance(self._listener.ticks[0],
                               wrapper.HistoricalTickBidAsk)
 
-        self._bridge._client.cancel_live_ticks_stream(req_id)
+        self._bridge.stop_live_ticks_stream(stream_id=req_id)
         await asyncio.sleep(0.5)
 
     @utils.async_test
@@ -493,7 +1436,7 @@ class TestLiveData(unittest.TestCase):
 
         self.assertIsInstance(self._listener.ticks[0], wrapper.HistoricalTick)
 
-        self._bridge._client.cancel_live_ticks_stream(req_id)
+        self._bridge.stop_live_ticks_stream(stream_id=req_id)
         await asyncio.sleep(0.5)
 
     @utils.async_test
@@ -513,7 +1456,7 @@ class TestLiveData(unittest.TestCase):
         self.assertIsInstance(self._listener.ticks[0],
                               wrapper.HistoricalTickLast)
 
-        self._bridge._client.cancel_live_ticks_stream(req_id)
+        self._bridge.stop_live_ticks_stream(stream_id=req_id)
         await asyncio.sleep(0.5)
 
     @utils.async_test
@@ -533,7 +1476,7 @@ class TestLiveData(unittest.TestCase):
         self.assertIsInstance(self._listener.ticks[0],
                               wrapper.HistoricalTickLast)
 
-        self._bridge._client.cancel_live_ticks_stream(req_id)
+        self._bridge.stop_live_ticks_stream(stream_id=req_id)
         await asyncio.sleep(0.5)
 
     @utils.async_test
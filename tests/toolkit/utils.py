@@ -3,10 +3,11 @@
 import asyncio
 import os
 import queue
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from ibapi import wrapper
 
+from ibpy_native import bridge
 from ibpy_native import error
 from ibpy_native import models
 from ibpy_native.interfaces import delegates
@@ -102,4 +103,43 @@ class MockLiveTicksListener(listeners.LiveTicksListener):
 
     def on_err(self, err: error.IBError):
         raise err
+
+def offline_bridge() -> bridge.IBBridge:
+    """Returns an `IBBridge` without connecting to IB, for the tests with
+    the requests stubbed via `RequestRecorder`.
+    """
+    return bridge.IBBridge(host=IB_HOST, port=IB_PORT,
+                           client_id=IB_CLIENT_ID, auto_conn=False)
+
+class RequestRecorder:
+    """Stubs a pair of request & cancel functions of `IBClient`, and
+    records the IDs of the requests sent & cancelled.
+
+    Args:
+        client (:obj:`ibapi.client.EClient`): Client to stub.
+        req (str): Name of the request function, e.g. `reqMktData`.
+        cancel (str): Name of the cancel function, e.g. `cancelMktData`.
+        respond (:obj:`Callable[..., None]`, optional): Called with the
+            arguments of each request to respond with, e.g. by feeding the
+            wrapper. Can be replaced via attribute `respond` in the tests.
+            Defaults to `None`.
+    """
+    def __init__(self, client: Any, req: str, cancel: str,
+                 respond: Optional[Callable[..., None]]=None):
+        self.requested: List[int] = []
+        self.cancelled: List[int] = []
+        self.respond = respond
+
+        setattr(client, req, self._request)
+        setattr(client, cancel, self._cancel)
+
+    def _request(self, reqId: int, *args, **kwargs):
+        # pylint: disable=invalid-name
+        self.requested.append(reqId)
+        if self.respond is not None:
+            self.respond(reqId, *args, **kwargs)
+
+    def _cancel(self, reqId: int, *_, **__):
+        # pylint: disable=invalid-name
+        self.cancelled.append(reqId)
 #endregion - ibpy_native specific
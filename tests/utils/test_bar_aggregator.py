@@ -0,0 +1,142 @@
+"""Unit tests for module `ibpy_native.utils.bar_aggregator`."""
+import unittest
+
+import numpy as np
+
+from ibapi import wrapper
+
+from ibpy_native.models import tick_array
+from ibpy_native.utils import bar_aggregator
+
+_BASE = 1614556800 # 2021-03-01 00:00:00 UTC
+
+def _trades(times: list, prices: list, sizes: list) -> list:
+    ticks = []
+    for time, price, size in zip(times, prices, sizes):
+        tick = wrapper.HistoricalTickLast()
+        tick.time = time
+        tick.price = price
+        tick.size = size
+        ticks.append(tick)
+
+    return ticks
+
+class TestBarAggregator(unittest.TestCase):
+    """Unit tests for class `BarAggregator`."""
+    def setUp(self):
+        self._aggregator = bar_aggregator.BarAggregator(intervals=[60, 300])
+        times = [_BASE + offset for offset in range(0, 900, 20)]
+        self._ticks = _trades(
+            times=times, prices=[100 + idx % 7 for idx in range(len(times))],
+            sizes=[1 + idx % 3 for idx in range(len(times))])
+
+    def test_update(self):
+        """Test aggregating the ticks one by one.
+
+        * Bars should be emitted once the ticks of next interval arrive.
+        """
+        closed = []
+        for tick in self._ticks[:4]:
+            closed.extend(self._aggregator.update(tick))
+
+        self.assertEqual(len(closed), 1)
+        interval, bar = closed[0]
+        self.assertEqual(interval, 60)
+        self.assertEqual(bar.date, str(_BASE))
+        self.assertEqual((bar.open, bar.high, bar.low, bar.close),
+                         (100, 102, 100, 102))
+        self.assertEqual(bar.volume, 6)
+        self.assertAlmostEqual(bar.average, (100 + 101 * 2 + 102 * 3) / 6)
+        self.assertEqual(bar.barCount, 3)
+        self.assertEqual(self._aggregator.get_current(60).date,
+                         str(_BASE + 60))
+
+    def test_update_bid_ask(self):
+        """Test aggregating bid/ask ticks by their midpoint."""
+        tick = wrapper.HistoricalTickBidAsk()
+        tick.time = _BASE
+        tick.priceBid = 1.2101
+        tick.priceAsk = 1.2103
+        self._aggregator.update(tick)
+
+        bar = self._aggregator.get_current(60)
+        self.assertAlmostEqual(bar.close, 1.2102)
+        self.assertEqual(bar.volume, 0)
+        self.assertAlmostEqual(bar.average, 1.2102)
+
+    def test_update_array(self):
+        """Test aggregating pages of ticks with vectorized aggregation.
+
+        * Bars should be the same as the ones aggregated one by one.
+        * Bar crossing pages should be merged.
+        """
+        expected = bar_aggregator.BarAggregator(intervals=[60, 300])
+        expected_bars = {60: [], 300: []}
+        for tick in self._ticks:
+            for interval, bar in expected.update(tick):
+                expected_bars[interval].append(bar)
+
+        ticks = tick_array.TickArray.from_objects(self._ticks)
+        bars = {60: [], 300: []}
+        for page in (ticks[:5], ticks[5:20], ticks[20:]):
+            for interval, closed in self._aggregator.update_array(
+                    page).items():
+                bars[interval].extend(closed)
+
+        for interval in (60, 300):
+            self.assertEqual(
+                [(bar.date, bar.open, bar.high, bar.low, bar.close,
+                  bar.volume, round(bar.average, 8), bar.barCount)
+                 for bar in bars[interval]],
+                [(bar.date, bar.open, bar.high, bar.low, bar.close,
+                  bar.volume, round(bar.average, 8), bar.barCount)
+                 for bar in expected_bars[interval]])
+        self.assertEqual(len(bars[300]), 2)
+        self.assertEqual(self._aggregator.get_current(300).barCount,
+                         expected.get_current(300).barCount)
+
+    def test_update_array_late_tick(self):
+        """Test aggregating a page with a late tick.
+
+        * Late tick should be added to the bar being built, as `update` does.
+        """
+        ticks = _trades(times=[_BASE, _BASE + 70, _BASE + 50, _BASE + 130],
+                        prices=[100, 101, 99, 102], sizes=[1, 1, 1, 1])
+        expected = bar_aggregator.BarAggregator(intervals=[60, 300])
+        expected_bars = [bar for tick in ticks
+                         for interval, bar in expected.update(tick)
+                         if interval == 60]
+
+        bars = self._aggregator.update_array(
+            tick_array.TickArray.from_objects(ticks))[60]
+
+        self.assertEqual([(bar.date, bar.low, bar.barCount) for bar in bars],
+                         [(bar.date, bar.low, bar.barCount)
+                          for bar in expected_bars])
+        self.assertEqual(len(bars), 2)
+
+    def test_flush(self):
+        """Test closing the bars being built."""
+        for tick in self._ticks[:2]:
+            self._aggregator.update(tick)
+
+        closed = self._aggregator.flush()
+
+        self.assertEqual([interval for interval, _ in closed], [60, 300])
+        self.assertEqual(closed[0][1].barCount, 2)
+        self.assertIsNone(self._aggregator.get_current(60))
+
+    def test_invalid_interval(self):
+        """Test creating the aggregator with interval shorter than 1 second.
+
+        * Expect `ValueError`.
+        """
+        with self.assertRaises(ValueError):
+            bar_aggregator.BarAggregator(intervals=[0])
+
+    def test_empty_array(self):
+        """Test aggregating an empty page of ticks."""
+        closed = self._aggregator.update_array(tick_array.TickArray(
+            columns={"time": np.empty(0, dtype="i8")}))
+
+        self.assertEqual(len(closed[60]), 0)
@@ -0,0 +1,248 @@
+"""Unit tests for module `ibpy_native.utils.finishable_queue`."""
+import asyncio
+import queue
+import threading
+import time
+import unittest
+
+from ibpy_native.utils import datatype
+from ibpy_native.utils import finishable_queue as fq
+
+from tests.toolkit import utils
+
+class TestFinishableQueue(unittest.TestCase):
+    """Unit tests for class `FinishableQueue`.
+
+    * Connection with IB is NOT REQUIRED.
+    """
+    def setUp(self):
+        self._queue = fq.FinishableQueue(queue_to_finish=queue.Queue())
+
+    @utils.async_test
+    async def test_get(self):
+        """Test function `get`.
+
+        * Elements are put from another thread while the coroutine is
+        awaiting.
+        """
+        threading.Thread(target=self._put_elements,
+                         args=([1, 2, 3, fq.Status.FINISHED],)).start()
+        result = await self._queue.get()
+
+        self.assertEqual(result, [1, 2, 3])
+        self.assertTrue(self._queue.finished)
+
+    @utils.async_test
+    async def test_get_queued(self):
+        """Test function `get`.
+
+        * Elements are put before the coroutine starts awaiting.
+        """
+        self._put_elements([1, 2, fq.Status.FINISHED])
+        result = await self._queue.get()
+
+        self.assertEqual(result, [1, 2])
+        self.assertTrue(self._queue.finished)
+
+    @utils.async_test
+    async def test_get_err(self):
+        """Test function `get`.
+
+        * Status should be marked as `ERROR` on exception received.
+        """
+        threading.Thread(target=self._put_elements,
+                         args=([1, ValueError()],)).start()
+        result = await self._queue.get()
+
+        self.assertIsInstance(result[-1], ValueError)
+        self.assertIs(self._queue.status, fq.Status.ERROR)
+
+    @utils.async_test
+    async def test_stream(self):
+        """Test function `stream`."""
+        threading.Thread(target=self._put_elements,
+                         args=([1, 2, fq.Status.FINISHED],)).start()
+        results = []
+        async for elm in self._queue.stream():
+            results.append(elm)
+
+        self.assertEqual(results, [1, 2, fq.Status.FINISHED])
+        self.assertTrue(self._queue.finished)
+
+    @utils.async_test
+    async def test_stream_same_thread(self):
+        """Test function `stream`.
+
+        * Elements are put by another task on the same event loop.
+        """
+        async def producer():
+            for elm in [1, 2, fq.Status.FINISHED]:
+                await asyncio.sleep(0.01)
+                self._queue.put(elm)
+
+        task = asyncio.create_task(producer())
+        results = [elm async for elm in self._queue.stream()]
+        await task
+
+        self.assertEqual(results, [1, 2, fq.Status.FINISHED])
+
+    @utils.async_test
+    async def test_stream_batches(self):
+        """Test function `stream_batches`.
+
+        * Elements already queued should be drained as one batch.
+        """
+        for i in range(5):
+            self._queue.put(i)
+        self._queue.put(fq.Status.FINISHED)
+
+        batches = [batch async for batch in self._queue.stream_batches(
+            max_batch=3)]
+
+        self.assertEqual(batches, [[0, 1, 2], [3, 4, fq.Status.FINISHED]])
+        self.assertTrue(self._queue.finished)
+
+    @utils.async_test
+    async def test_stream_batches_max_wait(self):
+        """Test function `stream_batches`.
+
+        * Elements arrive within `max_wait` should be included in the same
+        batch.
+        """
+        threading.Thread(target=self._put_elements,
+                         args=([1, 2, 3, ValueError()],)).start()
+
+        batches = [batch async for batch in self._queue.stream_batches(
+            max_wait=1)]
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0][:3], [1, 2, 3])
+        self.assertIsInstance(batches[0][-1], ValueError)
+        self.assertIs(self._queue.status, fq.Status.ERROR)
+
+    @utils.async_test
+    async def test_bound_drop_oldest(self):
+        """Test bounded queue with policy `OverflowPolicy.DROP_OLDEST`."""
+        self._queue.set_bound(maxsize=2,
+                              overflow=datatype.OverflowPolicy.DROP_OLDEST)
+        self._put_elements([1, 2, 3, 4, fq.Status.FINISHED])
+
+        self.assertEqual(await self._queue.get(), [3, 4])
+        self.assertEqual(self._queue.dropped, 2)
+
+    @utils.async_test
+    async def test_bound_drop_newest(self):
+        """Test bounded queue with policy `OverflowPolicy.DROP_NEWEST`."""
+        self._queue.set_bound(maxsize=2,
+                              overflow=datatype.OverflowPolicy.DROP_NEWEST)
+        self._put_elements([1, 2, 3, 4, fq.Status.FINISHED])
+
+        self.assertEqual(await self._queue.get(), [1, 2])
+        self.assertEqual(self._queue.dropped, 2)
+
+    @utils.async_test
+    async def test_bound_conflate(self):
+        """Test bounded queue with policy `OverflowPolicy.CONFLATE`."""
+        self._queue.set_bound(maxsize=3,
+                              overflow=datatype.OverflowPolicy.CONFLATE)
+        self._put_elements([1, 2, 3, 4, 5, fq.Status.FINISHED])
+
+        self.assertEqual(await self._queue.get(), [4, 5])
+        self.assertEqual(self._queue.dropped, 3)
+
+    @utils.async_test
+    async def test_bound_block(self):
+        """Test bounded queue with policy `OverflowPolicy.BLOCK`.
+
+        * Producer should be blocked until the consumer catches up, and no
+        element should be dropped.
+        """
+        self._queue.set_bound(maxsize=2)
+        elements = list(range(50))
+        producer = threading.Thread(
+            target=self._put_elements,
+            args=(elements + [fq.Status.FINISHED], 0)
+        )
+        producer.start()
+
+        await asyncio.sleep(0.1)
+        self.assertTrue(producer.is_alive()) # Blocked by the bound
+        self.assertEqual(await self._queue.get(), elements)
+        self.assertEqual(self._queue.dropped, 0)
+        producer.join()
+
+    @utils.async_test
+    async def test_bound_block_event_loop(self):
+        """Test bounded queue with policy `OverflowPolicy.BLOCK`.
+
+        * Elements put from an event loop should be accepted beyond the
+        bound and counted as overruns.
+        """
+        self._queue.set_bound(maxsize=2)
+        self._put_elements([1, 2, 3, 4, fq.Status.FINISHED], 0)
+
+        self.assertEqual(await self._queue.get(), [1, 2, 3, 4])
+        self.assertEqual(self._queue.overruns, 2)
+        self.assertEqual(self._queue.dropped, 0)
+
+        self._queue.reset()
+        self.assertEqual(self._queue.overruns, 0)
+
+    def test_bound_block_signal(self):
+        """Test bounded queue with policy `OverflowPolicy.BLOCK`.
+
+        * Producer blocked should be released once a signal is put, with the
+        element discarded.
+        """
+        self._queue.set_bound(maxsize=1)
+        self._queue.put(element=1)
+        producer = threading.Thread(target=self._queue.put, args=(2,),
+                                    daemon=True)
+        producer.start()
+        producer.join(timeout=0.1)
+        self.assertTrue(producer.is_alive()) # Blocked by the bound
+
+        self._queue.put(element=fq.Status.FINISHED)
+        producer.join(timeout=1)
+
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(self._queue.dropped, 1)
+
+    def test_bound_signal(self):
+        """Test bounded queue.
+
+        * `FINISHED` signal & exceptions should never be dropped.
+        """
+        self._queue.set_bound(maxsize=1,
+                              overflow=datatype.OverflowPolicy.DROP_NEWEST)
+        self._put_elements([1, ValueError(), fq.Status.FINISHED], 0)
+
+        self.assertEqual(self._queue._queue.qsize(), 3)
+
+    @utils.async_test
+    async def test_finish(self):
+        """Test function `finish`.
+
+        * Consumer awaiting on the queue should be released.
+        * Stale elements put after `finish` should be discarded on `reset`.
+        """
+        task = asyncio.create_task(self._queue.get())
+        await asyncio.sleep(0.05)
+
+        self._queue.finish()
+        self.assertEqual(await asyncio.wait_for(task, timeout=1), [])
+        self.assertTrue(self._queue.finished)
+
+        self._queue.put(2) # Late response
+        self._queue.put(fq.Status.FINISHED)
+        self._queue.reset()
+        self._put_elements([3, fq.Status.FINISHED], 0)
+        self.assertEqual(await self._queue.get(), [3])
+
+    #region - Private functions
+    def _put_elements(self, elements: list, interval: float=0.01):
+        for elm in elements:
+            if interval:
+                time.sleep(interval)
+            self._queue.put(elm)
+    #endregion - Private functions
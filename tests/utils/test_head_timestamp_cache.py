@@ -0,0 +1,77 @@
+"""Unit tests for module `ibpy_native.utils.head_timestamp_cache`."""
+import os
+import tempfile
+import time
+import unittest
+
+from ibpy_native.utils import datatype
+from ibpy_native.utils import head_timestamp_cache
+
+_CON_ID = 12087797
+_HEAD_TIME = 1215691200
+
+class TestHeadTimestampCache(unittest.TestCase):
+    """Unit tests for class `HeadTimestampCache`."""
+    def setUp(self):
+        self._cache = head_timestamp_cache.HeadTimestampCache()
+        self._cache.set(con_id=_CON_ID,
+                        data_type=datatype.EarliestDataPoint.BID,
+                        timestamp=_HEAD_TIME)
+
+    def test_get(self):
+        """Test getting the head timestamp cached."""
+        self.assertEqual(
+            self._cache.get(con_id=_CON_ID,
+                            data_type=datatype.EarliestDataPoint.BID),
+            _HEAD_TIME)
+        self.assertIsNone(
+            self._cache.get(con_id=_CON_ID,
+                            data_type=datatype.EarliestDataPoint.ASK))
+
+    def test_ttl(self):
+        """Test the expiry of the head timestamps cached."""
+        cache = head_timestamp_cache.HeadTimestampCache(ttl=0.01)
+        cache.set(con_id=_CON_ID, data_type=datatype.EarliestDataPoint.BID,
+                  timestamp=_HEAD_TIME)
+        time.sleep(0.02)
+
+        self.assertIsNone(
+            cache.get(con_id=_CON_ID,
+                      data_type=datatype.EarliestDataPoint.BID))
+
+    def test_invalidate(self):
+        """Test removing the head timestamps cached."""
+        self._cache.set(con_id=_CON_ID,
+                        data_type=datatype.EarliestDataPoint.ASK,
+                        timestamp=_HEAD_TIME)
+        self._cache.set(con_id=1, data_type=datatype.EarliestDataPoint.BID,
+                        timestamp=_HEAD_TIME)
+
+        self._cache.invalidate(con_id=_CON_ID,
+                               data_type=datatype.EarliestDataPoint.BID)
+        self.assertIsNone(
+            self._cache.get(con_id=_CON_ID,
+                            data_type=datatype.EarliestDataPoint.BID))
+        self.assertIsNotNone(
+            self._cache.get(con_id=_CON_ID,
+                            data_type=datatype.EarliestDataPoint.ASK))
+
+        self._cache.invalidate()
+        self.assertIsNone(
+            self._cache.get(con_id=1,
+                            data_type=datatype.EarliestDataPoint.BID))
+
+    def test_persistence(self):
+        """Test persisting the head timestamps cached into file."""
+        with tempfile.TemporaryDirectory() as path:
+            file = os.path.join(path, "head_timestamps.json")
+            cache = head_timestamp_cache.HeadTimestampCache(path=file)
+            cache.set(con_id=_CON_ID,
+                      data_type=datatype.EarliestDataPoint.TRADES,
+                      timestamp=_HEAD_TIME)
+
+            cache = head_timestamp_cache.HeadTimestampCache(path=file)
+            self.assertEqual(
+                cache.get(con_id=_CON_ID,
+                          data_type=datatype.EarliestDataPoint.TRADES),
+                _HEAD_TIME)
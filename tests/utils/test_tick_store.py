@@ -0,0 +1,174 @@
+"""Unit tests for module `ibpy_native.utils.tick_store`."""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from ibpy_native.models import tick_array
+from ibpy_native.utils import datatype
+from ibpy_native.utils import tick_store
+
+_CON_ID = 12087797
+_TICK_TYPE = datatype.HistoricalTicks.MIDPOINT
+
+def _ticks(start: int, end: int) -> tick_array.TickArray:
+    times = np.arange(start, end + 1, 10, dtype="i8")
+
+    return tick_array.TickArray(columns={
+        "time": times,
+        "price": np.full(len(times), 1.2101),
+        "size": np.zeros(len(times), dtype="i8"),
+    })
+
+class TestTickStore(unittest.TestCase):
+    """Unit tests for class `TickStore`."""
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._store = tick_store.TickStore(path=self._dir.name)
+
+    def test_lookup(self):
+        """Test splitting a time range into stored parts & gaps."""
+        self._store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                           end=199, ticks=_ticks(100, 199))
+        self._store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=300,
+                           end=399, ticks=_ticks(300, 399))
+
+        parts = self._store.lookup(con_id=_CON_ID, tick_type=_TICK_TYPE,
+                                   start=150, end=450)
+
+        self.assertEqual([(start, end) for start, end, _ in parts],
+                         [(150, 199), (200, 299), (300, 399), (400, 450)])
+        self.assertEqual(parts[0][2]["time"].tolist(),
+                         [150, 160, 170, 180, 190])
+        self.assertIsNone(parts[1][2])
+        self.assertEqual(len(parts[2][2]), 10)
+        self.assertIsNone(parts[3][2])
+        self.assertEqual(self._store.stats.hits, 2)
+        self.assertEqual(self._store.stats.misses, 2)
+        self.assertEqual(self._store.stats.hit_ticks, 15)
+
+    def test_lookup_other_type(self):
+        """Test looking up the ticks of a type not stored."""
+        self._store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                           end=199, ticks=_ticks(100, 199))
+
+        parts = self._store.lookup(con_id=_CON_ID,
+                                   tick_type=datatype.HistoricalTicks.TRADES,
+                                   start=100, end=199)
+
+        self.assertEqual(parts, [(100, 199, None)])
+
+    def test_append_overlapped(self):
+        """Test storing the ticks of a time range stored already.
+
+        * Expect `ValueError`.
+        """
+        self._store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                           end=199, ticks=_ticks(100, 199))
+
+        with self.assertRaises(ValueError):
+            self._store.append(con_id=_CON_ID, tick_type=_TICK_TYPE,
+                               start=150, end=250, ticks=_ticks(150, 250))
+
+    def test_fill(self):
+        """Test storing the ticks of a time range partly stored already.
+
+        * Only the parts not covered should be stored.
+        """
+        self._store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=150,
+                           end=199, ticks=_ticks(150, 199))
+
+        filled = self._store.fill(con_id=_CON_ID, tick_type=_TICK_TYPE,
+                                  start=100, end=299, ticks=_ticks(100, 299))
+        parts = self._store.lookup(con_id=_CON_ID, tick_type=_TICK_TYPE,
+                                   start=100, end=299)
+
+        self.assertEqual(filled, [(100, 149), (200, 299)])
+        self.assertEqual([time for _, _, ticks in parts
+                          for time in ticks["time"].tolist()],
+                         _ticks(100, 299)["time"].tolist())
+        self.assertEqual(self._store.fill(con_id=_CON_ID,
+                                          tick_type=_TICK_TYPE, start=100,
+                                          end=299, ticks=_ticks(100, 299)),
+                         [])
+        self.assertEqual(self._store.stats.segments, 3)
+
+    def test_persistence(self):
+        """Test reopening the store from the same directory."""
+        self._store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                           end=199, ticks=_ticks(100, 199))
+
+        store = tick_store.TickStore(path=self._dir.name)
+        parts = store.lookup(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                             end=199)
+
+        self.assertEqual(parts[0][2]["time"].tolist(),
+                         _ticks(100, 199)["time"].tolist())
+
+    def test_eviction(self):
+        """Test evicting the least recently used segments.
+
+        * Segment accessed recently should be kept.
+        """
+        self._store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                           end=199, ticks=_ticks(100, 199))
+        size = self._store.stats.size
+        store = tick_store.TickStore(path=self._dir.name,
+                                     max_size=size * 2)
+        store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=200,
+                     end=299, ticks=_ticks(200, 299))
+        store.lookup(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                     end=199)
+        store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=300,
+                     end=399, ticks=_ticks(300, 399))
+
+        parts = store.lookup(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                             end=399)
+
+        self.assertEqual([ticks is None for _, _, ticks in parts],
+                         [False, True, False])
+        self.assertEqual(store.stats.evictions, 1)
+        self.assertEqual(store.stats.segments, 2)
+
+    def test_eviction_persistence(self):
+        """Test evicting the segments after reopening the store.
+
+        * Access time of the segments looked up should be persisted on
+          close, without rewriting the index on every lookup.
+        """
+        for start in (100, 200):
+            self._store.append(con_id=_CON_ID, tick_type=_TICK_TYPE,
+                               start=start, end=start + 99,
+                               ticks=_ticks(start, start + 99))
+        size = self._store.stats.size
+        index_file = os.path.join(self._dir.name, "index.json")
+        written = os.stat(index_file).st_mtime_ns
+        self._store.lookup(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                           end=199)
+        self.assertEqual(os.stat(index_file).st_mtime_ns, written)
+        self._store.close()
+
+        store = tick_store.TickStore(path=self._dir.name, max_size=size)
+        store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=300,
+                     end=399, ticks=_ticks(300, 399))
+
+        parts = store.lookup(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                             end=399)
+        self.assertEqual([ticks is None for _, _, ticks in parts],
+                         [False, True, False])
+
+    def test_clear(self):
+        """Test removing all segments."""
+        self._store.append(con_id=_CON_ID, tick_type=_TICK_TYPE, start=100,
+                           end=199, ticks=_ticks(100, 199))
+        self._store.clear()
+
+        self.assertEqual(self._store.stats.size, 0)
+        self.assertEqual(self._store.lookup(con_id=_CON_ID,
+                                            tick_type=_TICK_TYPE, start=100,
+                                            end=199),
+                         [(100, 199, None)])
+
+    def tearDown(self):
+        self._dir.cleanup()
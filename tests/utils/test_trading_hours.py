@@ -0,0 +1,84 @@
+"""Unit tests for module `ibpy_native.utils.trading_hours`."""
+import datetime
+import unittest
+
+import pytz
+
+from ibpy_native.utils import trading_hours
+
+_TZ = pytz.timezone("US/Eastern")
+_HOURS = ("20210226:0930-20210226:1600;20210227:CLOSED;20210228:CLOSED;"
+          "20210301:0930-20210301:1600")
+
+def _timestamp(*args) -> float:
+    return _TZ.localize(datetime.datetime(*args)).timestamp()
+
+class TestTradingSchedule(unittest.TestCase):
+    """Unit tests for class `TradingSchedule`."""
+    def setUp(self):
+        self._schedule = trading_hours.TradingSchedule.parse(
+            hours=_HOURS, time_zone="US/Eastern")
+
+    def test_next_open_in_session(self):
+        """Test finding the next open time within a session."""
+        timestamp = _timestamp(2021, 2, 26, 10)
+
+        self.assertEqual(self._schedule.next_open(timestamp), timestamp)
+
+    def test_next_open_before_session(self):
+        """Test finding the next open time before a session starts."""
+        self.assertEqual(
+            self._schedule.next_open(_timestamp(2021, 3, 1, 3)),
+            _timestamp(2021, 3, 1, 9, 30))
+
+    def test_next_open_weekend(self):
+        """Test skipping the weekend after the close on Friday."""
+        self.assertEqual(
+            self._schedule.next_open(_timestamp(2021, 2, 26, 16)),
+            _timestamp(2021, 3, 1, 9, 30))
+
+    def test_next_open_not_listed(self):
+        """Test finding the next open time of the days not listed.
+
+        * The earliest open time observed on the same week day is used, and
+          stays open until the end of day.
+        * Week days without any session observed are treated as open all day.
+        """
+        self.assertEqual(
+            self._schedule.next_open(_timestamp(2021, 2, 6, 3)),
+            _timestamp(2021, 2, 8, 9, 30))
+        timestamp = _timestamp(2021, 2, 5, 17)
+        self.assertEqual(self._schedule.next_open(timestamp), timestamp)
+        timestamp = _timestamp(2021, 2, 3, 3)
+        self.assertEqual(self._schedule.next_open(timestamp), timestamp)
+
+    def test_parse_session_ranges(self):
+        """Test parsing the trading hours in format of time ranges per day,
+        with sessions across midnight.
+        """
+        schedule = trading_hours.TradingSchedule.parse(
+            hours="20210301:1700-1600;20210302:1700-1600;20210306:CLOSED",
+            time_zone="US/Central")
+        central = pytz.timezone("US/Central")
+
+        self.assertEqual(
+            schedule.next_open(
+                central.localize(datetime.datetime(2021, 3, 2, 16, 30))
+                .timestamp()),
+            central.localize(datetime.datetime(2021, 3, 2, 17)).timestamp())
+
+    def test_parse_closed(self):
+        """Test parsing the trading hours without any session.
+
+        * Expect `None`.
+        """
+        self.assertIsNone(trading_hours.TradingSchedule.parse(
+            hours="20210306:CLOSED;20210307:CLOSED", time_zone="US/Eastern"))
+
+    def test_time_zone_abbreviation(self):
+        """Test parsing the timezone in abbreviation."""
+        schedule = trading_hours.TradingSchedule.parse(
+            hours=_HOURS, time_zone="EST (Eastern Standard Time)")
+
+        self.assertEqual(schedule.next_open(_timestamp(2021, 2, 26, 16)),
+                         _timestamp(2021, 3, 1, 9, 30))